@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import logging
+from quart import request, jsonify
+from api.service.async_projeto_service import AsyncProjetoService
+from api.utils.error_response import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+"""
+Versão assíncrona (Quart) de ProjetoControl.
+
+Mesmos envelopes JSON e códigos HTTP da versão síncrona. Campos
+obrigatórios ausentes ou inválidos no corpo viram 400.
+"""
+class AsyncProjetoControl:
+    def __init__(self, projeto_service: AsyncProjetoService):
+        logger.debug("AsyncProjetoControl.constructor()")
+        self.__projeto_service = projeto_service
+
+    async def store(self):
+        """Cria um novo projeto"""
+        async def acao():
+            json_projeto = (await request.get_json())["projeto"]
+            newIdProjeto = await self.__projeto_service.createProjeto(json_projeto)
+            return {
+                "success": True,
+                "message": "Projeto criado com sucesso",
+                "data": {
+                    "projeto": {
+                        "id": newIdProjeto,
+                        "nome": json_projeto.get("nome"),
+                        "descricao": json_projeto.get("descricao"),
+                        "data_inicio": json_projeto.get("data_inicio"),
+                        "status": json_projeto.get("status", "Pendente"),
+                        "usuario_id": json_projeto.get("usuario_id")
+                    }
+                }
+            }, 201
+        return await self.__responder("store", acao)
+
+    async def index(self):
+        """Lista os projetos cadastrados, com os filtros de ProjetoControl.index"""
+        async def acao():
+            lista_projetos = await self.__projeto_service.findAll(request.args)
+            return {"success": True, "message": "Executado com sucesso", "data": {"projetos": lista_projetos}}, 200
+        return await self.__responder("index", acao)
+
+    async def show(self, id):
+        """Busca um projeto pelo ID"""
+        async def acao():
+            projeto = await self.__projeto_service.findById(id)
+            return {"success": True, "message": "Executado com sucesso", "data": projeto}, 200
+        return await self.__responder("show", acao)
+
+    async def update(self, id):
+        """Atualiza um projeto existente"""
+        async def acao():
+            requestBody = await request.get_json()
+            await self.__projeto_service.updateProjeto(id, requestBody)
+            return {
+                "success": True,
+                "message": "Projeto atualizado com sucesso",
+                "data": {
+                    "projeto": {
+                        "id": int(id),
+                        "nome": requestBody["projeto"].get("nome"),
+                        "status": requestBody["projeto"].get("status")
+                    }
+                }
+            }, 200
+        return await self.__responder("update", acao)
+
+    async def destroy(self, id):
+        """Remove um projeto pelo ID"""
+        async def acao():
+            await self.__projeto_service.deleteProjeto(id)
+            return {"success": True, "message": "Projeto excluído com sucesso"}, 200
+        return await self.__responder("destroy", acao)
+
+    async def __responder(self, nome: str, acao):
+        """
+        Executa a ação e converte erros no envelope padrão da API.
+        """
+        logger.debug("AsyncProjetoControl.%s()", nome)
+        try:
+            corpo, status = await acao()
+            return jsonify(corpo), status
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except (KeyError, TypeError, ValueError) as e:
+            mensagem = f"O campo {e} é obrigatório!" if isinstance(e, KeyError) else str(e)
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro na validação de dados",
+                    "details": {"message": mensagem},
+                    "code": 400
+                }
+            }), 400
+        except Exception:
+            logger.exception("Erro inesperado em %s", nome)
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import logging
+from quart import request, jsonify
+from api.service.async_tarefa_service import AsyncTarefaService
+from api.utils.error_response import ErrorResponse
+from api.utils.query_params import QueryParams
+
+logger = logging.getLogger(__name__)
+
+"""
+Versão assíncrona (Quart) de TarefaControl.
+
+Mesmos envelopes JSON e códigos HTTP da versão síncrona. Campos
+obrigatórios ausentes ou inválidos no corpo viram 400.
+"""
+class AsyncTarefaControl:
+    def __init__(self, tarefa_service: AsyncTarefaService):
+        logger.debug("AsyncTarefaControl.constructor()")
+        self.__tarefa_service = tarefa_service
+
+    async def store(self):
+        """Cria uma nova tarefa"""
+        async def acao():
+            json_tarefa = (await request.get_json())["tarefa"]
+            newIdTarefa = await self.__tarefa_service.createTarefa(json_tarefa)
+            return {
+                "success": True,
+                "message": "Tarefa criada com sucesso",
+                "data": {
+                    "tarefa": {
+                        "id": newIdTarefa,
+                        "titulo": json_tarefa.get("titulo"),
+                        "concluida": json_tarefa.get("concluida", False),
+                        "data_limite": json_tarefa.get("data_limite"),
+                        "projeto_id": json_tarefa.get("projeto_id")
+                    }
+                }
+            }, 201
+        return await self.__responder("store", acao)
+
+    async def index(self):
+        """Lista as tarefas cadastradas, paginadas por cursor (?limit=&after_id=), com os filtros de TarefaControl.index"""
+        async def acao():
+            pagina = await self.__tarefa_service.findAll(
+                QueryParams.inteiro_positivo(request.args, "limit"),
+                QueryParams.inteiro_positivo(request.args, "after_id"),
+                request.args,
+                QueryParams.inteiro_positivo(request.args, "offset")
+            )
+            return {"success": True, "message": "Executado com sucesso", "data": pagina}, 200
+        return await self.__responder("index", acao)
+
+    async def show(self, id):
+        """Busca uma tarefa pelo ID"""
+        async def acao():
+            tarefa = await self.__tarefa_service.findById(id)
+            return {"success": True, "message": "Executado com sucesso", "data": tarefa}, 200
+        return await self.__responder("show", acao)
+
+    async def update(self, id):
+        """Atualiza uma tarefa existente"""
+        async def acao():
+            requestBody = await request.get_json()
+            await self.__tarefa_service.updateTarefa(id, requestBody)
+            return {
+                "success": True,
+                "message": "Tarefa atualizada com sucesso",
+                "data": {
+                    "tarefa": {
+                        "id": int(id),
+                        "titulo": requestBody["tarefa"].get("titulo"),
+                        "concluida": requestBody["tarefa"].get("concluida")
+                    }
+                }
+            }, 200
+        return await self.__responder("update", acao)
+
+    async def destroy(self, id):
+        """Remove uma tarefa pelo ID"""
+        async def acao():
+            await self.__tarefa_service.deleteTarefa(id)
+            return {"success": True, "message": "Tarefa excluída com sucesso"}, 200
+        return await self.__responder("destroy", acao)
+
+    async def show_by_projeto(self, projeto_id):
+        """Lista as tarefas de um projeto"""
+        async def acao():
+            tarefas = await self.__tarefa_service.findByProjetoId(projeto_id)
+            return {"success": True, "message": "Executado com sucesso", "data": {"tarefas": tarefas}}, 200
+        return await self.__responder("show_by_projeto", acao)
+
+    async def marcar_concluida(self, id):
+        """Marca uma tarefa como concluída"""
+        async def acao():
+            await self.__tarefa_service.marcarComoConcluida(id)
+            return {
+                "success": True,
+                "message": "Tarefa marcada como concluída",
+                "data": {"tarefa": {"id": int(id), "concluida": True}}
+            }, 200
+        return await self.__responder("marcar_concluida", acao)
+
+    async def __responder(self, nome: str, acao):
+        """
+        Executa a ação e converte erros no envelope padrão da API.
+        """
+        logger.debug("AsyncTarefaControl.%s()", nome)
+        try:
+            corpo, status = await acao()
+            return jsonify(corpo), status
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except (KeyError, TypeError, ValueError) as e:
+            mensagem = f"O campo {e} é obrigatório!" if isinstance(e, KeyError) else str(e)
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro na validação de dados",
+                    "details": {"message": mensagem},
+                    "code": 400
+                }
+            }), 400
+        except Exception:
+            logger.exception("Erro inesperado em %s", nome)
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
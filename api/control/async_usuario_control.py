@@ -0,0 +1,90 @@
+# control/async_usuario_control.py
+import logging
+from quart import request, jsonify
+from api.service.async_usuario_service import AsyncUsuarioService
+from api.utils.error_response import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+class AsyncUsuarioControl:
+    def __init__(self, usuario_service: AsyncUsuarioService):
+        """
+        Versão assíncrona (Quart) de UsuarioControl
+        :param usuario_service: Instância do AsyncUsuarioService (injeção de dependência)
+        """
+        logger.debug("AsyncUsuarioControl.constructor()")
+        self.__usuario_service = usuario_service
+
+    async def login(self):
+        """Autentica um usuário pelo email e senha"""
+        async def acao():
+            json_usuario = await self.__json_usuario()
+            resultado = await self.__usuario_service.loginUsuario(json_usuario)
+            return {"success": True, "message": "Login efetuado com sucesso!", "data": resultado}, 200
+        return await self.__responder("login", acao)
+
+    async def store(self):
+        """Cria um novo usuário"""
+        async def acao():
+            json_usuario = await self.__json_usuario()
+            newIdUsuario = await self.__usuario_service.createUsuario(json_usuario)
+            return {
+                "success": True,
+                "message": "Cadastro realizado com sucesso",
+                "data": {
+                    "usuario": {
+                        "id": newIdUsuario,
+                        "nome": json_usuario.get("nome"),
+                        "email": json_usuario.get("email")
+                    }
+                }
+            }, 201
+        return await self.__responder("store", acao)
+
+    async def index(self):
+        """Lista os usuários cadastrados"""
+        async def acao():
+            lista_usuarios = await self.__usuario_service.findAll()
+            return {"success": True, "message": "Executado com sucesso", "data": {"usuarios": lista_usuarios}}, 200
+        return await self.__responder("index", acao)
+
+    async def show(self, id):
+        """Busca um usuário pelo ID"""
+        async def acao():
+            usuario = await self.__usuario_service.findById(id)
+            return {"success": True, "message": "Executado com sucesso", "data": usuario}, 200
+        return await self.__responder("show", acao)
+
+    async def __json_usuario(self) -> dict:
+        body = await request.get_json(silent=True) or {}
+        json_usuario = body.get("usuario")
+        if not json_usuario:
+            raise ErrorResponse(400, "Dados do usuário não fornecidos")
+        return json_usuario
+
+    async def __responder(self, nome: str, acao):
+        """
+        Executa a ação e converte erros no envelope padrão da API.
+        """
+        logger.debug("AsyncUsuarioControl.%s()", nome)
+        try:
+            corpo, status = await acao()
+            return jsonify(corpo), status
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception:
+            logger.exception("Erro inesperado em %s", nome)
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
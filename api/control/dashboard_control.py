@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import logging
+from flask import request, jsonify
+from api.service.dashboard_service import DashboardService
+from api.utils.error_response import ErrorResponse
+from api.utils.query_params import QueryParams
+
+logger = logging.getLogger(__name__)
+
+"""
+Classe responsável por controlar os endpoints do dashboard.
+
+Recebe a instância de DashboardService por injeção de dependência.
+"""
+class DashboardControl:
+    def __init__(self, dashboard_service: DashboardService):
+        """
+        Construtor da classe DashboardControl
+        :param dashboard_service: Instância do DashboardService (injeção de dependência)
+        """
+        logger.debug("DashboardControl.constructor()")
+        self.__dashboard_service = dashboard_service
+
+    def resumo(self):
+        """Agregados do dashboard (?projetos= limita a taxa de conclusão por projeto)"""
+        logger.debug("DashboardControl.resumo()")
+        try:
+            limite_projetos = QueryParams.inteiro_positivo(request.args, "projetos")
+            resumo = self.__dashboard_service.resumo(limite_projetos)
+            return jsonify({
+                "success": True,
+                "message": "Executado com sucesso",
+                "data": resumo
+            }), 200
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception as e:
+            logger.exception("Erro inesperado em resumo")
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
@@ -1,14 +1,19 @@
 # -*- coding: utf-8 -*-
+import logging
 from flask import request, jsonify
-import traceback
+from api.http.versao_recurso import VersaoRecurso
 from api.service.projeto_service import ProjetoService
 from api.utils.error_response import ErrorResponse
+from api.utils.query_params import QueryParams
+from api.utils.stream_response import StreamResponse
 # -*- coding: utf-8 -*-
 from flask import Blueprint, request, jsonify
 from api.middleware.jwt_middleware import JwtMiddleware
 from api.middleware.tarefa_middleware import TarefaMiddleware
 from api.control.tarefa_control import TarefaControl
 
+logger = logging.getLogger(__name__)
+
 class TarefaRoteador:
     """
     Classe responsável por configurar todas as rotas da entidade Tarefa no Flask.
@@ -27,7 +32,7 @@ class TarefaRoteador:
         :param tarefa_middleware: Middleware com validações específicas para Tarefa.
         :param tarefa_control: Controlador que implementa a lógica de negócio.
         """
-        print("⬆️  TarefaRoteador.__init__()")
+        logger.debug("TarefaRoteador.__init__()")
         self.__jwt_middleware = jwt_middleware
         self.__tarefa_middleware = tarefa_middleware
         self.__tarefa_control = tarefa_control
@@ -180,12 +185,12 @@ class ProjetoControl:
         Construtor da classe ProjetoControl
         :param projeto_service: Instância do ProjetoService (injeção de dependência)
         """
-        print("⬆️  ProjetoControl.constructor()")
+        logger.debug("ProjetoControl.constructor()")
         self.__projeto_service = projeto_service
 
     def store(self):
         """Cria um novo projeto"""
-        print("🔵 ProjetoControl.store()")
+        logger.debug("ProjetoControl.store()")
         try:
             json_projeto = request.json.get("projeto")
             newIdProjeto = self.__projeto_service.createProjeto(json_projeto)
@@ -213,7 +218,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em store: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em store")
             return jsonify({
                 "success": False,
                 "error": {
@@ -223,17 +228,40 @@ class ProjetoControl:
             }), 500
 
     def index(self):
-        """Lista todos os projetos cadastrados"""
-        print("🔵 ProjetoControl.index()")
+        """
+        Lista os projetos cadastrados (?stream=1 ou Accept: application/x-ndjson para
+        streaming). Aceita filtros (?status=&usuario_id=&data_inicio_de=&data_inicio_ate=
+        &data_fim_de=&data_fim_ate=), ordenação (?sort=nome) e projeção (?fields=id,nome).
+        Responde 304 quando If-None-Match já traz a versão da listagem.
+        """
+        logger.debug("ProjetoControl.index()")
         try:
-            lista_projetos = self.__projeto_service.findAll()
-            return jsonify({
+            if StreamResponse.is_requested():
+                return StreamResponse.build(self.__projeto_service.streamAll(request.args), "projetos")
+
+            v = self.__projeto_service.versaoLista(request.args)
+            versao = VersaoRecurso(v["marcas"], v["total"])
+            if versao.atual_no_cliente():
+                return versao.nao_modificado()
+
+            lista_projetos = self.__projeto_service.findAll(request.args, v)
+            resposta = jsonify({
                 "success": True,
                 "message": "Executado com sucesso",
                 "data": {"projetos": lista_projetos}
-            }), 200
+            })
+            return versao.aplicar(resposta), 200
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em index: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em index")
             return jsonify({
                 "success": False,
                 "error": {
@@ -243,15 +271,23 @@ class ProjetoControl:
             }), 500
 
     def show(self, id):
-        """Busca um projeto pelo ID"""
-        print("🔵 ProjetoControl.show()")
+        """Busca um projeto pelo ID (304 quando If-None-Match já traz a versão)"""
+        logger.debug("ProjetoControl.show()")
         try:
-            projeto = self.__projeto_service.findById(id)
-            return jsonify({
+            marcas = self.__projeto_service.versaoProjeto(id)
+            versao = VersaoRecurso(marcas) if marcas is not None else None
+            if versao and versao.atual_no_cliente():
+                return versao.nao_modificado()
+
+            projeto = self.__projeto_service.findById(id, marcas)
+            resposta = jsonify({
                 "success": True,
                 "message": "Executado com sucesso",
                 "data": projeto
-            }), 200
+            })
+            if versao:
+                versao.aplicar(resposta)
+            return resposta, 200
         except ErrorResponse as e:
             return jsonify({
                 "success": False,
@@ -262,7 +298,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em show: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em show")
             return jsonify({
                 "success": False,
                 "error": {
@@ -273,7 +309,7 @@ class ProjetoControl:
 
     def update(self, id):
         """Atualiza os dados de um projeto existente"""
-        print("🔵 ProjetoControl.update()")
+        logger.debug("ProjetoControl.update()")
         try:
             projeto_atualizado = self.__projeto_service.updateProjeto(id, request.json)
 
@@ -298,7 +334,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em update: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em update")
             return jsonify({
                 "success": False,
                 "error": {
@@ -309,7 +345,7 @@ class ProjetoControl:
 
     def destroy(self, id):
         """Remove um projeto pelo ID"""
-        print("🔵 ProjetoControl.destroy()")
+        logger.debug("ProjetoControl.destroy()")
         try:
             excluiu = self.__projeto_service.deleteProjeto(id)
             return jsonify({
@@ -326,7 +362,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em destroy: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em destroy")
             return jsonify({
                 "success": False,
                 "error": {
@@ -337,7 +373,7 @@ class ProjetoControl:
 
     def show_by_usuario(self, usuario_id):
         """Lista todos os projetos de um usuário específico"""
-        print("🔵 ProjetoControl.show_by_usuario()")
+        logger.debug("ProjetoControl.show_by_usuario()")
         try:
             projetos = self.__projeto_service.findByUsuarioId(usuario_id)
             return jsonify({
@@ -355,11 +391,54 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em show_by_usuario: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em show_by_usuario")
             return jsonify({
                 "success": False,
                 "error": {
                     "message": "Erro interno no servidor",
                     "code": 500
                 }
-            }), 500
\ No newline at end of file
+            }), 500
+
+    def meus_projetos(self, usuario_id):
+        """
+        Lista os projetos do usuário autenticado, paginados por cursor
+        (?limit=&after_id=, ou ?sort=&offset=), com os filtros e a projeção de index().
+        Responde 304 quando If-None-Match já traz a versão da listagem.
+        """
+        logger.debug("ProjetoControl.meus_projetos()")
+        try:
+            limit = QueryParams.inteiro_positivo(request.args, "limit")
+            after_id = QueryParams.inteiro_positivo(request.args, "after_id")
+            offset = QueryParams.inteiro_positivo(request.args, "offset")
+
+            v = self.__projeto_service.versaoMeusProjetos(usuario_id, request.args)
+            versao = VersaoRecurso(v["marcas"], v["total"], usuario_id)
+            if versao.atual_no_cliente():
+                return versao.nao_modificado()
+
+            pagina = self.__projeto_service.findMeusProjetos(usuario_id, limit, after_id, request.args, offset)
+            resposta = jsonify({
+                "success": True,
+                "message": "Executado com sucesso",
+                "data": pagina
+            })
+            return versao.aplicar(resposta), 200
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception as e:
+            logger.exception("Erro inesperado em meus_projetos")
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
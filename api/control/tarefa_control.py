@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
+import logging
 from flask import request, jsonify
-import traceback
+from api.http.versao_recurso import VersaoRecurso
 from api.service.tarefa_service import TarefaService
 from api.utils.error_response import ErrorResponse
+from api.utils.query_params import QueryParams
+from api.utils.stream_response import StreamResponse
+
+logger = logging.getLogger(__name__)
 
 """
 Classe responsável por controlar os endpoints da API REST para a entidade Tarefa.
@@ -17,12 +22,12 @@ class TarefaControl:
         Construtor da classe TarefaControl
         :param tarefa_service: Instância do TarefaService (injeção de dependência)
         """
-        print("⬆️  TarefaControl.constructor()")
+        logger.debug("TarefaControl.constructor()")
         self.__tarefa_service = tarefa_service
 
     def store(self):
         """Cria uma nova tarefa"""
-        print("🔵 TarefaControl.store()")
+        logger.debug("TarefaControl.store()")
         try:
             json_tarefa = request.json.get("tarefa")
             newIdTarefa = self.__tarefa_service.createTarefa(json_tarefa)
@@ -49,7 +54,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em store: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em store")
             return jsonify({
                 "success": False,
                 "error": {
@@ -59,17 +64,45 @@ class TarefaControl:
             }), 500
 
     def index(self):
-        """Lista todas as tarefas cadastradas"""
-        print("🔵 TarefaControl.index()")
+        """
+        Lista as tarefas cadastradas, paginadas por cursor (?limit=&after_id=) ou em
+        streaming (?stream=1). Aceita filtros (?status=&prioridade=&concluida=&projeto_id=
+        &usuario_id=&data_limite_de=&data_limite_ate=), ordenação (?sort=-data_limite,
+        paginada com ?offset=) e projeção (?fields=id,titulo).
+        Responde 304 quando If-None-Match já traz a versão da listagem.
+        """
+        logger.debug("TarefaControl.index()")
         try:
-            lista_tarefas = self.__tarefa_service.findAll()
-            return jsonify({
+            if StreamResponse.is_requested():
+                return StreamResponse.build(self.__tarefa_service.streamAll(request.args), "tarefas")
+
+            limit = QueryParams.inteiro_positivo(request.args, "limit")
+            after_id = QueryParams.inteiro_positivo(request.args, "after_id")
+            offset = QueryParams.inteiro_positivo(request.args, "offset")
+
+            v = self.__tarefa_service.versaoLista(request.args)
+            versao = VersaoRecurso(v["marcas"], v["total"])
+            if versao.atual_no_cliente():
+                return versao.nao_modificado()
+
+            pagina = self.__tarefa_service.findAll(limit, after_id, request.args, offset)
+            resposta = jsonify({
                 "success": True,
                 "message": "Executado com sucesso",
-                "data": {"tarefas": lista_tarefas}
-            }), 200
+                "data": pagina
+            })
+            return versao.aplicar(resposta), 200
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em index: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em index")
             return jsonify({
                 "success": False,
                 "error": {
@@ -79,15 +112,23 @@ class TarefaControl:
             }), 500
 
     def show(self, id):
-        """Busca uma tarefa pelo ID"""
-        print("🔵 TarefaControl.show()")
+        """Busca uma tarefa pelo ID (304 quando If-None-Match já traz a versão)"""
+        logger.debug("TarefaControl.show()")
         try:
-            tarefa = self.__tarefa_service.findById(id)
-            return jsonify({
+            marcas = self.__tarefa_service.versaoTarefa(id)
+            versao = VersaoRecurso(marcas) if marcas is not None else None
+            if versao and versao.atual_no_cliente():
+                return versao.nao_modificado()
+
+            tarefa = self.__tarefa_service.findById(id, marcas)
+            resposta = jsonify({
                 "success": True,
                 "message": "Executado com sucesso",
                 "data": tarefa
-            }), 200
+            })
+            if versao:
+                versao.aplicar(resposta)
+            return resposta, 200
         except ErrorResponse as e:
             return jsonify({
                 "success": False,
@@ -98,7 +139,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em show: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em show")
             return jsonify({
                 "success": False,
                 "error": {
@@ -109,7 +150,7 @@ class TarefaControl:
 
     def update(self, id):
         """Atualiza os dados de uma tarefa existente"""
-        print("🔵 TarefaControl.update()")
+        logger.debug("TarefaControl.update()")
         try:
             tarefa_atualizada = self.__tarefa_service.updateTarefa(id, request.json)
 
@@ -134,7 +175,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em update: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em update")
             return jsonify({
                 "success": False,
                 "error": {
@@ -145,7 +186,7 @@ class TarefaControl:
 
     def destroy(self, id):
         """Remove uma tarefa pelo ID"""
-        print("🔵 TarefaControl.destroy()")
+        logger.debug("TarefaControl.destroy()")
         try:
             excluiu = self.__tarefa_service.deleteTarefa(id)
             return jsonify({
@@ -162,7 +203,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em destroy: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em destroy")
             return jsonify({
                 "success": False,
                 "error": {
@@ -173,7 +214,7 @@ class TarefaControl:
 
     def show_by_projeto(self, projeto_id):
         """Lista todas as tarefas de um projeto específico"""
-        print("🔵 TarefaControl.show_by_projeto()")
+        logger.debug("TarefaControl.show_by_projeto()")
         try:
             tarefas = self.__tarefa_service.findByProjetoId(projeto_id)
             return jsonify({
@@ -191,7 +232,50 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em show_by_projeto: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em show_by_projeto")
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
+
+    def minhas_tarefas(self, usuario_id):
+        """
+        Lista as tarefas dos projetos do usuário autenticado, paginadas como index()
+        (?limit=&after_id=, ou ?sort=&offset=) e com os mesmos filtros e projeção.
+        Responde 304 quando If-None-Match já traz a versão da listagem.
+        """
+        logger.debug("TarefaControl.minhas_tarefas()")
+        try:
+            limit = QueryParams.inteiro_positivo(request.args, "limit")
+            after_id = QueryParams.inteiro_positivo(request.args, "after_id")
+            offset = QueryParams.inteiro_positivo(request.args, "offset")
+
+            v = self.__tarefa_service.versaoMinhasTarefas(usuario_id, request.args)
+            versao = VersaoRecurso(v["marcas"], v["total"], usuario_id)
+            if versao.atual_no_cliente():
+                return versao.nao_modificado()
+
+            pagina = self.__tarefa_service.findMinhasTarefas(usuario_id, limit, after_id, request.args, offset)
+            resposta = jsonify({
+                "success": True,
+                "message": "Executado com sucesso",
+                "data": pagina
+            })
+            return versao.aplicar(resposta), 200
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception as e:
+            logger.exception("Erro inesperado em minhas_tarefas")
             return jsonify({
                 "success": False,
                 "error": {
@@ -202,7 +286,7 @@ class TarefaControl:
 
     def marcar_concluida(self, id):
         """Marca uma tarefa como concluída"""
-        print("🔵 TarefaControl.marcar_concluida()")
+        logger.debug("TarefaControl.marcar_concluida()")
         try:
             tarefa_concluida = self.__tarefa_service.marcarComoConcluida(id)
             
@@ -226,11 +310,100 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em marcar_concluida: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em marcar_concluida")
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
+
+    def store_batch(self):
+        """Cria várias tarefas em uma única transação"""
+        logger.debug("TarefaControl.store_batch()")
+        try:
+            resultados = self.__tarefa_service.createTarefaBatch(request.json.get("tarefas"))
+            return jsonify({
+                "success": True,
+                "message": f"{len(resultados)} tarefas criadas com sucesso",
+                "data": {"resultados": resultados}
+            }), 201
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception as e:
+            logger.exception("Erro inesperado em store_batch")
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
+
+    def update_batch(self):
+        """Atualiza várias tarefas em uma única transação"""
+        logger.debug("TarefaControl.update_batch()")
+        try:
+            resultados = self.__tarefa_service.updateTarefaBatch(request.json.get("tarefas"))
+            atualizadas = sum(1 for r in resultados if r["success"])
+            return jsonify({
+                "success": True,
+                "message": f"{atualizadas} de {len(resultados)} tarefas atualizadas",
+                "data": {"resultados": resultados}
+            }), 200
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception as e:
+            logger.exception("Erro inesperado em update_batch")
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
+
+    def destroy_batch(self):
+        """Remove várias tarefas com um único DELETE"""
+        logger.debug("TarefaControl.destroy_batch()")
+        try:
+            resultados = self.__tarefa_service.deleteTarefaBatch(request.json.get("ids"))
+            excluidas = sum(1 for r in resultados if r["success"])
+            return jsonify({
+                "success": True,
+                "message": f"{excluidas} de {len(resultados)} tarefas excluídas",
+                "data": {"resultados": resultados}
+            }), 200
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception as e:
+            logger.exception("Erro inesperado em destroy_batch")
             return jsonify({
                 "success": False,
                 "error": {
                     "message": "Erro interno no servidor",
                     "code": 500
                 }
-            }), 500
\ No newline at end of file
+            }), 500
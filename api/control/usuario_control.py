@@ -1,8 +1,11 @@
 # control/usuario_control.py
+import logging
 from flask import request, jsonify
-import traceback
 from api.service.usuario_service import UsuarioService
 from api.utils.error_response import ErrorResponse
+from api.utils.stream_response import StreamResponse
+
+logger = logging.getLogger(__name__)
 
 class UsuarioControl:
     def __init__(self, usuario_service: UsuarioService):
@@ -10,12 +13,12 @@ class UsuarioControl:
         Construtor da classe UsuarioControl
         :param usuario_service: Instância do UsuarioService (injeção de dependência)
         """
-        print("⬆️  UsuarioControl.constructor()")
+        logger.debug("UsuarioControl.constructor()")
         self.__usuario_service = usuario_service
 
     def login(self):
         """Autentica um usuário pelo email e senha"""
-        print("🔵 UsuarioControl.login()")
+        logger.debug("UsuarioControl.login()")
         try:
             json_usuario = request.json.get("usuario")
             if not json_usuario:
@@ -43,7 +46,7 @@ class UsuarioControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em login: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em login")
             return jsonify({
                 "success": False,
                 "error": {
@@ -54,7 +57,7 @@ class UsuarioControl:
 
     def store(self):
         """Cria um novo usuário"""
-        print("🔵 UsuarioControl.store()")
+        logger.debug("UsuarioControl.store()")
         try:
             json_usuario = request.json.get("usuario")
             if not json_usuario:
@@ -88,7 +91,7 @@ class UsuarioControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em store: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em store")
             return jsonify({
                 "success": False,
                 "error": {
@@ -98,9 +101,12 @@ class UsuarioControl:
             }), 500
 
     def index(self):
-        """Lista todos os usuários cadastrados"""
-        print("🔵 UsuarioControl.index()")
+        """Lista todos os usuários cadastrados (?stream=1 ou Accept: application/x-ndjson para streaming)"""
+        logger.debug("UsuarioControl.index()")
         try:
+            if StreamResponse.is_requested():
+                return StreamResponse.build(self.__usuario_service.streamAll(), "usuarios")
+
             lista_usuarios = self.__usuario_service.findAll()
             return jsonify({
                 "success": True,
@@ -117,7 +123,7 @@ class UsuarioControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em index: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em index")
             return jsonify({
                 "success": False,
                 "error": {
@@ -128,7 +134,7 @@ class UsuarioControl:
 
     def show(self, id):
         """Busca um usuário pelo ID"""
-        print("🔵 UsuarioControl.show()")
+        logger.debug("UsuarioControl.show()")
         try:
             usuario = self.__usuario_service.findById(id)
             return jsonify({
@@ -146,7 +152,7 @@ class UsuarioControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em show: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em show")
             return jsonify({
                 "success": False,
                 "error": {
@@ -157,7 +163,7 @@ class UsuarioControl:
 
     def update(self, id):
         """Atualiza os dados de um usuário existente"""
-        print("🔵 UsuarioControl.update()")
+        logger.debug("UsuarioControl.update()")
         try:
             usuario_atualizado = self.__usuario_service.updateUsuario(id, request.json)
 
@@ -182,7 +188,7 @@ class UsuarioControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em update: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em update")
             return jsonify({
                 "success": False,
                 "error": {
@@ -193,7 +199,7 @@ class UsuarioControl:
 
     def destroy(self, id):
         """Remove um usuário pelo ID"""
-        print("🔵 UsuarioControl.destroy()")
+        logger.debug("UsuarioControl.destroy()")
         try:
             excluiu = self.__usuario_service.deleteUsuario(id)
             return jsonify({
@@ -210,7 +216,7 @@ class UsuarioControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em destroy: {traceback.format_exc()}")
+            logger.exception("Erro inesperado em destroy")
             return jsonify({
                 "success": False,
                 "error": {
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+import logging
+from api.dao.projeto_dao import ProjetoDAO
+from api.model.projeto import Projeto
+
+logger = logging.getLogger(__name__)
+
+"""
+Versão assíncrona de ProjetoDAO (AsyncMysqlDatabase).
+
+Mesmas queries e mesmo formato de retorno da versão síncrona; os métodos
+são corrotinas e devem ser chamados com await.
+"""
+
+class AsyncProjetoDAO:
+    # Colunas/joins comuns às listagens
+    SELECT_PROJETO = """
+        SELECT
+            p.id,
+            p.nome,
+            p.descricao,
+            p.data_inicio,
+            p.data_fim,
+            p.status,
+            p.usuario_id,
+            u.nome as usuario_nome
+        FROM projetos p
+        LEFT JOIN usuarios u ON p.usuario_id = u.id
+    """
+
+    def __init__(self, database_dependency):
+        logger.debug("AsyncProjetoDAO.__init__()")
+        self.__database = database_dependency
+
+    async def create(self, objProjeto: Projeto, tx=None) -> int:
+        logger.debug("AsyncProjetoDAO.create()")
+        try:
+            SQL = """
+                INSERT INTO projetos
+                (nome, descricao, data_inicio, data_fim, status, usuario_id)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """
+            insert_id = await (tx or self.__database).execute_query(SQL, self.__paramsProjeto(objProjeto))
+
+            if not insert_id:
+                raise Exception("Falha ao inserir projeto")
+            return insert_id
+
+        except Exception as e:
+            # 1452 = ER_NO_REFERENCED_ROW_2 (FK inexistente)
+            if e.args[:1] == (1452,):
+                raise ValueError(f"Usuário com ID {objProjeto.usuario_id} não existe")
+            logger.error("Erro em AsyncProjetoDAO.create(): %s", e)
+            raise
+
+    async def exists(self, id: int, tx=None) -> bool:
+        logger.debug("AsyncProjetoDAO.exists()")
+        SQL = "SELECT 1 FROM projetos WHERE id = %s LIMIT 1"
+        rows = await (tx or self.__database).execute_query(SQL, (id,), fetch=True)
+        return len(rows) > 0
+
+    async def update(self, objProjeto: Projeto, tx=None) -> bool:
+        logger.debug("AsyncProjetoDAO.update()")
+        SQL = """
+            UPDATE projetos
+            SET nome=%s, descricao=%s, data_inicio=%s, data_fim=%s, status=%s, usuario_id=%s
+            WHERE id=%s
+        """
+        params = self.__paramsProjeto(objProjeto) + (objProjeto.id,)
+        affected = await (tx or self.__database).execute_query(SQL, params)
+        return affected > 0
+
+    async def delete(self, id: int, tx=None) -> bool:
+        logger.debug("AsyncProjetoDAO.delete()")
+        SQL = "DELETE FROM projetos WHERE id = %s"
+        affected = await (tx or self.__database).execute_query(SQL, (id,))
+        return affected > 0
+
+    async def findAll(self, filtros=None) -> list[dict]:
+        """
+        Lista projetos com os filtros da query string (mesmas regras e
+        listas brancas de ProjetoDAO.findAll).
+        """
+        logger.debug("AsyncProjetoDAO.findAll()")
+        SQL, params, campos = ProjetoDAO.CONSULTA.montar(filtros)
+        rows = await self.__database.execute_query(SQL, params, fetch=True)
+        return [ProjetoDAO.CONSULTA.montar_linha(row, campos) for row in rows]
+
+    async def findById(self, id: int) -> dict | None:
+        logger.debug("AsyncProjetoDAO.findById()")
+        SQL = f"{self.SELECT_PROJETO} WHERE p.id = %s"
+        rows = await self.__database.execute_query(SQL, (id,), fetch=True)
+        return self.__montarProjeto(rows[0]) if rows else None
+
+    def __paramsProjeto(self, objProjeto: Projeto) -> tuple:
+        return (
+            objProjeto.nome,
+            objProjeto.descricao,
+            objProjeto.data_inicio,
+            objProjeto.data_fim,
+            objProjeto.status,
+            objProjeto.usuario_id,
+        )
+
+    def __montarProjeto(self, row: dict) -> dict:
+        projeto_data = {
+            "id": row["id"],
+            "nome": row["nome"],
+            "descricao": row["descricao"],
+            "status": row["status"],
+            "usuario_id": row["usuario_id"],
+            "usuario_nome": row["usuario_nome"],
+            "data_inicio": row["data_inicio"],
+            "data_fim": row["data_fim"]
+        }
+        return projeto_data
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import logging
+from api.dao.tarefa_dao import TarefaDAO
+from api.model.tarefa import Tarefa
+
+logger = logging.getLogger(__name__)
+
+"""
+Versão assíncrona de TarefaDAO (AsyncMysqlDatabase).
+
+Mesmas queries e mesmo formato de retorno da versão síncrona; os métodos
+são corrotinas e devem ser chamados com await.
+"""
+
+class AsyncTarefaDAO:
+    # Colunas/joins comuns às listagens
+    SELECT_TAREFA = """
+        SELECT
+            t.id,
+            t.titulo,
+            t.descricao,
+            t.status,
+            t.prioridade,
+            t.concluida,
+            t.data_limite,
+            t.data_inicio,
+            t.data_fim,
+            t.projeto_id,
+            t.usuario_id,
+            p.nome as projeto_nome,
+            u.nome as usuario_nome
+        FROM tarefas t
+        LEFT JOIN projetos p ON t.projeto_id = p.id
+        LEFT JOIN usuarios u ON t.usuario_id = u.id
+    """
+
+    def __init__(self, database_dependency):
+        logger.debug("AsyncTarefaDAO.__init__()")
+        self.__database = database_dependency
+
+    async def create(self, objTarefa: Tarefa, tx=None) -> int:
+        logger.debug("AsyncTarefaDAO.create()")
+        try:
+            SQL = """
+                INSERT INTO tarefas
+                (titulo, descricao, status, prioridade, concluida, data_limite, data_inicio, data_fim, projeto_id, usuario_id)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """
+            insert_id = await (tx or self.__database).execute_query(SQL, self.__paramsTarefa(objTarefa))
+
+            if not insert_id:
+                raise Exception("Falha ao inserir tarefa")
+            return insert_id
+
+        except Exception as e:
+            # 1452 = ER_NO_REFERENCED_ROW_2 (FK inexistente)
+            if e.args[:1] == (1452,):
+                raise ValueError(f"Projeto com ID {objTarefa.projeto_id} não existe")
+            logger.error("Erro em AsyncTarefaDAO.create(): %s", e)
+            raise
+
+    async def exists(self, id: int, tx=None) -> bool:
+        logger.debug("AsyncTarefaDAO.exists()")
+        SQL = "SELECT 1 FROM tarefas WHERE id = %s LIMIT 1"
+        rows = await (tx or self.__database).execute_query(SQL, (id,), fetch=True)
+        return len(rows) > 0
+
+    async def update(self, objTarefa: Tarefa, tx=None) -> bool:
+        logger.debug("AsyncTarefaDAO.update()")
+        SQL = """
+            UPDATE tarefas
+            SET titulo=%s, descricao=%s, status=%s, prioridade=%s, concluida=%s,
+                data_limite=%s, data_inicio=%s, data_fim=%s, projeto_id=%s, usuario_id=%s
+            WHERE id=%s
+        """
+        params = self.__paramsTarefa(objTarefa) + (objTarefa.id,)
+        affected = await (tx or self.__database).execute_query(SQL, params)
+        return affected > 0
+
+    async def delete(self, id: int, tx=None) -> bool:
+        logger.debug("AsyncTarefaDAO.delete()")
+        SQL = "DELETE FROM tarefas WHERE id = %s"
+        affected = await (tx or self.__database).execute_query(SQL, (id,))
+        return affected > 0
+
+    async def marcarComoConcluida(self, id: int, tx=None) -> bool:
+        logger.debug("AsyncTarefaDAO.marcarComoConcluida()")
+        SQL = "UPDATE tarefas SET concluida = TRUE WHERE id = %s"
+        affected = await (tx or self.__database).execute_query(SQL, (id,))
+        return affected > 0
+
+    async def findAll(self, limit: int, after_id: int | None = None, filtros=None,
+                      offset: int | None = None) -> list[dict]:
+        """
+        Lista tarefas com paginação por cursor em t.id e os filtros da query
+        string (mesmas regras e listas brancas de TarefaDAO.findAll).
+        """
+        logger.debug("AsyncTarefaDAO.findAll()")
+        SQL, params, campos = TarefaDAO.CONSULTA.montar(filtros, limit, after_id, offset)
+        rows = await self.__database.execute_query(SQL, params, fetch=True)
+        return [TarefaDAO.CONSULTA.montar_linha(row, campos) for row in rows]
+
+    async def findById(self, id: int) -> dict | None:
+        logger.debug("AsyncTarefaDAO.findById()")
+        SQL = f"{self.SELECT_TAREFA} WHERE t.id = %s"
+        rows = await self.__database.execute_query(SQL, (id,), fetch=True)
+        return self.__montarTarefa(rows[0]) if rows else None
+
+    async def findByProjetoId(self, projeto_id: int) -> list[dict]:
+        logger.debug("AsyncTarefaDAO.findByProjetoId()")
+        SQL = f"{self.SELECT_TAREFA} WHERE t.projeto_id = %s"
+        rows = await self.__database.execute_query(SQL, (projeto_id,), fetch=True)
+        return [self.__montarTarefa(row) for row in rows]
+
+    def __paramsTarefa(self, objTarefa: Tarefa) -> tuple:
+        return (
+            objTarefa.titulo,
+            objTarefa.descricao if hasattr(objTarefa, 'descricao') else "",
+            objTarefa.status if hasattr(objTarefa, 'status') else "pendente",
+            objTarefa.prioridade if hasattr(objTarefa, 'prioridade') else "media",
+            objTarefa.concluida,
+            objTarefa.data_limite,
+            objTarefa.data_inicio if hasattr(objTarefa, 'data_inicio') else None,
+            objTarefa.data_fim if hasattr(objTarefa, 'data_fim') else None,
+            objTarefa.projeto_id,
+            objTarefa.usuario_id if hasattr(objTarefa, 'usuario_id') else None,
+        )
+
+    def __montarTarefa(self, row: dict) -> dict:
+        tarefa_data = {
+            "id": row["id"],
+            "titulo": row["titulo"],
+            "descricao": row["descricao"],
+            "status": row["status"],
+            "prioridade": row["prioridade"],
+            "concluida": bool(row["concluida"]),
+            "projeto_id": row["projeto_id"],
+            "projeto_nome": row["projeto_nome"],
+            "usuario_id": row["usuario_id"],
+            "usuario_nome": row["usuario_nome"],
+            "data_limite": row["data_limite"],
+            "data_inicio": row["data_inicio"],
+            "data_fim": row["data_fim"]
+        }
+        return tarefa_data
@@ -0,0 +1,105 @@
+# dao/async_usuario_dao.py
+import logging
+from api.model.usuario import Usuario
+
+logger = logging.getLogger(__name__)
+
+"""
+Versão assíncrona de UsuarioDAO (AsyncMysqlDatabase).
+
+Não cria tabelas: o schema já existe quando o servidor ASGI sobe.
+"""
+
+class AsyncUsuarioDAO:
+    def __init__(self, database_dependency):
+        logger.debug("AsyncUsuarioDAO.__init__()")
+        self.__database = database_dependency
+
+    async def create(self, usuario: Usuario, tx=None) -> int:
+        """
+        Cria um novo usuário no banco de dados
+        :param usuario: Objeto Usuario
+        :return: ID do usuário criado
+        """
+        logger.debug("AsyncUsuarioDAO.create()")
+        try:
+            SQL = '''
+                INSERT INTO usuarios (nome, email, senha_hash, data_criacao)
+                VALUES (%s, %s, %s, %s)
+            '''
+            params = (
+                usuario.nome,
+                usuario.email,
+                usuario.senha_hash,
+                usuario.data_criacao.strftime('%Y-%m-%d %H:%M:%S')
+            )
+            return await (tx or self.__database).execute_query(SQL, params)
+
+        except Exception as e:
+            if "Duplicate entry" in str(e):
+                raise ValueError("Email já cadastrado")
+            logger.error("Erro em AsyncUsuarioDAO.create(): %s", e)
+            raise
+
+    async def find_by_id(self, usuario_id: int) -> Usuario | None:
+        """
+        Busca usuário por ID
+        :param usuario_id: ID do usuário
+        :return: Objeto Usuario ou None
+        """
+        logger.debug("AsyncUsuarioDAO.find_by_id()")
+        SQL = '''
+            SELECT id, nome, email, senha_hash, data_criacao
+            FROM usuarios WHERE id = %s
+        '''
+        rows = await self.__database.execute_query(SQL, (usuario_id,), fetch=True)
+        return self.__montarUsuario(rows[0]) if rows else None
+
+    async def find_by_email(self, email: str) -> Usuario | None:
+        """
+        Busca usuário por email
+        :param email: Email do usuário
+        :return: Objeto Usuario ou None
+        """
+        logger.debug("AsyncUsuarioDAO.find_by_email()")
+        SQL = '''
+            SELECT id, nome, email, senha_hash, data_criacao
+            FROM usuarios WHERE email = %s
+        '''
+        rows = await self.__database.execute_query(SQL, (email,), fetch=True)
+        return self.__montarUsuario(rows[0]) if rows else None
+
+    async def find_all(self) -> list[Usuario]:
+        """
+        Retorna todos os usuários
+        :return: Lista de objetos Usuario
+        """
+        logger.debug("AsyncUsuarioDAO.find_all()")
+        SQL = '''
+            SELECT id, nome, email, senha_hash, data_criacao
+            FROM usuarios ORDER BY id
+        '''
+        rows = await self.__database.execute_query(SQL, fetch=True)
+        return [self.__montarUsuario(row) for row in rows]
+
+    async def exists(self, usuario_id: int, tx=None) -> bool:
+        """
+        Verifica se existe usuário com o ID informado, sem carregar a linha
+        """
+        logger.debug("AsyncUsuarioDAO.exists()")
+        SQL = 'SELECT 1 FROM usuarios WHERE id = %s LIMIT 1'
+        rows = await (tx or self.__database).execute_query(SQL, (usuario_id,), fetch=True)
+        return len(rows) > 0
+
+    async def email_exists(self, email: str, tx=None) -> bool:
+        """
+        Verifica se o email já está cadastrado, sem carregar a linha
+        """
+        logger.debug("AsyncUsuarioDAO.email_exists()")
+        SQL = 'SELECT 1 FROM usuarios WHERE email = %s LIMIT 1'
+        rows = await (tx or self.__database).execute_query(SQL, (email,), fetch=True)
+        return len(rows) > 0
+
+    def __montarUsuario(self, row: dict) -> Usuario:
+        # Linha do banco: monta direto, sem revalidar nos setters
+        return Usuario.from_row(row)
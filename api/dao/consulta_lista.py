@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+from datetime import date, datetime
+from api.dao.mapeador_linhas import MapeadorLinhas
+
+
+"""
+Montagem de listagens com filtros, ordenação e projeção vindos da query
+string, sempre contra listas brancas definidas pela DAO.
+
+Nada do que o cliente envia vira SQL: nomes de filtro, de campo e de
+ordenação são chaves das listas brancas (que guardam as expressões SQL) e
+os valores viram parâmetros (%s). Parâmetros desconhecidos ou inválidos
+geram ValueError com uma mensagem para o cliente.
+
+Formato aceito:
+- filtro por igualdade: ?status=pendente  (vírgula = IN: ?status=pendente,andamento)
+- intervalos de data: ?data_limite_de=2025-01-01&data_limite_ate=2025-01-31T23:59:59
+- ordenação: ?sort=-data_limite,titulo  ("-" = decrescente; o id desempata)
+- projeção: ?fields=id,titulo,status  (o id é sempre incluído)
+
+montar_versao() gera, para os mesmos filtros, um SELECT com COUNT(*) e o
+MAX das colunas de versão (atualizado_em) da tabela e das junções
+projetadas: basta para saber se a listagem mudou sem montá-la (ETag).
+
+As colunas do SELECT têm o nome público do campo (AS <nome>): as linhas
+lidas com cursor de tuplas (database.fetch_rows) viram dicionários de
+resposta com mapear(), coluna a coluna.
+"""
+class ConsultaLista:
+    # Limites de tamanho para a entrada do cliente
+    MAX_VALORES = 50
+    MAX_TAMANHO_VALOR = 255
+
+    # Parâmetros de paginação/formato tratados por outras camadas
+    RESERVADOS = ("limit", "after_id", "offset", "stream", "sort", "fields")
+
+    def __init__(self, tabela: str, alias: str, campos: dict, filtros: dict, ordenacoes: tuple,
+                 juncoes: dict = None, versoes: dict = None):
+        """
+        :param tabela: str - tabela principal
+        :param alias: str - alias da tabela principal no SQL
+        :param campos: dict - nome público -> (expressão SQL, tipo, junção ou None);
+                       tipo: "int", "str", "bool" ou "data"
+        :param filtros: dict - nome do parâmetro -> (expressão SQL, operador, tipo);
+                        operador "=" aceita lista (IN); ">=" e "<=" para intervalos
+        :param ordenacoes: tuple - nomes de campos que podem ser usados em sort
+        :param juncoes: dict - nome da junção -> cláusula JOIN
+        :param versoes: dict - nome da junção (None = tabela principal) -> coluna de
+                        versão, ex.: {None: "t.atualizado_em", "projeto": "p.atualizado_em"}
+        """
+        self.__tabela = tabela
+        self.__alias = alias
+        self.__campos = campos
+        self.__filtros = filtros
+        self.__ordenacoes = ordenacoes
+        self.__juncoes = juncoes or {}
+        self.__versoes = versoes or {}
+        self.__mapeador = MapeadorLinhas(
+            {nome: bool for nome, (_, tipo, _) in campos.items() if tipo == "bool"}
+        )
+
+    def campos(self) -> list[str]:
+        """Nomes públicos dos campos, na ordem padrão da resposta."""
+        return list(self.__campos)
+
+    def ordenado(self, args) -> bool:
+        """True se a consulta pede uma ordenação diferente da padrão (id decrescente)."""
+        return bool(args and (args.get("sort") or "").strip())
+
+    def montar(self, args=None, limit: int = None, after_id: int = None, offset: int = None,
+               escopo: tuple = None):
+        """
+        Monta o SELECT da listagem.
+
+        :param args: Mapping - query string (request.args) ou None
+        :param limit: int - LIMIT (None = sem limite)
+        :param after_id: int - cursor (id < after_id); só com a ordenação padrão
+        :param offset: int - deslocamento; só com sort
+        :param escopo: tuple - (junção ou None, condição SQL, params) fixados pelo
+                       servidor, ex.: restringir ao usuário autenticado
+        :return: (sql, params, campos) - campos é a lista de nomes projetados
+        :raises ValueError: parâmetro desconhecido ou valor inválido
+        """
+        args = args or {}
+        campos, juncoes, condicoes, params = self.__selecao(args, escopo)
+
+        ordem = self.__ordem(args.get("sort"))
+        if after_id is not None:
+            if self.ordenado(args):
+                raise ValueError("after_id só pode ser usado com a ordenação padrão; use offset com sort")
+            condicoes.append(f"{self.__alias}.id < %s")
+            params.append(after_id)
+        if offset and not self.ordenado(args):
+            raise ValueError("offset só pode ser usado com sort; sem sort use after_id")
+
+        colunas = ",\n                ".join(
+            f"{self.__campos[nome][0]} AS {nome}" for nome in campos
+        )
+        juncoes_sql = self.__juncoes_sql(juncoes)
+        where = f"WHERE {' AND '.join(condicoes)}" if condicoes else ""
+
+        sql = f"""
+            SELECT
+                {colunas}
+            FROM {self.__tabela} {self.__alias}
+            {juncoes_sql}
+            {where}
+            ORDER BY {ordem}
+        """
+        if limit is not None:
+            sql += " LIMIT %s"
+            params.append(limit)
+            if offset:
+                sql += " OFFSET %s"
+                params.append(offset)
+        return sql, tuple(params), campos
+
+    def montar_versao(self, args=None, escopo: tuple = None):
+        """
+        Monta o SELECT que resume a versão da listagem: COUNT(*) AS total e
+        MAX(coluna de versão) AS versao_<n> da tabela principal e de cada
+        junção usada pelos campos projetados (nomes vindos de JOIN também
+        fazem parte da resposta). Ignora paginação: a página depende só do
+        conjunto filtrado, que muda sempre que muda a contagem ou a maior versão.
+
+        :return: (sql, params)
+        :raises ValueError: os mesmos casos de montar()
+        """
+        args = args or {}
+        campos, juncoes, condicoes, params = self.__selecao(args, escopo)
+        self.__ordem(args.get("sort"))
+
+        colunas = ["COUNT(*) AS total"]
+        for juncao in [None] + list(dict.fromkeys(juncoes)):
+            if juncao in self.__versoes:
+                colunas.append(f"MAX({self.__versoes[juncao]}) AS versao_{len(colunas) - 1}")
+        where = f"WHERE {' AND '.join(condicoes)}" if condicoes else ""
+
+        sql = f"""
+            SELECT {', '.join(colunas)}
+            FROM {self.__tabela} {self.__alias}
+            {self.__juncoes_sql(juncoes)}
+            {where}
+        """
+        return sql, tuple(params)
+
+    def mapear(self, colunas: tuple, linhas: list) -> list[dict]:
+        """
+        Converte as linhas de montar() lidas com cursor de tuplas nos
+        dicionários de resposta (ver MapeadorLinhas).
+        """
+        return self.__mapeador.mapear(colunas, linhas)
+
+    def montar_linha(self, row: dict, campos: list[str]) -> dict:
+        """
+        Converte uma linha de cursor dict (DAOs assíncronas) no dicionário de
+        resposta (só os campos projetados). Datas seguem como datetime: quem formata é o provider JSON da aplicação.
+        """
+        item = {}
+        for nome in campos:
+            valor = row[nome]
+            if self.__campos[nome][1] == "bool":
+                valor = bool(valor)
+            item[nome] = valor
+        return item
+
+    def __selecao(self, args, escopo: tuple = None):
+        """Projeção, junções e WHERE (condições e params) comuns às duas consultas."""
+        self.__validar_nomes(args)
+
+        campos = self.__projecao(args.get("fields"))
+        juncoes = [self.__campos[nome][2] for nome in campos if self.__campos[nome][2]]
+
+        condicoes = []
+        params = []
+        if escopo is not None:
+            juncao, condicao, params_escopo = escopo
+            if juncao:
+                juncoes.insert(0, juncao)
+            condicoes.append(condicao)
+            params.extend(params_escopo)
+        for nome, (expressao, operador, tipo) in self.__filtros.items():
+            bruto = args.get(nome)
+            if bruto is None or bruto == "":
+                continue
+            if operador == "=":
+                valores = [self.__converter(nome, tipo, v) for v in bruto.split(",")]
+                if len(valores) > self.MAX_VALORES:
+                    raise ValueError(f"O filtro '{nome}' aceita no máximo {self.MAX_VALORES} valores")
+                if len(valores) == 1:
+                    condicoes.append(f"{expressao} = %s")
+                else:
+                    condicoes.append(f"{expressao} IN ({', '.join(['%s'] * len(valores))})")
+                params.extend(valores)
+            else:
+                condicoes.append(f"{expressao} {operador} %s")
+                params.append(self.__converter(nome, tipo, bruto))
+        return campos, juncoes, condicoes, params
+
+    def __juncoes_sql(self, juncoes: list) -> str:
+        return "\n            ".join(self.__juncoes[j] for j in dict.fromkeys(juncoes))
+
+    def __validar_nomes(self, args):
+        for nome in args.keys():
+            if nome not in self.__filtros and nome not in self.RESERVADOS:
+                permitidos = ", ".join(sorted(self.__filtros))
+                raise ValueError(f"Filtro '{nome}' não é suportado. Permitidos: {permitidos}")
+
+    def __projecao(self, fields: str | None) -> list[str]:
+        if not fields:
+            return self.campos()
+        pedidos = [f.strip() for f in fields.split(",") if f.strip()]
+        for nome in pedidos:
+            if nome not in self.__campos:
+                raise ValueError(f"Campo '{nome}' não existe. Permitidos: {', '.join(self.__campos)}")
+        # id sempre presente (cursor e identificação no cliente), ordem da lista branca
+        return [nome for nome in self.__campos if nome == "id" or nome in pedidos]
+
+    def __ordem(self, sort: str | None) -> str:
+        alias = self.__alias
+        if not sort or not sort.strip():
+            return f"{alias}.id DESC"
+        partes = []
+        for chave in sort.split(","):
+            chave = chave.strip()
+            if not chave:
+                continue
+            direcao = "DESC" if chave.startswith("-") else "ASC"
+            nome = chave.lstrip("+-")
+            if nome not in self.__ordenacoes:
+                raise ValueError(
+                    f"Ordenação por '{nome}' não é suportada. Permitidas: {', '.join(self.__ordenacoes)}"
+                )
+            partes.append(f"{self.__campos[nome][0]} {direcao}")
+        if f"{alias}.id ASC" not in partes and f"{alias}.id DESC" not in partes:
+            partes.append(f"{alias}.id DESC")
+        return ", ".join(partes)
+
+    def __converter(self, nome: str, tipo: str, bruto: str):
+        bruto = bruto.strip()
+        if len(bruto) > self.MAX_TAMANHO_VALOR:
+            raise ValueError(f"Valor muito longo para o filtro '{nome}'")
+        if tipo == "int":
+            try:
+                valor = int(bruto)
+            except ValueError:
+                valor = 0
+            if valor <= 0:
+                raise ValueError(f"O filtro '{nome}' deve ser um número inteiro positivo")
+            return valor
+        if tipo == "bool":
+            normalizado = bruto.lower()
+            if normalizado in ("1", "true", "sim"):
+                return True
+            if normalizado in ("0", "false", "nao", "não"):
+                return False
+            raise ValueError(f"O filtro '{nome}' deve ser true ou false")
+        if tipo == "data":
+            try:
+                if len(bruto) == 10:
+                    data = date.fromisoformat(bruto)
+                    # "_ate" com só a data inclui o dia inteiro
+                    if nome.endswith("_ate"):
+                        return datetime(data.year, data.month, data.day, 23, 59, 59)
+                    return datetime(data.year, data.month, data.day)
+                return datetime.fromisoformat(bruto)
+            except ValueError:
+                raise ValueError(f"O filtro '{nome}' deve ser uma data ISO (AAAA-MM-DD ou AAAA-MM-DDTHH:MM:SS)")
+        return bruto
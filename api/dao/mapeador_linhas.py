@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+from operator import itemgetter
+
+
+"""
+Conversão de linhas do banco (tuplas) em dicionários de resposta.
+
+O plano de cada consulta (nomes das colunas e quais delas precisam de
+conversão) é montado uma única vez por conjunto de colunas e reaproveitado
+nas chamadas seguintes. Cada linha vira dict com um único dict(zip(...))
+e cada coluna que precisa de conversão é extraída do lote inteiro
+(itemgetter), convertida com map() e gravada de volta - nenhum laço em
+Python por campo de cada linha.
+
+Datas, Decimal etc. seguem crus: quem formata é o provider JSON.
+"""
+class MapeadorLinhas:
+    def __init__(self, conversores: dict = None):
+        """
+        :param conversores: dict - nome da coluna -> função aplicada a cada valor
+                            (ex.: {"concluida": bool})
+        """
+        self.__conversores = conversores or {}
+        self.__planos = {}
+
+    def mapear(self, colunas: tuple, linhas: list) -> list[dict]:
+        """
+        :param colunas: tuple[str] - nomes das colunas (cursor.column_names)
+        :param linhas: list[tuple] - linhas do cursor de tuplas
+        :return: list[dict] - chaves na ordem das colunas
+        """
+        if not linhas:
+            return []
+        nomes, conversoes = self.__plano(colunas)
+        itens = [dict(zip(nomes, linha)) for linha in linhas]
+        for nome, coluna, conversor in conversoes:
+            for item, valor in zip(itens, map(conversor, map(coluna, linhas))):
+                item[nome] = valor
+        return itens
+
+    def __plano(self, colunas: tuple):
+        plano = self.__planos.get(colunas)
+        if plano is None:
+            conversoes = tuple(
+                (nome, itemgetter(indice), self.__conversores[nome])
+                for indice, nome in enumerate(colunas)
+                if nome in self.__conversores
+            )
+            plano = self.__planos[colunas] = (tuple(colunas), conversoes)
+        return plano
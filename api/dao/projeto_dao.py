@@ -1,19 +1,59 @@
 # -*- coding: utf-8 -*-
+import logging
+from api.dao.consulta_lista import ConsultaLista
 from api.model.projeto import Projeto
 
+logger = logging.getLogger(__name__)
+
 """
 Classe responsável por gerenciar operações CRUD
 para a entidade Projeto no banco de dados.
+
+Os métodos de escrita e de verificação de existência aceitam um `tx`
+opcional (aberto com database.transaction()); sem ele cada chamada usa
+sua própria conexão e faz seu próprio commit.
 """
 
 class ProjetoDAO:
+    # Listas brancas das listagens: só estes nomes chegam ao SQL
+    CONSULTA = ConsultaLista(
+        tabela="projetos",
+        alias="p",
+        campos={
+            "id": ("p.id", "int", None),
+            "nome": ("p.nome", "str", None),
+            "descricao": ("p.descricao", "str", None),
+            "status": ("p.status", "str", None),
+            "usuario_id": ("p.usuario_id", "int", None),
+            "usuario_nome": ("u.nome", "str", "usuario"),
+            "data_inicio": ("p.data_inicio", "data", None),
+            "data_fim": ("p.data_fim", "data", None),
+        },
+        filtros={
+            "status": ("p.status", "=", "str"),
+            "usuario_id": ("p.usuario_id", "=", "int"),
+            "data_inicio_de": ("p.data_inicio", ">=", "data"),
+            "data_inicio_ate": ("p.data_inicio", "<=", "data"),
+            "data_fim_de": ("p.data_fim", ">=", "data"),
+            "data_fim_ate": ("p.data_fim", "<=", "data"),
+        },
+        ordenacoes=("id", "nome", "status", "data_inicio", "data_fim"),
+        juncoes={
+            "usuario": "LEFT JOIN usuarios u ON p.usuario_id = u.id",
+        },
+        versoes={
+            None: "p.atualizado_em",
+            "usuario": "u.atualizado_em",
+        },
+    )
+
     def __init__(self, database_dependency):
-        print("⬆️  ProjetoDAO.__init__()")
+        logger.debug("ProjetoDAO.__init__()")
         self.__database = database_dependency
         # ✅ REMOVIDO: self._create_tables() - tabelas já existem do Banco.sql
 
-    def create(self, objProjeto: Projeto) -> int:
-        print("🟢 ProjetoDAO.create()")
+    def create(self, objProjeto: Projeto, tx=None) -> int:
+        logger.debug("ProjetoDAO.create()")
         try:
             # ✅ CORREÇÃO: Query simplificada e corrigida
             SQL = """
@@ -30,28 +70,58 @@ class ProjetoDAO:
                 objProjeto.usuario_id,
             )
 
-            insert_id = self.__database.execute_query(SQL, params)
+            insert_id = (tx or self.__database).execute_query(SQL, params)
             
             if not insert_id:
                 raise Exception("Falha ao inserir projeto")
             return insert_id
             
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.create(): {e}")
+            # 1452 = ER_NO_REFERENCED_ROW_2 (FK inexistente)
+            if getattr(e, "errno", None) == 1452 or "FOREIGN KEY constraint" in str(e):
+                raise ValueError(f"Usuário com ID {objProjeto.usuario_id} não existe")
+            logger.error("Erro em ProjetoDAO.create(): %s", e)
             raise
 
-    def delete(self, id: int) -> bool:
-        print("🟢 ProjetoDAO.delete()")
+    def exists(self, id: int, tx=None) -> bool:
+        logger.debug("ProjetoDAO.exists()")
+        try:
+            # ✅ Só verifica a existência: não faz JOIN nem carrega colunas
+            SQL = "SELECT 1 FROM projetos WHERE id = %s LIMIT 1"
+            rows = (tx or self.__database).execute_query(SQL, (id,), fetch=True)
+            return len(rows) > 0
+        except Exception as e:
+            logger.error("Erro em ProjetoDAO.exists(): %s", e)
+            raise
+
+    def findExistingIds(self, ids: list[int], tx=None) -> set[int]:
+        """
+        Dentre os IDs informados, retorna os que existem (uma única consulta).
+        """
+        logger.debug("ProjetoDAO.findExistingIds()")
+        try:
+            if not ids:
+                return set()
+            placeholders = ", ".join(["%s"] * len(ids))
+            SQL = f"SELECT id FROM projetos WHERE id IN ({placeholders})"
+            rows = (tx or self.__database).execute_query(SQL, tuple(ids), fetch=True)
+            return {row["id"] for row in rows}
+        except Exception as e:
+            logger.error("Erro em ProjetoDAO.findExistingIds(): %s", e)
+            raise
+
+    def delete(self, id: int, tx=None) -> bool:
+        logger.debug("ProjetoDAO.delete()")
         try:
             SQL = "DELETE FROM projetos WHERE id = %s"
-            affected = self.__database.execute_query(SQL, (id,))
+            affected = (tx or self.__database).execute_query(SQL, (id,))
             return affected > 0
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.delete(): {e}")
+            logger.error("Erro em ProjetoDAO.delete(): %s", e)
             raise
 
-    def update(self, objProjeto: Projeto) -> bool:
-        print("🟢 ProjetoDAO.update()")
+    def update(self, objProjeto: Projeto, tx=None) -> bool:
+        logger.debug("ProjetoDAO.update()")
         try:
             # ✅ CORREÇÃO: Query atualizada
             SQL = """
@@ -69,234 +139,183 @@ class ProjetoDAO:
                 objProjeto.id,
             )
 
-            affected = self.__database.execute_query(SQL, params)
+            affected = (tx or self.__database).execute_query(SQL, params)
             return affected > 0
             
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.update(): {e}")
+            logger.error("Erro em ProjetoDAO.update(): %s", e)
             raise
 
-    def findAll(self) -> list[dict]:
-        print("🟢 ProjetoDAO.findAll()")
+    def findAll(self, filtros=None) -> list[dict]:
+        """
+        Lista projetos do mais novo para o mais antigo, aplicando filtros,
+        ordenação e projeção da query string (ver CONSULTA).
+
+        :param filtros: Mapping - parâmetros da query string (status, sort, fields...)
+        :return: list[dict] - só com os campos projetados
+        :raises ValueError: filtro, campo ou ordenação fora da lista branca
+        """
+        logger.debug("ProjetoDAO.findAll()")
         try:
-            # ✅ CORREÇÃO: Query corrigida com LEFT JOIN e tratamento de datas
-            SQL = """
-                SELECT 
-                    p.id, 
-                    p.nome, 
-                    p.descricao, 
-                    p.data_inicio, 
-                    p.data_fim,
-                    p.status, 
-                    p.usuario_id,
-                    u.nome as usuario_nome
-                FROM projetos p
-                LEFT JOIN usuarios u ON p.usuario_id = u.id
-                ORDER BY p.id DESC
-            """
-            rows = self.__database.execute_query(SQL, fetch=True)
+            return self.__consultar(filtros)
 
-            projetos = []
-            for row in rows:
-                projeto_data = {
-                    "id": row["id"],
-                    "nome": row["nome"],
-                    "descricao": row["descricao"],
-                    "status": row["status"],
-                    "usuario_id": row["usuario_id"],
-                    "usuario_nome": row["usuario_nome"]
-                }
-                
-                # ✅ CORREÇÃO: Tratamento seguro para datas
-                if row["data_inicio"]:
-                    if hasattr(row["data_inicio"], 'isoformat'):
-                        projeto_data["data_inicio"] = row["data_inicio"].isoformat()
-                    else:
-                        projeto_data["data_inicio"] = str(row["data_inicio"])
-                else:
-                    projeto_data["data_inicio"] = None
-                    
-                if row["data_fim"]:
-                    if hasattr(row["data_fim"], 'isoformat'):
-                        projeto_data["data_fim"] = row["data_fim"].isoformat()
-                    else:
-                        projeto_data["data_fim"] = str(row["data_fim"])
-                else:
-                    projeto_data["data_fim"] = None
-                
-                projetos.append(projeto_data)
-                
-            return projetos
-            
+        except ValueError:
+            raise
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.findAll(): {e}")
+            logger.error("Erro em ProjetoDAO.findAll(): %s", e)
             raise
 
-    def findById(self, id: int) -> dict | None:
-        print("✅ ProjetoDAO.findById()")
+    def findDoUsuario(self, usuario_id: int, limit: int, after_id: int | None = None, filtros=None,
+                      offset: int | None = None) -> list[dict]:
+        """
+        Lista os projetos do usuário com paginação por cursor (keyset) em
+        p.id, usando idx_projetos_usuario_id (usuario_id, id). Aceita os
+        filtros, a ordenação e a projeção de findAll().
+
+        :param usuario_id: int - dono dos projetos (usuário autenticado)
+        :param limit: int - quantidade máxima de linhas retornadas
+        :param after_id: int - cursor; retorna apenas projetos com id menor que ele
+        :param offset: int - deslocamento; usado quando há sort (sem cursor)
+        :return: list[dict] - só com os campos projetados
+        :raises ValueError: filtro, campo ou ordenação fora da lista branca
+        """
+        logger.debug("ProjetoDAO.findDoUsuario()")
+        try:
+            escopo = (None, "p.usuario_id = %s", (usuario_id,))
+            return self.__consultar(filtros, limit, after_id, offset, escopo)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Erro em ProjetoDAO.findDoUsuario(): %s", e)
+            raise
+
+    def iterAll(self, batch_size: int = 500, filtros=None):
+        """
+        Percorre todos os projetos sob demanda (generator), lendo do cursor
+        em lotes. Usado pelas respostas em streaming; aceita os mesmos
+        filtros de findAll().
+        """
+        logger.debug("ProjetoDAO.iterAll()")
+        SQL, params, _ = self.CONSULTA.montar(filtros)
+        for colunas, lote in self.__database.stream_batches(SQL, params, batch_size=batch_size):
+            yield from self.CONSULTA.mapear(colunas, lote)
+
+    def versaoAll(self, filtros=None) -> dict:
+        """
+        Versão da listagem de findAll() com os mesmos filtros: quantidade de
+        linhas e maior atualizado_em (da tabela e das junções projetadas).
+        Não lê nem formata as linhas; usada para ETag/304.
+
+        :return: dict {"total": int, "marcas": list[datetime | None]}
+        :raises ValueError: filtro, campo ou ordenação fora da lista branca
+        """
+        logger.debug("ProjetoDAO.versaoAll()")
+        return self.__versaoLista(filtros)
+
+    def versaoDoUsuario(self, usuario_id: int, filtros=None) -> dict:
+        """
+        Versão da listagem de findDoUsuario() (mesmo escopo e filtros).
+
+        :return: dict {"total": int, "marcas": list[datetime | None]}
+        :raises ValueError: filtro, campo ou ordenação fora da lista branca
+        """
+        logger.debug("ProjetoDAO.versaoDoUsuario()")
+        return self.__versaoLista(filtros, (None, "p.usuario_id = %s", (usuario_id,)))
+
+    def versao(self, id: int) -> list | None:
+        """
+        Colunas de versão (atualizado_em) do projeto e das linhas cujos nomes
+        entram em findById(), lidas pela PK. None se o projeto não existe.
+        """
+        logger.debug("ProjetoDAO.versao()")
         try:
             SQL = """
-                SELECT 
-                    p.id, 
-                    p.nome, 
-                    p.descricao, 
-                    p.data_inicio, 
-                    p.data_fim,
-                    p.status, 
-                    p.usuario_id,
-                    u.nome as usuario_nome
+                SELECT p.atualizado_em AS versao_projeto,
+                       u.atualizado_em AS versao_usuario
                 FROM projetos p
                 LEFT JOIN usuarios u ON p.usuario_id = u.id
                 WHERE p.id = %s
             """
             rows = self.__database.execute_query(SQL, (id,), fetch=True)
-            
             if not rows:
                 return None
-                
-            row = rows[0]
-            projeto_data = {
-                "id": row["id"],
-                "nome": row["nome"],
-                "descricao": row["descricao"],
-                "status": row["status"],
-                "usuario_id": row["usuario_id"],
-                "usuario_nome": row["usuario_nome"]
-            }
-            
-            # ✅ CORREÇÃO: Tratamento seguro para datas
-            if row["data_inicio"]:
-                if hasattr(row["data_inicio"], 'isoformat'):
-                    projeto_data["data_inicio"] = row["data_inicio"].isoformat()
-                else:
-                    projeto_data["data_inicio"] = str(row["data_inicio"])
-            else:
-                projeto_data["data_inicio"] = None
-                
-            if row["data_fim"]:
-                if hasattr(row["data_fim"], 'isoformat'):
-                    projeto_data["data_fim"] = row["data_fim"].isoformat()
-                else:
-                    projeto_data["data_fim"] = str(row["data_fim"])
-            else:
-                projeto_data["data_fim"] = None
-                
-            return projeto_data
-            
+            return list(rows[0].values())
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.findById(): {e}")
+            logger.error("Erro em ProjetoDAO.versao(): %s", e)
+            raise
+
+    def __versaoLista(self, filtros, escopo: tuple = None) -> dict:
+        try:
+            SQL, params = self.CONSULTA.montar_versao(filtros, escopo)
+            row = self.__database.execute_query(SQL, params, fetch=True)[0]
+            marcas = [valor for chave, valor in row.items() if chave.startswith("versao_")]
+            return {"total": row["total"], "marcas": marcas}
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Erro em ProjetoDAO.__versaoLista(): %s", e)
+            raise
+
+    def __consultar(self, filtros=None, limit: int = None, after_id: int = None,
+                    offset: int = None, escopo: tuple = None) -> list[dict]:
+        """
+        SELECT de CONSULTA lido com cursor de tuplas e convertido em dicts
+        de uma vez (CONSULTA.mapear). Sem filtros: todos os campos, id decrescente.
+        """
+        SQL, params, _ = self.CONSULTA.montar(filtros, limit, after_id, offset, escopo)
+        colunas, linhas = self.__database.fetch_rows(SQL, params)
+        return self.CONSULTA.mapear(colunas, linhas)
+
+    def findById(self, id: int) -> dict | None:
+        logger.debug("ProjetoDAO.findById()")
+        try:
+            linhas = self.__consultar(escopo=(None, "p.id = %s", (id,)))
+            return linhas[0] if linhas else None
+
+        except Exception as e:
+            logger.error("Erro em ProjetoDAO.findById(): %s", e)
             raise
 
     def findByField(self, campo: str, valor) -> list[dict]:
-        print(f"🟢 ProjetoDAO.findByField() - Campo: {campo}, Valor: {valor}")
+        logger.debug("ProjetoDAO.findByField() - Campo: %s, Valor: %s", campo, valor)
         try:
             allowedFields = ["id", "nome", "status", "usuario_id"]
             if campo not in allowedFields:
                 raise ValueError("Campo inválido para busca")
 
-            SQL = f"""
-                SELECT 
-                    p.id, 
-                    p.nome, 
-                    p.descricao, 
-                    p.data_inicio, 
-                    p.data_fim,
-                    p.status, 
-                    p.usuario_id,
-                    u.nome as usuario_nome
-                FROM projetos p
-                LEFT JOIN usuarios u ON p.usuario_id = u.id
-                WHERE p.{campo} = %s
-            """
-            resultados = self.__database.execute_query(SQL, (valor,), fetch=True)
-            
-            projetos = []
-            for row in resultados:
-                projeto_data = {
-                    "id": row["id"],
-                    "nome": row["nome"],
-                    "descricao": row["descricao"],
-                    "status": row["status"],
-                    "usuario_id": row["usuario_id"],
-                    "usuario_nome": row["usuario_nome"]
-                }
-                
-                # Tratamento seguro para datas
-                if row["data_inicio"]:
-                    if hasattr(row["data_inicio"], 'isoformat'):
-                        projeto_data["data_inicio"] = row["data_inicio"].isoformat()
-                    else:
-                        projeto_data["data_inicio"] = str(row["data_inicio"])
-                else:
-                    projeto_data["data_inicio"] = None
-                    
-                if row["data_fim"]:
-                    if hasattr(row["data_fim"], 'isoformat'):
-                        projeto_data["data_fim"] = row["data_fim"].isoformat()
-                    else:
-                        projeto_data["data_fim"] = str(row["data_fim"])
-                else:
-                    projeto_data["data_fim"] = None
-                
-                projetos.append(projeto_data)
-                
-            return projetos
-            
+            return self.__consultar(escopo=(None, f"p.{campo} = %s", (valor,)))
+
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.findByField(): {e}")
+            logger.error("Erro em ProjetoDAO.findByField(): %s", e)
             raise
 
-    def findByUsuarioId(self, usuario_id: int) -> list[dict]:
-        print("🟢 ProjetoDAO.findByUsuarioId()")
+    def contarPorStatus(self) -> list[dict]:
+        """
+        Quantidade de projetos por status (GROUP BY sobre idx_projetos_status).
+
+        :return: list[dict] - {"status", "total"}; status nulo vem como ""
+        """
+        logger.debug("ProjetoDAO.contarPorStatus()")
         try:
             SQL = """
-                SELECT 
-                    p.id, 
-                    p.nome, 
-                    p.descricao, 
-                    p.data_inicio, 
-                    p.data_fim,
-                    p.status, 
-                    p.usuario_id,
-                    u.nome as usuario_nome
-                FROM projetos p
-                LEFT JOIN usuarios u ON p.usuario_id = u.id
-                WHERE p.usuario_id = %s
+                SELECT COALESCE(status, '') AS status, COUNT(*) AS total
+                FROM projetos
+                GROUP BY COALESCE(status, '')
             """
-            rows = self.__database.execute_query(SQL, (usuario_id,), fetch=True)
-
-            projetos = []
-            for row in rows:
-                projeto_data = {
-                    "id": row["id"],
-                    "nome": row["nome"],
-                    "descricao": row["descricao"],
-                    "status": row["status"],
-                    "usuario_id": row["usuario_id"],
-                    "usuario_nome": row["usuario_nome"]
-                }
-                
-                # Tratamento seguro para datas
-                if row["data_inicio"]:
-                    if hasattr(row["data_inicio"], 'isoformat'):
-                        projeto_data["data_inicio"] = row["data_inicio"].isoformat()
-                    else:
-                        projeto_data["data_inicio"] = str(row["data_inicio"])
-                else:
-                    projeto_data["data_inicio"] = None
-                    
-                if row["data_fim"]:
-                    if hasattr(row["data_fim"], 'isoformat'):
-                        projeto_data["data_fim"] = row["data_fim"].isoformat()
-                    else:
-                        projeto_data["data_fim"] = str(row["data_fim"])
-                else:
-                    projeto_data["data_fim"] = None
-                
-                projetos.append(projeto_data)
-                
-            return projetos
-            
+            rows = self.__database.execute_query(SQL, fetch=True)
+            return [{"status": row["status"], "total": int(row["total"])} for row in rows]
+
+        except Exception as e:
+            logger.error("Erro em ProjetoDAO.contarPorStatus(): %s", e)
+            raise
+
+    def findByUsuarioId(self, usuario_id: int) -> list[dict]:
+        logger.debug("ProjetoDAO.findByUsuarioId()")
+        try:
+            # idx_projetos_usuario_id (usuario_id, id) atende o filtro e a ordem
+            return self.__consultar(escopo=(None, "p.usuario_id = %s", (usuario_id,)))
+
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.findByUsuarioId(): {e}")
-            raise
\ No newline at end of file
+            logger.error("Erro em ProjetoDAO.findByUsuarioId(): %s", e)
+            raise
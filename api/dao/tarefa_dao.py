@@ -1,19 +1,68 @@
 # -*- coding: utf-8 -*-
+import logging
+from datetime import datetime
+from api.dao.consulta_lista import ConsultaLista
 from api.model.tarefa import Tarefa
 
+logger = logging.getLogger(__name__)
+
 """
 Classe responsável por gerenciar operações CRUD
 para a entidade Tarefa no banco de dados.
+
+Os métodos de escrita e de verificação de existência aceitam um `tx`
+opcional (aberto com database.transaction()); sem ele cada chamada usa
+sua própria conexão e faz seu próprio commit.
 """
 
 class TarefaDAO:
+    # Listas brancas das listagens: só estes nomes chegam ao SQL
+    CONSULTA = ConsultaLista(
+        tabela="tarefas",
+        alias="t",
+        campos={
+            "id": ("t.id", "int", None),
+            "titulo": ("t.titulo", "str", None),
+            "descricao": ("t.descricao", "str", None),
+            "status": ("t.status", "str", None),
+            "prioridade": ("t.prioridade", "str", None),
+            "concluida": ("t.concluida", "bool", None),
+            "projeto_id": ("t.projeto_id", "int", None),
+            "projeto_nome": ("p.nome", "str", "projeto"),
+            "usuario_id": ("t.usuario_id", "int", None),
+            "usuario_nome": ("u.nome", "str", "usuario"),
+            "data_limite": ("t.data_limite", "data", None),
+            "data_inicio": ("t.data_inicio", "data", None),
+            "data_fim": ("t.data_fim", "data", None),
+        },
+        filtros={
+            "status": ("t.status", "=", "str"),
+            "prioridade": ("t.prioridade", "=", "str"),
+            "concluida": ("t.concluida", "=", "bool"),
+            "projeto_id": ("t.projeto_id", "=", "int"),
+            "usuario_id": ("t.usuario_id", "=", "int"),
+            "data_limite_de": ("t.data_limite", ">=", "data"),
+            "data_limite_ate": ("t.data_limite", "<=", "data"),
+        },
+        ordenacoes=("id", "titulo", "status", "prioridade", "data_limite", "data_inicio", "data_fim"),
+        juncoes={
+            "projeto": "LEFT JOIN projetos p ON t.projeto_id = p.id",
+            "usuario": "LEFT JOIN usuarios u ON t.usuario_id = u.id",
+        },
+        versoes={
+            None: "t.atualizado_em",
+            "projeto": "p.atualizado_em",
+            "usuario": "u.atualizado_em",
+        },
+    )
+
     def __init__(self, database_dependency):
-        print("⬆️  TarefaDAO.__init__()")
+        logger.debug("TarefaDAO.__init__()")
         self.__database = database_dependency
         # ✅ REMOVIDO: self._create_tables() - tabelas já existem do Banco.sql
 
-    def create(self, objTarefa: Tarefa) -> int:
-        print("🟢 TarefaDAO.create()")
+    def create(self, objTarefa: Tarefa, tx=None) -> int:
+        logger.debug("TarefaDAO.create()")
         try:
             # ✅ CORREÇÃO: Query atualizada com as novas colunas
             SQL = """
@@ -21,41 +70,44 @@ class TarefaDAO:
                 (titulo, descricao, status, prioridade, concluida, data_limite, data_inicio, data_fim, projeto_id, usuario_id) 
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
-            params = (
-                objTarefa.titulo,
-                objTarefa.descricao if hasattr(objTarefa, 'descricao') else "",
-                objTarefa.status if hasattr(objTarefa, 'status') else "pendente",
-                objTarefa.prioridade if hasattr(objTarefa, 'prioridade') else "media",
-                objTarefa.concluida,
-                objTarefa.data_limite,
-                objTarefa.data_inicio if hasattr(objTarefa, 'data_inicio') else None,
-                objTarefa.data_fim if hasattr(objTarefa, 'data_fim') else None,
-                objTarefa.projeto_id,
-                objTarefa.usuario_id if hasattr(objTarefa, 'usuario_id') else None,
-            )
-
-            insert_id = self.__database.execute_query(SQL, params)
+            params = self.__paramsTarefa(objTarefa)
+
+            insert_id = (tx or self.__database).execute_query(SQL, params)
             
             if not insert_id:
                 raise Exception("Falha ao inserir tarefa")
             return insert_id
             
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.create(): {e}")
+            # 1452 = ER_NO_REFERENCED_ROW_2 (FK inexistente)
+            if getattr(e, "errno", None) == 1452 or "FOREIGN KEY constraint" in str(e):
+                raise ValueError(f"Projeto com ID {objTarefa.projeto_id} não existe")
+            logger.error("Erro em TarefaDAO.create(): %s", e)
+            raise
+
+    def exists(self, id: int, tx=None) -> bool:
+        logger.debug("TarefaDAO.exists()")
+        try:
+            # ✅ Só verifica a existência: não faz JOIN nem carrega colunas
+            SQL = "SELECT 1 FROM tarefas WHERE id = %s LIMIT 1"
+            rows = (tx or self.__database).execute_query(SQL, (id,), fetch=True)
+            return len(rows) > 0
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.exists(): %s", e)
             raise
 
-    def delete(self, id: int) -> bool:
-        print("🟢 TarefaDAO.delete()")
+    def delete(self, id: int, tx=None) -> bool:
+        logger.debug("TarefaDAO.delete()")
         try:
             SQL = "DELETE FROM tarefas WHERE id = %s"
-            affected = self.__database.execute_query(SQL, (id,))
+            affected = (tx or self.__database).execute_query(SQL, (id,))
             return affected > 0
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.delete(): {e}")
+            logger.error("Erro em TarefaDAO.delete(): %s", e)
             raise
 
-    def update(self, objTarefa: Tarefa) -> bool:
-        print("🟢 TarefaDAO.update()")
+    def update(self, objTarefa: Tarefa, tx=None) -> bool:
+        logger.debug("TarefaDAO.update()")
         try:
             # ✅ CORREÇÃO: Query atualizada com as novas colunas
             SQL = """
@@ -64,317 +116,373 @@ class TarefaDAO:
                     data_limite=%s, data_inicio=%s, data_fim=%s, projeto_id=%s, usuario_id=%s 
                 WHERE id=%s
             """
-            params = (
-                objTarefa.titulo,
-                objTarefa.descricao if hasattr(objTarefa, 'descricao') else "",
-                objTarefa.status if hasattr(objTarefa, 'status') else "pendente",
-                objTarefa.prioridade if hasattr(objTarefa, 'prioridade') else "media",
-                objTarefa.concluida,
-                objTarefa.data_limite,
-                objTarefa.data_inicio if hasattr(objTarefa, 'data_inicio') else None,
-                objTarefa.data_fim if hasattr(objTarefa, 'data_fim') else None,
-                objTarefa.projeto_id,
-                objTarefa.usuario_id if hasattr(objTarefa, 'usuario_id') else None,
-                objTarefa.id,
-            )
-
-            affected = self.__database.execute_query(SQL, params)
+            params = self.__paramsTarefa(objTarefa) + (objTarefa.id,)
+
+            affected = (tx or self.__database).execute_query(SQL, params)
             return affected > 0
             
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.update(): {e}")
+            logger.error("Erro em TarefaDAO.update(): %s", e)
             raise
 
-    def findAll(self) -> list[dict]:
-        print("🟢 TarefaDAO.findAll()")
+    def createMany(self, tarefas: list[Tarefa], tx=None) -> list[int]:
+        """
+        Insere várias tarefas com um único executemany (uma transação).
+
+        :param tarefas: list[Tarefa]
+        :return: list[int] - IDs gerados, na mesma ordem da lista recebida
+        """
+        logger.debug("TarefaDAO.createMany()")
         try:
-            # ✅ CORREÇÃO: Query atualizada com LEFT JOIN e tratamento seguro de datas
             SQL = """
-                SELECT 
-                    t.id, 
-                    t.titulo,
-                    t.descricao,
-                    t.status,
-                    t.prioridade,
-                    t.concluida, 
-                    t.data_limite, 
-                    t.data_inicio,
-                    t.data_fim,
-                    t.projeto_id,
-                    t.usuario_id,
-                    p.nome as projeto_nome,
-                    u.nome as usuario_nome
-                FROM tarefas t
-                LEFT JOIN projetos p ON t.projeto_id = p.id
-                LEFT JOIN usuarios u ON t.usuario_id = u.id
-                ORDER BY t.id DESC
+                INSERT INTO tarefas 
+                (titulo, descricao, status, prioridade, concluida, data_limite, data_inicio, data_fim, projeto_id, usuario_id) 
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
-            rows = self.__database.execute_query(SQL, fetch=True)
+            seq_params = [self.__paramsTarefa(objTarefa) for objTarefa in tarefas]
+
+            # Um INSERT de várias linhas recebe um intervalo contíguo de AUTO_INCREMENT
+            first_id = (tx or self.__database).execute_many(SQL, seq_params)
+            if not first_id:
+                raise Exception("Falha ao inserir tarefas em lote")
+            return [first_id + i for i in range(len(tarefas))]
 
-            tarefas = []
-            for row in rows:
-                tarefa_data = {
-                    "id": row["id"],
-                    "titulo": row["titulo"],
-                    "descricao": row["descricao"],
-                    "status": row["status"],
-                    "prioridade": row["prioridade"],
-                    "concluida": bool(row["concluida"]),
-                    "projeto_id": row["projeto_id"],
-                    "projeto_nome": row["projeto_nome"],
-                    "usuario_id": row["usuario_id"],
-                    "usuario_nome": row["usuario_nome"]
-                }
-                
-                # ✅ CORREÇÃO: Tratamento seguro para datas
-                if row["data_limite"]:
-                    if hasattr(row["data_limite"], 'isoformat'):
-                        tarefa_data["data_limite"] = row["data_limite"].isoformat()
-                    else:
-                        tarefa_data["data_limite"] = str(row["data_limite"])
-                else:
-                    tarefa_data["data_limite"] = None
-                    
-                if row["data_inicio"]:
-                    if hasattr(row["data_inicio"], 'isoformat'):
-                        tarefa_data["data_inicio"] = row["data_inicio"].isoformat()
-                    else:
-                        tarefa_data["data_inicio"] = str(row["data_inicio"])
-                else:
-                    tarefa_data["data_inicio"] = None
-                    
-                if row["data_fim"]:
-                    if hasattr(row["data_fim"], 'isoformat'):
-                        tarefa_data["data_fim"] = row["data_fim"].isoformat()
-                    else:
-                        tarefa_data["data_fim"] = str(row["data_fim"])
-                else:
-                    tarefa_data["data_fim"] = None
-                
-                tarefas.append(tarefa_data)
-                
-            return tarefas
-            
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.findAll(): {e}")
+            if getattr(e, "errno", None) == 1452 or "FOREIGN KEY constraint" in str(e):
+                raise ValueError("Projeto informado em alguma tarefa do lote não existe")
+            logger.error("Erro em TarefaDAO.createMany(): %s", e)
             raise
 
-    def findById(self, id: int) -> dict | None:
-        print("✅ TarefaDAO.findById()")
+    def updateMany(self, tarefas: list[Tarefa], tx=None) -> int:
+        """
+        Atualiza várias tarefas com um único executemany (uma transação).
+
+        :param tarefas: list[Tarefa] - cada objeto deve ter id
+        :return: int - linhas afetadas
+        """
+        logger.debug("TarefaDAO.updateMany()")
+        try:
+            SQL = """
+                UPDATE tarefas 
+                SET titulo=%s, descricao=%s, status=%s, prioridade=%s, concluida=%s, 
+                    data_limite=%s, data_inicio=%s, data_fim=%s, projeto_id=%s, usuario_id=%s 
+                WHERE id=%s
+            """
+            seq_params = [self.__paramsTarefa(objTarefa) + (objTarefa.id,) for objTarefa in tarefas]
+            return (tx or self.__database).execute_many(SQL, seq_params)
+
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.updateMany(): %s", e)
+            raise
+
+    def deleteMany(self, ids: list[int], tx=None) -> int:
+        """
+        Remove várias tarefas com um único DELETE ... WHERE id IN (...).
+
+        :param ids: list[int]
+        :return: int - linhas removidas
+        """
+        logger.debug("TarefaDAO.deleteMany()")
+        try:
+            if not ids:
+                return 0
+            placeholders = ", ".join(["%s"] * len(ids))
+            SQL = f"DELETE FROM tarefas WHERE id IN ({placeholders})"
+            return (tx or self.__database).execute_query(SQL, tuple(ids))
+
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.deleteMany(): %s", e)
+            raise
+
+    def findExistingIds(self, ids: list[int], tx=None) -> set[int]:
+        """
+        Dentre os IDs informados, retorna os que existem (uma única consulta).
+
+        :param ids: list[int]
+        :return: set[int]
+        """
+        logger.debug("TarefaDAO.findExistingIds()")
+        try:
+            if not ids:
+                return set()
+            placeholders = ", ".join(["%s"] * len(ids))
+            SQL = f"SELECT id FROM tarefas WHERE id IN ({placeholders})"
+            rows = (tx or self.__database).execute_query(SQL, tuple(ids), fetch=True)
+            return {row["id"] for row in rows}
+
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.findExistingIds(): %s", e)
+            raise
+
+    def __paramsTarefa(self, objTarefa: Tarefa) -> tuple:
+        """
+        Monta os parâmetros de INSERT/UPDATE na ordem das colunas.
+        """
+        return (
+            objTarefa.titulo,
+            objTarefa.descricao if hasattr(objTarefa, 'descricao') else "",
+            objTarefa.status if hasattr(objTarefa, 'status') else "pendente",
+            objTarefa.prioridade if hasattr(objTarefa, 'prioridade') else "media",
+            objTarefa.concluida,
+            objTarefa.data_limite,
+            objTarefa.data_inicio if hasattr(objTarefa, 'data_inicio') else None,
+            objTarefa.data_fim if hasattr(objTarefa, 'data_fim') else None,
+            objTarefa.projeto_id,
+            objTarefa.usuario_id if hasattr(objTarefa, 'usuario_id') else None,
+        )
+
+    def findAll(self, limit: int, after_id: int | None = None, filtros=None,
+                offset: int | None = None) -> list[dict]:
+        """
+        Lista tarefas com paginação por cursor (keyset) em t.id, da mais nova
+        para a mais antiga, aplicando filtros, ordenação e projeção da
+        query string (ver CONSULTA).
+
+        :param limit: int - quantidade máxima de linhas retornadas
+        :param after_id: int - cursor; retorna apenas tarefas com id menor que ele
+        :param filtros: Mapping - parâmetros da query string (status, sort, fields...)
+        :param offset: int - deslocamento; usado quando há sort (sem cursor)
+        :return: list[dict] - só com os campos projetados
+        :raises ValueError: filtro, campo ou ordenação fora da lista branca
+        """
+        logger.debug("TarefaDAO.findAll()")
+        try:
+            # ✅ Keyset em t.id: usa o índice da PK e não lê as páginas anteriores
+            return self.__consultar(filtros, limit, after_id, offset)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.findAll(): %s", e)
+            raise
+
+    def findDoUsuario(self, usuario_id: int, limit: int, after_id: int | None = None, filtros=None,
+                      offset: int | None = None) -> list[dict]:
+        """
+        Lista as tarefas dos projetos do usuário (projetos.usuario_id) em uma
+        única consulta com JOIN: o otimizador parte de idx_projetos_usuario_id
+        e chega às tarefas por idx_tarefas_projeto_id. Mesmos filtros,
+        paginação e projeção de findAll().
+
+        :param usuario_id: int - dono dos projetos (usuário autenticado)
+        :return: list[dict] - só com os campos projetados
+        :raises ValueError: filtro, campo ou ordenação fora da lista branca
+        """
+        logger.debug("TarefaDAO.findDoUsuario()")
+        try:
+            escopo = ("projeto", "p.usuario_id = %s", (usuario_id,))
+            return self.__consultar(filtros, limit, after_id, offset, escopo)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.findDoUsuario(): %s", e)
+            raise
+
+    def iterAll(self, batch_size: int = 500, filtros=None):
+        """
+        Percorre todas as tarefas sob demanda (generator), lendo do cursor
+        em lotes. Usado pelas respostas em streaming; aceita os mesmos
+        filtros de findAll().
+        """
+        logger.debug("TarefaDAO.iterAll()")
+        SQL, params, _ = self.CONSULTA.montar(filtros)
+        for colunas, lote in self.__database.stream_batches(SQL, params, batch_size=batch_size):
+            yield from self.CONSULTA.mapear(colunas, lote)
+
+    def versaoAll(self, filtros=None) -> dict:
+        """
+        Versão da listagem de findAll() com os mesmos filtros: quantidade de
+        linhas e maior atualizado_em (da tabela e das junções projetadas).
+        Não lê nem formata as linhas; usada para ETag/304.
+
+        :return: dict {"total": int, "marcas": list[datetime | None]}
+        :raises ValueError: filtro, campo ou ordenação fora da lista branca
+        """
+        logger.debug("TarefaDAO.versaoAll()")
+        return self.__versaoLista(filtros)
+
+    def versaoDoUsuario(self, usuario_id: int, filtros=None) -> dict:
+        """
+        Versão da listagem de findDoUsuario() (mesmo escopo e filtros).
+
+        :return: dict {"total": int, "marcas": list[datetime | None]}
+        :raises ValueError: filtro, campo ou ordenação fora da lista branca
+        """
+        logger.debug("TarefaDAO.versaoDoUsuario()")
+        return self.__versaoLista(filtros, ("projeto", "p.usuario_id = %s", (usuario_id,)))
+
+    def versao(self, id: int) -> list | None:
+        """
+        Colunas de versão (atualizado_em) da tarefa e das linhas cujos nomes
+        entram em findById(), lidas pela PK. None se a tarefa não existe.
+        """
+        logger.debug("TarefaDAO.versao()")
         try:
             SQL = """
-                SELECT 
-                    t.id, 
-                    t.titulo,
-                    t.descricao,
-                    t.status,
-                    t.prioridade,
-                    t.concluida, 
-                    t.data_limite, 
-                    t.data_inicio,
-                    t.data_fim,
-                    t.projeto_id,
-                    t.usuario_id,
-                    p.nome as projeto_nome,
-                    u.nome as usuario_nome
+                SELECT t.atualizado_em AS versao_tarefa,
+                       p.atualizado_em AS versao_projeto,
+                       u.atualizado_em AS versao_usuario
                 FROM tarefas t
                 LEFT JOIN projetos p ON t.projeto_id = p.id
                 LEFT JOIN usuarios u ON t.usuario_id = u.id
                 WHERE t.id = %s
             """
             rows = self.__database.execute_query(SQL, (id,), fetch=True)
-            
             if not rows:
                 return None
-                
-            row = rows[0]
-            tarefa_data = {
-                "id": row["id"],
-                "titulo": row["titulo"],
-                "descricao": row["descricao"],
-                "status": row["status"],
-                "prioridade": row["prioridade"],
-                "concluida": bool(row["concluida"]),
-                "projeto_id": row["projeto_id"],
-                "projeto_nome": row["projeto_nome"],
-                "usuario_id": row["usuario_id"],
-                "usuario_nome": row["usuario_nome"]
-            }
-            
-            # ✅ CORREÇÃO: Tratamento seguro para datas
-            if row["data_limite"]:
-                if hasattr(row["data_limite"], 'isoformat'):
-                    tarefa_data["data_limite"] = row["data_limite"].isoformat()
-                else:
-                    tarefa_data["data_limite"] = str(row["data_limite"])
-            else:
-                tarefa_data["data_limite"] = None
-                
-            if row["data_inicio"]:
-                if hasattr(row["data_inicio"], 'isoformat'):
-                    tarefa_data["data_inicio"] = row["data_inicio"].isoformat()
-                else:
-                    tarefa_data["data_inicio"] = str(row["data_inicio"])
-            else:
-                tarefa_data["data_inicio"] = None
-                
-            if row["data_fim"]:
-                if hasattr(row["data_fim"], 'isoformat'):
-                    tarefa_data["data_fim"] = row["data_fim"].isoformat()
-                else:
-                    tarefa_data["data_fim"] = str(row["data_fim"])
-            else:
-                tarefa_data["data_fim"] = None
-                
-            return tarefa_data
-            
+            return list(rows[0].values())
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.findById(): {e}")
+            logger.error("Erro em TarefaDAO.versao(): %s", e)
+            raise
+
+    def __versaoLista(self, filtros, escopo: tuple = None) -> dict:
+        try:
+            SQL, params = self.CONSULTA.montar_versao(filtros, escopo)
+            row = self.__database.execute_query(SQL, params, fetch=True)[0]
+            marcas = [valor for chave, valor in row.items() if chave.startswith("versao_")]
+            return {"total": row["total"], "marcas": marcas}
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.__versaoLista(): %s", e)
+            raise
+
+    def __consultar(self, filtros=None, limit: int = None, after_id: int = None,
+                    offset: int = None, escopo: tuple = None) -> list[dict]:
+        """
+        SELECT de CONSULTA lido com cursor de tuplas e convertido em dicts
+        de uma vez (CONSULTA.mapear). Sem filtros: todos os campos, id decrescente.
+        """
+        SQL, params, _ = self.CONSULTA.montar(filtros, limit, after_id, offset, escopo)
+        colunas, linhas = self.__database.fetch_rows(SQL, params)
+        return self.CONSULTA.mapear(colunas, linhas)
+
+    def findById(self, id: int) -> dict | None:
+        logger.debug("TarefaDAO.findById()")
+        try:
+            linhas = self.__consultar(escopo=(None, "t.id = %s", (id,)))
+            return linhas[0] if linhas else None
+
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.findById(): %s", e)
             raise
 
     def findByField(self, campo: str, valor) -> list[dict]:
-        print(f"🟢 TarefaDAO.findByField() - Campo: {campo}, Valor: {valor}")
+        logger.debug("TarefaDAO.findByField() - Campo: %s, Valor: %s", campo, valor)
         try:
             allowedFields = ["id", "titulo", "concluida", "projeto_id", "status", "usuario_id"]
             if campo not in allowedFields:
                 raise ValueError("Campo inválido para busca")
 
+            return self.__consultar(escopo=(None, f"t.{campo} = %s", (valor,)))
+
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.findByField(): %s", e)
+            raise
+
+    def contarPorStatus(self, contadores: bool = False) -> list[dict]:
+        """
+        Total de tarefas e de concluídas por status (GROUP BY).
+
+        :param contadores: bool - True soma a tabela contadores_tarefas (migração
+                           0003, mantida por triggers) em vez de varrer tarefas
+        :return: list[dict] - {"status", "total", "concluidas"}; status nulo vem como ""
+        """
+        logger.debug("TarefaDAO.contarPorStatus()")
+        try:
+            if contadores:
+                SQL = """
+                    SELECT status, SUM(total) AS total, SUM(concluidas) AS concluidas
+                    FROM contadores_tarefas
+                    GROUP BY status
+                """
+            else:
+                SQL = """
+                    SELECT COALESCE(status, '') AS status, COUNT(*) AS total,
+                           COALESCE(SUM(concluida), 0) AS concluidas
+                    FROM tarefas
+                    GROUP BY COALESCE(status, '')
+                """
+            rows = self.__database.execute_query(SQL, fetch=True)
+            return [
+                {"status": row["status"], "total": int(row["total"]), "concluidas": int(row["concluidas"])}
+                for row in rows
+            ]
+
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.contarPorStatus(): %s", e)
+            raise
+
+    def contarAtrasadas(self, agora: datetime) -> int:
+        """
+        Tarefas não concluídas com data_limite anterior a `agora`
+        (faixa em idx_tarefas_concluida_data_limite).
+        """
+        logger.debug("TarefaDAO.contarAtrasadas()")
+        try:
+            SQL = """
+                SELECT COUNT(*) AS total
+                FROM tarefas
+                WHERE concluida = FALSE AND data_limite < %s
+            """
+            rows = self.__database.execute_query(SQL, (agora,), fetch=True)
+            return int(rows[0]["total"]) if rows else 0
+
+        except Exception as e:
+            logger.error("Erro em TarefaDAO.contarAtrasadas(): %s", e)
+            raise
+
+    def contarPorProjeto(self, limite: int, contadores: bool = False) -> list[dict]:
+        """
+        Total de tarefas e de concluídas dos `limite` projetos mais recentes.
+
+        :param limite: int - quantidade de projetos (os de maior id)
+        :param contadores: bool - True lê de contadores_tarefas em vez de tarefas
+        :return: list[dict] - {"id", "nome", "total", "concluidas"}, do mais novo ao mais antigo
+        """
+        logger.debug("TarefaDAO.contarPorProjeto()")
+        try:
+            if contadores:
+                juncao = "LEFT JOIN contadores_tarefas c ON c.projeto_id = p.id"
+                colunas = "COALESCE(SUM(c.total), 0) AS total, COALESCE(SUM(c.concluidas), 0) AS concluidas"
+            else:
+                juncao = "LEFT JOIN tarefas t ON t.projeto_id = p.id"
+                colunas = "COUNT(t.id) AS total, COALESCE(SUM(t.concluida), 0) AS concluidas"
             SQL = f"""
-                SELECT 
-                    t.*,
-                    p.nome as projeto_nome,
-                    u.nome as usuario_nome
-                FROM tarefas t
-                LEFT JOIN projetos p ON t.projeto_id = p.id
-                LEFT JOIN usuarios u ON t.usuario_id = u.id
-                WHERE t.{campo} = %s
+                SELECT p.id, p.nome, {colunas}
+                FROM (SELECT id, nome FROM projetos ORDER BY id DESC LIMIT %s) p
+                {juncao}
+                GROUP BY p.id, p.nome
+                ORDER BY p.id DESC
             """
-            resultados = self.__database.execute_query(SQL, (valor,), fetch=True)
-            
-            tarefas = []
-            for row in resultados:
-                tarefa_data = {
-                    "id": row["id"],
-                    "titulo": row["titulo"],
-                    "descricao": row["descricao"],
-                    "status": row["status"],
-                    "prioridade": row["prioridade"],
-                    "concluida": bool(row["concluida"]),
-                    "projeto_id": row["projeto_id"],
-                    "projeto_nome": row["projeto_nome"],
-                    "usuario_id": row["usuario_id"],
-                    "usuario_nome": row["usuario_nome"]
-                }
-                
-                # Tratamento seguro para datas
-                if row["data_limite"]:
-                    if hasattr(row["data_limite"], 'isoformat'):
-                        tarefa_data["data_limite"] = row["data_limite"].isoformat()
-                    else:
-                        tarefa_data["data_limite"] = str(row["data_limite"])
-                else:
-                    tarefa_data["data_limite"] = None
-                    
-                if row["data_inicio"]:
-                    if hasattr(row["data_inicio"], 'isoformat'):
-                        tarefa_data["data_inicio"] = row["data_inicio"].isoformat()
-                    else:
-                        tarefa_data["data_inicio"] = str(row["data_inicio"])
-                else:
-                    tarefa_data["data_inicio"] = None
-                    
-                if row["data_fim"]:
-                    if hasattr(row["data_fim"], 'isoformat'):
-                        tarefa_data["data_fim"] = row["data_fim"].isoformat()
-                    else:
-                        tarefa_data["data_fim"] = str(row["data_fim"])
-                else:
-                    tarefa_data["data_fim"] = None
-                
-                tarefas.append(tarefa_data)
-                
-            return tarefas
-            
+            rows = self.__database.execute_query(SQL, (limite,), fetch=True)
+            return [
+                {"id": row["id"], "nome": row["nome"],
+                 "total": int(row["total"]), "concluidas": int(row["concluidas"])}
+                for row in rows
+            ]
+
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.findByField(): {e}")
+            logger.error("Erro em TarefaDAO.contarPorProjeto(): %s", e)
             raise
 
     def findByProjetoId(self, projeto_id: int) -> list[dict]:
-        print("🟢 TarefaDAO.findByProjetoId()")
+        logger.debug("TarefaDAO.findByProjetoId()")
         try:
-            SQL = """
-                SELECT 
-                    t.id, 
-                    t.titulo,
-                    t.descricao,
-                    t.status,
-                    t.prioridade,
-                    t.concluida, 
-                    t.data_limite, 
-                    t.data_inicio,
-                    t.data_fim,
-                    t.projeto_id,
-                    t.usuario_id,
-                    p.nome as projeto_nome
-                FROM tarefas t
-                LEFT JOIN projetos p ON t.projeto_id = p.id
-                WHERE t.projeto_id = %s
-            """
-            rows = self.__database.execute_query(SQL, (projeto_id,), fetch=True)
-
-            tarefas = []
-            for row in rows:
-                tarefa_data = {
-                    "id": row["id"],
-                    "titulo": row["titulo"],
-                    "descricao": row["descricao"],
-                    "status": row["status"],
-                    "prioridade": row["prioridade"],
-                    "concluida": bool(row["concluida"]),
-                    "projeto_id": row["projeto_id"],
-                    "projeto_nome": row["projeto_nome"],
-                    "usuario_id": row["usuario_id"]
-                }
-                
-                # Tratamento seguro para datas
-                if row["data_limite"]:
-                    if hasattr(row["data_limite"], 'isoformat'):
-                        tarefa_data["data_limite"] = row["data_limite"].isoformat()
-                    else:
-                        tarefa_data["data_limite"] = str(row["data_limite"])
-                else:
-                    tarefa_data["data_limite"] = None
-                    
-                if row["data_inicio"]:
-                    if hasattr(row["data_inicio"], 'isoformat'):
-                        tarefa_data["data_inicio"] = row["data_inicio"].isoformat()
-                    else:
-                        tarefa_data["data_inicio"] = str(row["data_inicio"])
-                else:
-                    tarefa_data["data_inicio"] = None
-                    
-                if row["data_fim"]:
-                    if hasattr(row["data_fim"], 'isoformat'):
-                        tarefa_data["data_fim"] = row["data_fim"].isoformat()
-                    else:
-                        tarefa_data["data_fim"] = str(row["data_fim"])
-                else:
-                    tarefa_data["data_fim"] = None
-                
-                tarefas.append(tarefa_data)
-                
-            return tarefas
-            
+            # idx_tarefas_projeto_id (projeto_id, id) atende o filtro e a ordem
+            return self.__consultar(escopo=(None, "t.projeto_id = %s", (projeto_id,)))
+
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.findByProjetoId(): {e}")
+            logger.error("Erro em TarefaDAO.findByProjetoId(): %s", e)
             raise
 
-    def marcarComoConcluida(self, id: int) -> bool:
-        print("🟢 TarefaDAO.marcarComoConcluida()")
+    def marcarComoConcluida(self, id: int, tx=None) -> bool:
+        logger.debug("TarefaDAO.marcarComoConcluida()")
         try:
             SQL = "UPDATE tarefas SET concluida = TRUE WHERE id = %s"
-            affected = self.__database.execute_query(SQL, (id,))
+            affected = (tx or self.__database).execute_query(SQL, (id,))
             return affected > 0
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.marcarComoConcluida(): {e}")
+            logger.error("Erro em TarefaDAO.marcarComoConcluida(): %s", e)
             raise
\ No newline at end of file
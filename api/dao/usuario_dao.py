@@ -1,16 +1,22 @@
 # dao/usuario_dao.py
-from datetime import datetime
+import logging
+from api.dao.mapeador_linhas import MapeadorLinhas
 from api.model.usuario import Usuario
 
+logger = logging.getLogger(__name__)
+
 class UsuarioDAO:
+    # Listagens sem conversão de colunas: cada linha vira dict direto da tupla
+    MAPEADOR = MapeadorLinhas()
+
     def __init__(self, database_dependency):
-        print("⬆️  UsuarioDAO.__init__()")
+        logger.debug("UsuarioDAO.__init__()")
         self.__database = database_dependency
         self._create_tables()
 
     def _create_tables(self):
         """Cria as tabelas necessárias se não existirem"""
-        print("🟢 UsuarioDAO._create_tables()")
+        logger.debug("UsuarioDAO._create_tables()")
         try:
             # ✅ CORREÇÃO: Sintaxe MySQL para criar tabela
             SQL = '''
@@ -23,19 +29,19 @@ class UsuarioDAO:
                 )
             '''
             self.__database.execute_query(SQL)
-            print("✅ Tabela 'usuarios' criada/verificada com sucesso!")
+            logger.info("Tabela 'usuarios' criada/verificada com sucesso!")
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO._create_tables(): {e}")
+            logger.error("Erro em UsuarioDAO._create_tables(): %s", e)
             # Não levanta exceção para evitar que a aplicação pare
             # A tabela pode já existir
 
-    def create(self, usuario: Usuario) -> int:
+    def create(self, usuario: Usuario, tx=None) -> int:
         """
         Cria um novo usuário no banco de dados
         :param usuario: Objeto Usuario
         :return: ID do usuário criado
         """
-        print("🟢 UsuarioDAO.create()")
+        logger.debug("UsuarioDAO.create()")
         try:
             SQL = '''
                 INSERT INTO usuarios (nome, email, senha_hash, data_criacao)
@@ -48,7 +54,7 @@ class UsuarioDAO:
                 usuario.data_criacao.strftime('%Y-%m-%d %H:%M:%S')
             )
 
-            insert_id = self.__database.execute_query(SQL, params)
+            insert_id = (tx or self.__database).execute_query(SQL, params)
             
             if not insert_id:
                 raise Exception("Falha ao inserir usuário")
@@ -57,7 +63,7 @@ class UsuarioDAO:
         except Exception as e:
             if "Duplicate entry" in str(e) or "UNIQUE constraint" in str(e):
                 raise ValueError("Email já cadastrado")
-            print(f"❌ Erro em UsuarioDAO.create(): {e}")
+            logger.error("Erro em UsuarioDAO.create(): %s", e)
             raise
 
     def find_by_id(self, usuario_id: int) -> Usuario | None:
@@ -66,7 +72,7 @@ class UsuarioDAO:
         :param usuario_id: ID do usuário
         :return: Objeto Usuario ou None
         """
-        print("✅ UsuarioDAO.find_by_id()")
+        logger.debug("UsuarioDAO.find_by_id()")
         try:
             SQL = '''
                 SELECT id, nome, email, senha_hash, data_criacao 
@@ -77,24 +83,43 @@ class UsuarioDAO:
             if not rows:
                 return None
 
-            row = rows[0]
-            usuario = Usuario()
-            usuario.id = row["id"]
-            usuario.nome = row["nome"]
-            usuario.email = row["email"]
-            usuario.senha_hash = row["senha_hash"]
-            
-            # Converter string para datetime
-            if row["data_criacao"]:
-                if hasattr(row["data_criacao"], 'isoformat'):
-                    usuario.data_criacao = row["data_criacao"]
-                else:
-                    usuario.data_criacao = datetime.strptime(str(row["data_criacao"]), '%Y-%m-%d %H:%M:%S')
-            
-            return usuario
+            # Linha do banco: monta direto, sem revalidar nos setters
+            return Usuario.from_row(rows[0])
 
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO.find_by_id(): {e}")
+            logger.error("Erro em UsuarioDAO.find_by_id(): %s", e)
+            raise
+
+    def exists(self, usuario_id: int, tx=None) -> bool:
+        """
+        Verifica se existe usuário com o ID informado, sem carregar a linha
+        :param usuario_id: ID do usuário
+        :return: Boolean
+        """
+        logger.debug("UsuarioDAO.exists()")
+        try:
+            SQL = 'SELECT 1 FROM usuarios WHERE id = %s LIMIT 1'
+            rows = (tx or self.__database).execute_query(SQL, (usuario_id,), fetch=True)
+            return len(rows) > 0
+
+        except Exception as e:
+            logger.error("Erro em UsuarioDAO.exists(): %s", e)
+            raise
+
+    def email_exists(self, email: str, tx=None) -> bool:
+        """
+        Verifica se o email já está cadastrado, sem carregar a linha
+        :param email: Email do usuário
+        :return: Boolean
+        """
+        logger.debug("UsuarioDAO.email_exists()")
+        try:
+            SQL = 'SELECT 1 FROM usuarios WHERE email = %s LIMIT 1'
+            rows = (tx or self.__database).execute_query(SQL, (email,), fetch=True)
+            return len(rows) > 0
+
+        except Exception as e:
+            logger.error("Erro em UsuarioDAO.email_exists(): %s", e)
             raise
 
     def find_by_email(self, email: str) -> Usuario | None:
@@ -103,7 +128,7 @@ class UsuarioDAO:
         :param email: Email do usuário
         :return: Objeto Usuario ou None
         """
-        print("🟢 UsuarioDAO.find_by_email()")
+        logger.debug("UsuarioDAO.find_by_email()")
         try:
             SQL = '''
                 SELECT id, nome, email, senha_hash, data_criacao 
@@ -114,69 +139,68 @@ class UsuarioDAO:
             if not rows:
                 return None
 
-            row = rows[0]
-            usuario = Usuario()
-            usuario.id = row["id"]
-            usuario.nome = row["nome"]
-            usuario.email = row["email"]
-            usuario.senha_hash = row["senha_hash"]
-            
-            # Converter string para datetime
-            if row["data_criacao"]:
-                if hasattr(row["data_criacao"], 'isoformat'):
-                    usuario.data_criacao = row["data_criacao"]
-                else:
-                    usuario.data_criacao = datetime.strptime(str(row["data_criacao"]), '%Y-%m-%d %H:%M:%S')
-            
-            return usuario
+            # Linha do banco: monta direto, sem revalidar nos setters
+            return Usuario.from_row(rows[0])
 
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO.find_by_email(): {e}")
+            logger.error("Erro em UsuarioDAO.find_by_email(): %s", e)
             raise
 
-    def find_all(self) -> list[Usuario]:
+    def count_all(self) -> int:
         """
-        Retorna todos os usuários
-        :return: Lista de objetos Usuario
+        Quantidade de usuários cadastrados
+        :return: int
+        """
+        logger.debug("UsuarioDAO.count_all()")
+        try:
+            SQL = 'SELECT COUNT(*) AS total FROM usuarios'
+            rows = self.__database.execute_query(SQL, fetch=True)
+            return int(rows[0]["total"]) if rows else 0
+
+        except Exception as e:
+            logger.error("Erro em UsuarioDAO.count_all(): %s", e)
+            raise
+
+    def find_all(self) -> list[dict]:
+        """
+        Retorna todos os usuários, sem senha_hash
+        :return: Lista de dict (id, nome, email, data_criacao)
         """
-        print("🟢 UsuarioDAO.find_all()")
+        logger.debug("UsuarioDAO.find_all()")
         try:
             SQL = '''
-                SELECT id, nome, email, senha_hash, data_criacao 
+                SELECT id, nome, email, data_criacao
                 FROM usuarios ORDER BY id
             '''
-            rows = self.__database.execute_query(SQL, fetch=True)
-
-            usuarios = []
-            for row in rows:
-                usuario = Usuario()
-                usuario.id = row["id"]
-                usuario.nome = row["nome"]
-                usuario.email = row["email"]
-                usuario.senha_hash = row["senha_hash"]
-                
-                # Converter string para datetime
-                if row["data_criacao"]:
-                    if hasattr(row["data_criacao"], 'isoformat'):
-                        usuario.data_criacao = row["data_criacao"]
-                    else:
-                        usuario.data_criacao = datetime.strptime(str(row["data_criacao"]), '%Y-%m-%d %H:%M:%S')
-                
-                usuarios.append(usuario)
-
-            return usuarios
+            colunas, linhas = self.__database.fetch_rows(SQL)
+            return self.MAPEADOR.mapear(colunas, linhas)
 
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO.find_all(): {e}")
+            logger.error("Erro em UsuarioDAO.find_all(): %s", e)
             raise
 
-    def update(self, usuario: Usuario) -> bool:
+    def iter_all(self, batch_size: int = 500):
+        """
+        Percorre todos os usuários sob demanda, lendo do cursor em lotes.
+        Não expõe senha_hash: devolve dicts prontos para serialização.
+        :param batch_size: Quantidade de linhas lidas por fetchmany
+        :return: Generator de dict
+        """
+        logger.debug("UsuarioDAO.iter_all()")
+        SQL = '''
+            SELECT id, nome, email, data_criacao
+            FROM usuarios ORDER BY id
+        '''
+        for colunas, lote in self.__database.stream_batches(SQL, batch_size=batch_size):
+            yield from self.MAPEADOR.mapear(colunas, lote)
+
+    def update(self, usuario: Usuario, tx=None) -> bool:
         """
         Atualiza usuário
         :param usuario: Objeto Usuario
         :return: Boolean indicando sucesso
         """
-        print("🟢 UsuarioDAO.update()")
+        logger.debug("UsuarioDAO.update()")
         try:
             SQL = '''
                 UPDATE usuarios 
@@ -190,29 +214,29 @@ class UsuarioDAO:
                 usuario.id
             )
 
-            affected = self.__database.execute_query(SQL, params)
+            affected = (tx or self.__database).execute_query(SQL, params)
             return affected > 0
 
         except Exception as e:
             if "Duplicate entry" in str(e) or "UNIQUE constraint" in str(e):
                 raise ValueError("Email já cadastrado")
-            print(f"❌ Erro em UsuarioDAO.update(): {e}")
+            logger.error("Erro em UsuarioDAO.update(): %s", e)
             raise
 
-    def delete(self, usuario_id: int) -> bool:
+    def delete(self, usuario_id: int, tx=None) -> bool:
         """
         Exclui usuário por ID
         :param usuario_id: ID do usuário
         :return: Boolean indicando sucesso
         """
-        print("🟢 UsuarioDAO.delete()")
+        logger.debug("UsuarioDAO.delete()")
         try:
             SQL = 'DELETE FROM usuarios WHERE id = %s'
-            affected = self.__database.execute_query(SQL, (usuario_id,))
+            affected = (tx or self.__database).execute_query(SQL, (usuario_id,))
             return affected > 0
 
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO.delete(): {e}")
+            logger.error("Erro em UsuarioDAO.delete(): %s", e)
             raise
 
     def find_by_field(self, campo: str, valor) -> list[Usuario]:
@@ -222,7 +246,7 @@ class UsuarioDAO:
         :param valor: Valor do campo
         :return: Lista de objetos Usuario
         """
-        print(f"🟢 UsuarioDAO.find_by_field() - Campo: {campo}, Valor: {valor}")
+        logger.debug("UsuarioDAO.find_by_field() - Campo: %s, Valor: %s", campo, valor)
         try:
             allowed_fields = ["id", "nome", "email"]
             if campo not in allowed_fields:
@@ -234,25 +258,8 @@ class UsuarioDAO:
             '''
             rows = self.__database.execute_query(SQL, (valor,), fetch=True)
 
-            usuarios = []
-            for row in rows:
-                usuario = Usuario()
-                usuario.id = row["id"]
-                usuario.nome = row["nome"]
-                usuario.email = row["email"]
-                usuario.senha_hash = row["senha_hash"]
-                
-                # Converter string para datetime
-                if row["data_criacao"]:
-                    if hasattr(row["data_criacao"], 'isoformat'):
-                        usuario.data_criacao = row["data_criacao"]
-                    else:
-                        usuario.data_criacao = datetime.strptime(str(row["data_criacao"]), '%Y-%m-%d %H:%M:%S')
-                
-                usuarios.append(usuario)
-
-            return usuarios
+            return [Usuario.from_row(row) for row in rows]
 
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO.find_by_field(): {e}")
+            logger.error("Erro em UsuarioDAO.find_by_field(): %s", e)
             raise
\ No newline at end of file
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import os
+import aiomysql
+from api.database.async_transaction import AsyncTransaction
+
+logger = logging.getLogger(__name__)
+
+
+# Transação ativa na task atual (permite aninhar com savepoints)
+_transacao_atual = ContextVar("transacao_async_atual", default=None)
+
+
+class AsyncMysqlDatabase:
+    """
+    Versão assíncrona (asyncio + aiomysql) de MysqlDatabase.
+
+    Uma consulta lenta não prende uma thread: enquanto espera o MySQL, a
+    task fica suspensa no event loop e o processo atende outras
+    requisições. O número de consultas simultâneas é limitado pelo
+    tamanho do pool (pool_size); as demais aguardam na fila do aiomysql.
+
+    O pool precisa ser criado dentro do event loop que vai usá-lo:
+    chame `await connect()` na inicialização do servidor ASGI.
+
+    As conexões ficam em autocommit: uma leitura não deixa transação aberta
+    (o aiomysql fecha, em vez de reaproveitar, conexões devolvidas no meio
+    de uma transação, e uma transação esquecida prenderia o snapshot do
+    REPEATABLE READ). Transações são explícitas (BEGIN) em transaction()
+    e execute_many().
+    """
+
+    def __init__(self, pool_size=20, host="127.0.0.1", user="root", password="",
+                 database="projeto", port=3306, pool_min_idle=1, pool_max_lifetime=1800):
+        """
+        :param pool_size: conexões simultâneas ao MySQL
+        :param pool_min_idle: conexões mantidas abertas
+        :param pool_max_lifetime: idade máxima (s) de uma conexão antes de ser reciclada
+        """
+        self.pool_size = pool_size
+        self.pool_min_idle = pool_min_idle
+        self.pool_max_lifetime = pool_max_lifetime
+        self.host = host
+        self.user = user
+        self.password = password
+        self.database = database
+        self.port = port
+        self.__pool = None
+
+    async def connect(self):
+        """
+        Cria (uma vez) e retorna o pool aiomysql.
+        """
+        if self.__pool is None:
+            logger.info("Iniciando pool assíncrono de conexões MySQL...")
+            try:
+                self.__pool = await aiomysql.create_pool(
+                    host=self.host,
+                    port=self.port,
+                    user=self.user,
+                    password=self.password,
+                    db=self.database,
+                    minsize=self.pool_min_idle,
+                    maxsize=self.pool_size,
+                    pool_recycle=self.pool_max_lifetime,
+                    autocommit=True
+                )
+                logger.info("Pool assíncrono conectado (banco: %s)", self.database)
+            except aiomysql.Error as err:
+                logger.error("Falha ao conectar ao MySQL: %s", err)
+                raise
+        return self.__pool
+
+    async def execute_query(self, query: str, params: tuple = None, fetch: bool = False):
+        """
+        Executa uma query e retorna os resultados (mesmo contrato de
+        MysqlDatabase.execute_query). Em autocommit: cada escrita é
+        confirmada sozinha e a leitura não abre transação.
+        """
+        pool = self.__pool or await self.connect()
+        async with pool.acquire() as conn:
+            try:
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute(query, params or ())
+                    if fetch:
+                        return await cursor.fetchall()
+                    return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+
+            except aiomysql.Error as err:
+                await conn.rollback()
+                logger.error("Erro ao executar query: %s", err)
+                raise
+
+    async def execute_many(self, query: str, seq_params: list):
+        """
+        Executa cursor.executemany em uma conexão e um único commit.
+        """
+        pool = self.__pool or await self.connect()
+        async with pool.acquire() as conn:
+            try:
+                await conn.begin()
+                async with conn.cursor() as cursor:
+                    await cursor.executemany(query, seq_params)
+                    await conn.commit()
+                    return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+
+            except aiomysql.Error as err:
+                await conn.rollback()
+                logger.error("Erro ao executar query em lote: %s", err)
+                raise
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Abre uma transação:
+
+            async with database.transaction() as tx:
+                await dao.metodo(..., tx=tx)
+
+        Dentro de outra transação da mesma task, vira um SAVEPOINT.
+        """
+        atual = _transacao_atual.get()
+        if atual is not None:
+            async with atual.savepoint():
+                yield atual
+            return
+
+        pool = self.__pool or await self.connect()
+        async with pool.acquire() as conn:
+            # a conexão está em autocommit: a transação começa aqui
+            await conn.begin()
+            tx = AsyncTransaction(conn)
+            token = _transacao_atual.set(tx)
+            try:
+                yield tx
+                await tx.commit()
+            except BaseException:
+                try:
+                    await tx.rollback()
+                except aiomysql.Error as err:
+                    logger.error("Erro ao desfazer transação: %s", err)
+                raise
+            finally:
+                _transacao_atual.reset(token)
+
+    async def test_connection(self) -> bool:
+        try:
+            rows = await self.execute_query("SELECT 1 AS test", fetch=True)
+            logger.info("Conexão assíncrona com MySQL testada com sucesso!")
+            return bool(rows)
+        except aiomysql.Error as err:
+            logger.error("Erro ao testar conexão: %s", err)
+            return False
+
+    def get_pool_status(self):
+        if self.__pool is None:
+            return {"status": "Pool não inicializado"}
+
+        return {
+            "status": "Ativo",
+            "database": self.database,
+            "pool_size": self.__pool.maxsize,
+            "open": self.__pool.size,
+            "idle": self.__pool.freesize,
+            "in_use": self.__pool.size - self.__pool.freesize,
+        }
+
+    async def close_pool(self):
+        if self.__pool is not None:
+            logger.info("Fechando pool assíncrono de conexões MySQL...")
+            self.__pool.close()
+            await self.__pool.wait_closed()
+            self.__pool = None
+            logger.info("Pool assíncrono fechado.")
+
+
+def create_async_database_instance():
+    """
+    Factory da versão assíncrona, com as mesmas variáveis de ambiente de
+    create_database_instance. O pool pode ser bem maior que o do servidor
+    WSGI, já que uma conexão em espera não ocupa uma thread.
+    """
+    config = {
+        'host': os.getenv('MYSQL_HOST', '127.0.0.1'),
+        'user': os.getenv('MYSQL_USER', 'root'),
+        'password': os.getenv('MYSQL_PASSWORD', ''),
+        'database': os.getenv('MYSQL_DATABASE', 'projeto'),
+        'port': int(os.getenv('MYSQL_PORT', '3306')),
+        'pool_size': int(os.getenv('MYSQL_ASYNC_POOL_SIZE', '20')),
+        'pool_min_idle': int(os.getenv('MYSQL_POOL_MIN_IDLE', '1')),
+        'pool_max_lifetime': int(float(os.getenv('MYSQL_POOL_MAX_LIFETIME', '1800')))
+    }
+
+    return AsyncMysqlDatabase(**config)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import logging
+from contextlib import asynccontextmanager
+import aiomysql
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Versão assíncrona de Transaction, usada por AsyncMysqlDatabase.
+
+Mantém uma conexão do pool aiomysql durante todo o bloco
+`async with database.transaction() as tx:` e expõe a mesma interface de
+AsyncMysqlDatabase (execute_query / execute_many), então os DAOs
+assíncronos usam `tx or self.__database`.
+"""
+class AsyncTransaction:
+    def __init__(self, conn):
+        """
+        :param conn: conexão aiomysql já adquirida do pool, com a transação iniciada (BEGIN)
+        """
+        self.__conn = conn
+        self.__nivel = 0
+
+    async def execute_query(self, query: str, params: tuple = None, fetch: bool = False):
+        """
+        Executa uma query na conexão da transação, sem commit.
+        """
+        try:
+            async with self.__conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(query, params or ())
+                if fetch:
+                    return await cursor.fetchall()
+                return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+
+        except aiomysql.Error as err:
+            logger.error("Erro ao executar query na transação: %s", err)
+            raise
+
+    async def execute_many(self, query: str, seq_params: list):
+        """
+        Executa cursor.executemany na conexão da transação, sem commit.
+        """
+        try:
+            async with self.__conn.cursor() as cursor:
+                await cursor.executemany(query, seq_params)
+                return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+
+        except aiomysql.Error as err:
+            logger.error("Erro ao executar query em lote na transação: %s", err)
+            raise
+
+    @asynccontextmanager
+    async def savepoint(self):
+        """
+        Abre um SAVEPOINT dentro da transação (mesma semântica de
+        Transaction.savepoint).
+        """
+        self.__nivel += 1
+        nome = f"sp_{self.__nivel}"
+        await self.__executar_controle(f"SAVEPOINT {nome}")
+        try:
+            yield self
+        except BaseException:
+            await self.__executar_controle(f"ROLLBACK TO SAVEPOINT {nome}")
+            raise
+        else:
+            await self.__executar_controle(f"RELEASE SAVEPOINT {nome}")
+        finally:
+            self.__nivel -= 1
+
+    async def commit(self):
+        await self.__conn.commit()
+
+    async def rollback(self):
+        await self.__conn.rollback()
+
+    async def __executar_controle(self, comando: str):
+        async with self.__conn.cursor() as cursor:
+            await cursor.execute(comando)
@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+import time
+from collections import deque
+import mysql.connector
+from api.utils.error_response import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(ErrorResponse):
+    """
+    Nenhuma conexão ficou livre dentro do tempo de espera do checkout.
+    Vira 503 para o cliente (mesmo tratamento do ErrorResponse nos controls).
+    """
+    def __init__(self, timeout: float):
+        super().__init__(
+            503,
+            "Banco de dados ocupado",
+            {"message": f"Nenhuma conexão livre em {timeout}s, tente novamente em instantes"}
+        )
+
+
+class _Espera:
+    """Uma thread aguardando conexão na fila do pool."""
+    def __init__(self):
+        self.evento = threading.Event()
+        self.registro = None
+        # True quando a vaga liberada deve ser usada para abrir conexão nova
+        self.criar = False
+
+
+class _Registro:
+    """Conexão real do pool e os instantes usados para validação/reciclagem."""
+    def __init__(self, conexao):
+        self.conexao = conexao
+        self.criada_em = time.monotonic()
+        self.ociosa_desde = self.criada_em
+        self.usada = False
+
+
+"""
+Conexão emprestada do ConnectionPool.
+
+Repassa tudo para a conexão MySQL real; close() devolve a conexão ao
+pool em vez de fechá-la, então o código que já faz conn.close() no
+finally continua funcionando sem mudanças.
+"""
+class PooledConnection:
+    def __init__(self, pool, registro):
+        self.__pool = pool
+        self.__registro = registro
+
+    def close(self):
+        if self.__registro is not None:
+            registro, self.__registro = self.__registro, None
+            self.__pool._devolver(registro)
+
+    def __getattr__(self, nome):
+        if self.__registro is None:
+            raise mysql.connector.errors.OperationalError("Conexão já devolvida ao pool")
+        return getattr(self.__registro.conexao, nome)
+
+    def __setattr__(self, nome, valor):
+        if nome.startswith("_PooledConnection__"):
+            object.__setattr__(self, nome, valor)
+        else:
+            setattr(self.__registro.conexao, nome, valor)
+
+
+"""
+Pool de conexões MySQL com fila de espera e verificação de saúde.
+
+Diferente do MySQLConnectionPool do conector, que falha na hora quando
+não há conexão livre, este pool:
+- Mantém até pool_size conexões e abre até max_overflow extras em picos
+  (as extras são fechadas ao serem devolvidas);
+- Quando tudo está ocupado, a thread entra em uma fila FIFO e espera até
+  `timeout` segundos; a conexão devolvida é entregue diretamente à
+  primeira da fila (sem disputa entre quem espera);
+- Esgotado o tempo, levanta PoolTimeoutError (503);
+- Antes de entregar uma conexão ociosa há mais de pre_ping_after segundos,
+  faz ping; conexão morta (wait_timeout, failover) é trocada por uma nova
+  sem que a query do cliente falhe;
+- Recicla conexões mais velhas que max_lifetime (use um valor menor que o
+  wait_timeout do servidor);
+- Uma thread de manutenção fecha conexões vencidas ou ociosas demais e
+  mantém pelo menos min_idle conexões abertas e prontas;
+- O reset de sessão (uma ida ao servidor) é opcional e decidido a cada
+  checkout; sem ele a conexão só recebe rollback se voltar com transação aberta;
+- Expõe métricas: em uso, ociosas, aguardando e histograma do tempo de espera.
+"""
+class ConnectionPool:
+    # Limites superiores (ms) das faixas do histograma de espera no checkout
+    HISTOGRAMA_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+    def __init__(self, criar_conexao, pool_size: int = 5, max_overflow: int = 5,
+                 timeout: float = 5.0, reset_session: bool = False, min_idle: int = 0,
+                 max_lifetime: float = 1800.0, max_idle: float = 600.0,
+                 pre_ping_after: float = 10.0, reaper_interval: float = 30.0):
+        """
+        :param criar_conexao: callable - abre uma conexão MySQL nova
+        :param pool_size: int - conexões mantidas abertas
+        :param max_overflow: int - conexões extras permitidas em picos
+        :param timeout: float - espera máxima (segundos) por uma conexão
+        :param reset_session: bool - padrão do reset de sessão no checkout
+        :param min_idle: int - conexões mantidas abertas pela thread de manutenção
+        :param max_lifetime: float - idade máxima (segundos) de uma conexão; 0 desliga
+        :param max_idle: float - tempo ocioso (segundos) acima de min_idle antes de fechar; 0 desliga
+        :param pre_ping_after: float - ociosidade (segundos) a partir da qual faz ping
+                               no checkout; 0 sempre, None nunca
+        :param reaper_interval: float - intervalo (segundos) da manutenção; 0 desliga a thread
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size deve ser maior que zero.")
+        if max_overflow < 0:
+            raise ValueError("max_overflow não pode ser negativo.")
+        if not 0 <= min_idle <= pool_size:
+            raise ValueError("min_idle deve estar entre 0 e pool_size.")
+
+        self.__criar_conexao = criar_conexao
+        self.__pool_size = pool_size
+        self.__max_overflow = max_overflow
+        self.__timeout = timeout
+        self.__reset_session = reset_session
+        self.__min_idle = min_idle
+        self.__max_lifetime = max_lifetime
+        self.__max_idle = max_idle
+        self.__pre_ping_after = pre_ping_after
+
+        self.__lock = threading.Lock()
+        self.__ociosas = deque()
+        self.__esperas = deque()
+        self.__total = 0
+        self.__em_uso = 0
+        self.__fechado = False
+
+        self.__checkouts = 0
+        self.__timeouts = 0
+        self.__overflow_abertas = 0
+        self.__recicladas = 0
+        self.__falhas_ping = 0
+        self.__resets = 0
+        self.__espera_total_ms = 0.0
+        self.__espera_max_ms = 0.0
+        self.__histograma = {f"le_{limite}": 0 for limite in self.HISTOGRAMA_MS}
+        self.__histograma["inf"] = 0
+
+        self.__parar = threading.Event()
+        self.__reaper = None
+        if reaper_interval > 0:
+            self.__reaper = threading.Thread(
+                target=self.__ciclo_manutencao,
+                args=(reaper_interval,),
+                name="mysql-pool-reaper",
+                daemon=True
+            )
+            self.__reaper.start()
+
+    def get_connection(self, timeout: float = None, reset_session: bool = None) -> PooledConnection:
+        """
+        Empresta uma conexão do pool, esperando na fila se necessário.
+
+        :param timeout: float - sobrescreve o timeout padrão do pool
+        :param reset_session: bool - reseta a sessão (variáveis, tabelas temporárias)
+                              antes de entregar; None usa o padrão do pool
+        :return: PooledConnection
+        :raises PoolTimeoutError: se nenhuma conexão ficar livre a tempo
+        """
+        timeout = self.__timeout if timeout is None else timeout
+        reset_session = self.__reset_session if reset_session is None else reset_session
+        inicio = time.perf_counter()
+        registro = None
+        espera = None
+        criar = False
+
+        with self.__lock:
+            if self.__fechado:
+                raise mysql.connector.errors.PoolError("Pool de conexões fechado")
+            if self.__ociosas:
+                registro = self.__ociosas.pop()
+                self.__em_uso += 1
+            elif self.__total < self.__pool_size + self.__max_overflow:
+                self.__reservar_vaga()
+                criar = True
+            else:
+                espera = _Espera()
+                self.__esperas.append(espera)
+
+        if espera is not None:
+            if not espera.evento.wait(timeout):
+                with self.__lock:
+                    # a entrega pode ter acontecido entre o timeout e o lock
+                    if espera.registro is None and not espera.criar:
+                        self.__esperas.remove(espera)
+                        self.__timeouts += 1
+                        raise PoolTimeoutError(timeout)
+            criar = espera.criar
+            registro = espera.registro
+
+        try:
+            if criar:
+                registro = _Registro(self.__criar_conexao())
+            elif not self.__preparar(registro, reset_session):
+                # conexão vencida ou morta: troca por uma nova na mesma vaga
+                self.__fechar(registro.conexao)
+                registro = _Registro(self.__criar_conexao())
+        except Exception:
+            self.__liberar_vaga()
+            raise
+
+        registro.usada = True
+        with self.__lock:
+            self.__registrar_espera((time.perf_counter() - inicio) * 1000)
+        return PooledConnection(self, registro)
+
+    def carga(self) -> int:
+        """
+        Conexões em uso mais threads na fila (usado para escolher a réplica menos carregada).
+        """
+        with self.__lock:
+            return self.__em_uso + len(self.__esperas)
+
+    def stats(self) -> dict:
+        """
+        Retorna as métricas do pool.
+
+        :return: dict
+        """
+        with self.__lock:
+            return {
+                "pool_size": self.__pool_size,
+                "max_overflow": self.__max_overflow,
+                "min_idle": self.__min_idle,
+                "timeout": self.__timeout,
+                "max_lifetime": self.__max_lifetime,
+                "open": self.__total,
+                "in_use": self.__em_uso,
+                "idle": len(self.__ociosas),
+                "waiters": len(self.__esperas),
+                "checkouts": self.__checkouts,
+                "timeouts": self.__timeouts,
+                "overflow_opened": self.__overflow_abertas,
+                "recycled": self.__recicladas,
+                "ping_failures": self.__falhas_ping,
+                "session_resets": self.__resets,
+                "wait_avg_ms": round(self.__espera_total_ms / self.__checkouts, 2) if self.__checkouts else 0.0,
+                "wait_max_ms": round(self.__espera_max_ms, 2),
+                "wait_histogram_ms": dict(self.__histograma),
+            }
+
+    def close(self):
+        """
+        Para a thread de manutenção e fecha as conexões ociosas;
+        as emprestadas são fechadas ao serem devolvidas.
+        """
+        self.__parar.set()
+        with self.__lock:
+            self.__fechado = True
+            ociosas = list(self.__ociosas)
+            self.__ociosas.clear()
+            self.__total -= len(ociosas)
+        for registro in ociosas:
+            self.__fechar(registro.conexao)
+
+    def _devolver(self, registro: _Registro):
+        """
+        Recebe de volta uma conexão emprestada (chamado por PooledConnection.close()).
+        """
+        conexao = registro.conexao
+        try:
+            # sem reset de sessão, garante ao menos que nenhuma transação vaze
+            if getattr(conexao, "in_transaction", True):
+                conexao.rollback()
+        except mysql.connector.Error:
+            self.__descartar(registro)
+            return
+
+        if self.__vencida(registro):
+            with self.__lock:
+                self.__recicladas += 1
+            self.__descartar(registro)
+            return
+
+        registro.ociosa_desde = time.monotonic()
+        fechar = False
+        with self.__lock:
+            if self.__esperas and not self.__fechado:
+                espera = self.__esperas.popleft()
+                espera.registro = registro
+                espera.evento.set()
+                return
+
+            self.__em_uso -= 1
+            if self.__fechado or self.__total > self.__pool_size:
+                self.__total -= 1
+                fechar = True
+            else:
+                self.__ociosas.append(registro)
+
+        if fechar:
+            self.__fechar(conexao)
+
+    def __preparar(self, registro: _Registro, reset_session: bool) -> bool:
+        """
+        Valida uma conexão que estava ociosa e, se pedido, reseta a sessão.
+        Retorna False se ela deve ser descartada.
+        """
+        if self.__vencida(registro):
+            with self.__lock:
+                self.__recicladas += 1
+            return False
+
+        conexao = registro.conexao
+        try:
+            if reset_session and registro.usada:
+                conexao.reset_session()
+                with self.__lock:
+                    self.__resets += 1
+            elif (self.__pre_ping_after is not None
+                    and time.monotonic() - registro.ociosa_desde >= self.__pre_ping_after):
+                # o reset já faz uma ida ao servidor; o ping só é necessário sem ele
+                conexao.ping()
+        except mysql.connector.Error:
+            with self.__lock:
+                self.__falhas_ping += 1
+            return False
+        return True
+
+    def __vencida(self, registro: _Registro) -> bool:
+        return bool(self.__max_lifetime) and time.monotonic() - registro.criada_em > self.__max_lifetime
+
+    def __ciclo_manutencao(self, intervalo: float):
+        while not self.__parar.is_set():
+            try:
+                self.__manutencao()
+            except Exception as e:
+                logger.error("Erro na manutenção do pool de conexões: %s", e)
+            self.__parar.wait(intervalo)
+
+    def __manutencao(self):
+        """
+        Fecha conexões ociosas vencidas (ou ociosas demais acima de min_idle)
+        e abre conexões até ter min_idle prontas.
+        """
+        agora = time.monotonic()
+        descartar = []
+        with self.__lock:
+            if self.__fechado:
+                return
+            manter = deque()
+            # da mais antiga (esquerda) para a mais recente
+            for registro in self.__ociosas:
+                vencida = bool(self.__max_lifetime) and agora - registro.criada_em > self.__max_lifetime
+                ociosa_demais = (bool(self.__max_idle)
+                                 and agora - registro.ociosa_desde > self.__max_idle
+                                 and self.__total - len(descartar) > self.__min_idle)
+                if vencida or ociosa_demais:
+                    descartar.append(registro)
+                else:
+                    manter.append(registro)
+            self.__ociosas = manter
+            self.__total -= len(descartar)
+            self.__recicladas += len(descartar)
+
+            faltam = max(0, self.__min_idle - self.__total)
+            self.__total += faltam
+
+        for registro in descartar:
+            self.__fechar(registro.conexao)
+
+        for _ in range(faltam):
+            try:
+                registro = _Registro(self.__criar_conexao())
+            except Exception as e:
+                with self.__lock:
+                    self.__total -= 1
+                logger.error("Erro ao abrir conexão de reserva do pool: %s", e)
+                continue
+            self.__entregar(registro)
+
+    def __entregar(self, registro: _Registro):
+        """
+        Coloca uma conexão nova no pool: direto para o primeiro da fila, se houver.
+        """
+        with self.__lock:
+            if self.__fechado:
+                self.__total -= 1
+            elif self.__esperas:
+                espera = self.__esperas.popleft()
+                self.__em_uso += 1
+                espera.registro = registro
+                espera.evento.set()
+                return
+            else:
+                self.__ociosas.appendleft(registro)
+                return
+        self.__fechar(registro.conexao)
+
+    def __descartar(self, registro: _Registro):
+        self.__fechar(registro.conexao)
+        self.__liberar_vaga()
+
+    def __reservar_vaga(self):
+        # chamado com o lock adquirido
+        self.__total += 1
+        self.__em_uso += 1
+        if self.__total > self.__pool_size:
+            self.__overflow_abertas += 1
+
+    def __liberar_vaga(self):
+        """
+        Libera a vaga de uma conexão emprestada que não chegou a existir (ou
+        foi descartada). Se houver alguém na fila, a vaga passa para ele
+        abrir uma conexão nova.
+        """
+        with self.__lock:
+            self.__total -= 1
+            self.__em_uso -= 1
+            if self.__esperas and not self.__fechado:
+                espera = self.__esperas.popleft()
+                self.__reservar_vaga()
+                espera.criar = True
+                espera.evento.set()
+
+    def __registrar_espera(self, duracao_ms: float):
+        # chamado com o lock adquirido
+        self.__checkouts += 1
+        self.__espera_total_ms += duracao_ms
+        self.__espera_max_ms = max(self.__espera_max_ms, duracao_ms)
+        for limite in self.HISTOGRAMA_MS:
+            if duracao_ms <= limite:
+                self.__histograma[f"le_{limite}"] += 1
+                break
+        else:
+            self.__histograma["inf"] += 1
+
+    @staticmethod
+    def __fechar(conexao):
+        try:
+            conexao.close()
+        except Exception:
+            pass
@@ -0,0 +1,36 @@
+-- Schema inicial (mesmas tabelas de docs/Banco.sql)
+
+CREATE TABLE IF NOT EXISTS usuarios (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    nome VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    senha_hash VARCHAR(255) NOT NULL,
+    data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS projetos (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    nome VARCHAR(255) NOT NULL,
+    descricao TEXT,
+    data_inicio DATETIME NULL,
+    data_fim DATETIME NULL,
+    status VARCHAR(50) DEFAULT 'pendente',
+    usuario_id INT NOT NULL,
+    FOREIGN KEY (usuario_id) REFERENCES usuarios(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS tarefas (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    titulo VARCHAR(255) NOT NULL,
+    descricao TEXT,
+    status VARCHAR(50) DEFAULT 'pendente',
+    prioridade VARCHAR(50) DEFAULT 'media',
+    concluida BOOLEAN DEFAULT FALSE,
+    data_limite DATETIME NULL,
+    data_inicio DATETIME NULL,
+    data_fim DATETIME NULL,
+    projeto_id INT NOT NULL,
+    usuario_id INT NULL,
+    FOREIGN KEY (projeto_id) REFERENCES projetos(id) ON DELETE CASCADE,
+    FOREIGN KEY (usuario_id) REFERENCES usuarios(id) ON DELETE SET NULL
+);
@@ -0,0 +1,25 @@
+-- Índices compostos para os caminhos de acesso das DAOs.
+--
+-- O id no fim de cada índice mantém a ordem por id dentro do filtro
+-- (paginação por cursor "id < ?" e ORDER BY id sem filesort). Os índices
+-- com a FK na primeira coluna substituem os criados automaticamente pelo
+-- InnoDB para as chaves estrangeiras. O ORDER BY t.id DESC sem filtro já
+-- é atendido pela chave primária.
+
+-- TarefaDAO.findByProjetoId / findByField('projeto_id')
+CREATE INDEX idx_tarefas_projeto_id ON tarefas (projeto_id, id);
+
+-- findByField('usuario_id') / tarefas do usuário
+CREATE INDEX idx_tarefas_usuario_id ON tarefas (usuario_id, id);
+
+-- findByField('status') e filtros status + prioridade
+CREATE INDEX idx_tarefas_status_prioridade ON tarefas (status, prioridade, id);
+
+-- filtros só por prioridade
+CREATE INDEX idx_tarefas_prioridade ON tarefas (prioridade, id);
+
+-- ProjetoDAO.findByUsuarioId / findByField('usuario_id')
+CREATE INDEX idx_projetos_usuario_id ON projetos (usuario_id, id);
+
+-- ProjetoDAO.findByField('status')
+CREATE INDEX idx_projetos_status ON projetos (status, id);
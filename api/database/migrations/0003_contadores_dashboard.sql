@@ -0,0 +1,74 @@
+-- Contadores materializados do dashboard (GET /api/dashboard/resumo).
+--
+-- Uma linha por (projeto, status) com o total de tarefas e quantas estão
+-- concluídas, mantida pelos triggers abaixo em todo INSERT, UPDATE e
+-- DELETE em tarefas (inclusive create/updateMany/deleteMany e
+-- marcarComoConcluida). O resumo passa a somar poucas linhas por projeto
+-- em vez de varrer a tabela de tarefas.
+--
+-- Exclusões em cascata (projeto ou usuário removido) não disparam
+-- triggers no MySQL; por isso as linhas são por projeto e saem junto com
+-- ele pela FK ON DELETE CASCADE.
+--
+-- Status nulo é guardado como '' (coluna de chave primária).
+
+CREATE TABLE IF NOT EXISTS contadores_tarefas (
+    projeto_id INT NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    total INT NOT NULL DEFAULT 0,
+    concluidas INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (projeto_id, status),
+    FOREIGN KEY (projeto_id) REFERENCES projetos(id) ON DELETE CASCADE
+);
+
+-- Carga inicial a partir das tarefas existentes
+INSERT INTO contadores_tarefas (projeto_id, status, total, concluidas)
+SELECT projeto_id, COALESCE(status, ''), COUNT(*), COALESCE(SUM(concluida), 0)
+FROM tarefas
+GROUP BY projeto_id, COALESCE(status, '');
+
+DELIMITER $$
+
+CREATE TRIGGER trg_tarefas_contadores_insert AFTER INSERT ON tarefas
+FOR EACH ROW
+BEGIN
+    INSERT INTO contadores_tarefas (projeto_id, status, total, concluidas)
+    VALUES (NEW.projeto_id, COALESCE(NEW.status, ''), 1, IF(NEW.concluida, 1, 0))
+    ON DUPLICATE KEY UPDATE
+        total = total + 1,
+        concluidas = concluidas + IF(NEW.concluida, 1, 0);
+END$$
+
+CREATE TRIGGER trg_tarefas_contadores_update AFTER UPDATE ON tarefas
+FOR EACH ROW
+BEGIN
+    IF NOT (NEW.projeto_id <=> OLD.projeto_id)
+       OR NOT (NEW.status <=> OLD.status)
+       OR NOT (NEW.concluida <=> OLD.concluida) THEN
+        UPDATE contadores_tarefas
+        SET total = total - 1,
+            concluidas = concluidas - IF(OLD.concluida, 1, 0)
+        WHERE projeto_id = OLD.projeto_id AND status = COALESCE(OLD.status, '');
+
+        INSERT INTO contadores_tarefas (projeto_id, status, total, concluidas)
+        VALUES (NEW.projeto_id, COALESCE(NEW.status, ''), 1, IF(NEW.concluida, 1, 0))
+        ON DUPLICATE KEY UPDATE
+            total = total + 1,
+            concluidas = concluidas + IF(NEW.concluida, 1, 0);
+    END IF;
+END$$
+
+CREATE TRIGGER trg_tarefas_contadores_delete AFTER DELETE ON tarefas
+FOR EACH ROW
+BEGIN
+    UPDATE contadores_tarefas
+    SET total = total - 1,
+        concluidas = concluidas - IF(OLD.concluida, 1, 0)
+    WHERE projeto_id = OLD.projeto_id AND status = COALESCE(OLD.status, '');
+END$$
+
+DELIMITER ;
+
+-- Tarefas atrasadas (não concluídas com data_limite no passado): depende
+-- do relógio, então não vira contador - é uma faixa deste índice.
+CREATE INDEX idx_tarefas_concluida_data_limite ON tarefas (concluida, data_limite);
@@ -0,0 +1,27 @@
+-- Colunas de versão para as requisições condicionais (ETag / 304).
+--
+-- atualizado_em muda sozinha a cada UPDATE que altera a linha (ON UPDATE),
+-- com precisão de microssegundos. A versão de uma entidade é o
+-- atualizado_em dela e das linhas de onde vêm os nomes exibidos (projeto,
+-- usuário); a de uma listagem é COUNT(*) + MAX(atualizado_em) do conjunto
+-- filtrado: inserção e exclusão mudam a contagem, alteração muda o máximo.
+--
+-- Ações de FK (ON DELETE SET NULL em tarefas.usuario_id) não passam pelo
+-- ON UPDATE; a exclusão do usuário só aparece na versão quando muda a
+-- contagem ou o máximo do conjunto.
+
+ALTER TABLE usuarios
+    ADD COLUMN atualizado_em TIMESTAMP(6) NOT NULL
+        DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+
+ALTER TABLE projetos
+    ADD COLUMN atualizado_em TIMESTAMP(6) NOT NULL
+        DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+
+ALTER TABLE tarefas
+    ADD COLUMN atualizado_em TIMESTAMP(6) NOT NULL
+        DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+
+-- MAX(atualizado_em) das listagens sem filtro vira uma leitura do índice
+CREATE INDEX idx_projetos_atualizado_em ON projetos (atualizado_em);
+CREATE INDEX idx_tarefas_atualizado_em ON tarefas (atualizado_em);
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+import argparse
+import hashlib
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+DIRETORIO_MIGRACOES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+DIRETORIO_SEEDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seeds")
+
+# NNNN_descricao.sql
+_NOME_MIGRACAO = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+
+
+@dataclass(frozen=True)
+class Migracao:
+    versao: str
+    nome: str
+    caminho: str
+    checksum: str
+
+
+"""
+Executor de migrações versionadas do schema.
+
+Cada arquivo api/database/migrations/NNNN_descricao.sql é aplicado uma
+única vez, em ordem de versão; as aplicadas ficam registradas na tabela
+schema_migrations (versão, nome, checksum, quando e quanto tempo levou).
+Uma migração já aplicada cujo arquivo mudou interrompe a execução.
+
+Um GET_LOCK no MySQL garante que só um processo migra por vez (vários
+workers subindo juntos). DDL no MySQL faz commit implícito: se uma
+migração falhar no meio, as instruções anteriores dela continuam
+aplicadas e a versão não é registrada - corrija o banco e rode de novo.
+"""
+class Migrator:
+    TABELA = "schema_migrations"
+    LOCK = "schema_migrations_lock"
+
+    def __init__(self, database_dependency, diretorio: str = DIRETORIO_MIGRACOES, lock_timeout: int = 60):
+        """
+        :param database_dependency: MysqlDatabase (ou objeto com get_connection())
+        :param diretorio: str - pasta com os arquivos .sql
+        :param lock_timeout: int - segundos esperando outro processo terminar de migrar
+        """
+        self.__database = database_dependency
+        self.__diretorio = diretorio
+        self.__lock_timeout = lock_timeout
+
+    def disponiveis(self) -> list[Migracao]:
+        """Migrações encontradas no diretório, em ordem de versão."""
+        migracoes = []
+        for arquivo in os.listdir(self.__diretorio):
+            encontrado = _NOME_MIGRACAO.match(arquivo)
+            if not encontrado:
+                continue
+            caminho = os.path.join(self.__diretorio, arquivo)
+            with open(caminho, "rb") as f:
+                checksum = hashlib.sha256(f.read()).hexdigest()
+            migracoes.append(Migracao(encontrado.group(1), encontrado.group(2), caminho, checksum))
+
+        migracoes.sort(key=lambda m: int(m.versao))
+        versoes = [m.versao for m in migracoes]
+        if len(set(versoes)) != len(versoes):
+            raise ValueError(f"Versões de migração duplicadas em {self.__diretorio}")
+        return migracoes
+
+    def status(self) -> list[dict]:
+        """Situação de cada migração: aplicada, pendente ou alterada."""
+        conn = self.__database.get_connection()
+        try:
+            self.__criar_tabela(conn)
+            aplicadas = self.__aplicadas(conn)
+        finally:
+            conn.close()
+
+        resultado = []
+        for migracao in self.disponiveis():
+            registro = aplicadas.get(migracao.versao)
+            if registro is None:
+                situacao = "pendente"
+            elif registro["checksum"] != migracao.checksum:
+                situacao = "alterada"
+            else:
+                situacao = "aplicada"
+            resultado.append({
+                "versao": migracao.versao,
+                "nome": migracao.nome,
+                "situacao": situacao,
+                "aplicada_em": registro["aplicada_em"] if registro else None
+            })
+        return resultado
+
+    def migrar(self, ate: str = None) -> list[str]:
+        """
+        Aplica as migrações pendentes (até a versão `ate`, inclusive).
+
+        :return: list[str] - versões aplicadas nesta execução
+        """
+        conn = self.__database.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT GET_LOCK(%s, %s)", (self.LOCK, self.__lock_timeout))
+            if cursor.fetchone()[0] != 1:
+                raise RuntimeError("Outro processo está aplicando migrações (GET_LOCK expirou).")
+            try:
+                self.__criar_tabela(conn)
+                aplicadas = self.__aplicadas(conn)
+                feitas = []
+                for migracao in self.disponiveis():
+                    if ate is not None and int(migracao.versao) > int(ate):
+                        break
+                    registro = aplicadas.get(migracao.versao)
+                    if registro is not None:
+                        if registro["checksum"] != migracao.checksum:
+                            raise RuntimeError(
+                                f"Migração {migracao.versao}_{migracao.nome} foi alterada depois de aplicada."
+                            )
+                        continue
+                    self.__aplicar(conn, migracao)
+                    feitas.append(migracao.versao)
+                return feitas
+            finally:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (self.LOCK,))
+                cursor.fetchall()
+        finally:
+            cursor.close()
+            conn.close()
+
+    def executar_arquivo(self, caminho: str) -> int:
+        """
+        Executa um arquivo .sql avulso (ex.: seeds), sem registrar versão.
+
+        :return: int - instruções executadas
+        """
+        with open(caminho, "r", encoding="utf-8") as f:
+            instrucoes = dividir_instrucoes(f.read())
+        conn = self.__database.get_connection()
+        cursor = conn.cursor()
+        try:
+            for instrucao in instrucoes:
+                cursor.execute(instrucao)
+            conn.commit()
+            return len(instrucoes)
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+    def __criar_tabela(self, conn):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.TABELA} (
+                    versao VARCHAR(32) PRIMARY KEY,
+                    nome VARCHAR(255) NOT NULL,
+                    checksum CHAR(64) NOT NULL,
+                    aplicada_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    duracao_ms INT NOT NULL
+                )
+            """)
+            conn.commit()
+        finally:
+            cursor.close()
+
+    def __aplicadas(self, conn) -> dict:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(f"SELECT versao, checksum, aplicada_em FROM {self.TABELA}")
+            return {row["versao"]: row for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+    def __aplicar(self, conn, migracao: Migracao):
+        logger.info("Aplicando migração %s_%s", migracao.versao, migracao.nome)
+        with open(migracao.caminho, "r", encoding="utf-8") as f:
+            instrucoes = dividir_instrucoes(f.read())
+
+        inicio = time.perf_counter()
+        cursor = conn.cursor()
+        try:
+            for instrucao in instrucoes:
+                cursor.execute(instrucao)
+            duracao_ms = int((time.perf_counter() - inicio) * 1000)
+            cursor.execute(
+                f"INSERT INTO {self.TABELA} (versao, nome, checksum, duracao_ms) VALUES (%s, %s, %s, %s)",
+                (migracao.versao, migracao.nome, migracao.checksum, duracao_ms)
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error("Falha na migração %s_%s: %s", migracao.versao, migracao.nome, e)
+            raise
+        finally:
+            cursor.close()
+
+
+def dividir_instrucoes(sql: str) -> list[str]:
+    """
+    Separa um script SQL em instruções.
+
+    Diferente de sql.split(';'), respeita ';' dentro de strings ('...',
+    "..."), identificadores (`...`) e comentários (--, #, /* */), e
+    aceita linhas DELIMITER (triggers e procedures). Comentários fora de
+    strings são descartados.
+    """
+    instrucoes = []
+    atual = []
+    delimitador = ";"
+    i = 0
+    n = len(sql)
+    inicio_linha = True
+
+    while i < n:
+        if inicio_linha:
+            fim = sql.find("\n", i)
+            fim = n if fim == -1 else fim
+            linha = sql[i:fim].strip()
+            if linha.upper().startswith("DELIMITER "):
+                delimitador = linha.split(None, 1)[1]
+                i = fim + 1
+                continue
+        inicio_linha = False
+
+        c = sql[i]
+        if c in ("'", '"', "`"):
+            j = i + 1
+            while j < n:
+                if sql[j] == "\\" and c != "`":
+                    j += 2
+                    continue
+                if sql[j] == c:
+                    if j + 1 < n and sql[j + 1] == c:
+                        j += 2
+                        continue
+                    break
+                j += 1
+            atual.append(sql[i:j + 1])
+            i = j + 1
+            continue
+
+        if sql.startswith("--", i) and (i + 2 >= n or sql[i + 2] in " \t\r\n") or c == "#":
+            fim = sql.find("\n", i)
+            i = n if fim == -1 else fim
+            continue
+
+        if sql.startswith("/*", i):
+            fim = sql.find("*/", i + 2)
+            i = n if fim == -1 else fim + 2
+            continue
+
+        if sql.startswith(delimitador, i):
+            instrucao = "".join(atual).strip()
+            if instrucao:
+                instrucoes.append(instrucao)
+            atual = []
+            i += len(delimitador)
+            continue
+
+        atual.append(c)
+        if c == "\n":
+            inicio_linha = True
+        i += 1
+
+    instrucao = "".join(atual).strip()
+    if instrucao:
+        instrucoes.append(instrucao)
+    return instrucoes
+
+
+if __name__ == "__main__":
+    from api.database.mysql_database import create_database_instance
+    from api.database.query_plan import verificar_consultas_criticas
+    from api.utils.log_config import configurar_logging
+
+    parser = argparse.ArgumentParser(description="Migrações do schema")
+    parser.add_argument("comando", choices=["migrar", "status", "explain"], nargs="?", default="migrar")
+    parser.add_argument("--ate", help="aplica até esta versão (inclusive)")
+    parser.add_argument("--seed", action="store_true", help="carrega os dados de exemplo após migrar")
+    args = parser.parse_args()
+
+    configurar_logging()
+    migrator = Migrator(create_database_instance())
+
+    if args.comando == "status":
+        for item in migrator.status():
+            print(f"{item['versao']} {item['nome']:<30} {item['situacao']}")
+    elif args.comando == "explain":
+        for problema in verificar_consultas_criticas(create_database_instance()) or ["ok"]:
+            print(problema)
+    else:
+        aplicadas = migrator.migrar(args.ate)
+        print(f"Migrações aplicadas: {', '.join(aplicadas) or 'nenhuma'}")
+        if args.seed:
+            migrator.executar_arquivo(os.path.join(DIRETORIO_SEEDS, "dados_exemplo.sql"))
+            print("Dados de exemplo carregados")
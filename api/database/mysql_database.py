@@ -1,9 +1,23 @@
 # -*- coding: utf-8 -*-
+import logging
 import mysql.connector
-from mysql.connector import pooling, Error
+from mysql.connector import Error
+from contextlib import contextmanager
+from contextvars import ContextVar
+import itertools
 import sys
 import os
+import threading
 import time
+from api.database.connection_pool import ConnectionPool, PoolTimeoutError
+from api.database.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+
+# Até quando (epoch) as leituras deste contexto devem ir ao primário,
+# para o cliente enxergar as próprias escritas apesar do atraso das réplicas
+_primario_ate = ContextVar("primario_ate", default=0.0)
 
 
 class MysqlDatabase:
@@ -11,10 +25,18 @@ class MysqlDatabase:
     Classe responsável por gerenciar a conexão com o MySQL.
     """
     __pool = None
+    __replica_pools = []
     __instance = None
+    __round_robin = itertools.count()
+    # Transação ativa por thread (permite aninhar com savepoints)
+    __local = threading.local()
 
     def __init__(self, pool_name="projeto_pool", pool_size=5, pool_reset_session=True,
-                 host="127.0.0.1", user="root", password="", database="projeto", port=3306):
+                 host="127.0.0.1", user="root", password="", database="projeto", port=3306,
+                 pool_max_overflow=5, pool_timeout=5.0, pool_min_idle=1,
+                 pool_max_lifetime=1800.0, pool_max_idle=600.0, pool_pre_ping_after=10.0,
+                 replicas=None, replica_strategy="round_robin", replica_sticky_seconds=5.0,
+                 replica_timeout=0.5):
         """
         Configurações padrão para XAMPP:
         - host: 127.0.0.1
@@ -22,10 +44,42 @@ class MysqlDatabase:
         - password: (vazia)
         - database: projeto
         - port: 3306
+
+        Pool:
+        - pool_size: conexões mantidas abertas
+        - pool_max_overflow: conexões extras abertas em picos
+        - pool_timeout: segundos que uma requisição espera na fila por uma conexão
+        - pool_reset_session: reset de sessão a cada checkout (padrão do pool;
+          pode ser sobrescrito em get_connection)
+        - pool_min_idle: conexões mantidas abertas e prontas
+        - pool_max_lifetime: idade máxima (s) de uma conexão; menor que o wait_timeout do MySQL
+        - pool_max_idle: tempo ocioso (s) antes de fechar conexões acima de pool_min_idle
+        - pool_pre_ping_after: ociosidade (s) a partir da qual a conexão é testada antes do uso
+
+        Réplicas de leitura:
+        - replicas: lista de (host, port); cada uma ganha seu próprio pool e
+          recebe as queries com fetch=True
+        - replica_strategy: "round_robin" ou "least_loaded"
+        - replica_sticky_seconds: após uma escrita, por quanto tempo as leituras
+          do mesmo contexto (requisição/sessão) continuam no primário
+        - replica_timeout: espera máxima (s) por uma conexão da réplica; réplica
+          saturada ou fora do ar -> a leitura vai ao primário
         """
+        if replica_strategy not in ("round_robin", "least_loaded"):
+            raise ValueError("replica_strategy deve ser 'round_robin' ou 'least_loaded'.")
         self.pool_name = pool_name
         self.pool_size = pool_size
         self.pool_reset_session = pool_reset_session
+        self.pool_max_overflow = pool_max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_min_idle = pool_min_idle
+        self.pool_max_lifetime = pool_max_lifetime
+        self.pool_max_idle = pool_max_idle
+        self.pool_pre_ping_after = pool_pre_ping_after
+        self.replicas = list(replicas or [])
+        self.replica_strategy = replica_strategy
+        self.replica_sticky_seconds = replica_sticky_seconds
+        self.replica_timeout = replica_timeout
         self.host = host
         self.user = user
         self.password = password
@@ -43,7 +97,7 @@ class MysqlDatabase:
         """
         if MysqlDatabase.__pool is None:
             try:
-                print("🔄 Iniciando pool de conexões MySQL...")
+                logger.info("Iniciando pool de conexões MySQL...")
                 
                 # Primeiro tenta conectar sem database para verificar se MySQL está rodando
                 test_config = {
@@ -62,25 +116,18 @@ class MysqlDatabase:
                 db_exists = test_cursor.fetchone()
                 
                 if not db_exists:
-                    print(f"⚠️  Banco '{self.database}' não existe. Criando...")
+                    logger.warning("Banco '%s' não existe. Criando...", self.database)
                     test_cursor.execute(f"CREATE DATABASE {self.database}")
-                    print(f"✅ Banco '{self.database}' criado com sucesso!")
+                    logger.info("Banco '%s' criado com sucesso!", self.database)
                 
                 test_cursor.close()
                 test_conn.close()
                 
                 # Agora cria o pool com o database
-                MysqlDatabase.__pool = mysql.connector.pooling.MySQLConnectionPool(
-                    pool_name=self.pool_name,
-                    pool_size=self.pool_size,
-                    pool_reset_session=self.pool_reset_session,
-                    host=self.host,
-                    user=self.user,
-                    password=self.password,
-                    database=self.database,
-                    port=self.port,
-                    autocommit=False
-                )
+                MysqlDatabase.__pool = self.__novo_pool(self.host, self.port)
+                MysqlDatabase.__replica_pools = [
+                    self.__novo_pool(host, port) for host, port in self.replicas
+                ]
 
                 # Testa a conexão com o database
                 conn = MysqlDatabase.__pool.get_connection()
@@ -91,35 +138,101 @@ class MysqlDatabase:
                 cursor.close()
                 conn.close()
                 
-                print(f"✅ Conectado ao MySQL {version} (banco: {self.database})")
+                logger.info("Conectado ao MySQL %s (banco: %s)", version, self.database)
                 
             except mysql.connector.Error as err:
-                print(f"❌ Falha ao conectar ao MySQL: {err}")
-                print(f"🔧 Configuração: {self.host}:{self.port}, user: {self.user}")
-                print("💡 Verifique se:")
-                print("   - MySQL está rodando (XAMPP)")
-                print("   - Serviço MySQL foi iniciado")
-                print("   - Porta 3306 está livre")
+                logger.error(
+                    "Falha ao conectar ao MySQL em %s:%s (user: %s): %s. "
+                    "Verifique se o MySQL (XAMPP) está rodando e se a porta está livre",
+                    self.host, self.port, self.user, err
+                )
                 raise
 
         return MysqlDatabase.__pool
 
-    def get_connection(self):
+    def get_connection(self, reset_session: bool = None):
         """
-        Obtém uma conexão do pool com retry.
+        Obtém uma conexão do pool.
+
+        Se todas estiverem em uso, espera na fila do pool até pool_timeout
+        segundos (PoolTimeoutError -> 503) em vez de falhar na hora.
+
+        :param reset_session: bool - reseta a sessão antes do uso; None usa
+                              pool_reset_session
         """
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                pool = self.connect()
-                conn = pool.get_connection()
-                conn.autocommit = False
-                return conn
-            except mysql.connector.Error as err:
-                print(f"❌ Tentativa {attempt + 1}/{max_retries} - Erro ao obter conexão: {err}")
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(1)  # Espera 1 segundo antes de tentar novamente
+        pool = MysqlDatabase.__pool or self.connect()
+        return pool.get_connection(reset_session=reset_session)
+
+    def begin_request(self, sticky_until: float = None):
+        """
+        Inicia o contexto de uma requisição para o roteamento de leituras.
+
+        :param sticky_until: float - prazo (epoch) herdado da sessão do cliente
+                             (cookie); até lá as leituras vão ao primário
+        """
+        _primario_ate.set(sticky_until or 0.0)
+
+    def sticky_until(self) -> float:
+        """
+        Retorna até quando (epoch) as leituras deste contexto ficam no primário.
+        """
+        return _primario_ate.get()
+
+    def has_replicas(self) -> bool:
+        return bool(self.replicas)
+
+    def __conexao_leitura(self):
+        """
+        Conexão para SELECT: uma réplica, a menos que este contexto tenha
+        escrito há pouco (read-your-writes) ou que a réplica esteja fora do ar.
+        """
+        pool = MysqlDatabase.__pool or self.connect()
+        replicas = MysqlDatabase.__replica_pools
+        if not replicas or time.time() < _primario_ate.get():
+            return pool.get_connection()
+
+        if self.replica_strategy == "least_loaded":
+            replica = min(replicas, key=lambda r: r.carga())
+        else:
+            replica = replicas[next(MysqlDatabase.__round_robin) % len(replicas)]
+
+        try:
+            # espera curta: com a réplica saturada é melhor ler do primário
+            # do que esperar pool_timeout e responder 503
+            return replica.get_connection(timeout=self.replica_timeout)
+        except (mysql.connector.Error, PoolTimeoutError) as err:
+            logger.warning("Réplica indisponível, lendo do primário: %s", err)
+            return pool.get_connection()
+
+    def __marcar_escrita(self):
+        if self.replicas:
+            _primario_ate.set(time.time() + self.replica_sticky_seconds)
+
+    def __novo_pool(self, host: str, port: int) -> ConnectionPool:
+        return ConnectionPool(
+            lambda: self.__nova_conexao(host, port),
+            pool_size=self.pool_size,
+            max_overflow=self.pool_max_overflow,
+            timeout=self.pool_timeout,
+            reset_session=self.pool_reset_session,
+            min_idle=self.pool_min_idle,
+            max_lifetime=self.pool_max_lifetime,
+            max_idle=self.pool_max_idle,
+            pre_ping_after=self.pool_pre_ping_after
+        )
+
+    def __nova_conexao(self, host: str, port: int):
+        """
+        Abre uma conexão MySQL nova para um pool (primário ou réplica).
+        """
+        return mysql.connector.connect(
+            host=host,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            port=port,
+            autocommit=False
+        )
 
     def execute_query(self, query: str, params: tuple = None, fetch: bool = False):
         """
@@ -128,7 +241,7 @@ class MysqlDatabase:
         conn = None
         cursor = None
         try:
-            conn = self.get_connection()
+            conn = self.__conexao_leitura() if fetch else self.get_connection()
             cursor = conn.cursor(dictionary=True)
             
             cursor.execute(query, params or ())
@@ -138,12 +251,68 @@ class MysqlDatabase:
                 return result
             else:
                 conn.commit()
+                self.__marcar_escrita()
                 return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
                 
         except mysql.connector.Error as err:
             if conn:
                 conn.rollback()
-            print(f"❌ Erro ao executar query: {err}")
+            logger.error("Erro ao executar query: %s", err)
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+
+    def fetch_rows(self, query: str, params: tuple = None) -> tuple[tuple, list[tuple]]:
+        """
+        Executa um SELECT com cursor de tuplas (sem montar um dict por linha).
+
+        :return: (nomes das colunas, lista de tuplas) - para MapeadorLinhas
+        """
+        conn = None
+        cursor = None
+        try:
+            conn = self.__conexao_leitura()
+            cursor = conn.cursor()
+            cursor.execute(query, params or ())
+            linhas = cursor.fetchall()
+            return tuple(cursor.column_names), linhas
+
+        except mysql.connector.Error as err:
+            logger.error("Erro ao executar query: %s", err)
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+
+    def execute_many(self, query: str, seq_params: list):
+        """
+        Executa a mesma instrução para vários conjuntos de parâmetros com
+        cursor.executemany, em uma única conexão e um único commit.
+
+        Para INSERT ... VALUES o conector envia um único INSERT com várias
+        linhas; o retorno é o id da primeira linha inserida (os demais são
+        consecutivos). Para UPDATE/DELETE retorna o total de linhas afetadas.
+        """
+        conn = None
+        cursor = None
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            cursor.executemany(query, seq_params)
+            conn.commit()
+            self.__marcar_escrita()
+            return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+
+        except mysql.connector.Error as err:
+            if conn:
+                conn.rollback()
+            logger.error("Erro ao executar query em lote: %s", err)
             raise
         finally:
             if cursor:
@@ -151,6 +320,124 @@ class MysqlDatabase:
             if conn:
                 conn.close()
 
+    @contextmanager
+    def transaction(self):
+        """
+        Abre uma transação (unit of work):
+
+            with database.transaction() as tx:
+                dao.metodo(..., tx=tx)
+
+        Uma única conexão fica presa ao bloco e o commit acontece uma vez,
+        na saída. Qualquer exceção faz rollback e é propagada.
+
+        Se já houver uma transação ativa nesta thread, o bloco interno vira
+        um SAVEPOINT da transação externa (commit continua sendo o da externa).
+        """
+        atual = getattr(MysqlDatabase.__local, "tx", None)
+        if atual is not None:
+            with atual.savepoint():
+                yield atual
+            return
+
+        conn = self.get_connection()
+        tx = Transaction(conn)
+        MysqlDatabase.__local.tx = tx
+        try:
+            yield tx
+            tx.commit()
+            self.__marcar_escrita()
+        except BaseException:
+            try:
+                tx.rollback()
+            except mysql.connector.Error as err:
+                logger.error("Erro ao desfazer transação: %s", err)
+            raise
+        finally:
+            MysqlDatabase.__local.tx = None
+            conn.close()
+
+    def stream_query(self, query: str, params: tuple = None, batch_size: int = 500):
+        """
+        Executa um SELECT e devolve as linhas sob demanda (generator).
+
+        Lê do cursor em lotes com fetchmany, de modo que só um lote fica em
+        memória por vez. A conexão permanece emprestada do pool até o
+        generator ser consumido ou fechado.
+        """
+        conn = None
+        cursor = None
+        esgotado = False
+        try:
+            conn = self.__conexao_leitura()
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(query, params or ())
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    esgotado = True
+                    break
+                for row in rows:
+                    yield row
+
+        except mysql.connector.Error as err:
+            logger.error("Erro ao executar query em streaming: %s", err)
+            raise
+        finally:
+            if conn and not esgotado:
+                # Cliente desconectou no meio: descarta o restante do resultado
+                # para a conexão voltar limpa ao pool
+                try:
+                    conn.consume_results()
+                except mysql.connector.Error:
+                    pass
+            if cursor:
+                try:
+                    cursor.close()
+                except mysql.connector.Error:
+                    pass
+            if conn:
+                conn.close()
+
+    def stream_batches(self, query: str, params: tuple = None, batch_size: int = 500):
+        """
+        Como stream_query, mas com cursor de tuplas: devolve (colunas, lote)
+        a cada fetchmany, para o mapeamento ser feito um lote por vez.
+        """
+        conn = None
+        cursor = None
+        esgotado = False
+        try:
+            conn = self.__conexao_leitura()
+            cursor = conn.cursor()
+            cursor.execute(query, params or ())
+            colunas = tuple(cursor.column_names)
+
+            while True:
+                lote = cursor.fetchmany(batch_size)
+                if not lote:
+                    esgotado = True
+                    break
+                yield colunas, lote
+
+        except mysql.connector.Error as err:
+            logger.error("Erro ao executar query em streaming: %s", err)
+            raise
+        finally:
+            if conn and not esgotado:
+                try:
+                    conn.consume_results()
+                except mysql.connector.Error:
+                    pass
+            if cursor:
+                try:
+                    cursor.close()
+                except mysql.connector.Error:
+                    pass
+            if conn:
+                conn.close()
+
     def test_connection(self):
         """
         Teste de conexão mais simples e robusto.
@@ -166,30 +453,55 @@ class MysqlDatabase:
             cursor.close()
             conn.close()
             
-            print("✅ Conexão com MySQL testada com sucesso!")
+            logger.info("Conexão com MySQL testada com sucesso!")
             return True
             
         except mysql.connector.Error as err:
-            print(f"❌ Erro ao testar conexão: {err}")
+            logger.error("Erro ao testar conexão: %s", err)
             return False
 
     def get_pool_status(self):
         if MysqlDatabase.__pool is None:
             return {"status": "Pool não inicializado"}
         
-        return {
+        status = {
             "status": "Ativo",
             "pool_name": self.pool_name,
-            "pool_size": self.pool_size,
-            "database": self.database
+            "database": self.database,
+            **MysqlDatabase.__pool.stats()
         }
+        if MysqlDatabase.__replica_pools:
+            status["replica_strategy"] = self.replica_strategy
+            status["replicas"] = [
+                {"host": f"{host}:{port}", **replica.stats()}
+                for (host, port), replica in zip(self.replicas, MysqlDatabase.__replica_pools)
+            ]
+        return status
 
     def close_pool(self):
         if MysqlDatabase.__pool is not None:
-            print("🔒 Fechando pool de conexões MySQL...")
+            logger.info("Fechando pool de conexões MySQL...")
+            MysqlDatabase.__pool.close()
+            for replica in MysqlDatabase.__replica_pools:
+                replica.close()
             MysqlDatabase.__pool = None
+            MysqlDatabase.__replica_pools = []
             MysqlDatabase.__instance = None
-            print("✅ Pool de conexões fechado.")
+            logger.info("Pool de conexões fechado.")
+
+
+def _parse_replicas(valor: str) -> list[tuple[str, int]]:
+    """
+    Converte "host1:3306,host2" em [("host1", 3306), ("host2", 3306)].
+    """
+    replicas = []
+    for item in valor.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.partition(':')
+        replicas.append((host, int(port or 3306)))
+    return replicas
 
 
 def create_database_instance():
@@ -202,7 +514,21 @@ def create_database_instance():
         'password': os.getenv('MYSQL_PASSWORD', ''),
         'database': os.getenv('MYSQL_DATABASE', 'projeto'),
         'port': int(os.getenv('MYSQL_PORT', '3306')),
-        'pool_size': int(os.getenv('MYSQL_POOL_SIZE', '5'))
+        'pool_size': int(os.getenv('MYSQL_POOL_SIZE', '5')),
+        'pool_max_overflow': int(os.getenv('MYSQL_POOL_MAX_OVERFLOW', '5')),
+        'pool_timeout': float(os.getenv('MYSQL_POOL_TIMEOUT', '5')),
+        # Os DAOs não alteram variáveis de sessão: o reset (uma ida ao banco
+        # por checkout) fica desligado, salvo se configurado
+        'pool_reset_session': os.getenv('MYSQL_POOL_RESET_SESSION', '0') == '1',
+        'pool_min_idle': int(os.getenv('MYSQL_POOL_MIN_IDLE', '1')),
+        'pool_max_lifetime': float(os.getenv('MYSQL_POOL_MAX_LIFETIME', '1800')),
+        'pool_max_idle': float(os.getenv('MYSQL_POOL_MAX_IDLE', '600')),
+        'pool_pre_ping_after': float(os.getenv('MYSQL_POOL_PRE_PING_AFTER', '10')),
+        # MYSQL_REPLICAS=host1:3306,host2:3306
+        'replicas': _parse_replicas(os.getenv('MYSQL_REPLICAS', '')),
+        'replica_strategy': os.getenv('MYSQL_REPLICA_STRATEGY', 'round_robin'),
+        'replica_sticky_seconds': float(os.getenv('MYSQL_REPLICA_STICKY_SECONDS', '5')),
+        'replica_timeout': float(os.getenv('MYSQL_REPLICA_TIMEOUT', '0.5'))
     }
     
     return MysqlDatabase(**config)
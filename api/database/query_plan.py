@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Verificação de planos de execução (EXPLAIN) das consultas críticas.
+
+Uso em testes, contra um banco migrado e com volume representativo:
+
+    from api.database.query_plan import verificar_consultas_criticas
+    assert verificar_consultas_criticas(database) == []
+
+ou pela linha de comando: python -m api.database.migrator explain
+"""
+
+# (nome, tabela, SQL, parâmetros, índice esperado)
+CONSULTAS_CRITICAS = [
+    ("tarefas por projeto", "t",
+     "SELECT t.id FROM tarefas t WHERE t.projeto_id = %s ORDER BY t.id DESC",
+     (1,), "idx_tarefas_projeto_id"),
+    ("tarefas por usuário", "t",
+     "SELECT t.id FROM tarefas t WHERE t.usuario_id = %s ORDER BY t.id DESC",
+     (1,), "idx_tarefas_usuario_id"),
+    ("tarefas por status", "t",
+     "SELECT t.id FROM tarefas t WHERE t.status = %s ORDER BY t.id DESC",
+     ("pendente",), "idx_tarefas_status_prioridade"),
+    ("tarefas por status e prioridade", "t",
+     "SELECT t.id FROM tarefas t WHERE t.status = %s AND t.prioridade = %s ORDER BY t.id DESC",
+     ("pendente", "alta"), "idx_tarefas_status_prioridade"),
+    ("tarefas por prioridade", "t",
+     "SELECT t.id FROM tarefas t WHERE t.prioridade = %s ORDER BY t.id DESC",
+     ("alta",), "idx_tarefas_prioridade"),
+    ("página de tarefas (cursor)", "t",
+     "SELECT t.id FROM tarefas t WHERE t.id < %s ORDER BY t.id DESC LIMIT 50",
+     (1000000,), "PRIMARY"),
+    ("projetos por usuário", "p",
+     "SELECT p.id FROM projetos p WHERE p.usuario_id = %s ORDER BY p.id DESC",
+     (1,), "idx_projetos_usuario_id"),
+    ("projetos por status", "p",
+     "SELECT p.id FROM projetos p WHERE p.status = %s ORDER BY p.id DESC",
+     ("pendente",), "idx_projetos_status"),
+    ("tarefas atrasadas (dashboard)", "t",
+     "SELECT COUNT(*) FROM tarefas t WHERE t.concluida = FALSE AND t.data_limite < NOW()",
+     (), "idx_tarefas_concluida_data_limite"),
+]
+
+
+def explain(database, sql: str, params: tuple = None) -> list[dict]:
+    """
+    Executa EXPLAIN da consulta e retorna uma linha por tabela do plano.
+    """
+    return database.execute_query("EXPLAIN " + sql, params, fetch=True)
+
+
+def verificar_plano(database, sql: str, params: tuple = None, tabela: str = None,
+                    indice: str = None, permitir_filesort: bool = False) -> list[str]:
+    """
+    Confere o plano de uma consulta.
+
+    :param tabela: str - tabela/alias a verificar (None = todas do plano)
+    :param indice: str - índice que deve estar entre os candidatos do otimizador
+    :param permitir_filesort: bool - aceita "Using filesort" no plano
+    :return: list[str] - problemas encontrados (vazia se o plano está ok)
+    """
+    problemas = []
+    for linha in explain(database, sql, params):
+        if tabela is not None and linha.get("table") != tabela:
+            continue
+        nome = linha.get("table")
+        candidatos = (linha.get("possible_keys") or "").split(",")
+        usados = [linha.get("key")] if linha.get("key") else []
+        extra = linha.get("Extra") or ""
+
+        if indice is not None and indice not in candidatos + usados:
+            problemas.append(f"{nome}: índice {indice} não é candidato (possible_keys={candidatos})")
+        if linha.get("type") == "ALL":
+            problemas.append(f"{nome}: varredura completa da tabela ({linha.get('rows')} linhas estimadas)")
+        if not permitir_filesort and "Using filesort" in extra:
+            problemas.append(f"{nome}: ordenação em filesort")
+    return problemas
+
+
+def verificar_consultas_criticas(database) -> list[str]:
+    """
+    Roda verificar_plano em todas as CONSULTAS_CRITICAS.
+
+    :return: list[str] - "consulta: problema" para cada problema encontrado
+    """
+    problemas = []
+    for nome, tabela, sql, params, indice in CONSULTAS_CRITICAS:
+        for problema in verificar_plano(database, sql, params, tabela=tabela, indice=indice):
+            logger.warning("Plano de '%s': %s", nome, problema)
+            problemas.append(f"{nome}: {problema}")
+    return problemas
@@ -0,0 +1,21 @@
+-- Dados de exemplo (antes carregados pelo install.py junto com o schema)
+
+INSERT INTO usuarios (nome, email, senha_hash) VALUES
+('Ana Silva', 'ana.silva@email.com', 'hash_da_senha_da_ana'),
+('Bruno Costa', 'bruno.costa@email.com', 'hash_da_senha_do_bruno'),
+('Carlos Oliveira', 'carlos.oliveira@email.com', 'hash_da_senha_do_carlos'),
+('Davi Santos', 'davi@email.com', 'hash_da_senha_do_davi');
+
+INSERT INTO projetos (nome, descricao, data_inicio, data_fim, status, usuario_id) VALUES
+('API de E-commerce', 'Desenvolver a API REST para a nova loja virtual.', '2025-11-01 09:00:00', '2025-12-15 18:00:00', 'andamento', 1),
+('Website Institucional', 'Criar o novo site da empresa com um blog integrado.', '2025-10-20 08:30:00', '2025-11-10 17:00:00', 'concluido', 1),
+('Aplicativo Mobile de Fitness', 'App para iOS e Android para monitoramento de treinos.', '2026-01-15 10:00:00', '2026-03-20 18:00:00', 'pendente', 2);
+
+INSERT INTO tarefas (titulo, descricao, status, prioridade, concluida, data_limite, data_inicio, data_fim, projeto_id, usuario_id) VALUES
+('Definir endpoints de produtos', 'Definir todos os endpoints da API de produtos', 'concluida', 'alta', TRUE, '2025-11-05 18:00:00', '2025-11-01 09:00:00', '2025-11-03 17:00:00', 1, 1),
+('Implementar autenticação JWT', 'Desenvolver sistema de autenticação JWT', 'andamento', 'alta', FALSE, '2025-11-10 18:00:00', '2025-11-04 09:00:00', NULL, 1, 2),
+('Criar CRUD de clientes', 'Implementar operações CRUD para clientes', 'pendente', 'media', FALSE, '2025-11-15 18:00:00', NULL, NULL, 1, NULL),
+('Criar layout da home page', 'Desenvolver o layout da página inicial', 'concluida', 'alta', TRUE, '2025-10-25 18:00:00', '2025-10-20 08:30:00', '2025-10-24 17:00:00', 2, 1),
+('Desenvolver página de contato', 'Criar página de contato com formulário', 'concluida', 'media', TRUE, '2025-11-05 18:00:00', '2025-10-25 09:00:00', '2025-11-02 16:00:00', 2, 2),
+('Desenhar telas no Figma', 'Criar protótipo das telas do aplicativo', 'andamento', 'alta', FALSE, '2026-01-30 18:00:00', '2026-01-15 10:00:00', NULL, 3, 3),
+('Configurar ambiente React Native', 'Configurar ambiente de desenvolvimento', 'pendente', 'media', FALSE, '2026-02-05 18:00:00', NULL, NULL, 3, NULL);
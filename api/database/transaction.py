@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import logging
+from contextlib import contextmanager
+import mysql.connector
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Classe que representa uma transação aberta em MysqlDatabase.
+
+Mantém uma única conexão do pool emprestada durante toda a operação de
+serviço: todas as queries passam por ela e o commit acontece uma só vez,
+ao final do bloco `with database.transaction() as tx:`.
+
+Expõe a mesma interface de MysqlDatabase (execute_query / execute_many),
+então os DAOs usam `tx or self.__database` sem saber com qual dos dois
+estão falando.
+"""
+class Transaction:
+    def __init__(self, conn):
+        """
+        :param conn: conexão MySQL já emprestada do pool (autocommit desligado)
+        """
+        self.__conn = conn
+        self.__nivel = 0
+
+    def execute_query(self, query: str, params: tuple = None, fetch: bool = False):
+        """
+        Executa uma query na conexão da transação, sem commit.
+        O rollback em caso de erro fica a cargo de quem abriu a transação.
+        """
+        cursor = None
+        try:
+            cursor = self.__conn.cursor(dictionary=True)
+            cursor.execute(query, params or ())
+
+            if fetch:
+                return cursor.fetchall()
+            return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+
+        except mysql.connector.Error as err:
+            logger.error("Erro ao executar query na transação: %s", err)
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+
+    def execute_many(self, query: str, seq_params: list):
+        """
+        Executa cursor.executemany na conexão da transação, sem commit.
+        Mesmo retorno de MysqlDatabase.execute_many.
+        """
+        cursor = None
+        try:
+            cursor = self.__conn.cursor()
+            cursor.executemany(query, seq_params)
+            return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+
+        except mysql.connector.Error as err:
+            logger.error("Erro ao executar query em lote na transação: %s", err)
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+
+    @contextmanager
+    def savepoint(self):
+        """
+        Abre um SAVEPOINT dentro da transação.
+
+        Se o bloco falhar, desfaz apenas o que foi feito desde o savepoint
+        (ROLLBACK TO SAVEPOINT) e propaga a exceção; caso contrário libera
+        o savepoint e o trabalho segue para o commit da transação externa.
+        """
+        self.__nivel += 1
+        nome = f"sp_{self.__nivel}"
+        self.__executar_controle(f"SAVEPOINT {nome}")
+        try:
+            yield self
+        except BaseException:
+            self.__executar_controle(f"ROLLBACK TO SAVEPOINT {nome}")
+            raise
+        else:
+            self.__executar_controle(f"RELEASE SAVEPOINT {nome}")
+        finally:
+            self.__nivel -= 1
+
+    def commit(self):
+        self.__conn.commit()
+
+    def rollback(self):
+        self.__conn.rollback()
+
+    def __executar_controle(self, comando: str):
+        cursor = self.__conn.cursor()
+        try:
+            cursor.execute(comando)
+        finally:
+            cursor.close()
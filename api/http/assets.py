@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import re
+import shutil
+from flask import Blueprint, abort, request, send_file
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # pacote opcional: sem ele só as variantes .gz
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DIRETORIO_STATIC = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "static")
+DIRETORIO_DIST = os.path.join(DIRETORIO_STATIC, "dist")
+
+
+"""
+Assets estáticos pré-comprimidos, gerados no build e servidos em /assets.
+
+Build (python -m api.http.assets):
+- CSS/JS ganham o hash do conteúdo no nome (bootstrap.min.3f2a9c1b7e.css);
+- as páginas HTML são copiadas com as referências trocadas pelos nomes
+  com hash (o Bootstrap do CDN passa a ser a cópia local, mesma versão);
+- cada arquivo ganha as variantes .gz (gzip -9) e .br (brotli 11, se o
+  pacote estiver instalado), comprimidas uma única vez;
+- manifest.json mapeia o nome original para o nome com hash.
+
+Servidor: escolhe a variante pelo Accept-Encoding, sem comprimir nada na
+requisição. Nomes com hash nunca mudam de conteúdo e vão com cache de um
+ano (immutable); as páginas, que mantêm o nome, são revalidadas (ETag).
+"""
+class Assets:
+    # Arquivos que recebem hash no nome (caminhos relativos a static/)
+    VERSIONADOS = ("css/bootstrap.min.css", "js/bootstrap.bundle.min.js", "ApiService.js")
+    # Referências externas substituídas pela cópia local equivalente
+    CDN = {
+        "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css": "css/bootstrap.min.css",
+        "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js": "js/bootstrap.bundle.min.js",
+    }
+    PAGINAS = ("Login.html", "dashboard.html", "projeto.html", "tarefa.html", "usuario.html")
+    OUTROS = ("favicon.ico",)
+
+    CACHE_IMUTAVEL = "public, max-age=31536000, immutable"
+    CACHE_REVALIDAR = "no-cache"
+    NOME_COM_HASH = re.compile(r"\.[0-9a-f]{10}\.[a-z0-9]+$")
+    # Ordem de preferência na negociação
+    VARIANTES = (("br", ".br"), ("gzip", ".gz"))
+
+    def __init__(self, diretorio: str = DIRETORIO_DIST):
+        """
+        :param diretorio: str - saída do build (static/dist)
+        """
+        logger.debug("Assets.__init__()")
+        self.__diretorio = diretorio
+
+    def create_routes(self) -> Blueprint:
+        """
+        Blueprint com GET /<caminho> servindo os arquivos do build (registrado em /assets).
+        """
+        blueprint = Blueprint("assets", __name__)
+
+        @blueprint.route("/<path:caminho>", methods=["GET", "HEAD"])
+        def servir(caminho):
+            return self.servir(caminho)
+
+        if not os.path.isdir(self.__diretorio):
+            logger.warning("Assets não gerados em %s: rode python -m api.http.assets", self.__diretorio)
+        return blueprint
+
+    def servir(self, caminho: str):
+        if caminho.endswith((".gz", ".br")):
+            abort(404)
+        original = safe_join(self.__diretorio, caminho)
+        if original is None or not os.path.isfile(original):
+            abort(404)
+
+        arquivo, codificacao = original, None
+        aceitas = request.accept_encodings
+        for nome, extensao in self.VARIANTES:
+            if aceitas[nome] and os.path.isfile(original + extensao):
+                arquivo, codificacao = original + extensao, nome
+                break
+
+        mimetype = mimetypes.guess_type(original)[0] or "application/octet-stream"
+        response = send_file(arquivo, mimetype=mimetype, conditional=True, etag=True)
+        response.vary.add("Accept-Encoding")
+        if codificacao:
+            response.headers["Content-Encoding"] = codificacao
+        if self.NOME_COM_HASH.search(caminho):
+            response.headers["Cache-Control"] = self.CACHE_IMUTAVEL
+        else:
+            response.headers["Cache-Control"] = self.CACHE_REVALIDAR
+        return response
+
+    @classmethod
+    def construir(cls, origem: str = DIRETORIO_STATIC, destino: str = DIRETORIO_DIST) -> dict:
+        """
+        Gera o build em destino (apagado e recriado).
+
+        :return: dict - manifest {nome original: nome com hash}
+        """
+        if os.path.isdir(destino):
+            shutil.rmtree(destino)
+        os.makedirs(destino)
+
+        manifest = {}
+        for relativo in cls.VERSIONADOS:
+            with open(os.path.join(origem, relativo), "rb") as f:
+                conteudo = f.read()
+            base, extensao = os.path.splitext(relativo)
+            com_hash = f"{base}.{hashlib.sha256(conteudo).hexdigest()[:10]}{extensao}"
+            cls.__gravar(destino, com_hash, conteudo)
+            manifest[relativo] = com_hash
+
+        referencias = {f"./{nome}": f"./{com_hash}" for nome, com_hash in manifest.items()}
+        referencias.update({url: manifest[local] for url, local in cls.CDN.items()})
+        padrao = re.compile("|".join(re.escape(r) for r in sorted(referencias, key=len, reverse=True)))
+        for pagina in cls.PAGINAS:
+            with open(os.path.join(origem, pagina), encoding="utf-8") as f:
+                html = padrao.sub(lambda m: referencias[m.group(0)], f.read())
+            cls.__gravar(destino, pagina, html.encode("utf-8"))
+
+        for relativo in cls.OUTROS:
+            with open(os.path.join(origem, relativo), "rb") as f:
+                cls.__gravar(destino, relativo, f.read(), comprimir=False)
+
+        with open(os.path.join(destino, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+    @staticmethod
+    def __gravar(destino: str, relativo: str, conteudo: bytes, comprimir: bool = True):
+        caminho = os.path.join(destino, relativo)
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with open(caminho, "wb") as f:
+            f.write(conteudo)
+        if not comprimir:
+            return
+        # mtime=0: o mesmo conteúdo gera sempre o mesmo .gz
+        with open(caminho + ".gz", "wb") as f:
+            f.write(gzip.compress(conteudo, compresslevel=9, mtime=0))
+        if brotli:
+            with open(caminho + ".br", "wb") as f:
+                f.write(brotli.compress(conteudo, quality=11))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build dos assets estáticos (hash no nome + .gz/.br)")
+    parser.add_argument("--origem", default=DIRETORIO_STATIC)
+    parser.add_argument("--destino", default=DIRETORIO_DIST)
+    args = parser.parse_args()
+
+    for nome, com_hash in Assets.construir(args.origem, args.destino).items():
+        print(f"{nome} -> {com_hash}")
+    print(f"Assets gerados em {args.destino}" + ("" if brotli else " (sem .br: pacote brotli não instalado)"))
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+import gzip
+import logging
+import zlib
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:  # pacote opcional: sem ele só gzip
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Classe responsável por comprimir as respostas dinâmicas (gzip ou brotli).
+
+- A codificação é negociada pelo Accept-Encoding (brotli, se o pacote
+  estiver instalado, tem preferência; q=0 é respeitado);
+- Corpos menores que o mínimo seguem sem compressão: os cabeçalhos e o
+  custo de CPU não compensam;
+- Respostas em streaming (StreamResponse) são comprimidas pedaço a pedaço,
+  com flush a cada pedaço, sem acumular o corpo;
+- Arquivos enviados com send_file (direct_passthrough) e respostas que já
+  têm Content-Encoding (assets pré-comprimidos) não são tocados;
+- A ETag vira fraca (W/"...") sempre que o cliente aceita uma das
+  codificações, tenha o corpo sido comprimido ou não: continua validando
+  If-None-Match (comparação fraca) sem afirmar que os bytes são os mesmos
+  da versão sem compressão;
+- Respostas 304 recebem o mesmo Vary e a mesma ETag (fraca) que a 200
+  correspondente, como pede a RFC 9110; só o corpo é que não existe.
+"""
+class Compressao:
+    TIPOS = (
+        "application/json",
+        "application/x-ndjson",
+        "application/javascript",
+        "text/",
+        "image/svg+xml",
+    )
+
+    def __init__(self, minimo: int = 1024, nivel_gzip: int = 6, nivel_brotli: int = 4):
+        """
+        :param minimo: int - tamanho mínimo (bytes) do corpo para comprimir
+        :param nivel_gzip: int - 1 (rápido) a 9 (menor)
+        :param nivel_brotli: int - 0 a 11; 4 tem custo próximo do gzip 6 e corpo menor
+        """
+        self.__minimo = minimo
+        self.__nivel_gzip = nivel_gzip
+        self.__nivel_brotli = nivel_brotli
+        self.__codificacoes = ["br", "gzip"] if brotli else ["gzip"]
+
+    def registrar(self, app: Flask):
+        """Instala a compressão como after_request da aplicação."""
+        app.after_request(self.comprimir)
+        logger.info("Compressão de respostas: %s (mínimo %d bytes)",
+                    ", ".join(self.__codificacoes), self.__minimo)
+
+    def comprimir(self, response: Response) -> Response:
+        if not self.__comprimivel(response):
+            return response
+        response.vary.add("Accept-Encoding")
+
+        codificacao = request.accept_encodings.best_match(self.__codificacoes)
+        if codificacao is None:
+            return response
+
+        # Independe do tamanho do corpo: a 304, que não tem corpo, precisa
+        # anunciar a mesma ETag que a 200 anunciaria
+        etag, fraca = response.get_etag()
+        if etag and not fraca:
+            response.set_etag(etag, weak=True)
+        if response.status_code == 304:
+            return response
+
+        if response.is_streamed:
+            response.response = self.__comprimir_stream(response.response, codificacao)
+            response.headers.pop("Content-Length", None)
+        else:
+            corpo = response.get_data()
+            if len(corpo) < self.__minimo:
+                return response
+            response.set_data(self.__comprimir_bytes(corpo, codificacao))
+
+        response.headers["Content-Encoding"] = codificacao
+        return response
+
+    def __comprimivel(self, response: Response) -> bool:
+        # 304 entra só para receber Vary e ETag; comprimir() não toca no corpo
+        if response.status_code < 200 or response.status_code in (204, 206):
+            return False
+        if response.direct_passthrough or "Content-Encoding" in response.headers:
+            return False
+        if request.method == "HEAD":
+            return False
+        return (response.mimetype or "").startswith(self.TIPOS)
+
+    def __comprimir_bytes(self, corpo: bytes, codificacao: str) -> bytes:
+        if codificacao == "br":
+            return brotli.compress(corpo, quality=self.__nivel_brotli)
+        return gzip.compress(corpo, compresslevel=self.__nivel_gzip, mtime=0)
+
+    def __comprimir_stream(self, pedacos, codificacao: str):
+        if codificacao == "br":
+            compressor = brotli.Compressor(quality=self.__nivel_brotli)
+            comprimir = compressor.process
+            descarregar = compressor.flush
+            finalizar = compressor.finish
+        else:
+            # wbits 16+ = cabeçalho e rodapé gzip
+            compressor = zlib.compressobj(self.__nivel_gzip, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            comprimir = compressor.compress
+            descarregar = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)
+            finalizar = compressor.flush
+
+        try:
+            for pedaco in pedacos:
+                if isinstance(pedaco, str):
+                    pedaco = pedaco.encode("utf-8")
+                dados = comprimir(pedaco) + descarregar()
+                if dados:
+                    yield dados
+            yield finalizar()
+        finally:
+            fechar = getattr(pedacos, "close", None)
+            if fechar:
+                fechar()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pacote opcional: sem ele usa o json da biblioteca padrão
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Classe responsável pela serialização JSON de todas as respostas (jsonify,
+StreamResponse) e pela leitura dos corpos (request.json).
+
+As DAOs devolvem os valores das colunas como vieram do banco; a
+formatação fica aqui, em um único lugar:
+- datetime/date/time -> ISO 8601 (2025-01-31T23:59:59);
+- Decimal (SUM/AVG do MySQL) -> número (int quando inteiro);
+- modelos (Tarefa, Projeto, Usuario) -> to_dict().
+
+Com o pacote orjson a serialização é feita em C e datetime é codificado
+nativamente; sem ele (ou JSON_PROVIDER=json) o json padrão produz o mesmo
+resultado. Nos dois casos a saída é compacta, em UTF-8 e sem ordenar as
+chaves.
+"""
+class JsonRapido(JSONProvider):
+    mimetype = "application/json"
+
+    def __init__(self, app, usar_orjson: bool = True):
+        """
+        :param app: Flask (ou Quart)
+        :param usar_orjson: bool - False força o json da biblioteca padrão
+        """
+        super().__init__(app)
+        self.__orjson = bool(usar_orjson and orjson is not None)
+        if usar_orjson and orjson is None:
+            logger.info("orjson não instalado: serialização pelo json padrão")
+
+    @property
+    def backend(self) -> str:
+        return "orjson" if self.__orjson else "json"
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj) -> bytes:
+        """Serializa direto para bytes (o corpo da resposta), sem passar por str."""
+        if self.__orjson:
+            return orjson.dumps(obj, default=converter, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(obj, default=converter, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if self.__orjson:
+            return orjson.loads(s)
+        return json.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
+
+def converter(obj):
+    """
+    Tipos que nenhum dos dois encoders conhece (orjson já trata datetime,
+    date e time; o json padrão não).
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8")
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
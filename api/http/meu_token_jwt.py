@@ -1,7 +1,16 @@
 # -*- coding: utf-8 -*-
+import logging
 import jwt
 import secrets
 import time
+from contextvars import ContextVar
+
+logger = logging.getLogger(__name__)
+
+
+# Payload do último token validado no contexto atual (thread/tarefa).
+# Não fica na instância porque MeuTokenJWT é compartilhado entre requisições.
+_payload_atual = ContextVar("meu_token_jwt_payload", default=None)
 
 
 """
@@ -13,6 +22,8 @@ Implementa:
 - Configuração de cabeçalhos e payload do JWT.
 
 Os atributos principais são privados e podem ser acessados/modificados via getters/setters.
+A instância pode ser compartilhada entre threads: as claims decodificadas não
+ficam em atributo da instância (use decodificarToken ou o payload por contexto).
 """
 class MeuTokenJWT:
     def __init__(self):
@@ -27,7 +38,6 @@ class MeuTokenJWT:
         self.__aud = "http://localhost"
         self.__sub = "acesso_sistema"
         self.__duracaoToken = 3600 * 24 * 60  # 60 dias em segundos
-        self.__payload = None
 
     def gerarToken(self, claims: dict) -> str:
         """
@@ -59,35 +69,47 @@ class MeuTokenJWT:
 
         return jwt.encode(payload, self.__key, algorithm=self.__alg, headers=headers)
 
-    def validarToken(self, stringToken: str) -> bool:
+    def decodificarToken(self, stringToken: str) -> dict | None:
         """
-        Valida um token JWT.
+        Valida um token JWT e retorna suas claims, sem guardar estado na instância.
 
         :param stringToken: Token JWT a ser validado (pode incluir prefixo "Bearer ")
-        :return: True se válido, False caso contrário
+        :return: dict com as claims se válido, None caso contrário
         """
         if not stringToken or stringToken.strip() == "":
-            print("❌ Token não fornecido ou em branco")
-            return False
+            logger.warning("Token não fornecido ou em branco")
+            return None
 
         token = stringToken.replace("Bearer ", "").strip()
 
         try:
-            decoded = jwt.decode(
+            return jwt.decode(
                 token,
                 self.__key,
                 algorithms=[self.__alg],
                 audience=self.__aud,
                 issuer=self.__iss
             )
-            self.__payload = decoded
-            return True
         except jwt.ExpiredSignatureError:
-            print("❌ Token expirado")
-            return False
+            logger.warning("Token expirado")
+            return None
         except jwt.InvalidTokenError as err:
-            print("❌ Token inválido:", err)
-            return False
+            logger.warning("Token inválido: %s", err)
+            return None
+
+    def validarToken(self, stringToken: str) -> bool:
+        """
+        Valida um token JWT.
+
+        As claims ficam disponíveis em self.payload apenas para o contexto
+        (thread/tarefa asyncio) que chamou este método.
+
+        :param stringToken: Token JWT a ser validado (pode incluir prefixo "Bearer ")
+        :return: True se válido, False caso contrário
+        """
+        decoded = self.decodificarToken(stringToken)
+        _payload_atual.set(decoded)
+        return decoded is not None
 
     # Getters e Setters
     @property
@@ -126,6 +148,6 @@ class MeuTokenJWT:
     def duracaoToken(self, value): self.__duracaoToken = value
 
     @property
-    def payload(self): return self.__payload
+    def payload(self): return _payload_atual.get()
     @payload.setter
-    def payload(self, value): self.__payload = value
+    def payload(self, value): _payload_atual.set(value)
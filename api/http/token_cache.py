@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+"""
+Classe responsável por guardar em memória os tokens JWT já validados.
+
+Implementa:
+- Cache LRU limitado por quantidade de entradas;
+- TTL por entrada, nunca ultrapassando o "exp" do próprio token;
+- Chave pelo digest SHA-256 do token (o token em si não fica em memória);
+- Contadores de acertos (hits) e falhas (misses).
+
+Um acerto no cache dispensa a verificação da assinatura HMAC e das claims
+de audience/issuer, que já foram verificadas na primeira vez.
+"""
+class TokenCache:
+    def __init__(self, max_entries: int = 1024, ttl: int = 300):
+        """
+        Construtor da classe TokenCache
+
+        :param max_entries: int - quantidade máxima de tokens guardados
+        :param ttl: int - tempo máximo (segundos) que um token fica no cache
+        """
+        self.__max_entries = max_entries
+        self.__ttl = ttl
+        self.__entries = OrderedDict()  # digest -> (expira_em, payload)
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, token: str) -> dict | None:
+        """
+        Retorna o payload de um token já validado, ou None se não estiver
+        no cache (ou tiver expirado).
+
+        :param token: str - token JWT sem o prefixo "Bearer "
+        :return: dict com as claims ou None
+        """
+        digest = self.__digest(token)
+        agora = time.time()
+
+        with self.__lock:
+            entrada = self.__entries.get(digest)
+            if entrada is None:
+                self.__misses += 1
+                return None
+
+            expira_em, payload = entrada
+            if expira_em <= agora:
+                del self.__entries[digest]
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(digest)
+            self.__hits += 1
+            return payload
+
+    def set(self, token: str, payload: dict):
+        """
+        Guarda o payload de um token recém-validado.
+
+        :param token: str - token JWT sem o prefixo "Bearer "
+        :param payload: dict - claims decodificadas do token
+        """
+        expira_em = time.time() + self.__ttl
+        exp = payload.get("exp")
+        if exp is not None:
+            expira_em = min(expira_em, float(exp))
+
+        digest = self.__digest(token)
+        with self.__lock:
+            self.__entries[digest] = (expira_em, payload)
+            self.__entries.move_to_end(digest)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        """Remove todas as entradas do cache."""
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Retorna os contadores do cache.
+
+        :return: dict {hits, misses, size, max_entries}
+        """
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "size": len(self.__entries),
+                "max_entries": self.__max_entries
+            }
+
+    @staticmethod
+    def __digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
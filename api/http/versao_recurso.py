@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import hashlib
+from datetime import timezone
+from flask import Response, request
+
+
+"""
+Classe responsável pelas requisições condicionais (ETag / Last-Modified).
+
+A versão de um recurso vem das colunas atualizado_em (migração 0004):
+- entidade: atualizado_em da linha e das linhas de onde vêm os nomes (JOIN);
+- listagem: COUNT(*) e MAX(atualizado_em) do conjunto filtrado.
+
+A ETag (forte) é o SHA-1 dessas marcas junto com a URL completa (rota e
+query string) e um contexto extra (ex.: o usuário das rotas "minhas"), de
+modo que páginas, filtros e projeções diferentes têm ETags diferentes.
+
+Em listagens só a ETag decide o 304: excluir uma linha que não é a mais
+recente não altera MAX(atualizado_em), só o COUNT(*), então
+If-Modified-Since sozinho não basta.
+
+Fluxo no controller: ler a versão (uma consulta leve), responder 304 se o
+cliente já tem essa versão e só então montar e serializar o corpo.
+"""
+class VersaoRecurso:
+    # Sempre revalidar; a resposta depende do token, então não vai para caches compartilhados
+    CACHE_CONTROL = "private, no-cache"
+
+    def __init__(self, marcas, total: int = None, contexto=None):
+        """
+        :param marcas: list[datetime | None] - colunas de versão
+        :param total: int - quantidade de linhas (listagens)
+        :param contexto: valor extra que diferencia a representação (ex.: id do usuário)
+        """
+        marcas = list(marcas)
+        chave = repr((request.full_path, contexto, total, marcas))
+        self.etag = hashlib.sha1(chave.encode("utf-8")).hexdigest()
+        self.__listagem = total is not None
+        validas = [m for m in marcas if m is not None]
+        self.ultima_modificacao = self.__utc(max(validas)) if validas else None
+
+    def atual_no_cliente(self) -> bool:
+        """
+        True se a requisição já tem esta versão: If-None-Match com a ETag
+        (ou *) ou, sem If-None-Match e só para entidades, If-Modified-Since
+        não anterior à última modificação (precisão de segundos do
+        cabeçalho HTTP).
+        """
+        if request.if_none_match:
+            return request.if_none_match.contains_weak(self.etag)
+        desde = request.if_modified_since
+        if desde is None or self.__listagem or self.ultima_modificacao is None:
+            return False
+        return self.ultima_modificacao.replace(microsecond=0) <= desde
+
+    def nao_modificado(self) -> Response:
+        """Resposta 304 sem corpo, com os mesmos validadores de uma 200."""
+        # mimetype da 200: a Compressao decide Vary e ETag fraca por ele
+        return self.aplicar(Response(status=304, mimetype="application/json"))
+
+    def aplicar(self, response: Response) -> Response:
+        """Adiciona ETag, Last-Modified e Cache-Control à resposta."""
+        response.set_etag(self.etag)
+        if self.ultima_modificacao is not None:
+            response.last_modified = self.ultima_modificacao
+        response.headers["Cache-Control"] = self.CACHE_CONTROL
+        return response
+
+    @staticmethod
+    def __utc(momento):
+        # o banco devolve datetime sem fuso: tratado como UTC, como o Werkzeug faz
+        if momento.tzinfo is None:
+            return momento.replace(tzinfo=timezone.utc)
+        return momento.astimezone(timezone.utc)
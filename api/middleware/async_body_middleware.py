@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import logging
+from functools import wraps
+from quart import request
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBodyMiddleware:
+    """
+    Validação de corpo para o servidor ASGI (Quart).
+
+    Não tem regras próprias: aplica os métodos verificar_* de
+    UsuarioMiddleware, ProjetoMiddleware e TarefaMiddleware, os mesmos que
+    os decorators do servidor Flask usam. Só a leitura do corpo é
+    assíncrona; a falha sobe como ErrorResponse (400).
+    """
+
+    def validate(self, verificar):
+        """
+        Decorator que lê o corpo JSON e o passa para verificar() antes da rota.
+
+        :param verificar: callable(body) - ex.: TarefaMiddleware().verificar_body
+        """
+        def decorator(f):
+            @wraps(f)
+            async def decorated_function(*args, **kwargs):
+                logger.debug("AsyncBodyMiddleware.validate(%s)", verificar.__name__)
+                verificar(await request.get_json(silent=True))
+                return await f(*args, **kwargs)
+            return decorated_function
+        return decorator
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import logging
+from quart import request, jsonify, g
+from functools import wraps
+from api.http.meu_token_jwt import MeuTokenJWT
+from api.http.token_cache import TokenCache
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJwtMiddleware:
+    """
+    Versão para o servidor ASGI (Quart) do JwtMiddleware.
+
+    Mesma validação e mesmo TokenCache; as claims ficam em quart.g, que é
+    isolado por requisição (cada requisição roda na sua própria task).
+    """
+
+    def __init__(self, jwt_instance: MeuTokenJWT = None, token_cache: TokenCache = None):
+        """
+        :param jwt_instance: Instância de MeuTokenJWT (opcional)
+        :param token_cache: Instância de TokenCache (opcional)
+        """
+        logger.debug("AsyncJwtMiddleware.__init__()")
+        self.__jwt_instance = jwt_instance or MeuTokenJWT()
+        self.__token_cache = token_cache or TokenCache()
+
+    def validate_token(self, f):
+        """
+        Decorator para validar token JWT em endpoints protegidos (corrotinas).
+        """
+        @wraps(f)
+        async def decorated_function(*args, **kwargs):
+            authorization_header = request.headers.get("Authorization")
+
+            if not authorization_header:
+                return jsonify({
+                    "success": False,
+                    "error": {
+                        "message": "Token de autenticação não fornecido",
+                        "code": 401
+                    }
+                }), 401
+
+            if not self.__validar(authorization_header):
+                return jsonify({
+                    "success": False,
+                    "error": {
+                        "message": "Token inválido ou expirado",
+                        "code": 401
+                    }
+                }), 401
+
+            return await f(*args, **kwargs)
+
+        return decorated_function
+
+    def __validar(self, authorization_header: str) -> bool:
+        """
+        Valida o token consultando antes o cache de tokens verificados.
+        A verificação da assinatura é CPU curto, então roda no próprio loop.
+        """
+        g.jwt_payload = None
+        token = authorization_header.replace("Bearer ", "").strip()
+        if not token:
+            return False
+
+        payload = self.__token_cache.get(token)
+        if payload is None:
+            payload = self.__jwt_instance.decodificarToken(token)
+            if payload is None:
+                return False
+            self.__token_cache.set(token, payload)
+
+        g.jwt_payload = payload
+        return True
+
+    def get_user_id(self):
+        """
+        Retorna o ID do usuário a partir do token validado.
+        """
+        payload = g.get("jwt_payload")
+        if not payload:
+            return None
+        return payload.get("idFuncionario")
+
+    def get_cache_stats(self):
+        return self.__token_cache.stats()
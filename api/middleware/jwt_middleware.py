@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
-from flask import request, jsonify
+import logging
+from flask import request, jsonify, g
 from functools import wraps
 from api.http.meu_token_jwt import MeuTokenJWT
+from api.http.token_cache import TokenCache
+
+logger = logging.getLogger(__name__)
 
 
 class JwtMiddleware:
@@ -10,16 +14,24 @@ class JwtMiddleware:
     
     Implementa validação de token JWT para proteger endpoints da API.
     Utiliza injeção de dependência para receber a instância de MeuTokenJWT.
+    Tokens já validados ficam em um TokenCache, evitando repetir a
+    verificação da assinatura a cada requisição.
+
+    As claims do token ficam em flask.g (escopo da requisição), e não na
+    instância compartilhada de MeuTokenJWT, para que requisições concorrentes
+    (servidor com threads) não sobrescrevam a identidade umas das outras.
     """
 
-    def __init__(self, jwt_instance: MeuTokenJWT = None):
+    def __init__(self, jwt_instance: MeuTokenJWT = None, token_cache: TokenCache = None):
         """
         Construtor do JwtMiddleware.
         
         :param jwt_instance: Instância de MeuTokenJWT (opcional)
+        :param token_cache: Instância de TokenCache (opcional)
         """
-        print("⬆️  JwtMiddleware.__init__()")
+        logger.debug("JwtMiddleware.__init__()")
         self.__jwt_instance = jwt_instance or MeuTokenJWT()
+        self.__token_cache = token_cache or TokenCache()
 
     def validate_token(self, f):
         """
@@ -35,13 +47,13 @@ class JwtMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 JwtMiddleware.validate_token()")
+            logger.debug("JwtMiddleware.validate_token()")
             
             # Obtém o header Authorization
             authorization_header = request.headers.get("Authorization")
             
             if not authorization_header:
-                print("❌ Header Authorization não encontrado")
+                logger.warning("Header Authorization não encontrado")
                 return jsonify({
                     "success": False,
                     "error": {
@@ -51,11 +63,11 @@ class JwtMiddleware:
                 }), 401
 
             # Valida o token
-            if self.__jwt_instance.validarToken(authorization_header):
-                print(f"✅ Token válido para: {self.__jwt_instance.payload.get('email', 'Unknown')}")
+            if self.__validar(authorization_header):
+                logger.debug("Token válido para: %s", g.jwt_payload.get('email', 'Unknown'))
                 return f(*args, **kwargs)
             else:
-                print("❌ Token inválido ou expirado")
+                logger.warning("Token inválido ou expirado")
                 return jsonify({
                     "success": False,
                     "error": {
@@ -72,14 +84,15 @@ class JwtMiddleware:
         
         :return: dict com dados do usuário ou None se não houver token válido
         """
-        if not self.__jwt_instance.payload:
+        payload = self.__payload_atual()
+        if not payload:
             return None
         
         return {
-            "id": self.__jwt_instance.payload.get("idFuncionario"),
-            "email": self.__jwt_instance.payload.get("email"),
-            "name": self.__jwt_instance.payload.get("name"),
-            "role": self.__jwt_instance.payload.get("role")
+            "id": payload.get("idFuncionario"),
+            "email": payload.get("email"),
+            "name": payload.get("name"),
+            "role": payload.get("role")
         }
 
     def validate_token_and_role(self, allowed_roles: list):
@@ -92,7 +105,7 @@ class JwtMiddleware:
         def decorator(f):
             @wraps(f)
             def decorated_function(*args, **kwargs):
-                print(f"🔷 JwtMiddleware.validate_token_and_role() - Roles: {allowed_roles}")
+                logger.debug("JwtMiddleware.validate_token_and_role() - Roles: %s", allowed_roles)
                 
                 # Primeiro valida o token
                 authorization_header = request.headers.get("Authorization")
@@ -106,7 +119,7 @@ class JwtMiddleware:
                         }
                     }), 401
 
-                if not self.__jwt_instance.validarToken(authorization_header):
+                if not self.__validar(authorization_header):
                     return jsonify({
                         "success": False,
                         "error": {
@@ -116,9 +129,9 @@ class JwtMiddleware:
                     }), 401
 
                 # Verifica se o role do usuário está permitido
-                user_role = self.__jwt_instance.payload.get("role")
+                user_role = g.jwt_payload.get("role")
                 if user_role not in allowed_roles:
-                    print(f"❌ Acesso negado. Role: {user_role}, Permitidos: {allowed_roles}")
+                    logger.warning("Acesso negado. Role: %s, Permitidos: %s", user_role, allowed_roles)
                     return jsonify({
                         "success": False,
                         "error": {
@@ -127,21 +140,57 @@ class JwtMiddleware:
                         }
                     }), 403
 
-                print(f"✅ Acesso permitido para role: {user_role}")
+                logger.debug("Acesso permitido para role: %s", user_role)
                 return f(*args, **kwargs)
 
             return decorated_function
         return decorator
 
+    def __validar(self, authorization_header: str) -> bool:
+        """
+        Valida o token consultando antes o cache de tokens verificados.
+        Em caso de sucesso, as claims ficam em g.jwt_payload.
+
+        :param authorization_header: Valor do header Authorization
+        :return: True se o token for válido
+        """
+        g.jwt_payload = None
+        token = authorization_header.replace("Bearer ", "").strip()
+        if not token:
+            return False
+
+        payload = self.__token_cache.get(token)
+        if payload is None:
+            payload = self.__jwt_instance.decodificarToken(token)
+            if payload is None:
+                return False
+            self.__token_cache.set(token, payload)
+
+        g.jwt_payload = payload
+        return True
+
+    def __payload_atual(self):
+        """Claims do token validado na requisição atual (ou None)."""
+        return g.get("jwt_payload")
+
+    def get_cache_stats(self):
+        """
+        Retorna os contadores do cache de tokens (hits/misses).
+
+        :return: dict
+        """
+        return self.__token_cache.stats()
+
     def get_user_id(self):
         """
         Retorna o ID do usuário a partir do token validado.
         
         :return: int ID do usuário ou None
         """
-        if not self.__jwt_instance.payload:
+        payload = self.__payload_atual()
+        if not payload:
             return None
-        return self.__jwt_instance.payload.get("idFuncionario")
+        return payload.get("idFuncionario")
 
     def get_user_email(self):
         """
@@ -149,9 +198,10 @@ class JwtMiddleware:
         
         :return: str Email do usuário ou None
         """
-        if not self.__jwt_instance.payload:
+        payload = self.__payload_atual()
+        if not payload:
             return None
-        return self.__jwt_instance.payload.get("email")
+        return payload.get("email")
 
 
 # Exemplo de uso
@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
+import logging
 from functools import wraps
 from flask import request
 from api.utils.error_response import ErrorResponse
 
+logger = logging.getLogger(__name__)
+
 class ProjetoMiddleware:
     """
     Middleware para validação de requisições relacionadas à entidade Projeto.
@@ -10,6 +13,10 @@ class ProjetoMiddleware:
     Objetivos:
     - Garantir que os campos obrigatórios existam antes de chamar os métodos do Controller ou Service.
     - Lançar erros padronizados usando ErrorResponse quando a validação falhar.
+
+    As regras de corpo ficam nos métodos verificar_*, que recebem o corpo já
+    lido: os decorators validate_* (Flask) e o AsyncBodyMiddleware (ASGI)
+    aplicam as mesmas regras.
     """
 
     def validate_body(self, f):
@@ -22,22 +29,23 @@ class ProjetoMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 ProjetoMiddleware.validate_body()")
-            body = request.get_json()
-            
-            if not body or 'projeto' not in body:
-                raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'projeto' é obrigatório!"})
+            logger.debug("ProjetoMiddleware.validate_body()")
+            self.verificar_body(request.get_json())
+            return f(*args, **kwargs)
+        return decorated_function
 
-            projeto = body['projeto']
+    def verificar_body(self, body):
+        """Regras de validate_body sobre o corpo já lido (dict ou None)."""
+        if not isinstance(body, dict) or not isinstance(body.get('projeto'), dict):
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'projeto' é obrigatório!"})
 
-            # ✅ CORREÇÃO: Campos obrigatórios - nome e status (usuario_id é opcional)
-            campos_obrigatorios = ["nome", "status"]
-            for campo in campos_obrigatorios:
-                if campo not in projeto:
-                    raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
+        projeto = body['projeto']
 
-            return f(*args, **kwargs)
-        return decorated_function
+        # ✅ CORREÇÃO: Campos obrigatórios - nome e status (usuario_id é opcional)
+        campos_obrigatorios = ["nome", "status"]
+        for campo in campos_obrigatorios:
+            if campo not in projeto:
+                raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
 
     def validate_body_update(self, f):
         """
@@ -49,22 +57,23 @@ class ProjetoMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 ProjetoMiddleware.validate_body_update()")
-            body = request.get_json()
-            
-            if not body or 'projeto' not in body:
-                raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'projeto' é obrigatório!"})
+            logger.debug("ProjetoMiddleware.validate_body_update()")
+            self.verificar_body_update(request.get_json())
+            return f(*args, **kwargs)
+        return decorated_function
 
-            projeto = body['projeto']
+    def verificar_body_update(self, body):
+        """Regras de validate_body_update sobre o corpo já lido (dict ou None)."""
+        if not isinstance(body, dict) or not isinstance(body.get('projeto'), dict):
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'projeto' é obrigatório!"})
 
-            # ✅ CORREÇÃO: Campos obrigatórios para atualização
-            campos_obrigatorios = ["nome", "status"]
-            for campo in campos_obrigatorios:
-                if campo not in projeto:
-                    raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
+        projeto = body['projeto']
 
-            return f(*args, **kwargs)
-        return decorated_function
+        # ✅ CORREÇÃO: Campos obrigatórios para atualização
+        campos_obrigatorios = ["nome", "status"]
+        for campo in campos_obrigatorios:
+            if campo not in projeto:
+                raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
 
     def validate_id_param(self, f):
         """
@@ -74,7 +83,7 @@ class ProjetoMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 ProjetoMiddleware.validate_id_param()")
+            logger.debug("ProjetoMiddleware.validate_id_param()")
             if 'id' not in kwargs:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O parâmetro 'id' é obrigatório!"})
             return f(*args, **kwargs)
@@ -88,7 +97,7 @@ class ProjetoMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 ProjetoMiddleware.validate_usuario_id_param()")
+            logger.debug("ProjetoMiddleware.validate_usuario_id_param()")
             if 'usuario_id' not in kwargs:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O parâmetro 'usuario_id' é obrigatório!"})
             return f(*args, **kwargs)
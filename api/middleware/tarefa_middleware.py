@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
+import logging
 from functools import wraps
 from flask import request
 from api.utils.error_response import ErrorResponse
 
+logger = logging.getLogger(__name__)
+
 class TarefaMiddleware:
     """
     Middleware para validação de requisições relacionadas à entidade Tarefa.
@@ -10,6 +13,10 @@ class TarefaMiddleware:
     Objetivos:
     - Garantir que os campos obrigatórios existam antes de chamar os métodos do Controller ou Service.
     - Lançar erros padronizados usando ErrorResponse quando a validação falhar.
+
+    As regras de corpo ficam nos métodos verificar_*, que recebem o corpo já
+    lido: os decorators validate_* (Flask) e o AsyncBodyMiddleware (ASGI)
+    aplicam as mesmas regras.
     """
 
     def validate_body(self, f):
@@ -22,22 +29,23 @@ class TarefaMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 TarefaMiddleware.validate_body()")
-            body = request.get_json()
-            
-            if not body or 'tarefa' not in body:
-                raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'tarefa' é obrigatório!"})
+            logger.debug("TarefaMiddleware.validate_body()")
+            self.verificar_body(request.get_json())
+            return f(*args, **kwargs)
+        return decorated_function
 
-            tarefa = body['tarefa']
+    def verificar_body(self, body):
+        """Regras de validate_body sobre o corpo já lido (dict ou None)."""
+        if not isinstance(body, dict) or not isinstance(body.get('tarefa'), dict):
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'tarefa' é obrigatório!"})
 
-            # Apenas verificar existência dos campos obrigatórios
-            campos_obrigatorios = ["titulo", "projeto_id"]
-            for campo in campos_obrigatorios:
-                if campo not in tarefa:
-                    raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
+        tarefa = body['tarefa']
 
-            return f(*args, **kwargs)
-        return decorated_function
+        # Apenas verificar existência dos campos obrigatórios
+        campos_obrigatorios = ["titulo", "projeto_id"]
+        for campo in campos_obrigatorios:
+            if campo not in tarefa:
+                raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
 
     def validate_body_update(self, f):
         """
@@ -49,22 +57,23 @@ class TarefaMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 TarefaMiddleware.validate_body_update()")
-            body = request.get_json()
-            
-            if not body or 'tarefa' not in body:
-                raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'tarefa' é obrigatório!"})
+            logger.debug("TarefaMiddleware.validate_body_update()")
+            self.verificar_body_update(request.get_json())
+            return f(*args, **kwargs)
+        return decorated_function
 
-            tarefa = body['tarefa']
+    def verificar_body_update(self, body):
+        """Regras de validate_body_update sobre o corpo já lido (dict ou None)."""
+        if not isinstance(body, dict) or not isinstance(body.get('tarefa'), dict):
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'tarefa' é obrigatório!"})
 
-            # Campos obrigatórios para atualização
-            campos_obrigatorios = ["titulo", "concluida"]
-            for campo in campos_obrigatorios:
-                if campo not in tarefa:
-                    raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
+        tarefa = body['tarefa']
 
-            return f(*args, **kwargs)
-        return decorated_function
+        # Campos obrigatórios para atualização
+        campos_obrigatorios = ["titulo", "concluida"]
+        for campo in campos_obrigatorios:
+            if campo not in tarefa:
+                raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
 
     def validate_id_param(self, f):
         """
@@ -74,7 +83,7 @@ class TarefaMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 TarefaMiddleware.validate_id_param()")
+            logger.debug("TarefaMiddleware.validate_id_param()")
             if 'id' not in kwargs:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O parâmetro 'id' é obrigatório!"})
             return f(*args, **kwargs)
@@ -88,8 +97,60 @@ class TarefaMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 TarefaMiddleware.validate_projeto_id_param()")
+            logger.debug("TarefaMiddleware.validate_projeto_id_param()")
             if 'projeto_id' not in kwargs:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O parâmetro 'projeto_id' é obrigatório!"})
             return f(*args, **kwargs)
-        return decorated_function
\ No newline at end of file
+        return decorated_function
+
+    def validate_batch_body(self, f):
+        """
+        Decorator para validar o corpo das rotas de lote (POST/PUT /batch).
+
+        Verifica apenas a estrutura:
+        - O campo 'tarefas' existe e é uma lista não vazia de objetos
+        Os campos de cada item são validados no service, item a item.
+        """
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            logger.debug("TarefaMiddleware.validate_batch_body()")
+            self.verificar_batch_body(request.get_json())
+            return f(*args, **kwargs)
+        return decorated_function
+
+    def verificar_batch_body(self, body):
+        """
+        Regras de validate_batch_body, sem depender do framework (usadas também
+        pelo servidor ASGI).
+
+        :raises ErrorResponse: 400 se o corpo não passar na validação
+        """
+        if not isinstance(body, dict) or not isinstance(body.get('tarefas'), list) or len(body['tarefas']) == 0:
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'tarefas' deve ser uma lista não vazia!"})
+
+        if not all(isinstance(item, dict) for item in body['tarefas']):
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "Cada item de 'tarefas' deve ser um objeto!"})
+
+    def validate_batch_ids(self, f):
+        """
+        Decorator para validar o corpo da rota DELETE /batch.
+
+        Verifica apenas a estrutura:
+        - O campo 'ids' existe e é uma lista não vazia
+        """
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            logger.debug("TarefaMiddleware.validate_batch_ids()")
+            self.verificar_batch_ids(request.get_json())
+            return f(*args, **kwargs)
+        return decorated_function
+
+    def verificar_batch_ids(self, body):
+        """
+        Regras de validate_batch_ids, sem depender do framework (usadas também
+        pelo servidor ASGI).
+
+        :raises ErrorResponse: 400 se o corpo não passar na validação
+        """
+        if not isinstance(body, dict) or not isinstance(body.get('ids'), list) or len(body['ids']) == 0:
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'ids' deve ser uma lista não vazia!"})
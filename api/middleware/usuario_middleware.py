@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
+import logging
 from functools import wraps
 from flask import request
 from api.utils.error_response import ErrorResponse
 
+logger = logging.getLogger(__name__)
+
 class UsuarioMiddleware:
     """
     Middleware para validação de requisições relacionadas à entidade Usuario.
@@ -10,6 +13,10 @@ class UsuarioMiddleware:
     Objetivos:
     - Garantir que os campos obrigatórios existam antes de chamar os métodos do Controller ou Service.
     - Lançar erros padronizados usando ErrorResponse quando a validação falhar.
+
+    As regras de corpo ficam nos métodos verificar_*, que recebem o corpo já
+    lido: os decorators validate_* (Flask) e o AsyncBodyMiddleware (ASGI)
+    aplicam as mesmas regras.
     """
 
     def validate_body(self, f):
@@ -22,22 +29,23 @@ class UsuarioMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 UsuarioMiddleware.validate_body()")
-            body = request.get_json()
-            
-            if not body or 'usuario' not in body:
-                raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'usuario' é obrigatório!"})
+            logger.debug("UsuarioMiddleware.validate_body()")
+            self.verificar_body(request.get_json())
+            return f(*args, **kwargs)
+        return decorated_function
 
-            usuario = body['usuario']
+    def verificar_body(self, body):
+        """Regras de validate_body sobre o corpo já lido (dict ou None)."""
+        if not isinstance(body, dict) or not isinstance(body.get('usuario'), dict):
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'usuario' é obrigatório!"})
 
-            # Apenas verificar existência dos campos obrigatórios
-            campos_obrigatorios = ["nome", "email", "senha_hash"]
-            for campo in campos_obrigatorios:
-                if campo not in usuario:
-                    raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
+        usuario = body['usuario']
 
-            return f(*args, **kwargs)
-        return decorated_function
+        # Apenas verificar existência dos campos obrigatórios
+        campos_obrigatorios = ["nome", "email", "senha_hash"]
+        for campo in campos_obrigatorios:
+            if campo not in usuario:
+                raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
 
     def validate_body_update(self, f):
         """
@@ -49,22 +57,23 @@ class UsuarioMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 UsuarioMiddleware.validate_body_update()")
-            body = request.get_json()
-            
-            if not body or 'usuario' not in body:
-                raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'usuario' é obrigatório!"})
+            logger.debug("UsuarioMiddleware.validate_body_update()")
+            self.verificar_body_update(request.get_json())
+            return f(*args, **kwargs)
+        return decorated_function
 
-            usuario = body['usuario']
+    def verificar_body_update(self, body):
+        """Regras de validate_body_update sobre o corpo já lido (dict ou None)."""
+        if not isinstance(body, dict) or not isinstance(body.get('usuario'), dict):
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'usuario' é obrigatório!"})
 
-            # Campos obrigatórios para atualização
-            campos_obrigatorios = ["nome", "email"]
-            for campo in campos_obrigatorios:
-                if campo not in usuario:
-                    raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
+        usuario = body['usuario']
 
-            return f(*args, **kwargs)
-        return decorated_function
+        # Campos obrigatórios para atualização
+        campos_obrigatorios = ["nome", "email"]
+        for campo in campos_obrigatorios:
+            if campo not in usuario:
+                raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
 
     def validate_login_body(self, f):
         """
@@ -76,22 +85,28 @@ class UsuarioMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 UsuarioMiddleware.validate_login_body()")
-            body = request.get_json()
+            logger.debug("UsuarioMiddleware.validate_login_body()")
+            self.verificar_login_body(request.get_json())
+            return f(*args, **kwargs)
+        return decorated_function
 
-            if not body or 'usuario' not in body:
-                raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'usuario' é obrigatório!"})
+    def verificar_login_body(self, body):
+        """
+        Regras de validate_login_body, sem depender do framework (usadas também
+        pelo servidor ASGI).
 
-            usuario = body['usuario']
+        :raises ErrorResponse: 400 se o corpo não passar na validação
+        """
+        if not isinstance(body, dict) or not isinstance(body.get('usuario'), dict):
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'usuario' é obrigatório!"})
 
-            # ✅ CORREÇÃO CRÍTICA: Mudar de "senha_hash" para "senha"
-            campos_obrigatorios = ["email", "senha"]
-            for campo in campos_obrigatorios:
-                if campo not in usuario:
-                    raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
+        usuario = body['usuario']
 
-            return f(*args, **kwargs)
-        return decorated_function
+        # ✅ CORREÇÃO CRÍTICA: Mudar de "senha_hash" para "senha"
+        campos_obrigatorios = ["email", "senha"]
+        for campo in campos_obrigatorios:
+            if campo not in usuario:
+                raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{campo}' é obrigatório!"})
 
     def validate_id_param(self, f):
         """
@@ -101,7 +116,7 @@ class UsuarioMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 UsuarioMiddleware.validate_id_param()")
+            logger.debug("UsuarioMiddleware.validate_id_param()")
             if 'id' not in kwargs:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O parâmetro 'id' é obrigatório!"})
             return f(*args, **kwargs)
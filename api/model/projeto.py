@@ -2,6 +2,9 @@
 from datetime import datetime, date
 
 class Projeto:
+    # Atributos em slots (sem __dict__ por instância); os nomes são os privados de __init__
+    __slots__ = ("__id", "__nome", "__descricao", "__data_inicio", "__data_fim", "__status", "__usuario_id")
+
     def __init__(self):
         """
         Inicializa todos os atributos como atributos de instância.
@@ -14,6 +17,26 @@ class Projeto:
         self.__status = None
         self.__usuario_id = None
 
+    @classmethod
+    def from_row(cls, row: dict) -> "Projeto":
+        """
+        Cria o Projeto a partir de uma linha lida do banco, sem passar pelos
+        setters: os valores já foram validados quando foram gravados.
+        Dados vindos da API continuam usando o construtor e os setters.
+
+        :param row: dict - colunas id, nome, descricao, data_inicio, data_fim, status, usuario_id (outras são ignoradas)
+        :return: Projeto
+        """
+        projeto = cls.__new__(cls)
+        projeto.__id = row["id"]
+        projeto.__nome = row["nome"]
+        projeto.__descricao = row["descricao"]
+        projeto.__data_inicio = row["data_inicio"]
+        projeto.__data_fim = row["data_fim"]
+        projeto.__status = row["status"]
+        projeto.__usuario_id = row["usuario_id"]
+        return projeto
+
     @property
     def id(self):
         """
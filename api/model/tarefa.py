@@ -2,6 +2,9 @@
 from datetime import datetime, date
 
 class Tarefa:
+    # Atributos em slots (sem __dict__ por instância); os nomes são os privados de __init__
+    __slots__ = ("__id", "__titulo", "__concluida", "__data_limite", "__projeto_id")
+
     def __init__(self):
         """
         Inicializa todos os atributos como atributos de instância.
@@ -12,6 +15,24 @@ class Tarefa:
         self.__data_limite = None
         self.__projeto_id = None
 
+    @classmethod
+    def from_row(cls, row: dict) -> "Tarefa":
+        """
+        Cria a Tarefa a partir de uma linha lida do banco, sem passar pelos
+        setters: os valores já foram validados quando foram gravados.
+        Dados vindos da API continuam usando o construtor e os setters.
+
+        :param row: dict - colunas id, titulo, concluida, data_limite, projeto_id (outras são ignoradas)
+        :return: Tarefa
+        """
+        tarefa = cls.__new__(cls)
+        tarefa.__id = row["id"]
+        tarefa.__titulo = row["titulo"]
+        tarefa.__concluida = bool(row["concluida"])  # TINYINT(1) vem como 0/1
+        tarefa.__data_limite = row["data_limite"]
+        tarefa.__projeto_id = row["projeto_id"]
+        return tarefa
+
     @property
     def id(self):
         """
@@ -2,6 +2,9 @@
 from datetime import datetime
 
 class Usuario:
+    # Atributos em slots (sem __dict__ por instância); os nomes são os privados de __init__
+    __slots__ = ("__id", "__nome", "__email", "__senha_hash", "__data_criacao")
+
     def __init__(self):
         """
         Inicializa todos os atributos como atributos de instância.
@@ -12,6 +15,24 @@ class Usuario:
         self.__senha_hash = None
         self.__data_criacao = None
 
+    @classmethod
+    def from_row(cls, row: dict) -> "Usuario":
+        """
+        Cria o Usuario a partir de uma linha lida do banco, sem passar pelos
+        setters: os valores já foram validados quando foram gravados.
+        Dados vindos da API continuam usando o construtor e os setters.
+
+        :param row: dict - colunas id, nome, email, senha_hash, data_criacao (outras são ignoradas)
+        :return: Usuario
+        """
+        usuario = cls.__new__(cls)
+        usuario.__id = row["id"]
+        usuario.__nome = row["nome"]
+        usuario.__email = row["email"]
+        usuario.__senha_hash = row["senha_hash"]
+        usuario.__data_criacao = row["data_criacao"]
+        return usuario
+
     @property
     def id(self):
         """
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import logging
+from quart import Blueprint
+from api.middleware.async_jwt_middleware import AsyncJwtMiddleware
+from api.middleware.async_body_middleware import AsyncBodyMiddleware
+from api.middleware.projeto_middleware import ProjetoMiddleware
+from api.control.async_projeto_control import AsyncProjetoControl
+
+logger = logging.getLogger(__name__)
+
+class AsyncProjetoRoteador:
+    """
+    Rotas da entidade Projeto para o servidor ASGI (Quart).
+
+    Subconjunto das rotas do ProjetoRoteador (as listadas em create_routes),
+    nos mesmos caminhos e com as mesmas validações de corpo, apontando para
+    o AsyncProjetoControl.
+    """
+
+    def __init__(self, jwt_middleware: AsyncJwtMiddleware, body_middleware: AsyncBodyMiddleware,
+                 projeto_middleware: ProjetoMiddleware, projeto_control: AsyncProjetoControl):
+        """
+        :param jwt_middleware: Middleware responsável por validar token JWT.
+        :param body_middleware: Aplica as validações de corpo de projeto_middleware.
+        :param projeto_middleware: Mesmas validações de corpo do servidor Flask.
+        :param projeto_control: Controlador assíncrono de Projeto.
+        """
+        logger.debug("AsyncProjetoRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__body_middleware = body_middleware
+        self.__projeto_middleware = projeto_middleware
+        self.__projeto_control = projeto_control
+        self.__blueprint = Blueprint('projeto', __name__)
+
+    def create_routes(self):
+        """
+        Rotas implementadas:
+        - POST /        -> Cria um novo projeto
+        - GET /         -> Lista todos os projetos
+        - GET /<id>     -> Retorna um projeto por ID
+        - PUT /<id>     -> Atualiza um projeto por ID
+        - DELETE /<id>  -> Remove um projeto por ID
+        """
+
+        @self.__blueprint.route('/', methods=['POST'])
+        @self.__jwt_middleware.validate_token
+        @self.__body_middleware.validate(self.__projeto_middleware.verificar_body)
+        async def store():
+            return await self.__projeto_control.store()
+
+        @self.__blueprint.route('/', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        async def index():
+            return await self.__projeto_control.index()
+
+        @self.__blueprint.route('/<int:id>', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        async def show(id):
+            return await self.__projeto_control.show(id)
+
+        @self.__blueprint.route('/<int:id>', methods=['PUT'])
+        @self.__jwt_middleware.validate_token
+        @self.__body_middleware.validate(self.__projeto_middleware.verificar_body_update)
+        async def update(id):
+            return await self.__projeto_control.update(id)
+
+        @self.__blueprint.route('/<int:id>', methods=['DELETE'])
+        @self.__jwt_middleware.validate_token
+        async def destroy(id):
+            return await self.__projeto_control.destroy(id)
+
+        return self.__blueprint
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import logging
+from quart import Blueprint
+from api.middleware.async_jwt_middleware import AsyncJwtMiddleware
+from api.middleware.async_body_middleware import AsyncBodyMiddleware
+from api.middleware.tarefa_middleware import TarefaMiddleware
+from api.control.async_tarefa_control import AsyncTarefaControl
+
+logger = logging.getLogger(__name__)
+
+class AsyncTarefaRoteador:
+    """
+    Rotas da entidade Tarefa para o servidor ASGI (Quart).
+
+    Subconjunto das rotas do TarefaRoteador (as listadas em create_routes),
+    nos mesmos caminhos e com as mesmas validações de corpo, apontando para
+    o AsyncTarefaControl.
+    """
+
+    def __init__(self, jwt_middleware: AsyncJwtMiddleware, body_middleware: AsyncBodyMiddleware,
+                 tarefa_middleware: TarefaMiddleware, tarefa_control: AsyncTarefaControl):
+        """
+        :param jwt_middleware: Middleware responsável por validar token JWT.
+        :param body_middleware: Aplica as validações de corpo de tarefa_middleware.
+        :param tarefa_middleware: Mesmas validações de corpo do servidor Flask.
+        :param tarefa_control: Controlador assíncrono de Tarefa.
+        """
+        logger.debug("AsyncTarefaRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__body_middleware = body_middleware
+        self.__tarefa_middleware = tarefa_middleware
+        self.__tarefa_control = tarefa_control
+        self.__blueprint = Blueprint('tarefa', __name__)
+
+    def create_routes(self):
+        """
+        Rotas implementadas:
+        - POST /        -> Cria uma nova tarefa
+        - GET /         -> Lista as tarefas (paginado: ?limit=&after_id=)
+        - GET /<id>     -> Retorna uma tarefa por ID
+        - PUT /<id>     -> Atualiza uma tarefa por ID
+        - DELETE /<id>  -> Remove uma tarefa por ID
+        - GET /projeto/<projeto_id> -> Lista tarefas por projeto
+        - PUT /<id>/concluir -> Marca tarefa como concluída
+        """
+
+        @self.__blueprint.route('/', methods=['POST'])
+        @self.__jwt_middleware.validate_token
+        @self.__body_middleware.validate(self.__tarefa_middleware.verificar_body)
+        async def store():
+            return await self.__tarefa_control.store()
+
+        @self.__blueprint.route('/', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        async def index():
+            return await self.__tarefa_control.index()
+
+        @self.__blueprint.route('/<int:id>', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        async def show(id):
+            return await self.__tarefa_control.show(id)
+
+        @self.__blueprint.route('/<int:id>', methods=['PUT'])
+        @self.__jwt_middleware.validate_token
+        @self.__body_middleware.validate(self.__tarefa_middleware.verificar_body_update)
+        async def update(id):
+            return await self.__tarefa_control.update(id)
+
+        @self.__blueprint.route('/<int:id>', methods=['DELETE'])
+        @self.__jwt_middleware.validate_token
+        async def destroy(id):
+            return await self.__tarefa_control.destroy(id)
+
+        @self.__blueprint.route('/projeto/<int:projeto_id>', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        async def show_by_projeto(projeto_id):
+            return await self.__tarefa_control.show_by_projeto(projeto_id)
+
+        @self.__blueprint.route('/<int:id>/concluir', methods=['PUT'])
+        @self.__jwt_middleware.validate_token
+        async def marcar_concluida(id):
+            return await self.__tarefa_control.marcar_concluida(id)
+
+        return self.__blueprint
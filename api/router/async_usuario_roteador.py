@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import logging
+from quart import Blueprint
+from api.middleware.async_jwt_middleware import AsyncJwtMiddleware
+from api.middleware.async_body_middleware import AsyncBodyMiddleware
+from api.middleware.usuario_middleware import UsuarioMiddleware
+from api.control.async_usuario_control import AsyncUsuarioControl
+
+logger = logging.getLogger(__name__)
+
+class AsyncUsuarioRoteador:
+    """
+    Rotas da entidade Usuario para o servidor ASGI (Quart).
+
+    Subconjunto das rotas do UsuarioRoteador (as listadas em create_routes),
+    nos mesmos caminhos e com as mesmas validações de corpo, apontando para
+    o AsyncUsuarioControl.
+    """
+
+    def __init__(self, jwt_middleware: AsyncJwtMiddleware, body_middleware: AsyncBodyMiddleware,
+                 usuario_middleware: UsuarioMiddleware, usuario_control: AsyncUsuarioControl):
+        """
+        :param jwt_middleware: Middleware responsável por validar token JWT.
+        :param body_middleware: Aplica as validações de corpo de usuario_middleware.
+        :param usuario_middleware: Mesmas validações de corpo do servidor Flask.
+        :param usuario_control: Controlador assíncrono de Usuario.
+        """
+        logger.debug("AsyncUsuarioRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__body_middleware = body_middleware
+        self.__usuario_middleware = usuario_middleware
+        self.__usuario_control = usuario_control
+        self.__blueprint = Blueprint('usuario', __name__)
+
+    def create_routes(self):
+        """
+        Rotas implementadas:
+        - POST /login    -> Autentica usuário (público)
+        - POST /         -> Cria um novo usuário (público)
+        - GET /          -> Lista todos os usuários (público)
+        - GET /<id>      -> Retorna um usuário por ID
+        """
+
+        @self.__blueprint.route('/login', methods=['POST'])
+        @self.__body_middleware.validate(self.__usuario_middleware.verificar_login_body)
+        async def login():
+            return await self.__usuario_control.login()
+
+        @self.__blueprint.route('/', methods=['POST'])
+        @self.__body_middleware.validate(self.__usuario_middleware.verificar_body)
+        async def store():
+            return await self.__usuario_control.store()
+
+        @self.__blueprint.route('/', methods=['GET'])
+        async def index():
+            return await self.__usuario_control.index()
+
+        @self.__blueprint.route('/<int:id>', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        async def show(id):
+            return await self.__usuario_control.show(id)
+
+        return self.__blueprint
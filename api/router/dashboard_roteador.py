@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import logging
+from flask import Blueprint
+from api.middleware.jwt_middleware import JwtMiddleware
+from api.control.dashboard_control import DashboardControl
+
+logger = logging.getLogger(__name__)
+
+class DashboardRoteador:
+    """
+    Classe responsável por configurar as rotas do dashboard no Flask.
+
+    Objetivos:
+    - Criar um Blueprint isolado para as rotas do dashboard.
+    - Receber middleware e controlador via injeção de dependência.
+    - Aplicar autenticação JWT antes de chamar o controlador.
+    """
+
+    def __init__(self, jwt_middleware: JwtMiddleware, dashboard_control: DashboardControl):
+        """
+        Construtor do roteador.
+
+        :param jwt_middleware: Middleware responsável por validar token JWT.
+        :param dashboard_control: Controlador do dashboard.
+        """
+        logger.debug("DashboardRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__dashboard_control = dashboard_control
+
+        self.__blueprint = Blueprint('dashboard', __name__)
+
+    def create_routes(self):
+        """
+        Configura e retorna as rotas do dashboard.
+
+        Rotas implementadas:
+        - GET /resumo -> Totais de usuários, projetos e tarefas, tarefas por status,
+                         atrasadas e taxa de conclusão por projeto
+        """
+
+        # GET /resumo -> agregados do dashboard
+        @self.__blueprint.route('/resumo', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def resumo():
+            """
+            Rota que retorna os agregados exibidos no dashboard.
+            Requer autenticação JWT.
+            """
+            return self.__dashboard_control.resumo()
+
+        # Retorna o Blueprint configurado para registro na aplicação Flask
+        return self.__blueprint
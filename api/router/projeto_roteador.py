@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
+import logging
 from flask import Blueprint, request, jsonify
 from api.middleware.jwt_middleware import JwtMiddleware
 from api.middleware.projeto_middleware import ProjetoMiddleware
 from api.control.projeto_control import ProjetoControl
 
+logger = logging.getLogger(__name__)
+
 class ProjetoRoteador:
     """
     Classe responsável por configurar todas as rotas da entidade Projeto no Flask.
@@ -22,7 +25,7 @@ class ProjetoRoteador:
         :param projeto_middleware: Middleware com validações específicas para Projeto.
         :param projeto_control: Controlador que implementa a lógica de negócio.
         """
-        print("⬆️  ProjetoRoteador.__init__()")
+        logger.debug("ProjetoRoteador.__init__()")
         self.__jwt_middleware = jwt_middleware
         self.__projeto_middleware = projeto_middleware
         self.__projeto_control = projeto_control
@@ -41,7 +44,7 @@ class ProjetoRoteador:
         - PUT /<id>     -> Atualiza um projeto por ID
         - DELETE /<id>  -> Remove um projeto por ID
         - GET /usuario/<usuario_id> -> Lista projetos por usuário
-        - GET /meus-projetos -> Lista projetos do usuário autenticado
+        - GET /meus-projetos -> Lista projetos do usuário autenticado (paginado)
         """
 
         # POST / -> cria um projeto
@@ -137,7 +140,7 @@ class ProjetoRoteador:
                     }
                 }), 401
             
-            return self.__projeto_control.show_by_usuario(user_id)
+            return self.__projeto_control.meus_projetos(user_id)
 
         # Retorna o Blueprint configurado para registro na aplicação Flask
         return self.__blueprint
\ No newline at end of file
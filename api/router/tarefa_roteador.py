@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
+import logging
 from flask import Blueprint, request, jsonify
 from api.middleware.jwt_middleware import JwtMiddleware
 from api.middleware.tarefa_middleware import TarefaMiddleware
 from api.control.tarefa_control import TarefaControl
 
+logger = logging.getLogger(__name__)
+
 class TarefaRoteador:
     """
     Classe responsável por configurar todas as rotas da entidade Tarefa no Flask.
@@ -22,7 +25,7 @@ class TarefaRoteador:
         :param tarefa_middleware: Middleware com validações específicas para Tarefa.
         :param tarefa_control: Controlador que implementa a lógica de negócio.
         """
-        print("⬆️  TarefaRoteador.__init__()")
+        logger.debug("TarefaRoteador.__init__()")
         self.__jwt_middleware = jwt_middleware
         self.__tarefa_middleware = tarefa_middleware
         self.__tarefa_control = tarefa_control
@@ -36,13 +39,16 @@ class TarefaRoteador:
 
         Rotas implementadas:
         - POST /        -> Cria uma nova tarefa
-        - GET /         -> Lista todas as tarefas
+        - GET /         -> Lista as tarefas (paginado: ?limit=&after_id=)
         - GET /<id>     -> Retorna uma tarefa por ID
         - PUT /<id>     -> Atualiza uma tarefa por ID
         - DELETE /<id>  -> Remove uma tarefa por ID
         - GET /projeto/<projeto_id> -> Lista tarefas por projeto
         - PUT /<id>/concluir -> Marca tarefa como concluída
-        - GET /minhas-tarefas -> Lista tarefas do usuário autenticado
+        - GET /minhas-tarefas -> Lista tarefas dos projetos do usuário autenticado (paginado)
+        - POST /batch   -> Cria várias tarefas (uma transação)
+        - PUT /batch    -> Atualiza várias tarefas (uma transação)
+        - DELETE /batch -> Remove várias tarefas
         """
 
         # POST / -> cria uma tarefa
@@ -61,7 +67,8 @@ class TarefaRoteador:
         @self.__jwt_middleware.validate_token
         def index():
             """
-            Rota responsável por listar todas as tarefas cadastradas no sistema.
+            Rota responsável por listar as tarefas cadastradas no sistema.
+            Paginada por cursor: ?limit=N&after_id=<next_cursor da página anterior>.
             Requer autenticação JWT.
             """
             return self.__tarefa_control.index()
@@ -151,14 +158,46 @@ class TarefaRoteador:
                     }
                 }), 401
             
-            # Esta rota precisaria de um método específico no service/control
-            # que busca tarefas por usuário (não apenas por projeto)
-            # Por enquanto, vamos usar uma implementação básica
-            return jsonify({
-                "success": True,
-                "message": "Rota em desenvolvimento - minhas-tarefas",
-                "data": {"user_id": user_id}
-            }), 200
+            return self.__tarefa_control.minhas_tarefas(user_id)
+
+        # POST /batch -> cria várias tarefas
+        @self.__blueprint.route('/batch', methods=['POST'])
+        @self.__jwt_middleware.validate_token
+        @self.__tarefa_middleware.validate_batch_body
+        def store_batch():
+            """
+            Rota que cria várias tarefas de uma vez.
+            Requer autenticação JWT.
+
+            Body esperado: {"tarefas": [{"titulo": "...", "projeto_id": 1}, ...]}
+            """
+            return self.__tarefa_control.store_batch()
+
+        # PUT /batch -> atualiza várias tarefas
+        @self.__blueprint.route('/batch', methods=['PUT'])
+        @self.__jwt_middleware.validate_token
+        @self.__tarefa_middleware.validate_batch_body
+        def update_batch():
+            """
+            Rota que atualiza várias tarefas de uma vez.
+            Requer autenticação JWT.
+
+            Body esperado: {"tarefas": [{"id": 1, "titulo": "...", "concluida": false}, ...]}
+            """
+            return self.__tarefa_control.update_batch()
+
+        # DELETE /batch -> remove várias tarefas
+        @self.__blueprint.route('/batch', methods=['DELETE'])
+        @self.__jwt_middleware.validate_token
+        @self.__tarefa_middleware.validate_batch_ids
+        def destroy_batch():
+            """
+            Rota que remove várias tarefas de uma vez.
+            Requer autenticação JWT.
+
+            Body esperado: {"ids": [1, 2, 3]}
+            """
+            return self.__tarefa_control.destroy_batch()
 
         # Retorna o Blueprint configurado para registro na aplicação Flask
         return self.__blueprint
\ No newline at end of file
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
+import logging
 from flask import Blueprint, request, jsonify
 from api.middleware.jwt_middleware import JwtMiddleware
 from api.middleware.usuario_middleware import UsuarioMiddleware
 from api.control.usuario_control import UsuarioControl
 
+logger = logging.getLogger(__name__)
+
 class UsuarioRoteador:
     """
     Classe responsável por configurar todas as rotas da entidade Usuario no Flask.
@@ -22,7 +25,7 @@ class UsuarioRoteador:
         :param usuario_middleware: Middleware com validações específicas para Usuario.
         :param usuario_control: Controlador que implementa a lógica de negócio.
         """
-        print("⬆️  UsuarioRoteador.__init__()")
+        logger.debug("UsuarioRoteador.__init__()")
         self.__jwt_middleware = jwt_middleware
         self.__usuario_middleware = usuario_middleware
         self.__usuario_control = usuario_control
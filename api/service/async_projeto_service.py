@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import logging
+from api.dao.async_projeto_dao import AsyncProjetoDAO
+from api.dao.async_usuario_dao import AsyncUsuarioDAO
+from api.model.projeto import Projeto
+from api.utils.error_response import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Versão assíncrona de ProjetoService.
+
+Mesmas regras de negócio e mesmos erros (ErrorResponse) da versão
+síncrona, sobre AsyncProjetoDAO/AsyncUsuarioDAO.
+"""
+class AsyncProjetoService:
+    def __init__(self, projeto_dao_dependency: AsyncProjetoDAO, usuario_dao_dependency: AsyncUsuarioDAO,
+                 database_dependency, verificar_fk: bool = True):
+        """
+        :param database_dependency: AsyncMysqlDatabase - usado para abrir transações
+        :param verificar_fk: bool - mesma opção de ProjetoService
+        """
+        logger.debug("AsyncProjetoService.__init__()")
+        self.__projetoDAO = projeto_dao_dependency
+        self.__usuarioDAO = usuario_dao_dependency
+        self.__database = database_dependency
+        self.__verificar_fk = verificar_fk
+
+    async def createProjeto(self, jsonProjeto: dict) -> int:
+        logger.debug("AsyncProjetoService.createProjeto()")
+
+        objProjeto = Projeto()
+        objProjeto.nome = jsonProjeto["nome"]
+        objProjeto.descricao = jsonProjeto.get("descricao")
+        objProjeto.data_inicio = jsonProjeto.get("data_inicio")
+        objProjeto.status = jsonProjeto.get("status", "Pendente")
+        objProjeto.usuario_id = jsonProjeto["usuario_id"]
+
+        try:
+            async with self.__database.transaction() as tx:
+                if self.__verificar_fk and not await self.__usuarioDAO.exists(objProjeto.usuario_id, tx=tx):
+                    raise ErrorResponse(
+                        400,
+                        "Usuário não encontrado",
+                        {"message": f"O usuário com ID {objProjeto.usuario_id} não existe"}
+                    )
+                return await self.__projetoDAO.create(objProjeto, tx=tx)
+        except ValueError:
+            raise ErrorResponse(
+                400,
+                "Usuário não encontrado",
+                {"message": f"O usuário com ID {objProjeto.usuario_id} não existe"}
+            )
+
+    async def findAll(self, filtros=None) -> list[dict]:
+        logger.debug("AsyncProjetoService.findAll()")
+        try:
+            return await self.__projetoDAO.findAll(filtros)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+
+    async def findById(self, id: int) -> dict:
+        projeto = await self.__projetoDAO.findById(id)
+        if not projeto:
+            raise ErrorResponse(
+                404,
+                "Projeto não encontrado",
+                {"message": f"Não existe projeto com id {id}"}
+            )
+        return projeto
+
+    async def updateProjeto(self, id: int, requestBody: dict) -> bool:
+        logger.debug("AsyncProjetoService.updateProjeto()")
+
+        jsonProjeto = requestBody["projeto"]
+
+        objProjeto = Projeto()
+        objProjeto.id = id
+        objProjeto.nome = jsonProjeto["nome"]
+        objProjeto.descricao = jsonProjeto.get("descricao")
+        objProjeto.data_inicio = jsonProjeto.get("data_inicio")
+        objProjeto.status = jsonProjeto["status"]
+        objProjeto.usuario_id = jsonProjeto.get("usuario_id")
+
+        return await self.__projetoDAO.update(objProjeto)
+
+    async def deleteProjeto(self, id: int) -> bool:
+        logger.debug("AsyncProjetoService.deleteProjeto()")
+        return await self.__projetoDAO.delete(id)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+import logging
+from api.dao.async_tarefa_dao import AsyncTarefaDAO
+from api.dao.async_projeto_dao import AsyncProjetoDAO
+from api.dao.tarefa_dao import TarefaDAO
+from api.model.tarefa import Tarefa
+from api.utils.error_response import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Versão assíncrona de TarefaService.
+
+Mesmas regras de negócio e mesmos erros (ErrorResponse) da versão
+síncrona, sobre AsyncTarefaDAO/AsyncProjetoDAO.
+"""
+class AsyncTarefaService:
+    LIMITE_PADRAO = 50
+    LIMITE_MAXIMO = 200
+
+    def __init__(self, tarefa_dao_dependency: AsyncTarefaDAO, projeto_dao_dependency: AsyncProjetoDAO,
+                 database_dependency, verificar_fk: bool = True):
+        """
+        :param database_dependency: AsyncMysqlDatabase - usado para abrir transações
+        :param verificar_fk: bool - mesma opção de TarefaService
+        """
+        logger.debug("AsyncTarefaService.__init__()")
+        self.__tarefaDAO = tarefa_dao_dependency
+        self.__projetoDAO = projeto_dao_dependency
+        self.__database = database_dependency
+        self.__verificar_fk = verificar_fk
+
+    async def createTarefa(self, jsonTarefa: dict) -> int:
+        logger.debug("AsyncTarefaService.createTarefa()")
+
+        objTarefa = Tarefa()
+        objTarefa.titulo = jsonTarefa["titulo"]
+        objTarefa.concluida = jsonTarefa.get("concluida", False)
+        objTarefa.data_limite = jsonTarefa.get("data_limite") or None
+        objTarefa.projeto_id = jsonTarefa["projeto_id"]
+
+        try:
+            async with self.__database.transaction() as tx:
+                if self.__verificar_fk and not await self.__projetoDAO.exists(objTarefa.projeto_id, tx=tx):
+                    raise ErrorResponse(
+                        400,
+                        "Projeto não encontrado",
+                        {"message": f"O projeto com ID {objTarefa.projeto_id} não existe"}
+                    )
+                return await self.__tarefaDAO.create(objTarefa, tx=tx)
+        except ValueError:
+            raise ErrorResponse(
+                400,
+                "Projeto não encontrado",
+                {"message": f"O projeto com ID {objTarefa.projeto_id} não existe"}
+            )
+
+    async def findAll(self, limit: int = None, after_id: int = None, filtros=None, offset: int = None) -> dict:
+        """
+        Retorna uma página de tarefas (mesmo contrato de TarefaService.findAll).
+        """
+        logger.debug("AsyncTarefaService.findAll()")
+
+        if limit is None:
+            limit = self.LIMITE_PADRAO
+        limit = max(1, min(int(limit), self.LIMITE_MAXIMO))
+        ordenado = TarefaDAO.CONSULTA.ordenado(filtros)
+
+        # busca uma linha a mais só para saber se existe próxima página
+        try:
+            tarefas = await self.__tarefaDAO.findAll(limit + 1, after_id, filtros, offset)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+
+        tem_proxima = len(tarefas) > limit
+        tarefas = tarefas[:limit]
+        if ordenado:
+            next_offset = (offset or 0) + limit if tem_proxima else None
+            return {"tarefas": tarefas, "next_cursor": None, "next_offset": next_offset}
+
+        next_cursor = tarefas[-1]["id"] if tem_proxima else None
+        return {"tarefas": tarefas, "next_cursor": next_cursor}
+
+    async def findById(self, id: int) -> dict:
+        tarefa = await self.__tarefaDAO.findById(id)
+        if not tarefa:
+            raise ErrorResponse(
+                404,
+                "Tarefa não encontrada",
+                {"message": f"Não existe tarefa com id {id}"}
+            )
+        return tarefa
+
+    async def updateTarefa(self, id: int, requestBody: dict) -> bool:
+        logger.debug("AsyncTarefaService.updateTarefa()")
+
+        jsonTarefa = requestBody["tarefa"]
+        objTarefa = Tarefa()
+        objTarefa.id = id
+        objTarefa.titulo = jsonTarefa["titulo"]
+        objTarefa.concluida = jsonTarefa["concluida"]
+        objTarefa.data_limite = jsonTarefa.get("data_limite") or None
+        objTarefa.projeto_id = jsonTarefa.get("projeto_id")
+
+        return await self.__tarefaDAO.update(objTarefa)
+
+    async def deleteTarefa(self, id: int) -> bool:
+        logger.debug("AsyncTarefaService.deleteTarefa()")
+        return await self.__tarefaDAO.delete(id)
+
+    async def findByProjetoId(self, projeto_id: int) -> list[dict]:
+        logger.debug("AsyncTarefaService.findByProjetoId()")
+
+        if not await self.__projetoDAO.exists(projeto_id):
+            raise ErrorResponse(
+                404,
+                "Projeto não encontrado",
+                {"message": f"Não existe projeto com id {projeto_id}"}
+            )
+
+        return await self.__tarefaDAO.findByProjetoId(projeto_id)
+
+    async def marcarComoConcluida(self, id: int) -> bool:
+        logger.debug("AsyncTarefaService.marcarComoConcluida()")
+
+        async with self.__database.transaction() as tx:
+            if not await self.__tarefaDAO.exists(id, tx=tx):
+                raise ErrorResponse(
+                    404,
+                    "Tarefa não encontrada",
+                    {"message": f"Não existe tarefa com id {id}"}
+                )
+
+            return await self.__tarefaDAO.marcarComoConcluida(id, tx=tx)
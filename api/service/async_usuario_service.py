@@ -0,0 +1,110 @@
+# api/service/async_usuario_service.py
+import logging
+import asyncio
+from datetime import datetime
+from api.model.usuario import Usuario
+from api.utils.error_response import ErrorResponse
+from api.utils.password_hasher import PasswordHasher
+
+logger = logging.getLogger(__name__)
+
+class AsyncUsuarioService:
+    def __init__(self, usuario_dao_dependency, password_hasher: PasswordHasher = None):
+        """
+        Versão assíncrona do UsuarioService
+        :param usuario_dao_dependency: AsyncUsuarioDAO
+        :param password_hasher: PasswordHasher; o bcrypt roda fora do event loop
+        """
+        logger.debug("AsyncUsuarioService.__init__()")
+        self.__usuario_dao = usuario_dao_dependency
+        self.__password_hasher = password_hasher or PasswordHasher()
+
+    async def createUsuario(self, usuario_data):
+        """
+        Cria um novo usuário com validações
+        """
+        try:
+            if await self.__usuario_dao.email_exists(usuario_data.get('email')):
+                raise ErrorResponse(400, "Email já cadastrado")
+
+            usuario = Usuario()
+            usuario.nome = usuario_data.get('nome')
+            usuario.email = usuario_data.get('email')
+
+            senha = usuario_data.get('senha', '')
+            if not senha:
+                raise ErrorResponse(400, "Senha é obrigatória")
+
+            # bcrypt é CPU puro: não pode rodar no event loop
+            usuario.senha_hash = await asyncio.to_thread(self.__password_hasher.hash_password, senha)
+            usuario.data_criacao = datetime.now()
+
+            return await self.__usuario_dao.create(usuario)
+
+        except ErrorResponse:
+            raise
+        except ValueError as e:
+            raise ErrorResponse(400, str(e))
+        except Exception as e:
+            logger.error("Erro em createUsuario: %s", e)
+            raise ErrorResponse(500, "Erro ao criar usuário")
+
+    async def loginUsuario(self, login_data):
+        """
+        Autentica usuário
+        """
+        try:
+            email = login_data.get('email')
+            senha = login_data.get('senha')
+
+            if not email or not senha:
+                raise ErrorResponse(400, "Email e senha são obrigatórios")
+
+            usuario_db = await self.__usuario_dao.find_by_email(email)
+            if not usuario_db:
+                raise ErrorResponse(401, "Email ou senha incorretos")
+
+            senha_ok = await asyncio.to_thread(
+                self.__password_hasher.check_password, senha, usuario_db.senha_hash
+            )
+            if not senha_ok:
+                raise ErrorResponse(401, "Email ou senha incorretos")
+
+            return {
+                'usuario': {
+                    'id': usuario_db.id,
+                    'nome': usuario_db.nome,
+                    'email': usuario_db.email
+                }
+            }
+
+        except ErrorResponse:
+            raise
+        except Exception as e:
+            logger.error("Erro em loginUsuario: %s", e)
+            raise ErrorResponse(500, "Erro ao fazer login")
+
+    async def findById(self, id):
+        """
+        Busca usuário por ID
+        """
+        usuario_db = await self.__usuario_dao.find_by_id(id)
+        if not usuario_db:
+            raise ErrorResponse(404, "Usuário não encontrado")
+
+        return {'usuario': self.__semSenha(usuario_db)}
+
+    async def findAll(self):
+        """
+        Busca todos os usuários
+        """
+        usuarios_db = await self.__usuario_dao.find_all()
+        return [self.__semSenha(usuario_db) for usuario_db in usuarios_db]
+
+    def __semSenha(self, usuario_db: Usuario) -> dict:
+        return {
+            'id': usuario_db.id,
+            'nome': usuario_db.nome,
+            'email': usuario_db.email,
+            'data_criacao': usuario_db.data_criacao
+        }
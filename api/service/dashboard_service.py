@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import logging
+from datetime import datetime
+from api.dao.tarefa_dao import TarefaDAO
+from api.dao.projeto_dao import ProjetoDAO
+from api.dao.usuario_dao import UsuarioDAO
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Classe responsável pela camada de serviço do dashboard.
+
+Monta o resumo a partir de consultas agregadas (GROUP BY) nas DAOs, sem
+trazer as listas de projetos e tarefas. Com usar_contadores=True os
+totais por status e por projeto vêm da tabela contadores_tarefas
+(migração 0003), cujo custo de leitura não cresce com o número de tarefas.
+"""
+class DashboardService:
+    # Quantidade de projetos na taxa de conclusão por projeto
+    PROJETOS_PADRAO = 10
+    PROJETOS_MAXIMO = 100
+
+    def __init__(self, tarefa_dao_dependency: TarefaDAO, projeto_dao_dependency: ProjetoDAO,
+                 usuario_dao_dependency: UsuarioDAO, usar_contadores: bool = False):
+        """
+        :param usar_contadores: bool - True lê os agregados de tarefas de contadores_tarefas
+        """
+        logger.debug("DashboardService.__init__()")
+        self.__tarefaDAO = tarefa_dao_dependency
+        self.__projetoDAO = projeto_dao_dependency
+        self.__usuarioDAO = usuario_dao_dependency
+        self.__usar_contadores = usar_contadores
+
+    def resumo(self, limite_projetos: int = None) -> dict:
+        """
+        Agregados do dashboard.
+
+        :param limite_projetos: int - projetos (mais recentes) na taxa de conclusão
+        :return: dict com usuarios, projetos, tarefas e conclusao_por_projeto
+        """
+        logger.debug("DashboardService.resumo()")
+
+        if limite_projetos is None:
+            limite_projetos = self.PROJETOS_PADRAO
+        limite_projetos = max(1, min(int(limite_projetos), self.PROJETOS_MAXIMO))
+
+        tarefas_status = self.__tarefaDAO.contarPorStatus(self.__usar_contadores)
+        total_tarefas = sum(item["total"] for item in tarefas_status)
+        concluidas = sum(item["concluidas"] for item in tarefas_status)
+
+        projetos_status = self.__projetoDAO.contarPorStatus()
+        por_projeto = self.__tarefaDAO.contarPorProjeto(limite_projetos, self.__usar_contadores)
+
+        return {
+            "usuarios": {"total": self.__usuarioDAO.count_all()},
+            "projetos": {
+                "total": sum(item["total"] for item in projetos_status),
+                "por_status": {item["status"]: item["total"] for item in projetos_status}
+            },
+            "tarefas": {
+                "total": total_tarefas,
+                "concluidas": concluidas,
+                "pendentes": total_tarefas - concluidas,
+                "atrasadas": self.__tarefaDAO.contarAtrasadas(datetime.now()),
+                "taxa_conclusao": self.__taxa(concluidas, total_tarefas),
+                "por_status": {
+                    item["status"]: {"total": item["total"], "concluidas": item["concluidas"]}
+                    for item in tarefas_status if item["total"] > 0
+                }
+            },
+            "conclusao_por_projeto": [
+                {
+                    "id": item["id"],
+                    "nome": item["nome"],
+                    "total_tarefas": item["total"],
+                    "concluidas": item["concluidas"],
+                    "taxa_conclusao": self.__taxa(item["concluidas"], item["total"])
+                }
+                for item in por_projeto
+            ],
+            "fonte": "contadores" if self.__usar_contadores else "consulta"
+        }
+
+    def __taxa(self, concluidas: int, total: int) -> float:
+        """Percentual de conclusão com uma casa decimal (0 sem tarefas)."""
+        return round(concluidas * 100.0 / total, 1) if total else 0.0
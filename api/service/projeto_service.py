@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
+import logging
+from contextlib import nullcontext
 from api.dao.projeto_dao import ProjetoDAO
 from api.dao.usuario_dao import UsuarioDAO
 from api.model.projeto import Projeto
+from api.utils.cache import CacheLeituras
 from api.utils.error_response import ErrorResponse
 
+logger = logging.getLogger(__name__)
+
 
 """
 Classe responsável pela camada de serviço para a entidade Projeto.
@@ -14,16 +19,31 @@ Observações sobre injeção de dependência:
 - Facilita testes unitários e uso de mocks.
 """
 class ProjetoService:
-    def __init__(self, projeto_dao_dependency: ProjetoDAO, usuario_dao_dependency: UsuarioDAO):
+    # Tamanho de página de meus-projetos quando o cliente não informa "limit"
+    LIMITE_PADRAO = 50
+    # Teto rígido do servidor, independente do "limit" pedido
+    LIMITE_MAXIMO = 200
+
+    def __init__(self, projeto_dao_dependency: ProjetoDAO, usuario_dao_dependency: UsuarioDAO,
+                 verificar_fk: bool = True, database_dependency=None, cache: CacheLeituras = None):
         """
         Construtor da classe ProjetoService
 
         :param projeto_dao_dependency: ProjetoDAO
         :param usuario_dao_dependency: UsuarioDAO
+        :param verificar_fk: bool - True consulta se o usuário existe antes do INSERT;
+                             False confia na FK do banco (uma ida ao banco só)
+        :param database_dependency: MysqlDatabase - usado para abrir transações nas
+                                    operações de vários passos (opcional)
+        :param cache: CacheLeituras - cache de findById e da listagem; qualquer escrita
+                      em projeto invalida tudo (opcional)
         """
-        print("⬆️  ProjetoService.__init__()")
+        logger.debug("ProjetoService.__init__()")
         self.__projetoDAO = projeto_dao_dependency
         self.__usuarioDAO = usuario_dao_dependency
+        self.__verificar_fk = verificar_fk
+        self.__database = database_dependency
+        self.__cache = cache or CacheLeituras()
 
     def createProjeto(self, jsonProjeto: dict) -> int:
         """
@@ -33,7 +53,7 @@ class ProjetoService:
         :return: int ID do projeto criado
         :raises ErrorResponse: se usuário não existir
         """
-        print("🟣 ProjetoService.createProjeto()")
+        logger.debug("ProjetoService.createProjeto()")
 
         objProjeto = Projeto()
         objProjeto.nome = jsonProjeto["nome"]
@@ -42,33 +62,127 @@ class ProjetoService:
         objProjeto.status = jsonProjeto.get("status", "Pendente")
         objProjeto.usuario_id = jsonProjeto["usuario_id"]
 
-        # regra de negócio: validar se usuário existe
-        usuarioExiste = self.__usuarioDAO.findByField("id", objProjeto.usuario_id)
-        if not usuarioExiste or len(usuarioExiste) == 0:
+        try:
+            with self.__transacao() as tx:
+                # regra de negócio: validar se usuário existe
+                if self.__verificar_fk and not self.__usuarioDAO.exists(objProjeto.usuario_id, tx=tx):
+                    raise ErrorResponse(
+                        400,
+                        "Usuário não encontrado",
+                        {"message": f"O usuário com ID {objProjeto.usuario_id} não existe"}
+                    )
+                novo_id = self.__projetoDAO.create(objProjeto, tx=tx)
+        except ValueError:
+            # FK violada no banco (modo verificar_fk=False ou usuário removido no meio)
             raise ErrorResponse(
                 400,
                 "Usuário não encontrado",
                 {"message": f"O usuário com ID {objProjeto.usuario_id} não existe"}
             )
+        self.__cache.invalidar_tudo()
+        return novo_id
 
-        return self.__projetoDAO.create(objProjeto)
+    def findAll(self, filtros=None, versao=None) -> list[dict]:
+        """
+        Retorna os projetos que atendem aos filtros (todos, sem filtros).
 
-    def findAll(self) -> list[dict]:
+        :param filtros: Mapping - filtros, sort e fields da query string
+        :param versao: dict - resultado de versaoLista(); o cache só devolve uma
+                       entrada gravada nessa mesma versão
         """
-        Retorna todos os projetos.
+        logger.debug("ProjetoService.findAll()")
+        try:
+            return self.__cache.obter(
+                "projetos",
+                repr(sorted((filtros or {}).items())),
+                lambda: self.__projetoDAO.findAll(filtros),
+                versao
+            )
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+
+    def findMeusProjetos(self, usuario_id: int, limit: int = None, after_id: int = None, filtros=None,
+                         offset: int = None) -> dict:
         """
-        print("🟣 ProjetoService.findAll()")
-        return self.__projetoDAO.findAll()
+        Retorna uma página dos projetos do usuário autenticado (paginação
+        por cursor em id; com sort, por offset).
 
-    def findById(self, id: int) -> dict:
+        :param usuario_id: int - id do usuário do token
+        :return: dict {"projetos": [...], "next_cursor": int | None[, "next_offset": int | None]}
+        """
+        logger.debug("ProjetoService.findMeusProjetos()")
+
+        if limit is None:
+            limit = self.LIMITE_PADRAO
+        limit = max(1, min(int(limit), self.LIMITE_MAXIMO))
+        ordenado = ProjetoDAO.CONSULTA.ordenado(filtros)
+
+        # busca uma linha a mais só para saber se existe próxima página
+        try:
+            projetos = self.__projetoDAO.findDoUsuario(usuario_id, limit + 1, after_id, filtros, offset)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+
+        tem_proxima = len(projetos) > limit
+        projetos = projetos[:limit]
+        if ordenado:
+            next_offset = (offset or 0) + limit if tem_proxima else None
+            return {"projetos": projetos, "next_cursor": None, "next_offset": next_offset}
+
+        next_cursor = projetos[-1]["id"] if tem_proxima else None
+        return {"projetos": projetos, "next_cursor": next_cursor}
+
+    def streamAll(self, filtros=None):
+        """
+        Retorna um generator com os projetos, lidos do banco em lotes.
+        Os filtros são validados antes do primeiro byte da resposta.
+        """
+        logger.debug("ProjetoService.streamAll()")
+        try:
+            ProjetoDAO.CONSULTA.montar(filtros)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+        return self.__projetoDAO.iterAll(filtros=filtros)
+
+    def versaoLista(self, filtros=None) -> dict:
+        """
+        Versão da listagem (quantidade e maior atualizado_em) para os filtros
+        de findAll(); o controller compara com If-None-Match antes de listar.
+
+        :return: dict {"total": int, "marcas": list}
+        """
+        logger.debug("ProjetoService.versaoLista()")
+        try:
+            return self.__projetoDAO.versaoAll(filtros)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+
+    def versaoMeusProjetos(self, usuario_id: int, filtros=None) -> dict:
+        """Versão da listagem de findMeusProjetos() (mesmo escopo e filtros)."""
+        logger.debug("ProjetoService.versaoMeusProjetos()")
+        try:
+            return self.__projetoDAO.versaoDoUsuario(usuario_id, filtros)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+
+    def versaoProjeto(self, id: int) -> list | None:
+        """
+        Colunas de versão do projeto (None se não existe; findById responde o 404).
+        """
+        logger.debug("ProjetoService.versaoProjeto()")
+        return self.__projetoDAO.versao(id)
+
+    def findById(self, id: int, versao=None) -> dict:
         """
         Busca projeto por ID.
 
         :param id: int
+        :param versao: list - marcas de versaoProjeto(); o cache só devolve uma
+                       entrada gravada nessa mesma versão
         :return: dict
         :raises ErrorResponse: se projeto não for encontrado
         """
-        projeto = self.__projetoDAO.findById(id)
+        projeto = self.__cache.obter("projeto", id, lambda: self.__projetoDAO.findById(id), versao)
         if not projeto:
             raise ErrorResponse(
                 404,
@@ -85,7 +199,7 @@ class ProjetoService:
         :param requestBody: dict {"projeto": {...}}
         :return: bool
         """
-        print("🟣 ProjetoService.updateProjeto()")
+        logger.debug("ProjetoService.updateProjeto()")
 
         jsonProjeto = requestBody["projeto"]
 
@@ -97,7 +211,10 @@ class ProjetoService:
         objProjeto.status = jsonProjeto["status"]
         objProjeto.usuario_id = jsonProjeto.get("usuario_id")
 
-        return self.__projetoDAO.update(objProjeto)
+        atualizado = self.__projetoDAO.update(objProjeto)
+        # listagens e o projeto_nome das tarefas também mudam: nova geração
+        self.__cache.invalidar_tudo()
+        return atualizado
 
     def deleteProjeto(self, id: int) -> bool:
         """
@@ -106,8 +223,11 @@ class ProjetoService:
         :param id: int
         :return: bool
         """
-        print("🟣 ProjetoService.deleteProjeto()")
-        return self.__projetoDAO.delete(id)
+        logger.debug("ProjetoService.deleteProjeto()")
+        removido = self.__projetoDAO.delete(id)
+        # as tarefas do projeto saem em cascata
+        self.__cache.invalidar_tudo()
+        return removido
 
     def findByUsuarioId(self, usuario_id: int) -> list[dict]:
         """
@@ -117,15 +237,23 @@ class ProjetoService:
         :return: list[dict]
         :raises ErrorResponse: se usuário não for encontrado
         """
-        print("🟣 ProjetoService.findByUsuarioId()")
+        logger.debug("ProjetoService.findByUsuarioId()")
         
         # Verifica se o usuário existe
-        usuarioExiste = self.__usuarioDAO.findByField("id", usuario_id)
-        if not usuarioExiste or len(usuarioExiste) == 0:
+        if not self.__usuarioDAO.exists(usuario_id):
             raise ErrorResponse(
                 404,
                 "Usuário não encontrado",
                 {"message": f"Não existe usuário com id {usuario_id}"}
             )
 
-        return self.__projetoDAO.findByUsuarioId(usuario_id)
\ No newline at end of file
+        return self.__projetoDAO.findByUsuarioId(usuario_id)
+
+    def __transacao(self):
+        """
+        Abre uma transação no banco injetado; sem banco, cada chamada de DAO
+        segue com sua própria conexão (tx=None).
+        """
+        if self.__database is None:
+            return nullcontext()
+        return self.__database.transaction()
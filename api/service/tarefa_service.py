@@ -1,58 +1,167 @@
 # -*- coding: utf-8 -*-
+import logging
+from contextlib import nullcontext
 from api.dao.tarefa_dao import TarefaDAO
 from api.dao.projeto_dao import ProjetoDAO
 from api.model.tarefa import Tarefa
+from api.utils.cache import CacheLeituras
 from api.utils.error_response import ErrorResponse
 
+logger = logging.getLogger(__name__)
+
 
 """
 Classe responsável pela camada de serviço para a entidade Tarefa.
 """
 class TarefaService:
-    def __init__(self, tarefa_dao_dependency: TarefaDAO, projeto_dao_dependency: ProjetoDAO):
-        print("⬆️  TarefaService.__init__()")
+    # Tamanho de página usado quando o cliente não informa "limit"
+    LIMITE_PADRAO = 50
+    # Teto rígido do servidor, independente do "limit" pedido
+    LIMITE_MAXIMO = 200
+    # Quantidade máxima de itens aceita pelas rotas /batch
+    LOTE_MAXIMO = 10000
+
+    def __init__(self, tarefa_dao_dependency: TarefaDAO, projeto_dao_dependency: ProjetoDAO,
+                 verificar_fk: bool = True, database_dependency=None, cache: CacheLeituras = None):
+        """
+        :param verificar_fk: bool - True consulta se o projeto existe antes do INSERT;
+                             False confia na FK do banco (uma ida ao banco só)
+        :param database_dependency: MysqlDatabase - usado para abrir transações nas
+                                    operações de vários passos (opcional)
+        :param cache: CacheLeituras - cache de findById, invalidado por id a cada
+                      escrita (opcional; sem ele toda leitura vai ao banco)
+        """
+        logger.debug("TarefaService.__init__()")
         self.__tarefaDAO = tarefa_dao_dependency
         self.__projetoDAO = projeto_dao_dependency
+        self.__verificar_fk = verificar_fk
+        self.__database = database_dependency
+        self.__cache = cache or CacheLeituras()
 
     def createTarefa(self, jsonTarefa: dict) -> int:
         """
         Cria uma nova tarefa.
         """
-        print("🟣 TarefaService.createTarefa()")
+        logger.debug("TarefaService.createTarefa()")
 
-        objTarefa = Tarefa()
-        objTarefa.titulo = jsonTarefa["titulo"]
-        objTarefa.concluida = jsonTarefa.get("concluida", False)
-        
-        # ✅ CORREÇÃO: data_limite pode ser None ou string
-        data_limite = jsonTarefa.get("data_limite")
-        objTarefa.data_limite = data_limite if data_limite else None
-        
-        objTarefa.projeto_id = jsonTarefa["projeto_id"]
+        objTarefa = self.__montarTarefaCriacao(jsonTarefa)
 
-        # regra de negócio: validar se projeto existe
-        projetoExiste = self.__projetoDAO.findByField("id", objTarefa.projeto_id)
-        if not projetoExiste or len(projetoExiste) == 0:
+        try:
+            with self.__transacao() as tx:
+                # regra de negócio: validar se projeto existe
+                if self.__verificar_fk and not self.__projetoDAO.exists(objTarefa.projeto_id, tx=tx):
+                    raise ErrorResponse(
+                        400,
+                        "Projeto não encontrado",
+                        {"message": f"O projeto com ID {objTarefa.projeto_id} não existe"}
+                    )
+                return self.__tarefaDAO.create(objTarefa, tx=tx)
+        except ValueError:
+            # FK violada no banco (modo verificar_fk=False ou projeto removido no meio)
             raise ErrorResponse(
                 400,
                 "Projeto não encontrado",
                 {"message": f"O projeto com ID {objTarefa.projeto_id} não existe"}
             )
 
-        return self.__tarefaDAO.create(objTarefa)
+    def findAll(self, limit: int = None, after_id: int = None, filtros=None, offset: int = None) -> dict:
+        """
+        Retorna uma página de tarefas (paginação por cursor em id).
+
+        Com "sort" nos filtros a ordem deixa de ser por id e a paginação passa
+        a ser por offset: a resposta traz next_offset em vez de next_cursor.
+
+        :param limit: int - tamanho da página, limitado a LIMITE_MAXIMO
+        :param after_id: int - cursor recebido em next_cursor na página anterior
+        :param filtros: Mapping - filtros, sort e fields da query string
+        :param offset: int - deslocamento recebido em next_offset (só com sort)
+        :return: dict {"tarefas": [...], "next_cursor": int | None[, "next_offset": int | None]}
+        """
+        logger.debug("TarefaService.findAll()")
+        return self.__paginar(self.__tarefaDAO.findAll, limit, after_id, filtros, offset)
+
+    def findMinhasTarefas(self, usuario_id: int, limit: int = None, after_id: int = None, filtros=None,
+                          offset: int = None) -> dict:
+        """
+        Retorna uma página das tarefas dos projetos do usuário autenticado,
+        com o mesmo contrato (paginação, filtros, projeção) de findAll.
+        """
+        logger.debug("TarefaService.findMinhasTarefas()")
+
+        def buscar(*args):
+            return self.__tarefaDAO.findDoUsuario(usuario_id, *args)
 
-    def findAll(self) -> list[dict]:
+        return self.__paginar(buscar, limit, after_id, filtros, offset)
+
+    def __paginar(self, buscar, limit, after_id, filtros, offset) -> dict:
+        if limit is None:
+            limit = self.LIMITE_PADRAO
+        limit = max(1, min(int(limit), self.LIMITE_MAXIMO))
+        ordenado = TarefaDAO.CONSULTA.ordenado(filtros)
+
+        # busca uma linha a mais só para saber se existe próxima página
+        try:
+            tarefas = buscar(limit + 1, after_id, filtros, offset)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+
+        tem_proxima = len(tarefas) > limit
+        tarefas = tarefas[:limit]
+        if ordenado:
+            next_offset = (offset or 0) + limit if tem_proxima else None
+            return {"tarefas": tarefas, "next_cursor": None, "next_offset": next_offset}
+
+        next_cursor = tarefas[-1]["id"] if tem_proxima else None
+        return {"tarefas": tarefas, "next_cursor": next_cursor}
+
+    def streamAll(self, filtros=None):
+        """
+        Retorna um generator com as tarefas, lidas do banco em lotes.
+        Os filtros são validados antes do primeiro byte da resposta.
         """
-        Retorna todas as tarefas.
+        logger.debug("TarefaService.streamAll()")
+        try:
+            TarefaDAO.CONSULTA.montar(filtros)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+        return self.__tarefaDAO.iterAll(filtros=filtros)
+
+    def versaoLista(self, filtros=None) -> dict:
         """
-        print("🟣 TarefaService.findAll()")
-        return self.__tarefaDAO.findAll()
+        Versão da listagem (quantidade e maior atualizado_em) para os filtros
+        de findAll(); o controller compara com If-None-Match antes de listar.
 
-    def findById(self, id: int) -> dict:
+        :return: dict {"total": int, "marcas": list}
+        """
+        logger.debug("TarefaService.versaoLista()")
+        try:
+            return self.__tarefaDAO.versaoAll(filtros)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+
+    def versaoMinhasTarefas(self, usuario_id: int, filtros=None) -> dict:
+        """Versão da listagem de findMinhasTarefas() (mesmo escopo e filtros)."""
+        logger.debug("TarefaService.versaoMinhasTarefas()")
+        try:
+            return self.__tarefaDAO.versaoDoUsuario(usuario_id, filtros)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetros de listagem inválidos", {"message": str(e)})
+
+    def versaoTarefa(self, id: int) -> list | None:
+        """
+        Colunas de versão da tarefa (None se não existe; findById responde o 404).
+        """
+        logger.debug("TarefaService.versaoTarefa()")
+        return self.__tarefaDAO.versao(id)
+
+    def findById(self, id: int, versao=None) -> dict:
         """
         Busca tarefa por ID.
+
+        :param versao: list - marcas de versaoTarefa(); o cache só devolve uma
+                       entrada gravada nessa mesma versão
         """
-        tarefa = self.__tarefaDAO.findById(id)
+        tarefa = self.__cache.obter("tarefa", id, lambda: self.__tarefaDAO.findById(id), versao)
         if not tarefa:
             raise ErrorResponse(
                 404,
@@ -65,39 +174,32 @@ class TarefaService:
         """
         Atualiza dados de uma tarefa.
         """
-        print("🟣 TarefaService.updateTarefa()")
+        logger.debug("TarefaService.updateTarefa()")
 
         jsonTarefa = requestBody["tarefa"]
+        objTarefa = self.__montarTarefaAtualizacao(id, jsonTarefa)
 
-        objTarefa = Tarefa()
-        objTarefa.id = id
-        objTarefa.titulo = jsonTarefa["titulo"]
-        objTarefa.concluida = jsonTarefa["concluida"]
-        
-        # ✅ CORREÇÃO: data_limite pode ser None ou string
-        data_limite = jsonTarefa.get("data_limite")
-        objTarefa.data_limite = data_limite if data_limite else None
-        
-        objTarefa.projeto_id = jsonTarefa.get("projeto_id")
-
-        return self.__tarefaDAO.update(objTarefa)
+        atualizado = self.__tarefaDAO.update(objTarefa)
+        self.__cache.invalidar("tarefa", id)
+        return atualizado
 
     def deleteTarefa(self, id: int) -> bool:
         """
         Remove tarefa por ID.
         """
-        print("🟣 TarefaService.deleteTarefa()")
-        return self.__tarefaDAO.delete(id)
+        logger.debug("TarefaService.deleteTarefa()")
+        removido = self.__tarefaDAO.delete(id)
+        self.__cache.invalidar("tarefa", id)
+        return removido
 
     def findByProjetoId(self, projeto_id: int) -> list[dict]:
         """
         Busca tarefas por ID do projeto.
         """
-        print("🟣 TarefaService.findByProjetoId()")
+        logger.debug("TarefaService.findByProjetoId()")
         
         # Verifica se o projeto existe
-        projetoExiste = self.__projetoDAO.findByField("id", projeto_id)
-        if not projetoExiste or len(projetoExiste) == 0:
+        if not self.__projetoDAO.exists(projeto_id):
             raise ErrorResponse(
                 404,
                 "Projeto não encontrado",
@@ -110,15 +212,205 @@ class TarefaService:
         """
         Marca uma tarefa como concluída.
         """
-        print("🟣 TarefaService.marcarComoConcluida()")
+        logger.debug("TarefaService.marcarComoConcluida()")
         
-        # Verifica se a tarefa existe
-        tarefaExiste = self.__tarefaDAO.findById(id)
-        if not tarefaExiste:
+        with self.__transacao() as tx:
+            # Verifica se a tarefa existe
+            if not self.__tarefaDAO.exists(id, tx=tx):
+                raise ErrorResponse(
+                    404,
+                    "Tarefa não encontrada",
+                    {"message": f"Não existe tarefa com id {id}"}
+                )
+
+            concluida = self.__tarefaDAO.marcarComoConcluida(id, tx=tx)
+        # depois do commit: uma leitura no meio da transação não repõe o valor antigo
+        self.__cache.invalidar("tarefa", id)
+        return concluida
+
+    def createTarefaBatch(self, listaTarefas: list[dict]) -> list[dict]:
+        """
+        Cria várias tarefas de uma vez.
+
+        O lote inteiro é validado antes de qualquer escrita (campos e
+        existência dos projetos, em uma consulta só); se algum item for
+        inválido nada é gravado. Os válidos são inseridos com um único
+        executemany.
+
+        :param listaTarefas: list[dict] - itens no mesmo formato do POST /
+        :return: list[dict] - resultado por item {index, success, id}
+        :raises ErrorResponse: 400 com o resultado por item se houver inválidos
+        """
+        logger.debug("TarefaService.createTarefaBatch()")
+        self.__validarTamanhoLote(listaTarefas)
+
+        objetos = []
+        resultados = []
+        for index, jsonTarefa in enumerate(listaTarefas):
+            try:
+                objetos.append(self.__montarTarefaCriacao(jsonTarefa))
+                resultados.append({"index": index, "success": True})
+            except (KeyError, TypeError, ValueError) as e:
+                objetos.append(None)
+                resultados.append({"index": index, "success": False, "error": self.__mensagemErro(e)})
+
+        try:
+            with self.__transacao() as tx:
+                projetoIds = list({obj.projeto_id for obj in objetos if obj is not None})
+                existentes = self.__projetoDAO.findExistingIds(projetoIds, tx=tx)
+                for resultado, obj in zip(resultados, objetos):
+                    if obj is not None and obj.projeto_id not in existentes:
+                        resultado["success"] = False
+                        resultado["error"] = f"O projeto com ID {obj.projeto_id} não existe"
+
+                self.__exigirLoteValido(resultados)
+                ids = self.__tarefaDAO.createMany(objetos, tx=tx)
+        except ValueError as e:
+            # projeto removido entre a validação e o INSERT
+            raise ErrorResponse(400, "Projeto não encontrado", {"message": str(e)})
+
+        for resultado, novoId in zip(resultados, ids):
+            resultado["id"] = novoId
+        return resultados
+
+    def updateTarefaBatch(self, listaTarefas: list[dict]) -> list[dict]:
+        """
+        Atualiza várias tarefas de uma vez (um único executemany).
+
+        Cada item precisa de "id" e dos mesmos campos do PUT /<id>.
+        Itens inexistentes são reportados como não encontrados, sem impedir
+        a atualização dos demais.
+
+        :param listaTarefas: list[dict]
+        :return: list[dict] - resultado por item {index, id, success}
+        :raises ErrorResponse: 400 com o resultado por item se houver inválidos
+        """
+        logger.debug("TarefaService.updateTarefaBatch()")
+        self.__validarTamanhoLote(listaTarefas)
+
+        objetos = []
+        resultados = []
+        for index, jsonTarefa in enumerate(listaTarefas):
+            try:
+                objTarefa = self.__montarTarefaAtualizacao(jsonTarefa["id"], jsonTarefa)
+                if objTarefa.id is None:
+                    raise ValueError("id é obrigatório.")
+                objetos.append(objTarefa)
+                resultados.append({"index": index, "id": objTarefa.id, "success": True})
+            except (KeyError, TypeError, ValueError) as e:
+                objetos.append(None)
+                resultados.append({"index": index, "success": False, "error": self.__mensagemErro(e)})
+
+        self.__exigirLoteValido(resultados)
+
+        with self.__transacao() as tx:
+            existentes = self.__tarefaDAO.findExistingIds([obj.id for obj in objetos], tx=tx)
+            paraAtualizar = []
+            for resultado, obj in zip(resultados, objetos):
+                if obj.id in existentes:
+                    paraAtualizar.append(obj)
+                else:
+                    resultado["success"] = False
+                    resultado["error"] = f"Não existe tarefa com id {obj.id}"
+
+            if paraAtualizar:
+                self.__tarefaDAO.updateMany(paraAtualizar, tx=tx)
+        self.__cache.invalidar("tarefa", *(obj.id for obj in paraAtualizar))
+        return resultados
+
+    def deleteTarefaBatch(self, ids: list) -> list[dict]:
+        """
+        Remove várias tarefas com um único DELETE ... WHERE id IN (...).
+
+        :param ids: list[int]
+        :return: list[dict] - resultado por item {index, id, success}
+        :raises ErrorResponse: 400 se algum id não for inteiro positivo
+        """
+        logger.debug("TarefaService.deleteTarefaBatch()")
+        self.__validarTamanhoLote(ids)
+
+        resultados = []
+        for index, valor in enumerate(ids):
+            try:
+                objTarefa = Tarefa()
+                objTarefa.id = valor
+                if objTarefa.id is None:
+                    raise ValueError("id é obrigatório.")
+                resultados.append({"index": index, "id": objTarefa.id, "success": True})
+            except ValueError as e:
+                resultados.append({"index": index, "success": False, "error": str(e)})
+
+        self.__exigirLoteValido(resultados)
+
+        with self.__transacao() as tx:
+            existentes = self.__tarefaDAO.findExistingIds([r["id"] for r in resultados], tx=tx)
+            for resultado in resultados:
+                if resultado["id"] not in existentes:
+                    resultado["success"] = False
+                    resultado["error"] = f"Não existe tarefa com id {resultado['id']}"
+
+            if existentes:
+                self.__tarefaDAO.deleteMany(list(existentes), tx=tx)
+        self.__cache.invalidar("tarefa", *existentes)
+        return resultados
+
+    def __montarTarefaCriacao(self, jsonTarefa: dict) -> Tarefa:
+        """
+        Monta (e valida) o objeto Tarefa a partir do JSON de criação.
+        """
+        objTarefa = Tarefa()
+        objTarefa.titulo = jsonTarefa["titulo"]
+        objTarefa.concluida = jsonTarefa.get("concluida", False)
+        
+        # ✅ CORREÇÃO: data_limite pode ser None ou string
+        data_limite = jsonTarefa.get("data_limite")
+        objTarefa.data_limite = data_limite if data_limite else None
+        
+        objTarefa.projeto_id = jsonTarefa["projeto_id"]
+        return objTarefa
+
+    def __montarTarefaAtualizacao(self, id: int, jsonTarefa: dict) -> Tarefa:
+        """
+        Monta (e valida) o objeto Tarefa a partir do JSON de atualização.
+        """
+        objTarefa = Tarefa()
+        objTarefa.id = id
+        objTarefa.titulo = jsonTarefa["titulo"]
+        objTarefa.concluida = jsonTarefa["concluida"]
+        
+        # ✅ CORREÇÃO: data_limite pode ser None ou string
+        data_limite = jsonTarefa.get("data_limite")
+        objTarefa.data_limite = data_limite if data_limite else None
+        
+        objTarefa.projeto_id = jsonTarefa.get("projeto_id")
+        return objTarefa
+
+    def __transacao(self):
+        """
+        Abre uma transação no banco injetado; sem banco, cada chamada de DAO
+        segue com sua própria conexão (tx=None).
+        """
+        if self.__database is None:
+            return nullcontext()
+        return self.__database.transaction()
+
+    def __validarTamanhoLote(self, lote: list):
+        if len(lote) > self.LOTE_MAXIMO:
             raise ErrorResponse(
-                404,
-                "Tarefa não encontrada",
-                {"message": f"Não existe tarefa com id {id}"}
+                413,
+                "Lote muito grande",
+                {"message": f"O lote aceita no máximo {self.LOTE_MAXIMO} itens"}
+            )
+
+    def __exigirLoteValido(self, resultados: list[dict]):
+        if any(not r["success"] for r in resultados):
+            raise ErrorResponse(
+                400,
+                "Erro na validação do lote",
+                {"message": "Nenhuma tarefa foi gravada", "resultados": resultados}
             )
 
-        return self.__tarefaDAO.marcarComoConcluida(id)
\ No newline at end of file
+    def __mensagemErro(self, e: Exception) -> str:
+        if isinstance(e, KeyError):
+            return f"O campo {e} é obrigatório!"
+        return str(e)
@@ -1,16 +1,27 @@
 # api/service/usuario_service.py
+import logging
 from api.model.usuario import Usuario
+from api.utils.cache import CacheLeituras
 from api.utils.error_response import ErrorResponse
-import bcrypt
+from api.utils.password_hasher import PasswordHasher
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 class UsuarioService:
-    def __init__(self, usuario_dao_dependency):
+    def __init__(self, usuario_dao_dependency, password_hasher: PasswordHasher = None,
+                 cache: CacheLeituras = None):
         """
         Service para regras de negócio do Usuario
+        :param usuario_dao_dependency: UsuarioDAO
+        :param password_hasher: PasswordHasher que executa o bcrypt fora da thread da requisição
+        :param cache: CacheLeituras compartilhado com projetos e tarefas; remover um usuário
+                      apaga os projetos dele em cascata, então o cache é invalidado
         """
-        print("⬆️  UsuarioService.__init__()")
+        logger.debug("UsuarioService.__init__()")
         self.__usuario_dao = usuario_dao_dependency
+        self.__password_hasher = password_hasher or PasswordHasher()
+        self.__cache = cache or CacheLeituras()
 
     def createUsuario(self, usuario_data):
         """
@@ -19,7 +30,7 @@ class UsuarioService:
         try:
             # Verifica se email já existe
             if self.__usuario_dao.email_exists(usuario_data.get('email')):
-                raise ErrorResponse("Email já cadastrado", 400)
+                raise ErrorResponse(400, "Email já cadastrado")
 
             # Cria objeto Usuario
             usuario = Usuario()
@@ -29,21 +40,22 @@ class UsuarioService:
             # Hash da senha
             senha = usuario_data.get('senha', '')
             if not senha:
-                raise ErrorResponse("Senha é obrigatória", 400)
+                raise ErrorResponse(400, "Senha é obrigatória")
                 
-            senha_hash = bcrypt.hashpw(senha.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-            usuario.senha_hash = senha_hash
+            usuario.senha_hash = self.__password_hasher.hash_password(senha)
             usuario.data_criacao = datetime.now()
 
             # Salva no banco
             new_id = self.__usuario_dao.create(usuario)
             return new_id
 
+        except ErrorResponse:
+            raise
         except ValueError as e:
-            raise ErrorResponse(str(e), 400)
+            raise ErrorResponse(400, str(e))
         except Exception as e:
-            print(f"❌ Erro em createUsuario: {e}")
-            raise ErrorResponse("Erro ao criar usuário", 500)
+            logger.error("Erro em createUsuario: %s", e)
+            raise ErrorResponse(500, "Erro ao criar usuário")
 
     def loginUsuario(self, login_data):
         """
@@ -54,31 +66,31 @@ class UsuarioService:
             senha = login_data.get('senha')
 
             if not email or not senha:
-                raise ErrorResponse("Email e senha são obrigatórios", 400)
+                raise ErrorResponse(400, "Email e senha são obrigatórios")
 
             # Busca usuário
             usuario_db = self.__usuario_dao.find_by_email(email)
             if not usuario_db:
-                raise ErrorResponse("Email ou senha incorretos", 401)
+                raise ErrorResponse(401, "Email ou senha incorretos")
 
             # Verifica senha
-            if not bcrypt.checkpw(senha.encode('utf-8'), usuario_db['senha_hash'].encode('utf-8')):
-                raise ErrorResponse("Email ou senha incorretos", 401)
+            if not self.__password_hasher.check_password(senha, usuario_db.senha_hash):
+                raise ErrorResponse(401, "Email ou senha incorretos")
 
             # Retorna dados do usuário (sem senha)
             return {
                 'usuario': {
-                    'id': usuario_db['id'],
-                    'nome': usuario_db['nome'],
-                    'email': usuario_db['email']
+                    'id': usuario_db.id,
+                    'nome': usuario_db.nome,
+                    'email': usuario_db.email
                 }
             }
 
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro em loginUsuario: {e}")
-            raise ErrorResponse("Erro ao fazer login", 500)
+            logger.error("Erro em loginUsuario: %s", e)
+            raise ErrorResponse(500, "Erro ao fazer login")
 
     def findById(self, id):
         """
@@ -101,7 +113,7 @@ class UsuarioService:
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro em findById: {e}")
+            logger.error("Erro em findById: %s", e)
             raise ErrorResponse("Erro ao buscar usuário", 500)
 
     def findAll(self):
@@ -109,23 +121,19 @@ class UsuarioService:
         Busca todos os usuários
         """
         try:
-            usuarios_db = self.__usuario_dao.find_all()
-            
-            usuarios = []
-            for usuario_db in usuarios_db:
-                usuarios.append({
-                    'id': usuario_db['id'],
-                    'nome': usuario_db['nome'],
-                    'email': usuario_db['email'],
-                    'data_criacao': usuario_db['data_criacao']
-                })
-
-            return usuarios
+            # A DAO já devolve dicts sem senha_hash
+            return self.__usuario_dao.find_all()
 
         except Exception as e:
-            print(f"❌ Erro em findAll: {e}")
+            logger.error("Erro em findAll: %s", e)
             raise ErrorResponse("Erro ao buscar usuários", 500)
 
+    def streamAll(self):
+        """
+        Retorna um generator com todos os usuários, lidos do banco em lotes
+        """
+        return self.__usuario_dao.iter_all()
+
     def updateUsuario(self, id, usuario_data):
         """
         Atualiza usuário
@@ -143,16 +151,16 @@ class UsuarioService:
             if 'email' in update_data:
                 usuario_db['email'] = update_data['email']
             if 'senha' in update_data:
-                senha_hash = bcrypt.hashpw(update_data['senha'].encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-                usuario_db['senha_hash'] = senha_hash
+                usuario_db['senha_hash'] = self.__password_hasher.hash_password(update_data['senha'])
 
             self.__usuario_dao.update(id, usuario_db)
+            self.__cache.invalidar_tudo()
             return True
 
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro em updateUsuario: {e}")
+            logger.error("Erro em updateUsuario: %s", e)
             raise ErrorResponse("Erro ao atualizar usuário", 500)
 
     def deleteUsuario(self, id):
@@ -165,12 +173,13 @@ class UsuarioService:
                 raise ErrorResponse("Usuário não encontrado", 404)
 
             self.__usuario_dao.delete(id)
+            self.__cache.invalidar_tudo()
             return True
 
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro em deleteUsuario: {e}")
+            logger.error("Erro em deleteUsuario: %s", e)
             raise ErrorResponse("Erro ao excluir usuário", 500)
 
     def verificarEmail(self, email):
@@ -184,5 +193,5 @@ class UsuarioService:
             }
 
         except Exception as e:
-            print(f"❌ Erro em verificarEmail: {e}")
+            logger.error("Erro em verificarEmail: %s", e)
             raise ErrorResponse("Erro ao verificar email", 500)
\ No newline at end of file
@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+import logging
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Cache de leituras entre os services e as DAOs.
+
+Backends (mesma interface: get, set, add, delete, clear, stats):
+- MemoriaCache: LRU com TTL no próprio processo;
+- MemoriaCompartilhadaCache: substituto em memória de um cache
+  compartilhado (testes e desenvolvimento): instâncias com o mesmo
+  namespace enxergam os mesmos dados e os valores são serializados, como
+  aconteceria na rede;
+- RedisCache: cache compartilhado entre processos/máquinas (pacote
+  "redis", opcional);
+- CacheEmCamadas: um cache local curto na frente de um compartilhado.
+
+CacheLeituras aplica o cache às entidades: obter(tipo, id, carregar)
+devolve o valor guardado ou chama carregar() e guarda o resultado;
+invalidar(tipo, id) remove a entrada de uma entidade; invalidar_tudo()
+troca a "geração" que faz parte de todas as chaves, descartando de uma
+vez o que depende de outras entidades (listas, nomes vindos de JOIN,
+exclusões em cascata).
+
+obter(..., versao=) amarra a entrada à versão do recurso (as marcas de
+VersaoRecurso): uma entrada gravada em outra versão conta como miss. Assim
+o corpo servido nunca é mais antigo que a ETag que o acompanha, mesmo com
+a camada local de outro processo ainda sem a invalidação.
+
+Os valores guardados são tratados como imutáveis: quem lê não deve
+alterar o dicionário devolvido.
+"""
+
+_AUSENTE = object()
+
+
+class MemoriaCache:
+    """
+    LRU limitado por quantidade de entradas, com TTL por entrada.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 60):
+        """
+        :param max_entries: int - quantidade máxima de entradas
+        :param ttl: float - tempo padrão (segundos) de cada entrada
+        """
+        self.__max_entries = max_entries
+        self.__ttl = ttl
+        self.__entries = OrderedDict()  # chave -> (expira_em, valor)
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, chave: str, padrao=None):
+        agora = time.monotonic()
+        with self.__lock:
+            entrada = self.__entries.get(chave)
+            if entrada is None or entrada[0] <= agora:
+                if entrada is not None:
+                    del self.__entries[chave]
+                self.__misses += 1
+                return padrao
+            self.__entries.move_to_end(chave)
+            self.__hits += 1
+            return entrada[1]
+
+    def set(self, chave: str, valor, ttl: float = None):
+        expira_em = time.monotonic() + (self.__ttl if ttl is None else ttl)
+        with self.__lock:
+            self.__entries[chave] = (expira_em, valor)
+            self.__entries.move_to_end(chave)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def add(self, chave: str, valor, ttl: float = None) -> bool:
+        """Guarda só se a chave não existir (ou tiver expirado)."""
+        agora = time.monotonic()
+        with self.__lock:
+            entrada = self.__entries.get(chave)
+            if entrada is not None and entrada[0] > agora:
+                return False
+        self.set(chave, valor, ttl)
+        return True
+
+    def delete(self, *chaves: str):
+        with self.__lock:
+            for chave in chaves:
+                self.__entries.pop(chave, None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                "backend": "memoria",
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+                "size": len(self.__entries),
+                "max_entries": self.__max_entries
+            }
+
+
+class MemoriaCompartilhadaCache:
+    """
+    Substituto em memória de um cache compartilhado. Instâncias com o
+    mesmo namespace compartilham os dados (como dois workers ligados ao
+    mesmo servidor de cache); os valores são guardados serializados, então
+    cada leitura devolve uma cópia.
+    """
+
+    _servidores = {}
+    _servidores_lock = threading.Lock()
+
+    def __init__(self, namespace: str = "padrao", ttl: float = 60):
+        with self._servidores_lock:
+            if namespace not in self._servidores:
+                self._servidores[namespace] = (threading.Lock(), {})
+            self.__lock, self.__dados = self._servidores[namespace]
+        self.__ttl = ttl
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, chave: str, padrao=None):
+        with self.__lock:
+            entrada = self.__dados.get(chave)
+            if entrada is None or entrada[0] <= time.monotonic():
+                self.__dados.pop(chave, None)
+                self.__misses += 1
+                return padrao
+            self.__hits += 1
+            return pickle.loads(entrada[1])
+
+    def set(self, chave: str, valor, ttl: float = None):
+        expira_em = time.monotonic() + (self.__ttl if ttl is None else ttl)
+        with self.__lock:
+            self.__dados[chave] = (expira_em, pickle.dumps(valor))
+
+    def add(self, chave: str, valor, ttl: float = None) -> bool:
+        expira_em = time.monotonic() + (self.__ttl if ttl is None else ttl)
+        with self.__lock:
+            entrada = self.__dados.get(chave)
+            if entrada is not None and entrada[0] > time.monotonic():
+                return False
+            self.__dados[chave] = (expira_em, pickle.dumps(valor))
+            return True
+
+    def delete(self, *chaves: str):
+        with self.__lock:
+            for chave in chaves:
+                self.__dados.pop(chave, None)
+
+    def clear(self):
+        with self.__lock:
+            self.__dados.clear()
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                "backend": "memoria-compartilhada",
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "size": len(self.__dados)
+            }
+
+
+class RedisCache:
+    """
+    Cache compartilhado no Redis. Falhas de conexão viram "miss" (e um
+    aviso no log): o cache nunca derruba a requisição.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefixo: str = "api:", ttl: float = 60,
+                 timeout: float = 0.5):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("CACHE_BACKEND=redis requer o pacote 'redis' (pip install redis)")
+        self.__cliente = redis.Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+        self.__prefixo = prefixo
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__erros = 0
+
+    def get(self, chave: str, padrao=None):
+        try:
+            bruto = self.__cliente.get(self.__prefixo + chave)
+        except Exception as e:
+            self.__contar_erro("get", e)
+            bruto = None
+        with self.__lock:
+            if bruto is None:
+                self.__misses += 1
+                return padrao
+            self.__hits += 1
+        return pickle.loads(bruto)
+
+    def set(self, chave: str, valor, ttl: float = None):
+        try:
+            self.__cliente.set(self.__prefixo + chave, pickle.dumps(valor),
+                               px=int((self.__ttl if ttl is None else ttl) * 1000))
+        except Exception as e:
+            self.__contar_erro("set", e)
+
+    def add(self, chave: str, valor, ttl: float = None) -> bool:
+        try:
+            return bool(self.__cliente.set(self.__prefixo + chave, pickle.dumps(valor), nx=True,
+                                           px=int((self.__ttl if ttl is None else ttl) * 1000)))
+        except Exception as e:
+            self.__contar_erro("add", e)
+            return False
+
+    def delete(self, *chaves: str):
+        if not chaves:
+            return
+        try:
+            self.__cliente.delete(*(self.__prefixo + chave for chave in chaves))
+        except Exception as e:
+            self.__contar_erro("delete", e)
+
+    def clear(self):
+        try:
+            for chave in self.__cliente.scan_iter(self.__prefixo + "*"):
+                self.__cliente.delete(chave)
+        except Exception as e:
+            self.__contar_erro("clear", e)
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                "backend": "redis",
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "errors": self.__erros
+            }
+
+    def __contar_erro(self, operacao: str, e: Exception):
+        with self.__lock:
+            self.__erros += 1
+        logger.warning("Cache Redis indisponível (%s): %s", operacao, e)
+
+
+class CacheEmCamadas:
+    """
+    Cache local (L1, TTL curto) na frente de um compartilhado (L2).
+    Invalidações apagam nas duas camadas deste processo; nos demais
+    processos a cópia local vive no máximo ttl_local segundos.
+    """
+
+    def __init__(self, local: MemoriaCache, compartilhado, ttl_local: float = 2):
+        self.__local = local
+        self.__compartilhado = compartilhado
+        self.__ttl_local = ttl_local
+
+    def get(self, chave: str, padrao=None):
+        valor = self.__local.get(chave, _AUSENTE)
+        if valor is not _AUSENTE:
+            return valor
+        valor = self.__compartilhado.get(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            return padrao
+        self.__local.set(chave, valor, self.__ttl_local)
+        return valor
+
+    def set(self, chave: str, valor, ttl: float = None):
+        self.__compartilhado.set(chave, valor, ttl)
+        self.__local.set(chave, valor, self.__ttl_local if ttl is None else min(ttl, self.__ttl_local))
+
+    def add(self, chave: str, valor, ttl: float = None) -> bool:
+        self.__local.delete(chave)
+        return self.__compartilhado.add(chave, valor, ttl)
+
+    def delete(self, *chaves: str):
+        self.__local.delete(*chaves)
+        self.__compartilhado.delete(*chaves)
+
+    def clear(self):
+        self.__local.clear()
+        self.__compartilhado.clear()
+
+    def stats(self) -> dict:
+        return {
+            "backend": "camadas",
+            "local": self.__local.stats(),
+            "compartilhado": self.__compartilhado.stats()
+        }
+
+
+class CacheLeituras:
+    """
+    Leituras de entidades com chave "tipo:geração:id". Sem backend
+    (backend=None) só repassa para carregar(), sem guardar nada.
+    """
+
+    CHAVE_GERACAO = "geracao"
+
+    def __init__(self, backend=None, ttl: float = None):
+        """
+        :param backend: MemoriaCache, MemoriaCompartilhadaCache, RedisCache, CacheEmCamadas ou None
+        :param ttl: float - TTL das entradas (None = padrão do backend)
+        """
+        self.__backend = backend
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__metricas = {}  # tipo -> {"hits", "misses", "invalidations"}
+
+    def ativo(self) -> bool:
+        return self.__backend is not None
+
+    def obter(self, tipo: str, chave, carregar, versao=None):
+        """
+        Devolve o valor em cache ou carrega, guarda e devolve. Resultados
+        None (entidade inexistente) não são guardados.
+
+        :param tipo: str - "projeto", "projetos", "tarefa"...
+        :param chave: id da entidade (ou outra chave estável, ex.: filtros)
+        :param carregar: callable sem argumentos que lê do banco
+        :param versao: versão lida do banco antes (ex.: marcas da ETag); entradas
+                       de outra versão são recarregadas. None aceita qualquer versão.
+        """
+        if self.__backend is None:
+            return carregar()
+
+        chave_cache = f"{tipo}:{self.__geracao()}:{chave}"
+        entrada = self.__backend.get(chave_cache)
+        if entrada is not None and (versao is None or entrada[0] == versao):
+            self.__contar(tipo, "hits")
+            return entrada[1]
+
+        self.__contar(tipo, "misses")
+        valor = carregar()
+        if valor is not None:
+            self.__backend.set(chave_cache, (versao, valor), self.__ttl)
+        return valor
+
+    def invalidar(self, tipo: str, *chaves):
+        """Remove as entradas das entidades informadas."""
+        if self.__backend is None or not chaves:
+            return
+        geracao = self.__geracao()
+        self.__backend.delete(*(f"{tipo}:{geracao}:{chave}" for chave in chaves))
+        self.__contar(tipo, "invalidations", len(chaves))
+
+    def invalidar_tudo(self):
+        """Troca a geração: todas as entradas atuais deixam de ser encontradas."""
+        if self.__backend is None:
+            return
+        self.__backend.set(self.CHAVE_GERACAO, uuid.uuid4().hex, 0x7FFFFFFF)
+        self.__contar("geracao", "invalidations")
+
+    def stats(self) -> dict:
+        with self.__lock:
+            por_tipo = {tipo: dict(valores) for tipo, valores in self.__metricas.items()}
+        if self.__backend is None:
+            return {"enabled": False}
+        return {"enabled": True, "por_tipo": por_tipo, "backend": self.__backend.stats()}
+
+    def __geracao(self) -> str:
+        geracao = self.__backend.get(self.CHAVE_GERACAO)
+        if geracao is None:
+            # Geração perdida (expulsa/reiniciada): começa uma nova, nunca reaproveita a antiga
+            self.__backend.add(self.CHAVE_GERACAO, uuid.uuid4().hex, 0x7FFFFFFF)
+            geracao = self.__backend.get(self.CHAVE_GERACAO) or "0"
+        return geracao
+
+    def __contar(self, tipo: str, campo: str, quantidade: int = 1):
+        with self.__lock:
+            metricas = self.__metricas.setdefault(tipo, {"hits": 0, "misses": 0, "invalidations": 0})
+            metricas[campo] += quantidade
+
+
+def criar_cache(backend: str = None) -> CacheLeituras:
+    """
+    Monta o CacheLeituras a partir das variáveis de ambiente:
+    - CACHE_BACKEND: memoria, redis, memoria-compartilhada ou nenhum;
+    - CACHE_TTL (segundos, padrão 60) e CACHE_MAX_ENTRIES (padrão 10000);
+    - CACHE_REDIS_URL e CACHE_LOCAL_TTL (camada local na frente do Redis, padrão 2).
+
+    :param backend: str - usado quando CACHE_BACKEND não está definido
+    """
+    backend = os.getenv("CACHE_BACKEND", backend or "memoria")
+    ttl = float(os.getenv("CACHE_TTL", "60"))
+    max_entries = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+
+    if backend == "nenhum":
+        return CacheLeituras(None)
+    if backend == "memoria":
+        return CacheLeituras(MemoriaCache(max_entries, ttl))
+    if backend == "memoria-compartilhada":
+        return CacheLeituras(MemoriaCompartilhadaCache(ttl=ttl))
+    if backend == "redis":
+        redis = RedisCache(os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0"), ttl=ttl)
+        ttl_local = float(os.getenv("CACHE_LOCAL_TTL", "2"))
+        if ttl_local <= 0:
+            return CacheLeituras(redis)
+        return CacheLeituras(CacheEmCamadas(MemoriaCache(max_entries, ttl_local), redis, ttl_local))
+    raise ValueError(f"CACHE_BACKEND inválido: {backend}")
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+
+"""
+Configuração central do logging da aplicação.
+
+Cada módulo usa o seu próprio logger (logging.getLogger(__name__)) e
+formatação preguiçosa (logger.debug("... %s", valor)): mensagens abaixo do
+nível configurado custam só a checagem de nível.
+
+A thread da requisição apenas enfileira o registro (QueueHandler); uma
+thread própria (QueueListener) formata e escreve no stdout, então a
+requisição não disputa o lock do stdout nem espera o pipe do coletor.
+
+Variáveis de ambiente:
+- LOG_LEVEL: nível geral (padrão INFO);
+- LOG_TRACE: 1 liga o rastreio de chamadas (DEBUG nos loggers "api.*",
+  ex.: "TarefaDAO.findAll()"); o padrão vem de quem configura - ligado no
+  servidor de desenvolvimento, desligado em produção.
+"""
+
+FORMATO = "%(asctime)s %(levelname)s [%(process)d] %(name)s: %(message)s"
+
+_listener = None
+_queue_handler = None
+
+
+def configurar_logging(nivel: str = None, trace: bool = False):
+    """
+    Instala o QueueHandler na raiz e ajusta os níveis. Pode ser chamada
+    de novo (ex.: reload) - só os níveis são reaplicados.
+
+    :param nivel: str - nível geral; None usa LOG_LEVEL (padrão INFO)
+    :param trace: bool - padrão do rastreio de chamadas quando LOG_TRACE não está definido
+    """
+    global _queue_handler
+
+    raiz = logging.getLogger()
+    if _queue_handler is None:
+        _queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        raiz.addHandler(_queue_handler)
+        _iniciar_listener()
+        atexit.register(encerrar_logging)
+        # Fila e thread não sobrevivem ao fork: cada worker cria as suas
+        os.register_at_fork(after_in_child=_iniciar_listener)
+
+    raiz.setLevel((nivel or os.getenv("LOG_LEVEL", "INFO")).upper())
+
+    trace = os.getenv("LOG_TRACE", "1" if trace else "0") == "1"
+    logging.getLogger("api").setLevel(logging.DEBUG if trace else logging.NOTSET)
+
+
+def _iniciar_listener():
+    global _listener
+    if _queue_handler is None:
+        return
+    saida = logging.StreamHandler(sys.stdout)
+    saida.setFormatter(logging.Formatter(FORMATO))
+    _queue_handler.queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, saida)
+    _listener.start()
+
+
+def encerrar_logging():
+    """
+    Esvazia a fila e para a thread de escrita. Roda no atexit; quem sai
+    com os._exit (workers do prefork) deve chamá-la antes.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
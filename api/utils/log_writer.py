@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # fora do POSIX não há prefork: um único processo escreve
+    fcntl = None
+
+
+"""
+Escritor assíncrono de arquivo de log com rotação.
+
+Implementa:
+- Buffer circular em memória: quem registra só enfileira (sem I/O na
+  thread da requisição); com o buffer cheio a entrada mais antiga é
+  descartada e contada em "descartadas";
+- Uma thread de escrita que esvazia o buffer em lotes: um write, um
+  flush e (opcional) um fsync por lote;
+- Rotação por tamanho (max_bytes) e por tempo (rotate_seconds), mantendo
+  backup_count arquivos antigos (log.log.1, log.log.2, ...);
+- Saída em texto (formato histórico do Logger) ou JSON lines.
+
+O arquivo fica aberto entre os lotes. Depois de um fork o processo filho
+descarta o buffer herdado e reabre o arquivo na primeira escrita.
+
+Vários processos (workers do prefork) podem escrever no mesmo arquivo: a
+rotação é feita sob um flock em <arquivo>.lock, então só um deles
+rotaciona; os demais percebem que o arquivo foi trocado (inode diferente)
+e reabrem o novo antes do próximo lote.
+"""
+class LogWriter:
+    SEPARADOR = "-" * 80
+
+    def __init__(self, caminho: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5,
+                 rotate_seconds: float = 0, buffer_size: int = 10000, flush_interval: float = 1.0,
+                 fsync: bool = True, formato: str = "texto"):
+        """
+        :param caminho: str - arquivo de log
+        :param max_bytes: int - tamanho que dispara a rotação; 0 desliga
+        :param backup_count: int - arquivos rotacionados mantidos
+        :param rotate_seconds: float - tempo (s) desde a abertura do arquivo que dispara a rotação; 0 desliga
+        :param buffer_size: int - entradas mantidas em memória à espera da escrita
+        :param flush_interval: float - espera máxima (s) de uma entrada até ser gravada
+        :param fsync: bool - faz fsync após cada lote
+        :param formato: str - "texto" ou "json" (uma entrada JSON por linha)
+        """
+        if formato not in ("texto", "json"):
+            raise ValueError("formato deve ser 'texto' ou 'json'.")
+        if buffer_size < 1:
+            raise ValueError("buffer_size deve ser maior que zero.")
+
+        self.__caminho = caminho
+        self.__max_bytes = max_bytes
+        self.__backup_count = backup_count
+        self.__rotate_seconds = rotate_seconds
+        self.__buffer_size = buffer_size
+        self.__flush_interval = flush_interval
+        self.__fsync = fsync
+        self.__formato = formato
+
+        self.__reiniciar_estado()
+        os.register_at_fork(after_in_child=self.__reiniciar_estado)
+
+    def __reiniciar_estado(self):
+        self.__lock = threading.Lock()
+        self.__condicao = threading.Condition(self.__lock)
+        self.__buffer = deque(maxlen=self.__buffer_size)
+        self.__thread = None
+        self.__parar = False
+        self.__arquivo = None
+        self.__aberto_em = 0.0
+
+        self.__enfileiradas = 0
+        self.__escritas = 0
+        self.__descartadas = 0
+        self.__lotes = 0
+        self.__rotacoes = 0
+        self.__falhas = 0
+
+    def write(self, nivel: str, mensagem: str):
+        """
+        Enfileira uma entrada; a gravação acontece na thread de escrita.
+        """
+        entrada = (time.time(), nivel, mensagem)
+        with self.__condicao:
+            if len(self.__buffer) == self.__buffer_size:
+                self.__descartadas += 1
+            self.__buffer.append(entrada)
+            self.__enfileiradas += 1
+            if self.__thread is None:
+                self.__iniciar_thread()
+            if len(self.__buffer) * 2 >= self.__buffer_size:
+                # Buffer enchendo: acorda a escrita antes do intervalo
+                self.__condicao.notify()
+
+    def flush(self, timeout: float = 5.0):
+        """
+        Espera até o buffer atual ser gravado (ou o timeout estourar).
+        """
+        limite = time.monotonic() + timeout
+        with self.__condicao:
+            alvo = self.__enfileiradas
+            self.__condicao.notify()
+            while self.__escritas + self.__descartadas + self.__falhas < alvo:
+                restante = limite - time.monotonic()
+                if restante <= 0 or self.__thread is None:
+                    break
+                self.__condicao.wait(min(restante, 0.05))
+
+    def close(self):
+        """Grava o que estiver pendente, para a thread e fecha o arquivo."""
+        with self.__condicao:
+            thread = self.__thread
+            self.__parar = True
+            self.__condicao.notify_all()
+        if thread is not None:
+            thread.join(timeout=5.0)
+        with self.__condicao:
+            self.__thread = None
+            self.__parar = False
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                "file": self.__caminho,
+                "format": self.__formato,
+                "buffer_size": self.__buffer_size,
+                "pending": len(self.__buffer),
+                "enqueued": self.__enfileiradas,
+                "written": self.__escritas,
+                "dropped": self.__descartadas,
+                "batches": self.__lotes,
+                "rotations": self.__rotacoes,
+                "write_errors": self.__falhas,
+            }
+
+    def __iniciar_thread(self):
+        self.__thread = threading.Thread(target=self.__ciclo, name="log-writer", daemon=True)
+        self.__thread.start()
+
+    def __ciclo(self):
+        while True:
+            with self.__condicao:
+                if not self.__buffer and not self.__parar:
+                    self.__condicao.wait(self.__flush_interval)
+                lote = list(self.__buffer)
+                self.__buffer.clear()
+                parar = self.__parar
+
+            if lote:
+                self.__gravar(lote)
+            if parar:
+                self.__fechar_arquivo()
+                return
+
+    def __gravar(self, lote: list):
+        texto = "".join(self.__formatar(entrada) for entrada in lote)
+        try:
+            self.__rotacionar_se_preciso(len(texto.encode("utf-8")))
+            arquivo = self.__abrir()
+            arquivo.write(texto)
+            arquivo.flush()
+            if self.__fsync:
+                os.fsync(arquivo.fileno())
+            gravadas, falhas = len(lote), 0
+        except OSError:
+            # Sem onde escrever: as entradas são perdidas, não a requisição
+            self.__fechar_arquivo()
+            gravadas, falhas = 0, len(lote)
+
+        with self.__condicao:
+            self.__escritas += gravadas
+            self.__falhas += falhas
+            self.__lotes += 1
+            self.__condicao.notify_all()
+
+    def __formatar(self, entrada) -> str:
+        instante, nivel, mensagem = entrada
+        data_hora = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(instante))
+        data_hora += f".{int(instante % 1 * 1_000_000):06d}"
+        if self.__formato == "json":
+            return json.dumps({
+                "timestamp": data_hora + "Z",
+                "level": nivel,
+                "pid": os.getpid(),
+                "message": mensagem
+            }, ensure_ascii=False) + "\n"
+        return f"[{data_hora}] [{nivel}]\n{mensagem}\n{self.SEPARADOR}\n"
+
+    def __abrir(self):
+        if self.__arquivo is not None and self.__arquivo_trocado():
+            # Rotacionado por outro processo: o handle aponta para o backup
+            self.__fechar_arquivo()
+        if self.__arquivo is None:
+            diretorio = os.path.dirname(self.__caminho)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            self.__arquivo = open(self.__caminho, "a", encoding="utf-8")
+            self.__aberto_em = time.time()
+        return self.__arquivo
+
+    def __fechar_arquivo(self):
+        if self.__arquivo is not None:
+            try:
+                self.__arquivo.close()
+            except OSError:
+                pass
+            self.__arquivo = None
+
+    def __rotacionar_se_preciso(self, tamanho_lote: int):
+        if not self.__precisa_rotacionar(tamanho_lote):
+            return
+        with self.__trava_rotacao():
+            # Outro processo pode ter rotacionado enquanto esperávamos a trava
+            if self.__precisa_rotacionar(tamanho_lote):
+                self.__rotacionar()
+
+    def __precisa_rotacionar(self, tamanho_lote: int) -> bool:
+        try:
+            atual = os.stat(self.__caminho)
+        except FileNotFoundError:
+            return False
+        por_tamanho = (
+            self.__max_bytes > 0
+            and atual.st_size > 0
+            and atual.st_size + tamanho_lote > self.__max_bytes
+        )
+        # Por tempo só vale para o arquivo que este processo abriu; se outro
+        # já o trocou, __abrir reabre e a contagem recomeça
+        por_tempo = (
+            self.__rotate_seconds > 0
+            and self.__arquivo is not None
+            and self.__mesmo_arquivo(atual)
+            and time.time() - self.__aberto_em >= self.__rotate_seconds
+        )
+        return por_tamanho or por_tempo
+
+    def __rotacionar(self):
+        self.__fechar_arquivo()
+        if self.__backup_count > 0:
+            for indice in range(self.__backup_count - 1, 0, -1):
+                origem = f"{self.__caminho}.{indice}"
+                if os.path.exists(origem):
+                    os.replace(origem, f"{self.__caminho}.{indice + 1}")
+            os.replace(self.__caminho, f"{self.__caminho}.1")
+        else:
+            os.remove(self.__caminho)
+        with self.__lock:
+            self.__rotacoes += 1
+
+    def __mesmo_arquivo(self, atual: os.stat_result) -> bool:
+        aberto = os.fstat(self.__arquivo.fileno())
+        return (aberto.st_ino, aberto.st_dev) == (atual.st_ino, atual.st_dev)
+
+    def __arquivo_trocado(self) -> bool:
+        try:
+            return not self.__mesmo_arquivo(os.stat(self.__caminho))
+        except FileNotFoundError:
+            return True
+
+    @contextmanager
+    def __trava_rotacao(self):
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.__caminho}.lock", "a") as trava:
+            fcntl.flock(trava.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(trava.fileno(), fcntl.LOCK_UN)
@@ -1,15 +1,29 @@
+import atexit
 import os
+import threading
 import traceback
-from datetime import datetime
+from api.utils.log_writer import LogWriter
 
 class Logger:
     """
     Classe Logger
     Responsável por registrar mensagens de erro e exceções com stack trace completo.
+
+    A gravação é feita por um LogWriter (thread própria, buffer circular,
+    escrita em lotes e rotação): registrar um erro não faz I/O na thread
+    da requisição. Configuração por variáveis de ambiente:
+    - LOG_FILE_MAX_BYTES (padrão 10 MB) e LOG_FILE_BACKUPS (padrão 5);
+    - LOG_FILE_ROTATE_SECONDS (padrão 0 = só por tamanho);
+    - LOG_FILE_BUFFER (entradas em memória, padrão 10000);
+    - LOG_FILE_FLUSH_INTERVAL (segundos, padrão 1) e LOG_FILE_FSYNC (padrão 1);
+    - LOG_FILE_FORMAT: "texto" (padrão) ou "json".
     """
 
     LOG_FILE = "api/system/log.log"
 
+    __writer = None
+    __lock = threading.Lock()
+
     @staticmethod
     def log_error(message: str):
         """
@@ -34,16 +48,47 @@ class Logger:
     @staticmethod
     def _write_log(log_type: str, message: str):
         """
-        Escreve a entrada de log no arquivo, criando diretório se necessário.
+        Enfileira a entrada de log; o LogWriter grava em segundo plano.
+        """
+        Logger._writer().write(log_type, message)
+
+    @staticmethod
+    def flush(timeout: float = 5.0):
+        """
+        Espera as entradas pendentes serem gravadas.
+        """
+        Logger._writer().flush(timeout)
+
+    @staticmethod
+    def close():
         """
-        directory_path = os.path.dirname(Logger.LOG_FILE)
-        os.makedirs(directory_path, exist_ok=True)
+        Grava as entradas pendentes e fecha o arquivo. Roda no atexit; quem
+        sai com os._exit (workers do prefork) deve chamá-la antes.
+        """
+        if Logger.__writer is not None:
+            Logger.__writer.close()
 
-        date_time = datetime.utcnow().isoformat()
-        entry = f"[{date_time}] [{log_type}]\n{message}\n{'-'*80}\n"
+    @staticmethod
+    def stats() -> dict:
+        """
+        Contadores do escritor (enfileiradas, gravadas, descartadas, rotações...).
+        """
+        return Logger._writer().stats()
 
-        try:
-            with open(Logger.LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(entry)
-        except Exception as e:
-            print("🔴 Falha ao gravar log:", e)
+    @staticmethod
+    def _writer() -> LogWriter:
+        if Logger.__writer is None:
+            with Logger.__lock:
+                if Logger.__writer is None:
+                    Logger.__writer = LogWriter(
+                        Logger.LOG_FILE,
+                        max_bytes=int(os.getenv('LOG_FILE_MAX_BYTES', str(10 * 1024 * 1024))),
+                        backup_count=int(os.getenv('LOG_FILE_BACKUPS', '5')),
+                        rotate_seconds=float(os.getenv('LOG_FILE_ROTATE_SECONDS', '0')),
+                        buffer_size=int(os.getenv('LOG_FILE_BUFFER', '10000')),
+                        flush_interval=float(os.getenv('LOG_FILE_FLUSH_INTERVAL', '1')),
+                        fsync=os.getenv('LOG_FILE_FSYNC', '1') == '1',
+                        formato=os.getenv('LOG_FILE_FORMAT', 'texto')
+                    )
+                    atexit.register(Logger.__writer.close)
+        return Logger.__writer
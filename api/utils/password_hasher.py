@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+import bcrypt
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from api.utils.error_response import ErrorResponse
+
+
+"""
+Classe responsável por gerar e verificar hashes de senha com bcrypt
+fora da thread da requisição.
+
+Implementa:
+- Pool de threads dedicado e de tamanho fixo para o bcrypt;
+- Limite de fila: quando o pool e a fila estão cheios a chamada falha na hora
+  com ErrorResponse 503, em vez de prender a thread da requisição;
+- Custo (rounds) do bcrypt configurável;
+- Métricas de latência (contagem, média, máximo e histograma) por operação.
+
+Assim um pico de logins ocupa no máximo max_workers núcleos, e as demais
+rotas (CRUD) continuam sendo atendidas.
+"""
+class PasswordHasher:
+    # Limites superiores (ms) das faixas do histograma de latência
+    HISTOGRAMA_MS = (50, 100, 250, 500, 1000, 2500)
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 16, rounds: int = 12, timeout: float = 10.0):
+        """
+        Construtor da classe PasswordHasher
+
+        :param max_workers: int - threads dedicadas ao bcrypt
+        :param max_queue: int - chamadas que podem aguardar além das em execução
+        :param rounds: int - fator de custo do bcrypt (4 a 31)
+        :param timeout: float - espera máxima (segundos) pelo resultado
+        """
+        if not 4 <= rounds <= 31:
+            raise ValueError("rounds deve estar entre 4 e 31.")
+
+        self.__rounds = rounds
+        self.__timeout = timeout
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self.__vagas = threading.BoundedSemaphore(max_workers + max_queue)
+        self.__max_workers = max_workers
+        self.__max_queue = max_queue
+
+        self.__lock = threading.Lock()
+        self.__em_andamento = 0
+        self.__rejeitadas = 0
+        self.__metricas = {
+            "hash": self.__nova_metrica(),
+            "check": self.__nova_metrica(),
+        }
+
+    def hash_password(self, senha: str) -> str:
+        """
+        Gera o hash bcrypt de uma senha.
+
+        :param senha: str - senha em texto puro
+        :return: str - hash bcrypt
+        :raises ErrorResponse: 503 se o pool estiver saturado
+        """
+        return self.__executar("hash", self.__hash, senha)
+
+    def check_password(self, senha: str, senha_hash: str) -> bool:
+        """
+        Verifica uma senha contra um hash bcrypt.
+
+        :param senha: str - senha em texto puro
+        :param senha_hash: str - hash armazenado
+        :return: bool
+        :raises ErrorResponse: 503 se o pool estiver saturado
+        """
+        return self.__executar("check", self.__check, senha, senha_hash)
+
+    def stats(self) -> dict:
+        """
+        Retorna as métricas do pool e da latência do bcrypt.
+
+        :return: dict
+        """
+        with self.__lock:
+            operacoes = {}
+            for nome, m in self.__metricas.items():
+                operacoes[nome] = {
+                    "count": m["count"],
+                    "avg_ms": round(m["total_ms"] / m["count"], 2) if m["count"] else 0.0,
+                    "max_ms": round(m["max_ms"], 2),
+                    "histogram_ms": dict(m["histograma"]),
+                }
+            return {
+                "rounds": self.__rounds,
+                "max_workers": self.__max_workers,
+                "max_queue": self.__max_queue,
+                "in_flight": self.__em_andamento,
+                "rejected": self.__rejeitadas,
+                "operations": operacoes,
+            }
+
+    def shutdown(self):
+        """Encerra o pool de threads."""
+        self.__executor.shutdown(wait=False)
+
+    def __executar(self, operacao: str, fn, *args):
+        if not self.__vagas.acquire(blocking=False):
+            with self.__lock:
+                self.__rejeitadas += 1
+            raise ErrorResponse(
+                503,
+                "Servidor ocupado",
+                {"message": "Muitas autenticações simultâneas, tente novamente em instantes"}
+            )
+
+        with self.__lock:
+            self.__em_andamento += 1
+        try:
+            future = self.__executor.submit(self.__medir, operacao, fn, *args)
+        except BaseException:
+            self.__liberar()
+            raise
+        # A vaga só volta quando o bcrypt termina (ou a tarefa é cancelada
+        # antes de começar): um timeout não a devolve com o trabalho ainda
+        # ocupando o pool
+        future.add_done_callback(self.__liberar)
+
+        try:
+            return future.result(timeout=self.__timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise ErrorResponse(
+                503,
+                "Servidor ocupado",
+                {"message": "Tempo esgotado ao processar a senha"}
+            )
+
+    def __liberar(self, future=None):
+        with self.__lock:
+            self.__em_andamento -= 1
+        self.__vagas.release()
+
+    def __medir(self, operacao: str, fn, *args):
+        inicio = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.__registrar(operacao, (time.perf_counter() - inicio) * 1000)
+
+    def __registrar(self, operacao: str, duracao_ms: float):
+        with self.__lock:
+            m = self.__metricas[operacao]
+            m["count"] += 1
+            m["total_ms"] += duracao_ms
+            m["max_ms"] = max(m["max_ms"], duracao_ms)
+            for limite in self.HISTOGRAMA_MS:
+                if duracao_ms <= limite:
+                    m["histograma"][f"le_{limite}"] += 1
+                    break
+            else:
+                m["histograma"]["inf"] += 1
+
+    def __nova_metrica(self) -> dict:
+        histograma = {f"le_{limite}": 0 for limite in self.HISTOGRAMA_MS}
+        histograma["inf"] = 0
+        return {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "histograma": histograma}
+
+    def __hash(self, senha: str) -> str:
+        return bcrypt.hashpw(senha.encode('utf-8'), bcrypt.gensalt(rounds=self.__rounds)).decode('utf-8')
+
+    @staticmethod
+    def __check(senha: str, senha_hash: str) -> bool:
+        return bcrypt.checkpw(senha.encode('utf-8'), senha_hash.encode('utf-8'))
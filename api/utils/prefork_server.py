@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+from api.utils.log_config import encerrar_logging
+from api.utils.logger import Logger
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Servidor WSGI de produção com processos pré-criados (prefork).
+
+Implementa:
+- Um socket de escuta aberto pelo processo mestre e herdado pelos workers
+  (o kernel distribui as conexões entre eles);
+- Cada worker atende com um pool fixo de threads (sem thread por conexão);
+- preload: a aplicação é montada uma vez no mestre, antes do fork;
+- SIGHUP: reload gracioso - sobe uma geração nova de workers e só então
+  pede às antigas que terminem as requisições em andamento e saiam;
+- SIGTERM/SIGINT: parada graciosa, com SIGKILL após graceful_timeout;
+- Worker que morre fora de uma parada é recriado.
+
+Recursos que não sobrevivem ao fork (conexões MySQL, threads) devem ser
+liberados no callback antes_do_fork e recriados sob demanda no worker.
+Só funciona em sistemas POSIX (os.fork).
+"""
+class PreforkServer:
+    def __init__(self, criar_app, host: str = "0.0.0.0", porta: int = 5000, workers: int = 2,
+                 threads: int = 4, preload: bool = True, graceful_timeout: float = 30.0,
+                 antes_do_fork=None, ao_encerrar_worker=None):
+        """
+        :param criar_app: callable - monta e retorna a aplicação WSGI
+        :param host: str - endereço de escuta
+        :param porta: int - porta de escuta
+        :param workers: int - processos atendendo requisições
+        :param threads: int - threads por processo
+        :param preload: bool - monta a aplicação no mestre antes do fork
+        :param graceful_timeout: float - segundos para um worker terminar as
+                                 requisições em andamento antes do SIGKILL
+        :param antes_do_fork: callable - chamado no mestre antes de criar workers
+        :param ao_encerrar_worker: callable - chamado no worker antes de sair
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("O modo prefork requer um sistema POSIX (os.fork).")
+        if workers < 1 or threads < 1:
+            raise ValueError("workers e threads devem ser maiores que zero.")
+
+        self.__criar_app = criar_app
+        self.__host = host
+        self.__porta = porta
+        self.__workers = workers
+        self.__threads = threads
+        self.__preload = preload
+        self.__graceful_timeout = graceful_timeout
+        self.__antes_do_fork = antes_do_fork
+        self.__ao_encerrar_worker = ao_encerrar_worker
+
+        self.__app = None
+        self.__socket = None
+        # pid -> instante do SIGTERM (None enquanto o worker está ativo)
+        self.__filhos = {}
+        self.__sinais = []
+        self.__encerrando = False
+
+    def run(self):
+        """
+        Abre o socket, cria os workers e supervisiona até SIGTERM/SIGINT.
+        """
+        self.__socket = socket.create_server((self.__host, self.__porta), backlog=2048)
+        self.__socket.set_inheritable(True)
+
+        if self.__preload:
+            self.__carregar()
+
+        for sinal in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+            signal.signal(sinal, self.__registrar_sinal)
+
+        logger.info("Mestre %s escutando em http://%s:%s (%s workers x %s threads, preload=%s)",
+                    os.getpid(), self.__host, self.__porta, self.__workers, self.__threads,
+                    self.__preload)
+        self.__completar_workers()
+
+        try:
+            while self.__filhos or not self.__encerrando:
+                self.__tratar_sinais()
+                self.__recolher_filhos()
+                self.__matar_atrasados()
+                if not self.__encerrando:
+                    self.__completar_workers()
+                time.sleep(0.2)
+        finally:
+            self.__socket.close()
+            logger.info("Todos os workers encerrados")
+
+    def __carregar(self):
+        """Monta a aplicação no mestre e libera o que não pode ser herdado."""
+        self.__app = self.__criar_app()
+        if self.__antes_do_fork:
+            self.__antes_do_fork()
+
+    def __registrar_sinal(self, sinal, frame):
+        self.__sinais.append(sinal)
+
+    def __tratar_sinais(self):
+        while self.__sinais:
+            sinal = self.__sinais.pop(0)
+            if sinal in (signal.SIGTERM, signal.SIGINT) and not self.__encerrando:
+                logger.info("Parada graciosa solicitada, aguardando os workers...")
+                self.__encerrando = True
+                self.__parar_workers(list(self.__filhos))
+            elif sinal == signal.SIGHUP and not self.__encerrando:
+                self.__recarregar()
+
+    def __recarregar(self):
+        """
+        Reload gracioso: a geração nova já aceita conexões no mesmo socket
+        quando a antiga recebe SIGTERM, então nenhuma requisição é recusada.
+        Com preload, a aplicação é remontada (relê a configuração do ambiente);
+        código Python alterado só entra com um restart completo.
+        """
+        logger.info("SIGHUP: recarregando workers...")
+        antigos = [pid for pid, parada in self.__filhos.items() if parada is None]
+        if self.__preload:
+            try:
+                self.__carregar()
+            except Exception as e:
+                logger.error("Falha ao recarregar a aplicação, mantendo os workers atuais: %s", e)
+                return
+        for _ in range(self.__workers):
+            self.__criar_worker()
+        self.__parar_workers(antigos)
+
+    def __completar_workers(self):
+        ativos = sum(1 for parada in self.__filhos.values() if parada is None)
+        for _ in range(self.__workers - ativos):
+            self.__criar_worker()
+
+    def __parar_workers(self, pids):
+        agora = time.monotonic()
+        for pid in pids:
+            if self.__filhos.get(pid, 0) is None:
+                self.__filhos[pid] = agora
+                self.__sinalizar(pid, signal.SIGTERM)
+
+    def __matar_atrasados(self):
+        limite = time.monotonic() - self.__graceful_timeout
+        for pid, parada in list(self.__filhos.items()):
+            if parada is not None and parada < limite:
+                logger.warning("Worker %s excedeu o graceful_timeout, enviando SIGKILL", pid)
+                self.__sinalizar(pid, signal.SIGKILL)
+
+    def __recolher_filhos(self):
+        while self.__filhos:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.__filhos.clear()
+                return
+            if pid == 0:
+                return
+            parada = self.__filhos.pop(pid, None)
+            if parada is None and not self.__encerrando:
+                logger.warning("Worker %s terminou inesperadamente (status %s), recriando", pid, status)
+
+    @staticmethod
+    def __sinalizar(pid: int, sinal):
+        try:
+            os.kill(pid, sinal)
+        except ProcessLookupError:
+            pass
+
+    def __criar_worker(self):
+        pid = os.fork()
+        if pid:
+            self.__filhos[pid] = None
+            return
+
+        # Processo filho: nunca retorna ao laço do mestre
+        codigo = 0
+        try:
+            self.__executar_worker()
+        except BaseException as e:
+            logger.exception("Worker %s falhou: %s", os.getpid(), e)
+            codigo = 1
+        finally:
+            # os._exit não roda o atexit: o que estiver nos buffers se perderia
+            Logger.close()
+            encerrar_logging()
+            os._exit(codigo)
+
+    def __executar_worker(self):
+        """
+        Laço do worker: aceita conexões no socket herdado e as despacha para
+        um pool fixo de threads; no SIGTERM para de aceitar, termina o que
+        está em andamento e sai.
+        """
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        # Até o servidor existir, SIGTERM/SIGINT simplesmente encerram o worker
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        app = self.__app if self.__preload else self.__criar_app()
+        servidor = _PoolWSGIServer(self.__host, self.__porta, app, self.__threads,
+                                   self.__socket.fileno())
+
+        def parar(sinal, frame):
+            # shutdown() espera o serve_forever sair: não pode rodar nesta thread
+            threading.Thread(target=servidor.shutdown, daemon=True).start()
+
+        signal.signal(signal.SIGTERM, parar)
+        signal.signal(signal.SIGINT, parar)
+
+        logger.info("Worker %s pronto", os.getpid())
+        try:
+            servidor.serve_forever()
+        finally:
+            servidor.encerrar()
+            if self.__ao_encerrar_worker:
+                self.__ao_encerrar_worker()
+            logger.info("Worker %s encerrado", os.getpid())
+
+
+class _RequestHandler(WSGIRequestHandler):
+    # Sem keep-alive: uma conexão ociosa não prende uma das poucas threads
+    protocol_version = "HTTP/1.0"
+
+
+class _PoolWSGIServer(BaseWSGIServer):
+    """
+    Servidor WSGI do Werkzeug sobre um socket herdado, atendendo cada
+    conexão em um pool fixo de threads.
+    """
+    multithread = True
+
+    def __init__(self, host: str, porta: int, app, threads: int, fd: int):
+        super().__init__(host, porta, app, handler=_RequestHandler, fd=fd)
+        self.__executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="wsgi")
+
+    def process_request(self, request, client_address):
+        self.__executor.submit(self.__atender, request, client_address)
+
+    def __atender(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def encerrar(self):
+        """Termina as requisições já aceitas e fecha o socket deste worker."""
+        self.__executor.shutdown(wait=True)
+        self.server_close()
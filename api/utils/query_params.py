@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from api.utils.error_response import ErrorResponse
+
+"""
+Classe utilitária para ler parâmetros da query string.
+
+Recebe o mapeamento de argumentos (request.args do Flask ou do Quart), para
+que controles síncronos e assíncronos apliquem a mesma regra e a mesma
+mensagem de erro.
+"""
+class QueryParams:
+    @staticmethod
+    def inteiro_positivo(args, nome: str):
+        """
+        Lê um parâmetro inteiro positivo da query string (None se ausente)
+
+        :param args: request.args da requisição atual
+        :param nome: Nome do parâmetro
+        :raises ErrorResponse: 400 se o valor não for um inteiro maior que zero
+        """
+        valor = args.get(nome)
+        if valor is None or valor == "":
+            return None
+        try:
+            parsed = int(valor)
+        except ValueError:
+            parsed = 0
+        if parsed <= 0:
+            raise ErrorResponse(
+                400,
+                "Erro na validação de dados",
+                {"message": f"O parâmetro '{nome}' deve ser um número inteiro positivo"}
+            )
+        return parsed
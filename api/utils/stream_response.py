@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import logging
+from flask import Response, current_app, request, stream_with_context
+
+logger = logging.getLogger(__name__)
+
+"""
+Classe utilitária para respostas de listagem em streaming.
+
+Em vez de montar a lista inteira e chamar jsonify, os itens são serializados
+um a um a partir de um generator, mantendo a memória constante e enviando o
+primeiro byte assim que a primeira linha sai do banco.
+
+Formatos suportados:
+- NDJSON (Accept: application/x-ndjson): um objeto JSON por linha;
+- JSON (?stream=1): o mesmo envelope {message, data, success} das rotas
+  normais, com o array construído incrementalmente e "complete" e
+  "success" escritos só depois do último item.
+
+Depois do primeiro byte o status 200 e o que já saiu não podem mais ser
+corrigidos. Um erro no meio da listagem é registrado no log e sinalizado
+no fim do corpo:
+- NDJSON: uma última linha {"success": false, "complete": false, "error"};
+- JSON: o documento é fechado (continua válido) com a lista parcial,
+  "complete": false, "success": false e "error".
+No JSON o cliente só pode tratar a lista como inteira com "complete":
+true; sem essa chave (conexão cortada) o corpo também está incompleto.
+"""
+class StreamResponse:
+    NDJSON_MIMETYPE = "application/x-ndjson"
+
+    @staticmethod
+    def is_requested() -> bool:
+        """
+        Indica se o cliente pediu a listagem em streaming.
+
+        :return: True para ?stream=1 ou Accept: application/x-ndjson
+        """
+        if request.args.get("stream") in ("1", "true"):
+            return True
+        return StreamResponse.__wants_ndjson()
+
+    @staticmethod
+    def build(itens, chave: str, message: str = "Executado com sucesso") -> Response:
+        """
+        Cria a resposta Flask a partir de um iterável de dicts.
+
+        :param itens: Iterable[dict] - normalmente um generator vindo do DAO
+        :param chave: str - nome da lista dentro de "data" (ex: "tarefas")
+        :param message: str - mensagem do envelope JSON
+        :return: flask.Response com corpo gerado sob demanda
+        """
+        if StreamResponse.__wants_ndjson():
+            gerador = StreamResponse.__ndjson(itens)
+            mimetype = StreamResponse.NDJSON_MIMETYPE
+        else:
+            gerador = StreamResponse.__json_array(itens, chave, message)
+            mimetype = "application/json"
+
+        response = Response(stream_with_context(gerador), status=200, mimetype=mimetype)
+        # Impede que proxies acumulem o corpo antes de repassar
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+
+    @staticmethod
+    def __wants_ndjson() -> bool:
+        return StreamResponse.NDJSON_MIMETYPE in request.headers.get("Accept", "")
+
+    @staticmethod
+    def __dumps(obj) -> str:
+        # mesmo provider do jsonify: datas e Decimal saem iguais nas duas rotas
+        return current_app.json.dumps(obj)
+
+    @staticmethod
+    def __ndjson(itens):
+        try:
+            for item in itens:
+                yield StreamResponse.__dumps(item) + "\n"
+        except Exception as e:
+            # O status 200 já foi enviado: sinaliza o erro na última linha
+            logger.error("Erro durante streaming NDJSON: %s", e)
+            yield StreamResponse.__dumps({
+                "success": False,
+                "complete": False,
+                "error": {"message": "Erro interno no servidor", "code": 500}
+            }) + "\n"
+
+    @staticmethod
+    def __json_array(itens, chave: str, message: str):
+        # "success" vai no fim: só é escrito quando o resultado já é conhecido
+        yield '{"message": %s, "data": {%s: [' % (
+            StreamResponse.__dumps(message), StreamResponse.__dumps(chave)
+        )
+        separador = ""
+        try:
+            for item in itens:
+                yield separador + StreamResponse.__dumps(item)
+                separador = ","
+        except Exception as e:
+            # O status 200 já foi enviado: fecha o documento (continua JSON
+            # válido) com a lista incompleta marcada como tal
+            logger.error("Erro durante streaming JSON: %s", e)
+            yield ']}, "complete": false, "success": false, "error": %s}' % StreamResponse.__dumps(
+                {"message": "Erro interno no servidor", "code": 500}
+            )
+            return
+        yield ']}, "complete": true, "success": true}'
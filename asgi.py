@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+import logging
+from quart import Quart, request
+import sys
+import os
+import time
+from datetime import datetime
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.database.async_mysql_database import create_async_database_instance
+from api.http.meu_token_jwt import MeuTokenJWT
+from api.http.token_cache import TokenCache
+from api.http.json_provider import JsonRapido
+from api.utils.password_hasher import PasswordHasher
+from api.utils.log_config import configurar_logging
+from api.middleware.async_jwt_middleware import AsyncJwtMiddleware
+from api.middleware.async_body_middleware import AsyncBodyMiddleware
+from api.middleware.usuario_middleware import UsuarioMiddleware
+from api.middleware.projeto_middleware import ProjetoMiddleware
+from api.middleware.tarefa_middleware import TarefaMiddleware
+from api.utils.error_response import ErrorResponse
+
+from api.dao.async_usuario_dao import AsyncUsuarioDAO
+from api.dao.async_projeto_dao import AsyncProjetoDAO
+from api.dao.async_tarefa_dao import AsyncTarefaDAO
+
+from api.service.async_usuario_service import AsyncUsuarioService
+from api.service.async_projeto_service import AsyncProjetoService
+from api.service.async_tarefa_service import AsyncTarefaService
+
+from api.control.async_usuario_control import AsyncUsuarioControl
+from api.control.async_projeto_control import AsyncProjetoControl
+from api.control.async_tarefa_control import AsyncTarefaControl
+
+from api.router.async_usuario_roteador import AsyncUsuarioRoteador
+from api.router.async_projeto_roteador import AsyncProjetoRoteador
+from api.router.async_tarefa_roteador import AsyncTarefaRoteador
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncServer:
+    """
+    Servidor ASGI (Quart) com o mesmo contrato HTTP do Server (Flask) para
+    um subconjunto das rotas: CRUD de projetos e tarefas, tarefas por
+    projeto, concluir tarefa, login, cadastro e consulta de usuários. O
+    restante (lotes, minhas-tarefas, meus-projetos, dashboard, PUT/DELETE
+    de usuário, /me, /logout...) só existe no servidor Flask.
+
+    Cada requisição é uma task no event loop; enquanto espera o MySQL ela
+    não prende nenhuma thread, então um único processo segura milhares de
+    requisições lentas simultâneas. O pool aiomysql é aberto no
+    before_serving (precisa do loop do servidor) e fechado no after_serving.
+
+    Uso:
+        hypercorn asgi:app --bind 0.0.0.0:5000
+        uvicorn asgi:app --port 5000
+    """
+
+    def __init__(self):
+        self.app = None
+        self.database = None
+        self.dependencies = {}
+
+    def init(self):
+        """
+        Inicializa todas as dependências do servidor.
+        """
+        configurar_logging()
+        logger.info("Inicializando servidor ASGI...")
+
+        # 1. Criar aplicação Quart
+        self.app = Quart(__name__)
+        self.app.config['SECRET_KEY'] = 'chave_secreta_projeto_mvcs'
+        # Mesmo provider JSON do servidor Flask (as DAOs devolvem datas sem formatar)
+        self.app.json = JsonRapido(self.app, os.getenv('JSON_PROVIDER', 'orjson') == 'orjson')
+
+        # 2. Headers CORS (mesmos valores do servidor Flask)
+        @self.app.after_request
+        async def after_request(response):
+            response.headers.add('Access-Control-Allow-Origin', 'http://localhost')
+            response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
+            response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+            response.headers.add('Access-Control-Allow-Credentials', 'true')
+            return response
+
+        # 3. Preflight: qualquer OPTIONS responde 200
+        @self.app.before_request
+        async def before_request():
+            if request.method == 'OPTIONS':
+                return '', 200
+
+        # 4. Banco de dados (o pool só abre quando o loop do servidor existe)
+        self.database = create_async_database_instance()
+
+        @self.app.before_serving
+        async def abrir_pool():
+            logger.info("Abrindo pool aiomysql...")
+            await self.database.connect()
+            if await self.database.test_connection():
+                logger.info("Conexão com banco de dados estabelecida")
+            else:
+                raise Exception("Falha ao conectar com o banco de dados")
+
+        @self.app.after_serving
+        async def fechar_pool():
+            await self.shutdown()
+
+        # 5. Configurar dependências
+        self._configure_dependencies()
+
+        # 6. Registrar rotas
+        self._register_routes()
+
+        # 7. Configurar error handlers
+        self._configure_error_handlers()
+
+        logger.info("Servidor ASGI inicializado com sucesso!")
+
+    def _configure_dependencies(self):
+        """Configura todas as dependências do sistema."""
+        logger.info("Configurando dependências...")
+
+        # JWT (mesmo token e mesmo cache da versão síncrona)
+        jwt_instance = MeuTokenJWT()
+        token_cache = TokenCache(
+            max_entries=int(os.getenv('JWT_CACHE_SIZE', '1024')),
+            ttl=int(os.getenv('JWT_CACHE_TTL', '300'))
+        )
+        jwt_middleware = AsyncJwtMiddleware(jwt_instance, token_cache)
+        body_middleware = AsyncBodyMiddleware()
+
+        # DAOs
+        usuario_dao = AsyncUsuarioDAO(self.database)
+        projeto_dao = AsyncProjetoDAO(self.database)
+        tarefa_dao = AsyncTarefaDAO(self.database)
+
+        password_hasher = PasswordHasher(
+            max_workers=int(os.getenv('BCRYPT_WORKERS', '2')),
+            max_queue=int(os.getenv('BCRYPT_MAX_QUEUE', '16')),
+            rounds=int(os.getenv('BCRYPT_ROUNDS', '12'))
+        )
+
+        verificar_fk = os.getenv('FK_CHECK_MODE', 'exists') != 'constraint'
+
+        # Services
+        usuario_service = AsyncUsuarioService(usuario_dao, password_hasher)
+        projeto_service = AsyncProjetoService(projeto_dao, usuario_dao, self.database, verificar_fk)
+        tarefa_service = AsyncTarefaService(tarefa_dao, projeto_dao, self.database, verificar_fk)
+
+        # Controls
+        usuario_control = AsyncUsuarioControl(usuario_service)
+        projeto_control = AsyncProjetoControl(projeto_service)
+        tarefa_control = AsyncTarefaControl(tarefa_service)
+
+        # Roteadores
+        self.dependencies = {
+            'jwt_middleware': jwt_middleware,
+            'password_hasher': password_hasher,
+            'usuario_roteador': AsyncUsuarioRoteador(jwt_middleware, body_middleware,
+                                                     UsuarioMiddleware(), usuario_control),
+            'projeto_roteador': AsyncProjetoRoteador(jwt_middleware, body_middleware,
+                                                     ProjetoMiddleware(), projeto_control),
+            'tarefa_roteador': AsyncTarefaRoteador(jwt_middleware, body_middleware,
+                                                   TarefaMiddleware(), tarefa_control)
+        }
+
+        logger.info("Dependências configuradas com sucesso")
+
+    def _register_routes(self):
+        """Registra os blueprints nas mesmas URLs do servidor Flask."""
+        logger.info("Registrando rotas...")
+
+        self.app.register_blueprint(
+            self.dependencies['usuario_roteador'].create_routes(),
+            url_prefix='/api/usuario'
+        )
+        self.app.register_blueprint(
+            self.dependencies['projeto_roteador'].create_routes(),
+            url_prefix='/api/projeto'
+        )
+        self.app.register_blueprint(
+            self.dependencies['tarefa_roteador'].create_routes(),
+            url_prefix='/api/tarefa'
+        )
+
+        @self.app.route('/api/health')
+        async def health_check():
+            return {
+                "status": "healthy",
+                "message": "Servidor funcionando corretamente",
+                "engine": "asgi",
+                "timestamp": datetime.now().isoformat() + "Z",
+                "jwt_cache": self.dependencies['jwt_middleware'].get_cache_stats(),
+                "password_hasher": self.dependencies['password_hasher'].stats(),
+                "database_pool": self.database.get_pool_status()
+            }
+
+        @self.app.route('/')
+        async def index():
+            return {
+                "message": "Bem-vindo ao Sistema de Gerenciamento de Projetos",
+                "version": "1.0.0",
+                "endpoints": {
+                    "usuario": "/api/usuario",
+                    "projeto": "/api/projeto",
+                    "tarefa": "/api/tarefa",
+                    "health": "/api/health"
+                }
+            }
+
+        logger.info("Rotas registradas com sucesso")
+
+    def _configure_error_handlers(self):
+        """Configura handlers de erro globais."""
+
+        @self.app.errorhandler(404)
+        async def not_found(error):
+            return {
+                "success": False,
+                "error": {
+                    "message": "Endpoint não encontrado",
+                    "code": 404
+                }
+            }, 404
+
+        # Validação de corpo (AsyncBodyMiddleware) e demais ErrorResponse fora dos controls
+        @self.app.errorhandler(ErrorResponse)
+        async def error_response(error):
+            return {
+                "success": False,
+                "error": {
+                    "message": error.message,
+                    "details": error.details,
+                    "code": error.status_code
+                }
+            }, error.status_code
+
+        @self.app.errorhandler(500)
+        async def internal_error(error):
+            return {
+                "success": False,
+                "error": {
+                    "message": "Erro interno do servidor",
+                    "code": 500
+                }
+            }, 500
+
+    async def shutdown(self):
+        """Fecha o pool e o executor de bcrypt."""
+        logger.info("Encerrando servidor ASGI...")
+        if 'password_hasher' in self.dependencies:
+            self.dependencies['password_hasher'].shutdown()
+        if self.database:
+            await self.database.close_pool()
+        logger.info("Servidor encerrado")
+
+
+def create_asgi_app():
+    """Factory da app ASGI (par do server.create_app)."""
+    server = AsyncServer()
+    server.init()
+    return server.app
+
+
+app = create_asgi_app()
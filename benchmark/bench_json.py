@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark da serialização de uma listagem de tarefas (envelope
+{success, message, data}), sem banco e sem HTTP.
+
+Compara:
+- antes: DAO convertendo cada data com isoformat() + provider padrão do
+  Flask (json da biblioteca padrão, sort_keys, ensure_ascii);
+- json: valores crus das colunas + JsonRapido sem orjson (fallback);
+- orjson: valores crus das colunas + JsonRapido com orjson.
+
+Exemplo:
+
+    python benchmark/bench_json.py --tarefas 50000 --repeticoes 7
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from api.http.json_provider import JsonRapido, orjson
+
+
+def _linhas(quantidade: int) -> list[dict]:
+    """Linhas como o conector MySQL devolve (datetime, Decimal, 0/1)."""
+    base = datetime(2025, 1, 1, 8, 30, 15)
+    return [
+        {
+            "id": i,
+            "titulo": f"Tarefa {i} - revisão do módulo de relatórios",
+            "descricao": "Descrição com acentuação: integração, validação e publicação",
+            "status": ("pendente", "andamento", "concluida")[i % 3],
+            "prioridade": ("baixa", "media", "alta")[i % 3],
+            "concluida": i % 3 == 2,
+            "projeto_id": i % 200 + 1,
+            "projeto_nome": f"Projeto {i % 200 + 1}",
+            "usuario_id": i % 50 + 1,
+            "usuario_nome": f"Usuário {i % 50 + 1}",
+            "data_limite": base + timedelta(hours=i),
+            "data_inicio": base + timedelta(minutes=i),
+            "data_fim": None if i % 2 else base + timedelta(days=1, microseconds=i),
+            "horas": Decimal(i % 40) / 4,
+        }
+        for i in range(1, quantidade + 1)
+    ]
+
+
+def _formatar_como_antes(linhas: list[dict]) -> list[dict]:
+    """O que as DAOs faziam antes: uma cópia de cada linha com as datas em texto."""
+    tarefas = []
+    for row in linhas:
+        tarefa = dict(row)
+        for campo in ("data_limite", "data_inicio", "data_fim"):
+            valor = row[campo]
+            if valor:
+                tarefa[campo] = valor.isoformat() if hasattr(valor, "isoformat") else str(valor)
+            else:
+                tarefa[campo] = None
+        tarefa["horas"] = float(row["horas"])
+        tarefas.append(tarefa)
+    return tarefas
+
+
+def _envelope(tarefas: list[dict]) -> dict:
+    return {"success": True, "message": "Executado com sucesso", "data": {"tarefas": tarefas, "next_cursor": None}}
+
+
+def _medir(funcao, repeticoes: int) -> tuple[list[float], bytes]:
+    tempos = []
+    corpo = b""
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        corpo = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return tempos, corpo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark da serialização JSON")
+    parser.add_argument("--tarefas", type=int, default=50000)
+    parser.add_argument("--repeticoes", type=int, default=7)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    padrao_flask = DefaultJSONProvider(app)
+    rapido_json = JsonRapido(app, usar_orjson=False)
+    rapido_orjson = JsonRapido(app, usar_orjson=True)
+
+    linhas = _linhas(args.tarefas)
+    casos = [
+        ("antes (isoformat + json do Flask)",
+         lambda: padrao_flask.dumps(_envelope(_formatar_como_antes(linhas))).encode("utf-8")),
+        ("json (valores crus, fallback)", lambda: rapido_json.dumps_bytes(_envelope(linhas))),
+    ]
+    if orjson is not None:
+        casos.append(("orjson (valores crus)", lambda: rapido_orjson.dumps_bytes(_envelope(linhas))))
+    else:
+        print("orjson não instalado: caso orjson ignorado")
+
+    print(f"{args.tarefas} tarefas, {args.repeticoes} repetições")
+    print(f"{'caso':<36} {'mediana':>10} {'mínimo':>10} {'bytes':>12} {'x antes':>8}")
+    referencia = None
+    resultado_antes = None
+    for nome, funcao in casos:
+        tempos, corpo = _medir(funcao, args.repeticoes)
+        mediana = statistics.median(tempos)
+        referencia = referencia or mediana
+        # mesmo conteúdo em todos os casos (a ordem das chaves pode mudar)
+        decodificado = json.loads(corpo)
+        resultado_antes = resultado_antes or decodificado
+        igual = "" if decodificado == resultado_antes else "  (CONTEÚDO DIFERENTE)"
+        print(f"{nome:<36} {mediana * 1000:>8.1f}ms {min(tempos) * 1000:>8.1f}ms "
+              f"{len(corpo):>12,} {referencia / mediana:>7.1f}x{igual}")
+
+
+if __name__ == "__main__":
+    main()
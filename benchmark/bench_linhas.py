@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark da conversão de linhas do banco em dicionários de resposta
+(listagem completa de tarefas), sem banco e sem HTTP.
+
+Compara:
+- original: cursor dict + dicionário remontado chave a chave e um
+  hasattr(..., 'isoformat') por coluna de data (como as DAOs faziam);
+- montar_linha: cursor dict + ConsultaLista.montar_linha (laço por campo);
+- mapeador: cursor de tuplas + ConsultaLista.mapear (plano por consulta,
+  conversão coluna a coluna).
+
+Nos casos de cursor dict o tempo inclui o dict que o conector monta para
+cada linha (simulado com o mesmo dict(zip(colunas, linha))), custo que o
+cursor de tuplas não tem.
+
+Exemplo:
+
+    python benchmark/bench_linhas.py --linhas 50000 --repeticoes 7
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.dao.tarefa_dao import TarefaDAO
+
+COLUNAS = tuple(TarefaDAO.CONSULTA.campos())
+
+
+def _tuplas(quantidade: int) -> list[tuple]:
+    """Linhas como o cursor de tuplas devolve (datetime, 0/1, None)."""
+    base = datetime(2025, 1, 1, 8, 30, 15)
+    return [
+        (
+            i,
+            f"Tarefa {i} - revisão do módulo de relatórios",
+            "Descrição com acentuação: integração, validação e publicação",
+            ("pendente", "andamento", "concluida")[i % 3],
+            ("baixa", "media", "alta")[i % 3],
+            int(i % 3 == 2),
+            i % 200 + 1,
+            f"Projeto {i % 200 + 1}",
+            i % 50 + 1,
+            f"Usuário {i % 50 + 1}",
+            base + timedelta(hours=i),
+            base + timedelta(minutes=i),
+            None if i % 2 else base + timedelta(days=1),
+        )
+        for i in range(1, quantidade + 1)
+    ]
+
+
+def _original(rows: list[dict]) -> list[dict]:
+    tarefas = []
+    for row in rows:
+        tarefa_data = {
+            "id": row["id"],
+            "titulo": row["titulo"],
+            "descricao": row["descricao"],
+            "status": row["status"],
+            "prioridade": row["prioridade"],
+            "concluida": bool(row["concluida"]),
+            "projeto_id": row["projeto_id"],
+            "projeto_nome": row["projeto_nome"],
+            "usuario_id": row["usuario_id"],
+            "usuario_nome": row["usuario_nome"],
+        }
+        for campo in ("data_limite", "data_inicio", "data_fim"):
+            valor = row[campo]
+            if valor:
+                tarefa_data[campo] = valor.isoformat() if hasattr(valor, "isoformat") else str(valor)
+            else:
+                tarefa_data[campo] = None
+        tarefas.append(tarefa_data)
+    return tarefas
+
+
+def _medir(funcao, repeticoes: int) -> tuple[list[float], list]:
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return tempos, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark do mapeamento de linhas")
+    parser.add_argument("--linhas", type=int, default=50000)
+    parser.add_argument("--repeticoes", type=int, default=7)
+    args = parser.parse_args()
+
+    consulta = TarefaDAO.CONSULTA
+    campos = list(COLUNAS)
+    tuplas = _tuplas(args.linhas)
+
+    def cursor_dict():
+        return [dict(zip(COLUNAS, linha)) for linha in tuplas]
+
+    # o original ainda formatava as datas: não entra na conferência do resultado
+    casos = [
+        ("original (dict + chave a chave)", lambda: _original(cursor_dict())),
+        ("montar_linha (dict + laço)", lambda: [consulta.montar_linha(row, campos) for row in cursor_dict()]),
+        ("mapeador (tuplas + colunas)", lambda: consulta.mapear(COLUNAS, tuplas)),
+    ]
+
+    print(f"{args.linhas} linhas, {args.repeticoes} repetições")
+    print(f"{'caso':<34} {'mediana':>10} {'mínimo':>10} {'x original':>11}")
+    referencia = None
+    esperado = [consulta.montar_linha(row, campos) for row in cursor_dict()]
+    for nome, funcao in casos:
+        tempos, resultado = _medir(funcao, args.repeticoes)
+        mediana = statistics.median(tempos)
+        referencia = referencia or mediana
+        igual = "" if funcao is casos[0][1] or resultado == esperado else "  (RESULTADO DIFERENTE)"
+        print(f"{nome:<34} {mediana * 1000:>8.1f}ms {min(tempos) * 1000:>8.1f}ms "
+              f"{referencia / mediana:>10.1f}x{igual}")
+
+
+if __name__ == "__main__":
+    main()
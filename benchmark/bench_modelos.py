@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark dos modelos (Usuario, Projeto, Tarefa): memória por objeto
+e tempo de construção a partir de linhas do banco.
+
+Compara, para cada modelo:
+- antes: o mesmo módulo sem __slots__ (um __dict__ por instância),
+  construído com o construtor + setters, como as DAOs faziam;
+- setters: classe com __slots__, construtor + setters (caminho da API);
+- from_row: classe com __slots__, construção confiável sem validação.
+
+A variante "antes" é gerada a partir do código atual do modelo, só sem a
+linha __slots__, para que a diferença seja apenas essa.
+
+Exemplo:
+
+    python benchmark/bench_modelos.py --objetos 100000 --repeticoes 7
+"""
+import argparse
+import inspect
+import os
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.model import projeto, tarefa, usuario
+
+
+def _sem_slots(modulo, nome: str):
+    """A classe do modelo compilada de novo sem a declaração de __slots__."""
+    fonte = re.sub(r"^\s*__slots__ = .*$", "", inspect.getsource(modulo), flags=re.M)
+    namespace = {"__name__": f"{modulo.__name__}_sem_slots"}
+    exec(compile(fonte, modulo.__file__, "exec"), namespace)
+    return namespace[nome]
+
+
+def _linhas(modelo: str, quantidade: int) -> list[dict]:
+    base = datetime(2025, 1, 1, 8, 30, 15)
+    if modelo == "Usuario":
+        return [{"id": i, "nome": f"Usuário {i}", "email": f"usuario{i}@empresa.com",
+                 "senha_hash": "pbkdf2:sha256:600000$" + "a" * 64, "data_criacao": base + timedelta(minutes=i)}
+                for i in range(1, quantidade + 1)]
+    if modelo == "Projeto":
+        return [{"id": i, "nome": f"Projeto {i}", "descricao": "Integração com o módulo de relatórios",
+                 "data_inicio": base + timedelta(days=i % 30), "data_fim": None,
+                 "status": ("pendente", "andamento", "concluido")[i % 3], "usuario_id": i % 50 + 1}
+                for i in range(1, quantidade + 1)]
+    return [{"id": i, "titulo": f"Tarefa {i}", "concluida": i % 3 == 2,
+             "data_limite": base + timedelta(hours=i), "projeto_id": i % 200 + 1}
+            for i in range(1, quantidade + 1)]
+
+
+def _com_setters(cls, linhas: list[dict]) -> list:
+    objetos = []
+    for row in linhas:
+        obj = cls()
+        for nome, valor in row.items():
+            setattr(obj, nome, valor)
+        objetos.append(obj)
+    return objetos
+
+
+def _medir_tempo(funcao, repeticoes: int) -> float:
+    funcao()  # aquecimento
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+def _medir_memoria(funcao, quantidade: int) -> float:
+    """Bytes alocados por objeto (a lista que guarda os objetos é descontada)."""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    objetos = funcao()
+    total = tracemalloc.get_traced_memory()[0] - antes - sys.getsizeof(objetos)
+    tracemalloc.stop()
+    return total / quantidade
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark dos modelos com __slots__")
+    parser.add_argument("--objetos", type=int, default=100000)
+    parser.add_argument("--repeticoes", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{args.objetos} objetos por caso, {args.repeticoes} repetições")
+    print(f"{'modelo':<8} {'caso':<10} {'mediana':>10} {'x antes':>8} {'bytes/obj':>10}")
+    for modulo, nome in ((usuario, "Usuario"), (projeto, "Projeto"), (tarefa, "Tarefa")):
+        com_slots = getattr(modulo, nome)
+        sem_slots = _sem_slots(modulo, nome)
+        linhas = _linhas(nome, args.objetos)
+        casos = [
+            ("antes", lambda: _com_setters(sem_slots, linhas)),
+            ("setters", lambda: _com_setters(com_slots, linhas)),
+            ("from_row", lambda: [com_slots.from_row(row) for row in linhas]),
+        ]
+        referencia = None
+        for caso, funcao in casos:
+            mediana = _medir_tempo(funcao, args.repeticoes)
+            referencia = referencia or mediana
+            memoria = _medir_memoria(funcao, args.objetos)
+            print(f"{nome:<8} {caso:<10} {mediana * 1000:>8.1f}ms {referencia / mediana:>7.1f}x {memoria:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
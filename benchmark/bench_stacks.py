@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark comparando o servidor WSGI (server.py / Flask) e o ASGI (asgi.py / Quart).
+
+Os dois expõem as mesmas URLs, então o mesmo cliente mede os dois. O
+cliente é asyncio puro (só biblioteca padrão): N conexões keep-alive
+abertas ao mesmo tempo, cada uma disparando requisições em sequência
+durante a duração pedida. Mede vazão, latência (p50/p95/p99/máx) e
+erros (status >= 500, timeouts e conexões recusadas).
+
+Exemplo (duas instâncias já rodando contra o mesmo banco):
+
+    python server.py                                # :5000
+    hypercorn asgi:app --bind 0.0.0.0:5001
+
+    python benchmark/bench_stacks.py \\
+        --wsgi http://127.0.0.1:5000 --asgi http://127.0.0.1:5001 \\
+        --path /api/tarefa/?limit=50 --token "$TOKEN" \\
+        --concurrency 10,100,1000 --duration 15
+
+Com --concurrency alto o WSGI satura no número de threads/conexões do
+pool, enquanto o ASGI segue aceitando; a diferença aparece no p99 e nos
+erros, não na mediana.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+async def _requisicao(reader, writer, host: str, caminho: str, token: str):
+    """
+    Envia um GET keep-alive e lê a resposta inteira.
+    Retorna (status, manter_conexao).
+    """
+    cabecalhos = [f"GET {caminho} HTTP/1.1", f"Host: {host}", "Connection: keep-alive"]
+    if token:
+        cabecalhos.append(f"Authorization: Bearer {token}")
+    writer.write(("\r\n".join(cabecalhos) + "\r\n\r\n").encode("latin-1"))
+    await writer.drain()
+
+    linha_status = await reader.readline()
+    if not linha_status:
+        raise ConnectionError("conexão fechada pelo servidor")
+    versao, status = linha_status.split()[:2]
+    status = int(status)
+    manter = versao == b"HTTP/1.1"
+
+    tamanho = 0
+    chunked = False
+    while True:
+        linha = await reader.readline()
+        if linha in (b"\r\n", b"\n", b""):
+            break
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        nome = nome.strip().lower()
+        if nome == "content-length":
+            tamanho = int(valor.strip())
+        elif nome == "transfer-encoding" and "chunked" in valor.lower():
+            chunked = True
+        elif nome == "connection":
+            manter = valor.strip().lower() == "keep-alive"
+
+    if chunked:
+        while True:
+            tamanho_chunk = int((await reader.readline()).strip() or b"0", 16)
+            await reader.readexactly(tamanho_chunk + 2)
+            if tamanho_chunk == 0:
+                break
+    elif tamanho:
+        await reader.readexactly(tamanho)
+    elif not manter:
+        await reader.read()
+    return status, manter
+
+
+async def _worker(url, caminho, token, fim, timeout, latencias, contadores):
+    partes = urlsplit(url)
+    host = partes.hostname
+    porta = partes.port or 80
+    reader = writer = None
+    while time.perf_counter() < fim:
+        inicio = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, porta), timeout)
+            status, manter = await asyncio.wait_for(
+                _requisicao(reader, writer, partes.netloc, caminho, token), timeout
+            )
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError):
+            contadores["erros"] += 1
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+            continue
+        latencias.append(time.perf_counter() - inicio)
+        if not manter:
+            writer.close()
+            reader = writer = None
+        if status >= 500:
+            contadores["erros"] += 1
+        else:
+            contadores["ok"] += 1
+    if writer is not None:
+        writer.close()
+
+
+def _percentil(valores_ordenados, p):
+    if not valores_ordenados:
+        return 0.0
+    indice = min(len(valores_ordenados) - 1, int(round(p / 100 * (len(valores_ordenados) - 1))))
+    return valores_ordenados[indice]
+
+
+async def medir(url, caminho, token, concorrencia, duracao, timeout) -> dict:
+    """Roda `concorrencia` conexões por `duracao` segundos contra `url`."""
+    latencias = []
+    contadores = {"ok": 0, "erros": 0}
+    inicio = time.perf_counter()
+    fim = inicio + duracao
+    await asyncio.gather(*[
+        _worker(url, caminho, token, fim, timeout, latencias, contadores)
+        for _ in range(concorrencia)
+    ])
+    decorrido = time.perf_counter() - inicio
+    ordenadas = sorted(latencias)
+    ms = lambda s: round(s * 1000, 2)
+    return {
+        "concorrencia": concorrencia,
+        "requisicoes": contadores["ok"],
+        "erros": contadores["erros"],
+        "rps": round(contadores["ok"] / decorrido, 1),
+        "p50_ms": ms(_percentil(ordenadas, 50)),
+        "p95_ms": ms(_percentil(ordenadas, 95)),
+        "p99_ms": ms(_percentil(ordenadas, 99)),
+        "max_ms": ms(ordenadas[-1]) if ordenadas else 0.0,
+        "media_ms": ms(statistics.fmean(ordenadas)) if ordenadas else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara os servidores WSGI e ASGI")
+    parser.add_argument("--wsgi", default="http://127.0.0.1:5000", help="URL base do servidor Flask")
+    parser.add_argument("--asgi", default="http://127.0.0.1:5001", help="URL base do servidor Quart")
+    parser.add_argument("--path", default="/api/health", help="caminho requisitado (GET)")
+    parser.add_argument("--token", default="", help="JWT para rotas protegidas")
+    parser.add_argument("--concurrency", default="10,100,500",
+                        help="níveis de concorrência separados por vírgula")
+    parser.add_argument("--duration", type=float, default=10.0, help="segundos por medição")
+    parser.add_argument("--timeout", type=float, default=30.0, help="timeout por requisição (s)")
+    parser.add_argument("--json", action="store_true", help="imprime o resultado em JSON")
+    args = parser.parse_args()
+
+    niveis = [int(n) for n in args.concurrency.split(",") if n.strip()]
+    resultados = []
+    for nome, url in (("wsgi", args.wsgi), ("asgi", args.asgi)):
+        for concorrencia in niveis:
+            resultado = asyncio.run(medir(url, args.path, args.token, concorrencia,
+                                          args.duration, args.timeout))
+            resultado["stack"] = nome
+            resultados.append(resultado)
+            if not args.json:
+                print(f"{nome:5} c={concorrencia:<5} rps={resultado['rps']:<9} "
+                      f"p50={resultado['p50_ms']}ms p95={resultado['p95_ms']}ms "
+                      f"p99={resultado['p99_ms']}ms max={resultado['max_ms']}ms "
+                      f"erros={resultado['erros']}")
+
+    if args.json:
+        print(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,69 @@
+import argparse
 import subprocess
 import sys
 import mysql.connector
 from mysql.connector import errorcode
 
+from api.database.mysql_database import MysqlDatabase
+from api.database.migrator import Migrator, DIRETORIO_SEEDS
+from api.http.assets import Assets
+
 # --------- Passo 1: Instalar bibliotecas ---------
-def install_packages():
+# Servidor ASGI (asgi.py): Quart, aiomysql e um servidor ASGI (hypercorn)
+PACOTES_ASYNC = ["quart", "aiomysql", "hypercorn"]
+
+def install_packages(async_stack=False):
     packages = ["flask", "mysql-connector-python", "bcrypt", "pyjwt", "flask-cors"]
+    if async_stack:
+        packages += PACOTES_ASYNC
     for pkg in packages:
         subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
 
-# --------- Passo 2: Criar banco de dados a partir do arquivo SQL ---------
-def setup_database(host="127.0.0.1", user="root", password="", database="gestao_rh", port=3306, sql_file="./docs/Banco.sql"):
+# --------- Passo 2: Criar banco de dados e aplicar as migrações ---------
+def setup_database(host="127.0.0.1", user="root", password="", database="projeto", port=3306, seed=True):
+    """
+    Cria o banco (se não existir) e aplica as migrações versionadas de
+    api/database/migrations; rodar de novo aplica só as pendentes.
+    Com seed=True carrega os dados de exemplo se a tabela de usuários estiver vazia.
+    """
     try:
-        # Conecta ao MySQL (sem especificar database ainda)
-        cnx = mysql.connector.connect(host=host, user=user, password=password, port=port)
-        cursor = cnx.cursor()
-
-        # Executa o SQL do arquivo
-        with open(sql_file, 'r', encoding='utf-8') as f:
-            sql_script = f.read()
+        db = MysqlDatabase(host=host, user=user, password=password, database=database, port=port,
+                           pool_size=1, pool_max_overflow=0, pool_min_idle=0)
+        migrator = Migrator(db)
+        aplicadas = migrator.migrar()
+        print(f"Migrações aplicadas: {', '.join(aplicadas) or 'nenhuma (banco já atualizado)'}")
 
-        # Separar comandos individuais por ';'
-        commands = sql_script.split(';')
+        if seed and not db.execute_query("SELECT 1 FROM usuarios LIMIT 1", fetch=True):
+            migrator.executar_arquivo(f"{DIRETORIO_SEEDS}/dados_exemplo.sql")
+            print("Dados de exemplo carregados")
 
-        for command in commands:
-            command = command.strip()
-            if command:
-                cursor.execute(command)
-
-        cnx.commit()
-        print(f"Script SQL '{sql_file}' executado com sucesso!")
+        db.close_pool()
 
     except mysql.connector.Error as err:
         if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
             print("Erro: Usuário ou senha incorretos")
         else:
             print(err)
-    finally:
-        cursor.close()
-        cnx.close()
+
+# --------- Passo 3: Gerar os assets do front-end ---------
+def build_assets():
+    """Gera static/dist (nomes com hash e variantes .gz/.br), servido em /assets."""
+    for nome, com_hash in Assets.construir().items():
+        print(f"  {nome} -> {com_hash}")
 
 # --------- Execução ---------
 if __name__ == "__main__":
-    print("Instalando pacotes...")
-    install_packages()
+    parser = argparse.ArgumentParser(description="Instalador do projeto")
+    parser.add_argument("--skip-packages", action="store_true", help="não roda o pip install")
+    parser.add_argument("--no-seed", dest="seed", action="store_false", help="não carrega dados de exemplo")
+    parser.add_argument("--async", dest="async_stack", action="store_true",
+                        help="instala também o necessário para o servidor ASGI (asgi.py)")
+    args = parser.parse_args()
+
+    if not args.skip_packages:
+        print("Instalando pacotes...")
+        install_packages(args.async_stack)
     print("Configurando banco de dados...")
-    setup_database(password="")  # coloque sua senha do MySQL aqui
+    setup_database(password="", seed=args.seed)  # coloque sua senha do MySQL aqui
+    print("Gerando assets do front-end...")
+    build_assets()
@@ -1,15 +1,28 @@
 # -*- coding: utf-8 -*-
-from flask import Flask
+import logging
+from flask import Flask, request
 from flask_cors import CORS
+import argparse
+import math
 import sys
 import os
+import time
 from datetime import datetime
 
 # Adiciona o diretório raiz ao path para imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from api.database.mysql_database import MysqlDatabase, create_database_instance
+from api.database.migrator import Migrator
 from api.http.meu_token_jwt import MeuTokenJWT
+from api.http.token_cache import TokenCache
+from api.http.compressao import Compressao
+from api.http.assets import Assets
+from api.http.json_provider import JsonRapido
+from api.utils.password_hasher import PasswordHasher
+from api.utils.cache import criar_cache
+from api.utils.prefork_server import PreforkServer
+from api.utils.log_config import configurar_logging
 from api.middleware.jwt_middleware import JwtMiddleware
 from api.middleware.usuario_middleware import UsuarioMiddleware
 from api.middleware.projeto_middleware import ProjetoMiddleware
@@ -22,25 +35,41 @@ from api.dao.tarefa_dao import TarefaDAO
 from api.service.usuario_service import UsuarioService
 from api.service.projeto_service import ProjetoService
 from api.service.tarefa_service import TarefaService
+from api.service.dashboard_service import DashboardService
 
 from api.control.usuario_control import UsuarioControl
 from api.control.projeto_control import ProjetoControl
 from api.control.tarefa_control import TarefaControl
+from api.control.dashboard_control import DashboardControl
 
 from api.router.usuario_roteador import UsuarioRoteador
 from api.router.projeto_roteador import ProjetoRoteador
 from api.router.tarefa_roteador import TarefaRoteador
+from api.router.dashboard_roteador import DashboardRoteador
+
+logger = logging.getLogger(__name__)
 
 
 class Server:
     """
     Classe principal do servidor Flask.
+
+    Com workers=None, run() usa o servidor de desenvolvimento do Flask.
+    Com workers >= 1, run() sobe o modo de produção (PreforkServer):
+    processos pré-criados, cada um com `threads` threads e o seu próprio
+    pool MySQL. MYSQL_POOL_SIZE passa a ser o total de conexões da
+    instância, dividido entre os workers.
     """
     
-    def __init__(self, porta=5000, host='0.0.0.0', debug=True):
+    def __init__(self, porta=5000, host='0.0.0.0', debug=True, workers=None, threads=4,
+                 preload=True, graceful_timeout=30.0):
         self.porta = porta
         self.host = host
         self.debug = debug
+        self.workers = workers
+        self.threads = threads
+        self.preload = preload
+        self.graceful_timeout = graceful_timeout
         self.app = None
         self.database = None
         self.dependencies = {}
@@ -49,11 +78,15 @@ class Server:
         """
         Inicializa todas as dependências do servidor.
         """
-        print("🔄 Inicializando servidor...")
+        # Rastreio de chamadas só no servidor de desenvolvimento (LOG_TRACE sobrescreve)
+        configurar_logging(trace=self.debug)
+        logger.info("Inicializando servidor...")
 
         # 1. Criar aplicação Flask
         self.app = Flask(__name__)
         self.app.config['SECRET_KEY'] = 'chave_secreta_projeto_mvcs'
+        # JSON das respostas: orjson se instalado (JSON_PROVIDER=json força a biblioteca padrão)
+        self.app.json = JsonRapido(self.app, os.getenv('JSON_PROVIDER', 'orjson') == 'orjson')
 
         # 2. ✅ CORREÇÃO CORS - CONFIGURAÇÃO COMPLETA E FUNCIONAL
         CORS(self.app, 
@@ -65,12 +98,40 @@ class Server:
         # 3. ✅ ADICIONAR headers CORS manualmente para garantir
         @self.app.after_request
         def after_request(response):
+            # Read-your-writes: depois de uma escrita, as leituras do mesmo
+            # cliente continuam no primário até o prazo gravado no cookie
+            if self.database and self.database.has_replicas():
+                sticky_until = self.database.sticky_until()
+                if sticky_until > time.time():
+                    response.set_cookie(
+                        'db_sticky_until',
+                        str(sticky_until),
+                        max_age=int(sticky_until - time.time()) + 1,
+                        httponly=True,
+                        samesite='Lax'
+                    )
             response.headers.add('Access-Control-Allow-Origin', 'http://localhost')
             response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
             response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
             response.headers.add('Access-Control-Allow-Credentials', 'true')
             return response
 
+        @self.app.before_request
+        def before_request():
+            if self.database and self.database.has_replicas():
+                try:
+                    sticky_until = float(request.cookies.get('db_sticky_until', 0))
+                except ValueError:
+                    sticky_until = 0.0
+                self.database.begin_request(sticky_until)
+
+        # Compressão gzip/brotli das respostas (COMPRESSAO=0 quando um proxy já comprime)
+        if os.getenv('COMPRESSAO', '1') == '1':
+            Compressao(
+                minimo=int(os.getenv('COMPRESSAO_MIN_BYTES', '1024')),
+                nivel_gzip=int(os.getenv('COMPRESSAO_NIVEL', '6'))
+            ).registrar(self.app)
+
         # 4. ✅ Rotas OPTIONS para preflight requests
         @self.app.route('/api/usuario/login', methods=['OPTIONS'])
         def options_login():
@@ -88,6 +149,14 @@ class Server:
         def options_tarefas():
             return '', 200
 
+        @self.app.route('/api/tarefa/batch', methods=['OPTIONS'])
+        def options_tarefas_batch():
+            return '', 200
+
+        @self.app.route('/api/dashboard/resumo', methods=['OPTIONS'])
+        def options_dashboard_resumo():
+            return '', 200
+
         # 5. Inicializar banco de dados
         self._init_database()
 
@@ -100,45 +169,75 @@ class Server:
         # 8. Configurar error handlers
         self._configure_error_handlers()
 
-        print("✅ Servidor inicializado com sucesso!")
+        logger.info("Servidor inicializado com sucesso!")
 
     def _init_database(self):
         """Inicializa e testa a conexão com o banco de dados."""
-        print("🗄️  Inicializando banco de dados...")
+        logger.info("Inicializando banco de dados...")
         try:
             self.database = create_database_instance()
+            if self.workers:
+                # Cada worker tem o seu pool: divide o total entre eles
+                self.database.pool_size = max(1, math.ceil(self.database.pool_size / self.workers))
             
             if self.database.test_connection():
-                print("✅ Conexão com banco de dados estabelecida")
+                logger.info("Conexão com banco de dados estabelecida")
+                # DB_AUTO_MIGRATE=1: aplica as migrações pendentes ao subir
+                if os.getenv('DB_AUTO_MIGRATE', '0') == '1':
+                    aplicadas = Migrator(self.database).migrar()
+                    logger.info("Migrações aplicadas: %s", ", ".join(aplicadas) or "nenhuma")
             else:
                 raise Exception("Falha ao conectar com o banco de dados")
                 
         except Exception as e:
-            print(f"❌ Erro ao inicializar banco de dados: {e}")
-            print("💡 Soluções possíveis:")
-            print("   - Inicie o MySQL no XAMPP")
-            print("   - Verifique se a senha está correta")
-            print("   - Crie o banco 'projeto' manualmente se necessário")
+            logger.error(
+                "Erro ao inicializar banco de dados: %s. Inicie o MySQL no XAMPP, "
+                "verifique a senha ou crie o banco 'projeto' manualmente", e
+            )
             raise
 
     def _configure_dependencies(self):
         """Configura todas as dependências do sistema."""
-        print("🔗 Configurando dependências...")
+        logger.info("Configurando dependências...")
         
         try:
             # JWT
             jwt_instance = MeuTokenJWT()
-            jwt_middleware = JwtMiddleware(jwt_instance)
+            token_cache = TokenCache(
+                max_entries=int(os.getenv('JWT_CACHE_SIZE', '1024')),
+                ttl=int(os.getenv('JWT_CACHE_TTL', '300'))
+            )
+            jwt_middleware = JwtMiddleware(jwt_instance, token_cache)
             
             # DAOs
             usuario_dao = UsuarioDAO(self.database)
             projeto_dao = ProjetoDAO(self.database)
             tarefa_dao = TarefaDAO(self.database)
             
+            # Hash de senha (bcrypt) em pool dedicado
+            password_hasher = PasswordHasher(
+                max_workers=int(os.getenv('BCRYPT_WORKERS', '2')),
+                max_queue=int(os.getenv('BCRYPT_MAX_QUEUE', '16')),
+                rounds=int(os.getenv('BCRYPT_ROUNDS', '12'))
+            )
+
+            # FK_CHECK_MODE=exists: SELECT 1 antes do INSERT (padrão)
+            # FK_CHECK_MODE=constraint: só o INSERT, erro de FK vira 400
+            verificar_fk = os.getenv('FK_CHECK_MODE', 'exists') != 'constraint'
+
+            # DASHBOARD_CONTADORES=1: resumo lido de contadores_tarefas (migração 0003)
+            usar_contadores = os.getenv('DASHBOARD_CONTADORES', '0') == '1'
+
+            # Cache de leituras (CACHE_BACKEND). Com vários workers um cache em
+            # memória não veria as invalidações dos outros processos: sem
+            # CACHE_BACKEND explícito (ex.: redis) o cache fica desligado
+            cache = criar_cache('nenhum' if self.workers and self.workers > 1 else 'memoria')
+
             # Services
-            usuario_service = UsuarioService(usuario_dao)
-            projeto_service = ProjetoService(projeto_dao, usuario_dao)
-            tarefa_service = TarefaService(tarefa_dao, projeto_dao)
+            usuario_service = UsuarioService(usuario_dao, password_hasher, cache)
+            projeto_service = ProjetoService(projeto_dao, usuario_dao, verificar_fk, self.database, cache)
+            tarefa_service = TarefaService(tarefa_dao, projeto_dao, verificar_fk, self.database, cache)
+            dashboard_service = DashboardService(tarefa_dao, projeto_dao, usuario_dao, usar_contadores)
             
             # Middlewares
             usuario_middleware = UsuarioMiddleware()
@@ -149,29 +248,35 @@ class Server:
             usuario_control = UsuarioControl(usuario_service)
             projeto_control = ProjetoControl(projeto_service)
             tarefa_control = TarefaControl(tarefa_service)
+            dashboard_control = DashboardControl(dashboard_service)
             
             # Roteadores
             usuario_roteador = UsuarioRoteador(jwt_middleware, usuario_middleware, usuario_control)
             projeto_roteador = ProjetoRoteador(jwt_middleware, projeto_middleware, projeto_control)
             tarefa_roteador = TarefaRoteador(jwt_middleware, tarefa_middleware, tarefa_control)
+            dashboard_roteador = DashboardRoteador(jwt_middleware, dashboard_control)
             
             # Salvar dependências
             self.dependencies = {
                 'jwt_middleware': jwt_middleware,
+                'password_hasher': password_hasher,
+                'cache': cache,
                 'usuario_roteador': usuario_roteador,
                 'projeto_roteador': projeto_roteador,
-                'tarefa_roteador': tarefa_roteador
+                'tarefa_roteador': tarefa_roteador,
+                'dashboard_roteador': dashboard_roteador,
+                'assets': Assets()
             }
             
-            print("✅ Dependências configuradas com sucesso")
+            logger.info("Dependências configuradas com sucesso")
             
         except Exception as e:
-            print(f"❌ Erro ao configurar dependências: {e}")
+            logger.error("Erro ao configurar dependências: %s", e)
             raise
 
     def _register_routes(self):
         """Registra todos os blueprints (rotas) na aplicação Flask."""
-        print("🛣️  Registrando rotas...")
+        logger.info("Registrando rotas...")
         
         try:
             self.app.register_blueprint(
@@ -186,6 +291,15 @@ class Server:
                 self.dependencies['tarefa_roteador'].create_routes(),
                 url_prefix='/api/tarefa'
             )
+            self.app.register_blueprint(
+                self.dependencies['dashboard_roteador'].create_routes(),
+                url_prefix='/api/dashboard'
+            )
+            # Front-end gerado por "python -m api.http.assets" (hash no nome, .gz/.br)
+            self.app.register_blueprint(
+                self.dependencies['assets'].create_routes(),
+                url_prefix='/assets'
+            )
             
             # Rota de health check
             @self.app.route('/api/health')
@@ -193,7 +307,11 @@ class Server:
                 return {
                     "status": "healthy",
                     "message": "Servidor funcionando corretamente",
-                    "timestamp": datetime.now().isoformat() + "Z"
+                    "timestamp": datetime.now().isoformat() + "Z",
+                    "jwt_cache": self.dependencies['jwt_middleware'].get_cache_stats(),
+                    "password_hasher": self.dependencies['password_hasher'].stats(),
+                    "cache": self.dependencies['cache'].stats(),
+                    "database_pool": self.database.get_pool_status()
                 }
             
             # Rota raiz
@@ -206,14 +324,16 @@ class Server:
                         "usuario": "/api/usuario",
                         "projeto": "/api/projeto",
                         "tarefa": "/api/tarefa",
-                        "health": "/api/health"
+                        "dashboard": "/api/dashboard/resumo",
+                        "health": "/api/health",
+                        "front-end": "/assets/Login.html"
                     }
                 }
             
-            print("✅ Rotas registradas com sucesso")
+            logger.info("Rotas registradas com sucesso")
             
         except Exception as e:
-            print(f"❌ Erro ao registrar rotas: {e}")
+            logger.error("Erro ao registrar rotas: %s", e)
             raise
 
     def _configure_error_handlers(self):
@@ -243,16 +363,17 @@ class Server:
         """
         Inicia o servidor Flask.
         """
+        if self.workers:
+            self._run_prefork()
+            return
+
         if not self.app:
             raise Exception("Servidor não inicializado. Chame init() primeiro.")
         
-        print(f"🌐 Servidor iniciado em http://{self.host}:{self.porta}")
-        print("📋 Endpoints disponíveis:")
-        print("   👥 /api/usuario/*")
-        print("   📁 /api/projeto/*")
-        print("   ✅ /api/tarefa/*")
-        print("   ❤️  /api/health")
-        print("\n⏹️  Pressione CTRL+C para parar o servidor")
+        logger.info(
+            "Servidor iniciado em http://%s:%s (endpoints: /api/usuario, /api/projeto, "
+            "/api/tarefa, /api/dashboard, /api/health) - CTRL+C para parar", self.host, self.porta
+        )
         
         self.app.run(
             host=self.host,
@@ -261,12 +382,47 @@ class Server:
             use_reloader=False
         )
 
+    def _run_prefork(self):
+        """
+        Modo de produção: PreforkServer com a app montada por init().
+
+        O pool MySQL aberto no mestre (teste de conexão do init) é fechado
+        antes do fork; cada worker abre o seu na primeira requisição.
+        SIGHUP recarrega os workers sem derrubar conexões.
+        """
+        self.debug = False
+        configurar_logging(trace=False)
+
+        def criar_app():
+            self.init()
+            self.app.debug = False
+            return self.app
+
+        PreforkServer(
+            criar_app,
+            host=self.host,
+            porta=self.porta,
+            workers=self.workers,
+            threads=self.threads,
+            preload=self.preload,
+            graceful_timeout=self.graceful_timeout,
+            antes_do_fork=self._close_database_pool,
+            ao_encerrar_worker=self.shutdown
+        ).run()
+
+    def _close_database_pool(self):
+        """Fecha o pool MySQL deste processo (reaberto sob demanda)."""
+        if self.database:
+            self.database.close_pool()
+
     def shutdown(self):
         """Desliga o servidor gracefulmente."""
-        print("🔒 Encerrando servidor...")
+        logger.info("Encerrando servidor...")
+        if 'password_hasher' in self.dependencies:
+            self.dependencies['password_hasher'].shutdown()
         if self.database:
             self.database.close_pool()
-        print("✅ Servidor encerrado")
+        logger.info("Servidor encerrado")
 
 
 def create_app():
@@ -276,7 +432,37 @@ def create_app():
     return server.app
 
 
+def parse_args(argv=None):
+    """
+    Argumentos de linha de comando do servidor.
+
+    Sem --workers sobe o servidor de desenvolvimento (debug), como antes.
+    """
+    parser = argparse.ArgumentParser(description="Servidor da API de projetos e tarefas")
+    parser.add_argument('--host', default=os.getenv('SERVER_HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('SERVER_PORT', '5000')))
+    parser.add_argument('--workers', type=int, default=int(os.getenv('SERVER_WORKERS', '0')),
+                        help="processos de produção (0 = servidor de desenvolvimento)")
+    parser.add_argument('--threads', type=int, default=int(os.getenv('SERVER_THREADS', '4')),
+                        help="threads por worker")
+    parser.add_argument('--no-preload', dest='preload', action='store_false',
+                        help="monta a app em cada worker em vez de no mestre")
+    parser.add_argument('--graceful-timeout', type=float,
+                        default=float(os.getenv('SERVER_GRACEFUL_TIMEOUT', '30')),
+                        help="segundos para um worker terminar as requisições ao parar")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    server = Server()
-    server.init()
+    args = parse_args()
+    server = Server(
+        porta=args.port,
+        host=args.host,
+        workers=args.workers or None,
+        threads=args.threads,
+        preload=args.preload,
+        graceful_timeout=args.graceful_timeout
+    )
+    if not server.workers:
+        server.init()
     server.run()
\ No newline at end of file
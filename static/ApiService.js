@@ -120,6 +120,38 @@ export default class ApiService {
         }
     }
 
+    /**
+     * GET de uma listagem paginada, seguindo next_cursor (ou next_offset, com sort)
+     * até a última página. Devolve o mesmo envelope de get(), com todos os itens.
+     * @param {string} uri - URL da listagem (pode ter query string).
+     * @param {string} chave - Nome da lista em data (ex.: "tarefas").
+     * @param {number} limit - Tamanho de cada página (máximo do servidor: 200).
+     * @returns {Promise<Object>} {success, data: {[chave]: [...]}} ou o erro da página que falhou.
+     */
+    async getTodasPaginas(uri, chave, limit = 200) {
+        const separador = uri.includes('?') ? '&' : '?';
+        const itens = [];
+        let continuacao = "";
+
+        while (true) {
+            const resposta = await this.get(`${uri}${separador}limit=${limit}${continuacao}`);
+            if (!resposta || resposta.success === false) {
+                return resposta;
+            }
+
+            const dados = resposta.data || {};
+            itens.push(...(dados[chave] || []));
+
+            if (dados.next_cursor != null) {
+                continuacao = `&after_id=${encodeURIComponent(dados.next_cursor)}`;
+            } else if (dados.next_offset != null) {
+                continuacao = `&offset=${encodeURIComponent(dados.next_offset)}`;
+            } else {
+                return { success: true, message: resposta.message, data: { [chave]: itens } };
+            }
+        }
+    }
+
     /**
      * Método para buscar um recurso específico pelo ID via GET.
      * Monta a URL com o ID no final e faz a requisição.
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Backends do cache de leituras (MemoriaCache, MemoriaCompartilhadaCache,
+CacheEmCamadas) e CacheLeituras: expulsão LRU, TTL, troca de geração e
+métricas.
+
+    python -m pytest -q tests/test_cache.py
+"""
+import os
+import sys
+import unittest
+import uuid
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.utils import cache
+from api.utils.cache import CacheEmCamadas, CacheLeituras, MemoriaCache, MemoriaCompartilhadaCache
+
+
+class RelogioFalso:
+    """Substitui o módulo time dentro de api.utils.cache."""
+    def __init__(self):
+        self.agora = 1000.0
+
+    def monotonic(self) -> float:
+        return self.agora
+
+
+class TestCacheComRelogio(unittest.TestCase):
+    def setUp(self):
+        self.relogio = RelogioFalso()
+        patcher = mock.patch.object(cache, "time", self.relogio)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestMemoriaCache(TestCacheComRelogio):
+    def test_expulsa_a_menos_usada_ao_passar_de_max_entries(self):
+        memoria = MemoriaCache(max_entries=2, ttl=60)
+        memoria.set("a", 1)
+        memoria.set("b", 2)
+        memoria.get("a")  # "b" passa a ser a menos usada
+        memoria.set("c", 3)
+
+        self.assertEqual((memoria.get("a"), memoria.get("b"), memoria.get("c")), (1, None, 3))
+        self.assertEqual(memoria.stats()["evictions"], 1)
+        self.assertEqual(memoria.stats()["size"], 2)
+
+    def test_entrada_expira_no_ttl(self):
+        memoria = MemoriaCache(ttl=60)
+        memoria.set("padrao", 1)
+        memoria.set("curta", 2, ttl=5)
+
+        self.relogio.agora += 5
+        self.assertIsNone(memoria.get("curta"))
+        self.assertEqual(memoria.get("padrao"), 1)
+
+        self.relogio.agora += 55
+        self.assertIsNone(memoria.get("padrao"))
+        self.assertEqual(memoria.stats()["size"], 0)
+
+    def test_add_so_grava_chave_ausente_ou_expirada(self):
+        memoria = MemoriaCache(ttl=60)
+        self.assertTrue(memoria.add("chave", 1, ttl=5))
+        self.assertFalse(memoria.add("chave", 2))
+        self.relogio.agora += 5
+        self.assertTrue(memoria.add("chave", 3))
+        self.assertEqual(memoria.get("chave"), 3)
+
+
+class TestMemoriaCompartilhadaCache(TestCacheComRelogio):
+    def test_instancias_do_mesmo_namespace_enxergam_os_mesmos_dados(self):
+        namespace = uuid.uuid4().hex
+        primeiro = MemoriaCompartilhadaCache(namespace, ttl=60)
+        segundo = MemoriaCompartilhadaCache(namespace, ttl=60)
+        outro = MemoriaCompartilhadaCache(uuid.uuid4().hex, ttl=60)
+
+        primeiro.set("projeto", {"nome": "Alfa"})
+        self.assertEqual(segundo.get("projeto"), {"nome": "Alfa"})
+        self.assertIsNone(outro.get("projeto"))
+
+        segundo.delete("projeto")
+        self.assertIsNone(primeiro.get("projeto"))
+
+    def test_valores_sao_copias_serializadas(self):
+        compartilhado = MemoriaCompartilhadaCache(uuid.uuid4().hex, ttl=60)
+        valor = {"nome": "Alfa"}
+        compartilhado.set("projeto", valor)
+        valor["nome"] = "alterado depois"
+
+        lido = compartilhado.get("projeto")
+        self.assertEqual(lido, {"nome": "Alfa"})
+        self.assertIsNot(lido, compartilhado.get("projeto"))
+
+    def test_entrada_expira_no_ttl(self):
+        compartilhado = MemoriaCompartilhadaCache(uuid.uuid4().hex, ttl=60)
+        compartilhado.set("projeto", 1)
+        self.relogio.agora += 60
+        self.assertIsNone(compartilhado.get("projeto"))
+
+
+class TestCacheEmCamadas(TestCacheComRelogio):
+    def test_le_do_compartilhado_e_guarda_copia_local_curta(self):
+        namespace = uuid.uuid4().hex
+        camadas = CacheEmCamadas(MemoriaCache(ttl=60), MemoriaCompartilhadaCache(namespace, ttl=60), ttl_local=2)
+        MemoriaCompartilhadaCache(namespace).set("projeto", "v1")
+
+        self.assertEqual(camadas.get("projeto"), "v1")
+        # Outro processo troca o valor: a cópia local vale até ttl_local
+        MemoriaCompartilhadaCache(namespace).set("projeto", "v2")
+        self.assertEqual(camadas.get("projeto"), "v1")
+        self.relogio.agora += 2
+        self.assertEqual(camadas.get("projeto"), "v2")
+
+    def test_delete_apaga_as_duas_camadas(self):
+        namespace = uuid.uuid4().hex
+        camadas = CacheEmCamadas(MemoriaCache(ttl=60), MemoriaCompartilhadaCache(namespace, ttl=60), ttl_local=2)
+        camadas.set("projeto", "v1")
+        camadas.delete("projeto")
+        self.assertIsNone(camadas.get("projeto"))
+        self.assertIsNone(MemoriaCompartilhadaCache(namespace).get("projeto"))
+
+
+class TestCacheLeituras(unittest.TestCase):
+    def setUp(self):
+        self.cache = CacheLeituras(MemoriaCache(ttl=60))
+        self.leituras = []
+
+    def __obter(self, tipo: str, chave):
+        def carregar():
+            self.leituras.append((tipo, chave))
+            return {"tipo": tipo, "id": chave, "leitura": len(self.leituras)}
+        return self.cache.obter(tipo, chave, carregar)
+
+    def test_segunda_leitura_vem_do_cache(self):
+        self.assertEqual(self.__obter("projeto", 1), self.__obter("projeto", 1))
+        self.assertEqual(self.leituras, [("projeto", 1)])
+
+    def test_resultado_none_nao_e_guardado(self):
+        self.cache.obter("projeto", 9, lambda: None)
+        self.assertEqual(self.cache.obter("projeto", 9, lambda: "carregado"), "carregado")
+
+    def test_invalidar_remove_so_a_entidade(self):
+        self.__obter("projeto", 1)
+        self.__obter("projeto", 2)
+        self.cache.invalidar("projeto", 1)
+        self.__obter("projeto", 1)
+        self.__obter("projeto", 2)
+        self.assertEqual(self.leituras, [("projeto", 1), ("projeto", 2), ("projeto", 1)])
+
+    def test_troca_de_geracao_invalida_todas_as_entradas(self):
+        for tipo, chave in (("projeto", 1), ("tarefa", 5), ("projetos", "filtros")):
+            self.__obter(tipo, chave)
+        self.cache.invalidar_tudo()
+        for tipo, chave in (("projeto", 1), ("tarefa", 5), ("projetos", "filtros")):
+            self.__obter(tipo, chave)
+        self.assertEqual(len(self.leituras), 6)
+
+    def test_geracao_compartilhada_entre_processos(self):
+        namespace = uuid.uuid4().hex
+        leitor = CacheLeituras(MemoriaCompartilhadaCache(namespace, ttl=60))
+        escritor = CacheLeituras(MemoriaCompartilhadaCache(namespace, ttl=60))
+        leitor.obter("projeto", 1, lambda: "v1")
+
+        escritor.invalidar_tudo()
+        self.assertEqual(leitor.obter("projeto", 1, lambda: "v2"), "v2")
+
+    def test_metricas_por_tipo(self):
+        self.__obter("projeto", 1)
+        self.__obter("projeto", 1)
+        self.__obter("projeto", 1)
+        self.__obter("tarefa", 5)
+        self.cache.invalidar("projeto", 1, 2)
+        self.cache.invalidar_tudo()
+
+        stats = self.cache.stats()
+        self.assertTrue(stats["enabled"])
+        self.assertEqual(stats["por_tipo"]["projeto"], {"hits": 2, "misses": 1, "invalidations": 2})
+        self.assertEqual(stats["por_tipo"]["tarefa"], {"hits": 0, "misses": 1, "invalidations": 0})
+        self.assertEqual(stats["por_tipo"]["geracao"]["invalidations"], 1)
+        self.assertEqual(stats["backend"]["backend"], "memoria")
+
+    def test_sem_backend_so_repassa(self):
+        sem_cache = CacheLeituras(None)
+        self.assertFalse(sem_cache.ativo())
+        self.assertEqual(sem_cache.obter("projeto", 1, lambda: "lido"), "lido")
+        self.assertEqual(sem_cache.obter("projeto", 1, lambda: "de novo"), "de novo")
+        self.assertEqual(sem_cache.stats(), {"enabled": False})
+
+
+if __name__ == "__main__":
+    unittest.main()
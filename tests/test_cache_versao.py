@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+CacheLeituras.obter com versão: dois "workers", cada um com a sua camada
+local na frente do mesmo cache compartilhado (como CACHE_BACKEND=redis).
+
+    python -m pytest -q tests/test_cache_versao.py
+"""
+import os
+import sys
+import unittest
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.utils.cache import CacheEmCamadas, CacheLeituras, MemoriaCache, MemoriaCompartilhadaCache
+
+
+class TestCacheVersao(unittest.TestCase):
+    def setUp(self):
+        namespace = uuid.uuid4().hex
+        self.banco = {"nome": "Antigo", "versao": 1}
+        self.workers = [
+            CacheLeituras(CacheEmCamadas(MemoriaCache(ttl=60), MemoriaCompartilhadaCache(namespace), ttl_local=60))
+            for _ in range(2)
+        ]
+
+    def __ler(self, worker: CacheLeituras, versao=None) -> str:
+        return worker.obter("projeto", 1, lambda: dict(self.banco), versao)["nome"]
+
+    def __escrever(self, worker: CacheLeituras, nome: str):
+        self.banco = {"nome": nome, "versao": self.banco["versao"] + 1}
+        worker.invalidar("projeto", 1)
+
+    def test_copia_local_de_outra_versao_nao_e_servida(self):
+        leitor, escritor = self.workers
+        self.assertEqual(self.__ler(leitor, [1]), "Antigo")
+
+        self.__escrever(escritor, "Novo")
+
+        self.assertEqual(self.__ler(leitor, [self.banco["versao"]]), "Novo")
+
+    def test_mesma_versao_vem_do_cache(self):
+        leitor = self.workers[0]
+        self.__ler(leitor, [1])
+        self.banco = {"nome": "Alterado sem invalidar", "versao": 1}
+        self.assertEqual(self.__ler(leitor, [1]), "Antigo")
+
+    def test_sem_versao_continua_dependendo_da_invalidacao(self):
+        leitor, escritor = self.workers
+        self.__ler(leitor)
+        self.__escrever(escritor, "Novo")
+        # Camada local do leitor ainda não soube da invalidação
+        self.assertEqual(self.__ler(leitor), "Antigo")
+
+
+if __name__ == "__main__":
+    unittest.main()
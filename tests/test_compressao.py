@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Compressao e requisições condicionais: a 304 anuncia o mesmo Vary e a
+mesma ETag que a 200 correspondente (RFC 9110).
+
+    python -m pytest -q tests/test_compressao.py
+"""
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify
+from api.http.compressao import Compressao
+from api.http.versao_recurso import VersaoRecurso
+
+
+class TestCompressaoCondicional(unittest.TestCase):
+    def setUp(self):
+        app = Flask(__name__)
+        Compressao(minimo=1024).registrar(app)
+
+        @app.route("/recurso/<int:tamanho>")
+        def recurso(tamanho):
+            versao = VersaoRecurso([datetime(2026, 1, 1)])
+            if versao.atual_no_cliente():
+                return versao.nao_modificado()
+            return versao.aplicar(jsonify({"data": "x" * tamanho}))
+
+        self.client = app.test_client()
+
+    def __par(self, tamanho: int, encoding: str):
+        headers = {"Accept-Encoding": encoding} if encoding else {}
+        completa = self.client.get(f"/recurso/{tamanho}", headers=headers)
+        nao_modificada = self.client.get(
+            f"/recurso/{tamanho}", headers={**headers, "If-None-Match": completa.headers["ETag"]})
+        return completa, nao_modificada
+
+    def test_304_repete_vary_e_etag_da_200_comprimida(self):
+        completa, nao_modificada = self.__par(5000, "gzip")
+        self.assertEqual(completa.headers["Content-Encoding"], "gzip")
+        self.assertTrue(completa.headers["ETag"].startswith('W/"'))
+
+        self.assertEqual(nao_modificada.status_code, 304)
+        self.assertEqual(nao_modificada.headers["ETag"], completa.headers["ETag"])
+        self.assertIn("Accept-Encoding", nao_modificada.headers["Vary"])
+        self.assertEqual(nao_modificada.data, b"")
+
+    def test_corpo_pequeno_tem_a_mesma_etag_na_200_e_na_304(self):
+        completa, nao_modificada = self.__par(10, "gzip")
+        self.assertNotIn("Content-Encoding", completa.headers)
+        self.assertEqual(nao_modificada.status_code, 304)
+        self.assertEqual(nao_modificada.headers["ETag"], completa.headers["ETag"])
+        self.assertEqual(nao_modificada.headers["Vary"], completa.headers["Vary"])
+
+    def test_sem_accept_encoding_a_etag_continua_forte(self):
+        completa, nao_modificada = self.__par(5000, None)
+        self.assertNotIn("Content-Encoding", completa.headers)
+        self.assertFalse(completa.headers["ETag"].startswith("W/"))
+        self.assertEqual(nao_modificada.status_code, 304)
+        self.assertEqual(nao_modificada.headers["ETag"], completa.headers["ETag"])
+        self.assertIn("Accept-Encoding", nao_modificada.headers["Vary"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+ConnectionPool com conexões falsas (sem MySQL): fila de espera, timeout,
+overflow e devolução; pre-ping, max_lifetime e a manutenção (min_idle,
+max_idle), com um relógio controlado pelo teste.
+
+    python -m pytest -q tests/test_connection_pool.py
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mysql.connector
+from api.database import connection_pool
+from api.database.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+class ConexaoFalsa:
+    def __init__(self, numero: int):
+        self.numero = numero
+        self.fechada = False
+        self.morta = False
+        self.in_transaction = False
+
+    def ping(self, *args, **kwargs):
+        if self.morta:
+            raise mysql.connector.errors.InterfaceError("MySQL server has gone away")
+
+    def rollback(self):
+        pass
+
+    def reset_session(self):
+        pass
+
+    def close(self):
+        self.fechada = True
+
+
+class RelogioFalso:
+    """Substitui o módulo time dentro de connection_pool."""
+    def __init__(self):
+        self.agora = 1000.0
+
+    def monotonic(self) -> float:
+        return self.agora
+
+    def perf_counter(self) -> float:
+        return self.agora
+
+
+class PoolComConexoesFalsas(unittest.TestCase):
+    def criar_pool(self, **kwargs) -> ConnectionPool:
+        self.conexoes = []
+
+        def criar_conexao():
+            conexao = ConexaoFalsa(len(self.conexoes) + 1)
+            self.conexoes.append(conexao)
+            return conexao
+
+        kwargs.setdefault("reaper_interval", 0)
+        pool = ConnectionPool(criar_conexao, **kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    def esperar(self, condicao, limite: float = 2.0):
+        fim = time.monotonic() + limite
+        while not condicao():
+            if time.monotonic() > fim:
+                self.fail("condição não atingida a tempo")
+            time.sleep(0.001)
+
+
+class TestConnectionPool(PoolComConexoesFalsas):
+    def test_conexao_devolvida_vai_para_o_primeiro_da_fila(self):
+        pool = self.criar_pool(pool_size=1, max_overflow=0, timeout=2.0)
+        ocupada = pool.get_connection()
+        recebidas = []
+
+        def pedir(nome):
+            conexao = pool.get_connection()
+            recebidas.append((nome, conexao.numero))
+            liberar[nome].wait(2.0)
+            conexao.close()
+
+        liberar = {"primeiro": threading.Event(), "segundo": threading.Event()}
+        threads = []
+        for nome in ("primeiro", "segundo"):
+            thread = threading.Thread(target=pedir, args=(nome,))
+            thread.start()
+            threads.append(thread)
+            self.esperar(lambda: pool.stats()["waiters"] == len(threads))
+
+        ocupada.close()
+        self.esperar(lambda: len(recebidas) == 1)
+        self.assertEqual(recebidas, [("primeiro", 1)])
+        self.assertEqual(pool.stats()["waiters"], 1)
+
+        liberar["primeiro"].set()
+        self.esperar(lambda: len(recebidas) == 2)
+        liberar["segundo"].set()
+        for thread in threads:
+            thread.join(2.0)
+
+        self.assertEqual(recebidas, [("primeiro", 1), ("segundo", 1)])
+        self.assertEqual(len(self.conexoes), 1)
+        self.assertEqual(pool.stats()["idle"], 1)
+
+    def test_pool_esgotado_levanta_pool_timeout_error(self):
+        pool = self.criar_pool(pool_size=1, max_overflow=0)
+        ocupada = pool.get_connection()
+        try:
+            inicio = time.monotonic()
+            with self.assertRaises(PoolTimeoutError) as contexto:
+                pool.get_connection(timeout=0.05)
+            self.assertLess(time.monotonic() - inicio, 1.0)
+        finally:
+            ocupada.close()
+
+        self.assertEqual(contexto.exception.status_code, 503)
+        stats = pool.stats()
+        self.assertEqual((stats["timeouts"], stats["waiters"]), (1, 0))
+        # A conexão devolvida volta para o pool, não para a espera que desistiu
+        self.assertEqual(stats["idle"], 1)
+
+    def test_conexao_de_overflow_e_fechada_ao_ser_devolvida(self):
+        pool = self.criar_pool(pool_size=1, max_overflow=1)
+        fixa = pool.get_connection()
+        extra = pool.get_connection()
+        self.assertEqual((pool.stats()["open"], pool.stats()["overflow_opened"]), (2, 1))
+
+        extra.close()
+        self.assertTrue(self.conexoes[1].fechada)
+        self.assertEqual((pool.stats()["open"], pool.stats()["idle"]), (1, 0))
+
+        fixa.close()
+        self.assertFalse(self.conexoes[0].fechada)
+        self.assertEqual((pool.stats()["open"], pool.stats()["idle"]), (1, 1))
+
+    def test_close_da_conexao_emprestada_devolve_uma_unica_vez(self):
+        pool = self.criar_pool(pool_size=2, max_overflow=0)
+        conexao = pool.get_connection()
+        conexao.close()
+        conexao.close()
+
+        stats = pool.stats()
+        self.assertEqual((stats["in_use"], stats["idle"], stats["open"]), (0, 1, 1))
+        with self.assertRaises(mysql.connector.errors.OperationalError):
+            conexao.ping()
+
+        # A mesma conexão real não é entregue a dois checkouts
+        primeira, segunda = pool.get_connection(), pool.get_connection()
+        self.assertNotEqual(primeira.numero, segunda.numero)
+        primeira.close()
+        segunda.close()
+
+
+class TestSaudeDoPool(PoolComConexoesFalsas):
+    def setUp(self):
+        self.relogio = RelogioFalso()
+        patcher = mock.patch.object(connection_pool, "time", self.relogio)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def manutencao(self, pool: ConnectionPool):
+        pool._ConnectionPool__manutencao()
+
+    def test_pre_ping_troca_conexao_morta_por_uma_nova(self):
+        pool = self.criar_pool(pool_size=1, max_overflow=0, pre_ping_after=10)
+        pool.get_connection().close()
+        self.conexoes[0].morta = True
+
+        # Ociosa há menos que pre_ping_after: entregue sem ping
+        conexao = pool.get_connection()
+        self.assertEqual(conexao.numero, 1)
+        conexao.close()
+
+        self.relogio.agora += 11
+        conexao = pool.get_connection()
+        self.assertEqual(conexao.numero, 2)
+        conexao.ping()
+        conexao.close()
+
+        self.assertTrue(self.conexoes[0].fechada)
+        stats = pool.stats()
+        self.assertEqual((stats["ping_failures"], stats["open"], stats["idle"]), (1, 1, 1))
+
+    def test_conexao_mais_velha_que_max_lifetime_e_reciclada_no_checkout(self):
+        pool = self.criar_pool(pool_size=1, max_overflow=0, max_lifetime=100)
+        pool.get_connection().close()
+
+        self.relogio.agora += 101
+        conexao = pool.get_connection()
+        self.assertEqual(conexao.numero, 2)
+        conexao.close()
+
+        self.assertTrue(self.conexoes[0].fechada)
+        self.assertEqual((pool.stats()["recycled"], pool.stats()["open"]), (1, 1))
+
+    def test_conexao_vencida_durante_o_uso_e_fechada_na_devolucao(self):
+        pool = self.criar_pool(pool_size=1, max_overflow=0, max_lifetime=100)
+        conexao = pool.get_connection()
+        self.relogio.agora += 101
+        conexao.close()
+
+        self.assertTrue(self.conexoes[0].fechada)
+        stats = pool.stats()
+        self.assertEqual((stats["recycled"], stats["open"], stats["idle"], stats["in_use"]), (1, 0, 0, 0))
+
+    def test_manutencao_completa_ate_min_idle(self):
+        pool = self.criar_pool(pool_size=3, max_overflow=0, min_idle=2)
+        self.assertEqual(pool.stats()["open"], 0)
+
+        self.manutencao(pool)
+        self.assertEqual((pool.stats()["open"], pool.stats()["idle"]), (2, 2))
+        self.manutencao(pool)
+        self.assertEqual(len(self.conexoes), 2)
+
+    def test_thread_de_manutencao_repoe_min_idle_sozinha(self):
+        pool = self.criar_pool(pool_size=2, max_overflow=0, min_idle=2, reaper_interval=0.01)
+        self.esperar(lambda: pool.stats()["idle"] == 2)
+
+    def test_manutencao_fecha_ociosas_demais_so_acima_de_min_idle(self):
+        pool = self.criar_pool(pool_size=3, max_overflow=0, min_idle=1, max_idle=60)
+        emprestadas = [pool.get_connection() for _ in range(3)]
+        for conexao in emprestadas:
+            conexao.close()
+
+        self.relogio.agora += 61
+        self.manutencao(pool)
+
+        self.assertEqual((pool.stats()["open"], pool.stats()["idle"]), (1, 1))
+        self.assertEqual(sum(conexao.fechada for conexao in self.conexoes), 2)
+
+    def test_manutencao_recicla_vencidas_e_repoe_min_idle(self):
+        pool = self.criar_pool(pool_size=2, max_overflow=0, min_idle=2, max_lifetime=100)
+        self.manutencao(pool)
+
+        self.relogio.agora += 101
+        self.manutencao(pool)
+
+        self.assertTrue(all(conexao.fechada for conexao in self.conexoes[:2]))
+        self.assertEqual(len(self.conexoes), 4)
+        stats = pool.stats()
+        self.assertEqual((stats["open"], stats["idle"], stats["recycled"]), (2, 2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+LogWriter com vários escritores no mesmo arquivo (workers do prefork) e
+gravação do pendente na saída por os._exit.
+
+    python -m pytest -q tests/test_log_writer.py
+"""
+import glob
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.utils.log_writer import LogWriter
+from api.utils.logger import Logger
+
+
+class TestLogWriter(unittest.TestCase):
+    def setUp(self):
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        self.caminho = os.path.join(diretorio.name, "log.log")
+
+    def __escritor(self, **kwargs) -> LogWriter:
+        escritor = LogWriter(self.caminho, fsync=False, flush_interval=0.01, **kwargs)
+        self.addCleanup(escritor.close)
+        return escritor
+
+    def __conteudo(self, caminho: str) -> str:
+        with open(caminho, encoding="utf-8") as arquivo:
+            return arquivo.read()
+
+    def test_escritor_reabre_o_arquivo_rotacionado_por_outro(self):
+        primeiro = self.__escritor(max_bytes=1000, backup_count=5)
+        segundo = self.__escritor(max_bytes=1000, backup_count=5)
+
+        segundo.write("ERROR", "antes" + "y" * 500)
+        segundo.flush()
+        primeiro.write("ERROR", "rotaciona" + "x" * 500)
+        primeiro.flush()
+        segundo.write("ERROR", "depois")
+        segundo.flush()
+
+        self.assertEqual(primeiro.stats()["rotations"], 1)
+        self.assertEqual(segundo.stats()["rotations"], 0)
+        atual = self.__conteudo(self.caminho)
+        self.assertIn("rotaciona", atual)
+        self.assertIn("depois", atual)
+        self.assertIn("antes", self.__conteudo(f"{self.caminho}.1"))
+
+    def test_nenhuma_entrada_perdida_com_rotacoes_concorrentes(self):
+        escritores = [self.__escritor(max_bytes=2000, backup_count=100) for _ in range(3)]
+        for indice in range(300):
+            escritores[indice % 3].write("ERROR", f"entrada-{indice}")
+            if indice % 10 == 0:
+                for escritor in escritores:
+                    escritor.flush()
+        for escritor in escritores:
+            escritor.flush()
+
+        texto = "".join(self.__conteudo(caminho) for caminho in glob.glob(f"{self.caminho}*")
+                        if not caminho.endswith(".lock"))
+        for indice in range(300):
+            self.assertIn(f"entrada-{indice}\n", texto)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requer os.fork")
+    def test_logger_close_grava_o_pendente_antes_do_os_exit(self):
+        anterior = Logger.LOG_FILE
+        Logger.LOG_FILE = self.caminho
+        self.addCleanup(setattr, Logger, "LOG_FILE", anterior)
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.environ["LOG_FILE_FLUSH_INTERVAL"] = "60"
+                Logger._Logger__writer = None
+                Logger.log_error("erro no worker")
+                Logger.close()
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+
+        self.assertIn("erro no worker", self.__conteudo(self.caminho))
+
+
+if __name__ == "__main__":
+    unittest.main()
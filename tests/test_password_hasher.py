@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+PasswordHasher: pool saturado responde 503 na hora, e a vaga de uma chamada
+que estourou o timeout só volta quando o bcrypt termina.
+
+O bcrypt do módulo é trocado por um falso que espera um Event, para o teste
+decidir quando o trabalho acaba.
+
+    python -m pytest -q tests/test_password_hasher.py
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.utils import password_hasher
+from api.utils.error_response import ErrorResponse
+from api.utils.password_hasher import PasswordHasher
+
+
+class BcryptFalso:
+    def __init__(self):
+        self.liberar = threading.Event()
+        self.iniciadas = 0
+        self.__lock = threading.Lock()
+
+    def gensalt(self, rounds: int = 12) -> bytes:
+        return b"salt"
+
+    def hashpw(self, senha: bytes, salt: bytes) -> bytes:
+        with self.__lock:
+            self.iniciadas += 1
+        self.liberar.wait(5.0)
+        return b"hash:" + senha
+
+    def checkpw(self, senha: bytes, senha_hash: bytes) -> bool:
+        return senha_hash == b"hash:" + senha
+
+
+class TestPasswordHasher(unittest.TestCase):
+    def setUp(self):
+        self.bcrypt = BcryptFalso()
+        patcher = mock.patch.object(password_hasher, "bcrypt", self.bcrypt)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Nunca deixa uma thread do pool presa se o teste falhar no meio
+        self.addCleanup(self.bcrypt.liberar.set)
+
+    def criar(self, **kwargs) -> PasswordHasher:
+        hasher = PasswordHasher(rounds=4, **kwargs)
+        self.addCleanup(hasher.shutdown)
+        return hasher
+
+    def esperar(self, condicao, limite: float = 2.0):
+        fim = time.monotonic() + limite
+        while not condicao():
+            if time.monotonic() > fim:
+                self.fail("condição não atingida a tempo")
+            time.sleep(0.001)
+
+    def em_thread(self, fn, *args) -> list:
+        resultado = []
+
+        def executar():
+            try:
+                resultado.append(fn(*args))
+            except ErrorResponse as e:
+                resultado.append(e)
+
+        thread = threading.Thread(target=executar)
+        thread.start()
+        self.addCleanup(thread.join, 5.0)
+        return resultado
+
+    def assert503(self, chamada):
+        with self.assertRaises(ErrorResponse) as contexto:
+            chamada()
+        self.assertEqual(contexto.exception.status_code, 503)
+        return contexto.exception
+
+    def test_pool_e_fila_cheios_respondem_503_na_hora(self):
+        hasher = self.criar(max_workers=1, max_queue=1, timeout=5.0)
+        resultados = [self.em_thread(hasher.hash_password, f"senha{i}") for i in range(2)]
+        self.esperar(lambda: hasher.stats()["in_flight"] == 2 and self.bcrypt.iniciadas == 1)
+
+        inicio = time.monotonic()
+        self.assert503(lambda: hasher.hash_password("excedente"))
+        self.assertLess(time.monotonic() - inicio, 1.0)
+        self.assertEqual(hasher.stats()["rejected"], 1)
+
+        self.bcrypt.liberar.set()
+        self.esperar(lambda: all(resultados))
+        self.assertEqual([r[0] for r in resultados], ["hash:senha0", "hash:senha1"])
+        self.assertEqual(hasher.stats()["in_flight"], 0)
+        self.assertTrue(hasher.check_password("outra", "hash:outra"))
+
+    def test_timeout_so_libera_a_vaga_quando_o_bcrypt_termina(self):
+        hasher = self.criar(max_workers=1, max_queue=0, timeout=0.05)
+
+        erro = self.assert503(lambda: hasher.hash_password("lenta"))
+        self.assertEqual(erro.details["message"], "Tempo esgotado ao processar a senha")
+
+        # O bcrypt continua ocupando a única thread: a vaga ainda está presa
+        self.assertEqual(hasher.stats()["in_flight"], 1)
+        self.assert503(lambda: hasher.hash_password("outra"))
+        self.assertEqual(hasher.stats()["rejected"], 1)
+
+        self.bcrypt.liberar.set()
+        self.esperar(lambda: hasher.stats()["in_flight"] == 0)
+        self.assertEqual(hasher.stats()["operations"]["hash"]["count"], 1)
+        self.assertEqual(hasher.hash_password("depois"), "hash:depois")
+
+    def test_timeout_na_fila_cancela_a_tarefa_e_devolve_a_vaga(self):
+        hasher = self.criar(max_workers=1, max_queue=1, timeout=0.05)
+        primeira = self.em_thread(hasher.hash_password, "em_execucao")
+        self.esperar(lambda: self.bcrypt.iniciadas == 1)
+
+        # A segunda nem chegou a começar: o cancelamento devolve a vaga já
+        self.assert503(lambda: hasher.hash_password("na_fila"))
+        self.esperar(lambda: primeira)
+        self.assertEqual(hasher.stats()["in_flight"], 1)
+
+        self.bcrypt.liberar.set()
+        self.esperar(lambda: hasher.stats()["in_flight"] == 0)
+        self.assertEqual(self.bcrypt.iniciadas, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
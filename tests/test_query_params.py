@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+QueryParams.inteiro_positivo, usado pelos controles síncronos e assíncronos.
+
+    python -m pytest -q tests/test_query_params.py
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.utils.error_response import ErrorResponse
+from api.utils.query_params import QueryParams
+
+
+class TestQueryParams(unittest.TestCase):
+    def test_ausente_ou_vazio_e_none(self):
+        self.assertIsNone(QueryParams.inteiro_positivo({}, "limit"))
+        self.assertIsNone(QueryParams.inteiro_positivo({"limit": ""}, "limit"))
+
+    def test_inteiro_positivo(self):
+        self.assertEqual(QueryParams.inteiro_positivo({"limit": "25"}, "limit"), 25)
+
+    def test_valor_invalido_e_400_com_o_nome_do_parametro(self):
+        for valor in ("abc", "0", "-3", "1.5"):
+            with self.assertRaises(ErrorResponse) as contexto:
+                QueryParams.inteiro_positivo({"offset": valor}, "offset")
+            self.assertEqual(contexto.exception.status_code, 400)
+            self.assertIn("'offset'", contexto.exception.details["message"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Planos de execução das consultas críticas (query_plan) contra o MySQL
+configurado nas variáveis MYSQL_*; pulado quando ele não está acessível.
+As migrações pendentes são aplicadas antes, como no DB_AUTO_MIGRATE=1.
+
+    python -m pytest -q tests/test_query_plan.py
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mysql.connector
+from api.database.migrator import Migrator
+from api.database.mysql_database import create_database_instance
+from api.database.query_plan import verificar_consultas_criticas
+
+
+def _mysql_acessivel() -> bool:
+    try:
+        conexao = mysql.connector.connect(
+            host=os.getenv('MYSQL_HOST', '127.0.0.1'),
+            user=os.getenv('MYSQL_USER', 'root'),
+            password=os.getenv('MYSQL_PASSWORD', ''),
+            port=int(os.getenv('MYSQL_PORT', '3306')),
+            connection_timeout=2
+        )
+    except mysql.connector.Error:
+        return False
+    conexao.close()
+    return True
+
+
+@unittest.skipUnless(_mysql_acessivel(), "MySQL não acessível (MYSQL_HOST/MYSQL_PORT)")
+class TestQueryPlan(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.database = create_database_instance()
+        cls.database.connect()
+        cls.addClassCleanup(cls.database.close_pool)
+        Migrator(cls.database).migrar()
+
+    def test_consultas_criticas_usam_os_indices(self):
+        self.assertEqual(verificar_consultas_criticas(self.database), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Roteamento de leituras para réplicas (MysqlDatabase), com conexões falsas
+no lugar do MySQL: cada conexão responde com o host de onde veio.
+
+    python -m pytest -q tests/test_replicas_leitura.py
+"""
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mysql.connector
+from api.database.mysql_database import MysqlDatabase
+
+
+class CursorFalso:
+    def __init__(self, host):
+        self.__host = host
+        self.lastrowid = 1
+        self.rowcount = 1
+        self.column_names = ("origem",)
+
+    def execute(self, query, params=()):
+        pass
+
+    def fetchone(self):
+        return ("8.0.0-falso",)
+
+    def fetchall(self):
+        return [{"origem": self.__host}]
+
+    def close(self):
+        pass
+
+
+class ConexaoFalsa:
+    def __init__(self, host):
+        self.host = host
+
+    def cursor(self, dictionary=False):
+        return CursorFalso(self.host)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def ping(self, *args, **kwargs):
+        pass
+
+    def reset_session(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestReplicasLeitura(unittest.TestCase):
+    def setUp(self):
+        self.fora_do_ar = set()
+        patcher = mock.patch("mysql.connector.connect", side_effect=self.__conectar)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.database = MysqlDatabase(
+            host="primario", replicas=[("replica", 3306)],
+            pool_size=1, pool_max_overflow=0, pool_min_idle=0,
+            pool_timeout=2.0, replica_timeout=0.05, replica_sticky_seconds=5.0,
+        )
+        self.database.connect()
+        self.database.begin_request()
+        self.addCleanup(self.database.close_pool)
+
+    def __conectar(self, **config):
+        if config["host"] in self.fora_do_ar:
+            raise mysql.connector.errors.InterfaceError("Can't connect to MySQL server")
+        return ConexaoFalsa(config["host"])
+
+    def __origem_leitura(self) -> str:
+        return self.database.execute_query("SELECT origem", fetch=True)[0]["origem"]
+
+    def test_leitura_vai_para_replica(self):
+        self.assertEqual(self.__origem_leitura(), "replica")
+
+    def test_replica_fora_do_ar_le_do_primario(self):
+        self.fora_do_ar.add("replica")
+        self.assertEqual(self.__origem_leitura(), "primario")
+
+    def test_replica_saturada_le_do_primario_sem_esperar_pool_timeout(self):
+        replica = MysqlDatabase._MysqlDatabase__replica_pools[0]
+        ocupada = replica.get_connection()
+        try:
+            inicio = time.monotonic()
+            self.assertEqual(self.__origem_leitura(), "primario")
+            self.assertLess(time.monotonic() - inicio, self.database.pool_timeout)
+        finally:
+            ocupada.close()
+
+    def test_leitura_apos_escrita_fica_no_primario(self):
+        self.database.execute_query("UPDATE tarefas SET concluida = TRUE WHERE id = %s", (1,))
+        self.assertEqual(self.__origem_leitura(), "primario")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+StreamResponse: fim do documento com e sem erro no meio da listagem.
+
+    python -m pytest -q tests/test_stream_response.py
+"""
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from api.utils.stream_response import StreamResponse
+
+
+def _itens(falhar: bool):
+    yield {"id": 1}
+    yield {"id": 2}
+    if falhar:
+        raise RuntimeError("conexão perdida")
+
+
+class TestStreamResponse(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+
+    def __corpo(self, falhar: bool, headers: dict = None) -> str:
+        with self.app.test_request_context("/api/tarefa/?stream=1", headers=headers or {}):
+            resposta = StreamResponse.build(_itens(falhar), "tarefas")
+            return "".join(p if isinstance(p, str) else p.decode() for p in resposta.response)
+
+    def test_lista_inteira_termina_com_complete_true(self):
+        documento = json.loads(self.__corpo(False))
+        self.assertEqual(documento["data"]["tarefas"], [{"id": 1}, {"id": 2}])
+        self.assertIs(documento["complete"], True)
+        self.assertIs(documento["success"], True)
+        self.assertNotIn("error", documento)
+
+    def test_erro_no_meio_nunca_fica_ao_lado_de_success_true(self):
+        with self.assertLogs("api.utils.stream_response", "ERROR"):
+            corpo = self.__corpo(True)
+        documento = json.loads(corpo)
+        self.assertEqual(documento["data"]["tarefas"], [{"id": 1}, {"id": 2}])
+        self.assertIs(documento["complete"], False)
+        self.assertIs(documento["success"], False)
+        self.assertEqual(documento["error"]["code"], 500)
+        self.assertNotIn('"success": true', corpo)
+
+    def test_ndjson_sinaliza_o_erro_na_ultima_linha(self):
+        with self.assertLogs("api.utils.stream_response", "ERROR"):
+            linhas = self.__corpo(True, {"Accept": StreamResponse.NDJSON_MIMETYPE}).splitlines()
+        self.assertEqual([json.loads(linha) for linha in linhas[:2]], [{"id": 1}, {"id": 2}])
+        self.assertEqual(json.loads(linhas[-1])["complete"], False)
+
+
+if __name__ == "__main__":
+    unittest.main()
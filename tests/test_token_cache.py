@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+TokenCache: validade da entrada em min(agora + ttl, exp), expulsão LRU em
+max_entries e nenhum token entregue depois do próprio "exp".
+
+    python -m pytest -q tests/test_token_cache.py
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.http import token_cache
+from api.http.token_cache import TokenCache
+
+
+class RelogioFalso:
+    """Substitui o módulo time dentro de token_cache."""
+    def __init__(self):
+        self.agora = 1_700_000_000.0
+
+    def time(self) -> float:
+        return self.agora
+
+
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.relogio = RelogioFalso()
+        patcher = mock.patch.object(token_cache, "time", self.relogio)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def __payload(self, expira_em_segundos: float) -> dict:
+        return {"email": "ana@exemplo.com", "exp": int(self.relogio.agora + expira_em_segundos)}
+
+    def test_ttl_vence_antes_do_exp(self):
+        cache = TokenCache(ttl=60)
+        payload = self.__payload(3600)
+        cache.set("token", payload)
+
+        self.relogio.agora += 59
+        self.assertIs(cache.get("token"), payload)
+        self.relogio.agora += 1
+        self.assertIsNone(cache.get("token"))
+
+    def test_exp_vence_antes_do_ttl(self):
+        cache = TokenCache(ttl=300)
+        cache.set("token", self.__payload(30))
+
+        self.relogio.agora += 29
+        self.assertIsNotNone(cache.get("token"))
+        self.relogio.agora += 1
+        self.assertIsNone(cache.get("token"))
+
+    def test_token_ja_expirado_nunca_e_entregue(self):
+        cache = TokenCache(ttl=300)
+        cache.set("token", self.__payload(-1))
+        self.assertIsNone(cache.get("token"))
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_sem_exp_vale_o_ttl(self):
+        cache = TokenCache(ttl=10)
+        cache.set("token", {"email": "ana@exemplo.com"})
+        self.relogio.agora += 10
+        self.assertIsNone(cache.get("token"))
+
+    def test_expulsa_o_menos_usado_em_max_entries(self):
+        cache = TokenCache(max_entries=2, ttl=300)
+        for token in ("a", "b"):
+            cache.set(token, self.__payload(3600))
+        cache.get("a")  # "b" passa a ser o menos usado
+        cache.set("c", self.__payload(3600))
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.stats()["size"], 2)
+
+    def test_contadores(self):
+        cache = TokenCache(ttl=300)
+        cache.get("token")
+        cache.set("token", self.__payload(3600))
+        cache.get("token")
+        cache.get("token")
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
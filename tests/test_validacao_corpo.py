@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Regras de corpo dos middlewares (verificar_*), usadas pelos decorators do
+Flask e pelo AsyncBodyMiddleware do servidor ASGI.
+
+    python -m pytest -q tests/test_validacao_corpo.py
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.middleware.projeto_middleware import ProjetoMiddleware
+from api.middleware.tarefa_middleware import TarefaMiddleware
+from api.middleware.usuario_middleware import UsuarioMiddleware
+from api.utils.error_response import ErrorResponse
+
+
+class TestValidacaoCorpo(unittest.TestCase):
+    def assertRecusa(self, verificar, body):
+        with self.assertRaises(ErrorResponse) as contexto:
+            verificar(body)
+        self.assertEqual(contexto.exception.status_code, 400)
+
+    def test_corpos_validos_passam(self):
+        UsuarioMiddleware().verificar_body({"usuario": {"nome": "Ana", "email": "a@b.c", "senha_hash": "x"}})
+        UsuarioMiddleware().verificar_login_body({"usuario": {"email": "a@b.c", "senha": "x"}})
+        ProjetoMiddleware().verificar_body_update({"projeto": {"nome": "P", "status": "pendente"}})
+        TarefaMiddleware().verificar_body({"tarefa": {"titulo": "Tarefa", "projeto_id": 1}})
+        TarefaMiddleware().verificar_batch_ids({"ids": [1, 2]})
+
+    def test_corpo_ausente_ou_sem_objeto(self):
+        for body in (None, {}, [], "texto", {"tarefa": "texto"}, {"tarefa": [1]}):
+            self.assertRecusa(TarefaMiddleware().verificar_body, body)
+        self.assertRecusa(ProjetoMiddleware().verificar_body, {"projeto": "abc"})
+
+    def test_campo_obrigatorio_ausente(self):
+        self.assertRecusa(TarefaMiddleware().verificar_body, {"tarefa": {"titulo": "Tarefa"}})
+        self.assertRecusa(TarefaMiddleware().verificar_body_update, {"tarefa": {"titulo": "Tarefa"}})
+        self.assertRecusa(UsuarioMiddleware().verificar_login_body, {"usuario": {"email": "a@b.c"}})
+        self.assertRecusa(ProjetoMiddleware().verificar_body, {"projeto": {"nome": "P"}})
+
+    def test_lotes(self):
+        verificar = TarefaMiddleware().verificar_batch_body
+        for body in ([1], {"tarefas": []}, {"tarefas": [1]}, {"tarefas": "x"}):
+            self.assertRecusa(verificar, body)
+        self.assertRecusa(TarefaMiddleware().verificar_batch_ids, {"ids": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
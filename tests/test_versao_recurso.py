@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Decisão do 304 em VersaoRecurso (ETag / If-Modified-Since).
+
+    python -m pytest -q tests/test_versao_recurso.py
+"""
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from api.http.versao_recurso import VersaoRecurso
+
+MARCAS = [datetime(2026, 1, 1, 12, 0, 0)]
+DEPOIS = "Thu, 01 Jan 2026 13:00:00 GMT"
+
+
+class TestVersaoRecurso(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+
+    def __atual(self, headers: dict, total: int = None) -> bool:
+        with self.app.test_request_context("/api/tarefa/", headers=headers):
+            return VersaoRecurso(MARCAS, total).atual_no_cliente()
+
+    def test_entidade_aceita_if_modified_since(self):
+        self.assertTrue(self.__atual({"If-Modified-Since": DEPOIS}))
+
+    def test_listagem_ignora_if_modified_since(self):
+        # Excluir uma linha antiga muda o COUNT(*), não o MAX(atualizado_em)
+        self.assertFalse(self.__atual({"If-Modified-Since": DEPOIS}, total=3))
+
+    def test_listagem_com_etag_do_cliente(self):
+        with self.app.test_request_context("/api/tarefa/"):
+            etag = VersaoRecurso(MARCAS, 3).etag
+        self.assertTrue(self.__atual({"If-None-Match": f'"{etag}"'}, total=3))
+        self.assertFalse(self.__atual({"If-None-Match": f'"{etag}"'}, total=2))
+
+
+if __name__ == "__main__":
+    unittest.main()